@@ -0,0 +1,164 @@
+"""
+REST order round trip per HTTP backend against a local fake Binance USD-M futures exchange.
+
+The fake exchange runs in its own process and acks `POST /fapi/v1/order`. Every backend
+goes through `BinanceApiClient.post_fapi_v1_order`, so the numbers include signing,
+error mapping and msgspec decoding, not just the transport.
+
+Reported per backend:
+    - order round trip latency: request built -> `BinanceOrder` decoded
+    - CPU per request: process CPU time (all threads, so the Rust client of the nautilus
+      backend is included) divided by the number of requests
+
+    python benchmark/http_backend_benchmark.py --requests 5000
+    python benchmark/http_backend_benchmark.py --backends aiohttp nautilus --concurrency 8
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import time
+
+import numpy as np
+import orjson
+from aiohttp import web
+
+from nexustrader.constants import HttpBackend
+from nexustrader.core.log import SpdLog
+from nexustrader.exchange.binance import BinanceAccountType
+from nexustrader.exchange.binance.constants import BASE_URLS
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+
+
+SYMBOL_ID = "BTCUSDT"
+
+
+async def handle_order(request: web.Request):
+    params = request.query
+    now_ms = time.time_ns() // 1_000_000
+    return web.json_response(
+        {
+            "symbol": SYMBOL_ID,
+            "orderId": 1,
+            "clientOrderId": params.get("newClientOrderId", ""),
+            "price": params.get("price", "0"),
+            "avgPrice": "0.00",
+            "origQty": params["quantity"],
+            "executedQty": "0",
+            "cumQuote": "0",
+            "status": "NEW",
+            "timeInForce": "GTC",
+            "type": params["type"],
+            "side": params["side"],
+            "reduceOnly": False,
+            "positionSide": "BOTH",
+            "updateTime": now_ms,
+        },
+        headers={"X-MBX-USED-WEIGHT-1M": "1", "X-MBX-ORDER-COUNT-10S": "1"},
+        dumps=lambda obj: orjson.dumps(obj).decode(),
+    )
+
+
+def run_fake_exchange(port: int, ready: mp.Event):
+    async def serve():
+        app = web.Application()
+        app.router.add_post("/fapi/v1/order", handle_order)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+async def bench_backend(backend: HttpBackend, requests: int, concurrency: int, warmup: int):
+    client = BinanceApiClient(
+        api_key="benchmark",
+        secret="benchmark",
+        enable_rate_limit=False,
+        http_backend=backend,
+    )
+    latencies_ns = []
+
+    async def send(i: int, record: bool):
+        start = time.perf_counter_ns()
+        await client.post_fapi_v1_order(
+            symbol=SYMBOL_ID,
+            side="BUY",
+            type="LIMIT",
+            quantity="0.001",
+            price="60000",
+            timeInForce="GTC",
+            newClientOrderId=f"bench{i}",
+        )
+        if record:
+            latencies_ns.append(time.perf_counter_ns() - start)
+
+    async def worker(ids: range, record: bool):
+        for i in ids:
+            await send(i, record)
+
+    async def run(n: int, record: bool):
+        await asyncio.gather(
+            *(worker(range(w, n, concurrency), record) for w in range(concurrency))
+        )
+
+    try:
+        await run(warmup, record=False)
+        cpu_start, wall_start = time.process_time(), time.perf_counter()
+        await run(requests, record=True)
+        cpu = time.process_time() - cpu_start
+        wall = time.perf_counter() - wall_start
+    finally:
+        await client.close_session()
+    return latencies_ns, cpu, wall
+
+
+def report(backend: HttpBackend, latencies_ns: list[int], cpu: float, wall: float):
+    us = np.array(latencies_ns) / 1000
+    p50, p99, p999 = np.percentile(us, [50, 99, 99.9])
+    print(
+        f"{backend.value:<9} n={len(us):<6} p50={p50:8.1f}us  p99={p99:8.1f}us  "
+        f"p99.9={p999:8.1f}us  cpu/req={cpu / len(us) * 1e6:7.1f}us  "
+        f"req/s={len(us) / wall:8.0f}"
+    )
+
+
+def main(backends: list[HttpBackend], requests: int, concurrency: int, warmup: int, port: int):
+    SpdLog.initialize(level="INFO", std_level="ERROR", production_mode=True)
+
+    ready = mp.Event()
+    exchange_process = mp.Process(target=run_fake_exchange, args=(port, ready), daemon=True)
+    exchange_process.start()
+    assert ready.wait(timeout=10)
+    BASE_URLS[BinanceAccountType.USD_M_FUTURE] = f"http://127.0.0.1:{port}"
+
+    print(f"requests={requests} concurrency={concurrency}")
+    try:
+        for backend in backends:
+            try:
+                result = asyncio.run(bench_backend(backend, requests, concurrency, warmup))
+            except ImportError as e:
+                print(f"{backend.value:<9} skipped: {e}")
+                continue
+            report(backend, *result)
+    finally:
+        exchange_process.terminate()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--warmup", type=int, default=200)
+    parser.add_argument("--port", type=int, default=18081)
+    parser.add_argument(
+        "--backends",
+        nargs="+",
+        type=HttpBackend,
+        default=list(HttpBackend),
+        help="aiohttp, aiosonic, nautilus",
+    )
+    args = parser.parse_args()
+    main(args.backends, args.requests, args.concurrency, args.warmup, args.port)
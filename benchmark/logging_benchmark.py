@@ -0,0 +1,144 @@
+"""
+CPU spent logging on the order path, per logging profile.
+
+Every order goes through the log calls the live order path makes: the EMS `[ORDER SUBMIT]`
+line, the REST request line of `BinanceApiClient`, `OrderRegistry.register_order` and the
+OMS `ORDER STATUS` lines for ACCEPTED and FILLED. Each profile runs in a fresh process,
+since `SpdLog` is configured once per process.
+
+Profiles:
+    - debug, flush all: DEBUG written and every entry flushed, the behaviour before
+      `flush_level`
+    - debug: DEBUG written, flushed from ERROR up
+    - info: DEBUG disabled, the lazy args are never formatted
+    - info, f-string: DEBUG disabled, but messages built eagerly with f-strings
+    - off: no logging call at all, the baseline
+
+    python benchmark/logging_benchmark.py --orders 20000
+"""
+
+import argparse
+import multiprocessing as mp
+import tempfile
+import time
+from decimal import Decimal
+
+from nexustrader.constants import (
+    ExchangeType,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    SubmitType,
+)
+from nexustrader.core.log import SpdLog
+from nexustrader.core.registry import OrderRegistry
+from nexustrader.schema import InstrumentId, Order, OrderSubmit
+
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+URL = (
+    "https://fapi.binance.com/fapi/v1/order?symbol=BTCUSDT&side=BUY&type=LIMIT"
+    "&quantity=0.001&price=60000&timeInForce=GTC&timestamp=1700000000000"
+    "&recvWindow=60000&signature=" + "0" * 64
+)
+
+PROFILES = {
+    "debug, flush all": dict(level="DEBUG", flush_level=None),
+    "debug": dict(level="DEBUG", flush_level="ERROR"),
+    "info": dict(level="INFO", flush_level="ERROR"),
+    "info, f-string": dict(level="INFO", flush_level="ERROR"),
+    "off": dict(level="INFO", flush_level="ERROR"),
+}
+
+
+def run_profile(profile: str, orders: int, log_dir: str, result_queue: mp.Queue):
+    SpdLog.initialize(
+        level=PROFILES[profile]["level"],
+        std_level="ERROR",
+        file_dir=log_dir,
+        production_mode=True,
+        flush_level=PROFILES[profile]["flush_level"],
+    )
+    ems_log = SpdLog.get_logger("ExecutionManagementSystem", level="DEBUG", flush=True)
+    api_log = SpdLog.get_logger("BinanceApiClient", level="DEBUG", flush=True)
+    oms_log = SpdLog.get_logger("OrderManagementSystem", level="DEBUG", flush=True)
+    registry = OrderRegistry()
+    instrument_id = InstrumentId.from_str(SYMBOL)
+
+    submits = [
+        OrderSubmit(
+            symbol=SYMBOL,
+            instrument_id=instrument_id,
+            submit_type=SubmitType.CREATE,
+            side=OrderSide.BUY,
+            type=OrderType.LIMIT,
+            amount=Decimal("0.001"),
+            price=Decimal("60000"),
+        )
+        for _ in range(orders)
+    ]
+    accepted = [
+        Order(
+            exchange=ExchangeType.BINANCE,
+            symbol=SYMBOL,
+            status=OrderStatus.ACCEPTED,
+            id=i,
+            uuid=submit.uuid,
+            amount=Decimal("0.001"),
+            price=60000.0,
+            side=OrderSide.BUY,
+            type=OrderType.LIMIT,
+        )
+        for i, submit in enumerate(submits)
+    ]
+
+    def lazy(submit: OrderSubmit, order: Order):
+        ems_log.debug("[ORDER SUBMIT]: %s", submit)
+        api_log.debug("Request: %s", URL)
+        registry.register_order(order)
+        oms_log.debug("ORDER STATUS ACCEPTED: %s", order)
+        oms_log.debug("ORDER STATUS FILLED: %s", order)
+
+    def eager(submit: OrderSubmit, order: Order):
+        ems_log.debug(f"[ORDER SUBMIT]: {submit}")
+        api_log.debug(f"Request: {URL}")
+        registry.register_order(order)
+        oms_log.debug(f"ORDER STATUS ACCEPTED: {str(order)}")
+        oms_log.debug(f"ORDER STATUS FILLED: {str(order)}")
+
+    def off(submit: OrderSubmit, order: Order):
+        registry._uuid_to_order_id[order.uuid] = order.id
+        registry._order_id_to_uuid[order.id] = order.uuid
+
+    log_order = {"info, f-string": eager, "off": off}.get(profile, lazy)
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    for submit, order in zip(submits, accepted):
+        log_order(submit, order)
+    cpu = time.process_time() - cpu_start
+    wall = time.perf_counter() - wall_start
+    result_queue.put((cpu, wall))
+
+
+def main(orders: int):
+    print(f"orders={orders}")
+    result_queue = mp.Queue()
+    for profile in PROFILES:
+        with tempfile.TemporaryDirectory() as log_dir:
+            process = mp.Process(
+                target=run_profile, args=(profile, orders, log_dir, result_queue)
+            )
+            process.start()
+            cpu, wall = result_queue.get(timeout=300)
+            process.join()
+        print(
+            f"{profile:<17} cpu/order={cpu / orders * 1e6:7.2f}us  "
+            f"wall/order={wall / orders * 1e6:7.2f}us"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--orders", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.orders)
@@ -0,0 +1,112 @@
+"""
+Replay a websocket recording (see `Config.ws_recorder_config`) into the public connectors
+and report end-to-end msgs/sec of decode -> msgbus -> cache -> subscriber, per exchange.
+
+    python benchmark/replay_benchmark.py .log/ws_record
+    python benchmark/replay_benchmark.py .log/ws_record --speed 10
+"""
+
+import argparse
+import asyncio
+import tempfile
+from collections import Counter
+
+from nexustrader.constants import ExchangeType
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.nautilius_core import MessageBus, TraderId, LiveClock
+from nexustrader.core.recorder import FrameReader
+from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.replay import FrameReplayer
+from nexustrader.exchange.binance import (
+    BinanceAccountType,
+    BinanceExchangeManager,
+    BinancePublicConnector,
+)
+from nexustrader.exchange.bybit import (
+    BybitAccountType,
+    BybitExchangeManager,
+    BybitPublicConnector,
+)
+from nexustrader.exchange.okx import (
+    OkxAccountType,
+    OkxExchangeManager,
+    OkxPublicConnector,
+)
+
+
+PUBLIC_CONNECTORS = {
+    "BinanceAccountType": (
+        BinanceAccountType,
+        BinanceExchangeManager,
+        BinancePublicConnector,
+        ExchangeType.BINANCE,
+    ),
+    "OkxAccountType": (OkxAccountType, OkxExchangeManager, OkxPublicConnector, ExchangeType.OKX),
+    "BybitAccountType": (
+        BybitAccountType,
+        BybitExchangeManager,
+        BybitPublicConnector,
+        ExchangeType.BYBIT,
+    ),
+}
+
+
+async def main(path: str, speed: float | None):
+    reader = FrameReader(path)
+    for _ in reader:
+        pass
+
+    task_manager = TaskManager(asyncio.get_running_loop(), enable_signal_handlers=False)
+    msgbus = MessageBus(trader_id=TraderId("REPLAY-001"), clock=LiveClock())
+    AsyncCache(
+        strategy_id="replay",
+        user_id="benchmark",
+        msgbus=msgbus,
+        task_manager=task_manager,
+        registry=OrderRegistry(),
+        db_path=f"{tempfile.mkdtemp()}/cache.db",
+    )
+
+    received = Counter()
+    for topic in ("bookl1", "trade", "kline"):
+        msgbus.subscribe(topic=topic, handler=lambda msg, topic=topic: received.update([topic]))
+
+    replayer = FrameReplayer(path, speed=speed)
+    exchanges = {}
+    connectors = {}
+    for meta in reader.connections.values():
+        account_type = meta.get("account_type")
+        if not account_type or account_type in connectors:
+            continue
+        enum_name, member = account_type.split(".")
+        if enum_name not in PUBLIC_CONNECTORS:
+            continue
+        enum_cls, manager_cls, connector_cls, exchange_id = PUBLIC_CONNECTORS[enum_name]
+        account_type = enum_cls[member]
+        if exchange_id not in exchanges:
+            exchanges[exchange_id] = manager_cls({"sandbox": account_type.is_testnet})
+        try:
+            connector = connector_cls(
+                account_type=account_type,
+                exchange=exchanges[exchange_id],
+                msgbus=msgbus,
+                task_manager=task_manager,
+            )
+        except ValueError:
+            # private-only account types, e.g. `BybitAccountType.UNIFIED`
+            continue
+        connectors[str(account_type)] = connector
+        replayer.add_connector(connector)
+
+    stats = await replayer.run()
+    print(stats)
+    print(f"published: {dict(received)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("path", help="recording file or directory")
+    parser.add_argument("--speed", type=float, default=None, help="time scale, default max speed")
+    args = parser.parse_args()
+    asyncio.run(main(args.path, args.speed))
@@ -0,0 +1,431 @@
+"""
+End-to-end tick -> order latency against a local fake Binance USD-M futures exchange.
+
+The fake exchange runs in its own process and serves:
+    - `/ws`: SUBSCRIBE handling, Binance-format `bookTicker` ticks and the user data stream
+    - `POST /fapi/v1/order` and `order.place` on `/ws-fapi/v1` (WebSocket API): order ack,
+      followed by an `ORDER_TRADE_UPDATE` FILLED push
+    - `/fapi/v1/listenKey`, `GET /fapi/v2/account`: what the private connector needs to start
+
+A real `Engine` runs a strategy sending a market order on every tick. The tick sequence
+number travels in the best bid qty of the ticker and comes back in `newClientOrderId`.
+
+Reported latencies (CLOCK_MONOTONIC, shared by both processes):
+    - tick -> order: tick sent by the fake exchange -> order request received by it
+    - tick -> FILLED: tick sent by the fake exchange -> `Strategy.on_filled_order` called
+
+    python benchmark/tick_to_order_benchmark.py --ticks 2000 --interval 0.005
+    python benchmark/tick_to_order_benchmark.py --ws-order  # orders over the WebSocket API
+"""
+
+import argparse
+import asyncio
+import multiprocessing as mp
+import signal
+import tempfile
+import time
+from decimal import Decimal
+
+import msgspec
+import numpy as np
+import orjson
+from aiohttp import web
+
+import nexustrader.engine as engine_module
+from nexustrader.config import (
+    Config,
+    PublicConnectorConfig,
+    PrivateConnectorConfig,
+    BasicConfig,
+)
+from nexustrader.constants import ExchangeType, OrderSide, OrderType
+from nexustrader.core.log import SpdLog
+from nexustrader.engine import Engine
+from nexustrader.exchange.binance import BinanceAccountType, BinanceExchangeManager
+from nexustrader.exchange.binance.constants import BASE_URLS, STREAM_URLS, WS_API_URLS
+from nexustrader.exchange.binance.schema import BinanceMarket
+from nexustrader.schema import BookL1, Order
+from nexustrader.strategy import Strategy
+
+
+SYMBOL_ID = "BTCUSDT"
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+LISTEN_KEY = "benchmark-listen-key"
+CLIENT_ORDER_PREFIX = "bench"
+
+MARKET = {
+    "id": SYMBOL_ID,
+    "lowercaseId": SYMBOL_ID.lower(),
+    "symbol": "BTC/USDT:USDT",
+    "base": "BTC",
+    "quote": "USDT",
+    "settle": "USDT",
+    "baseId": "BTC",
+    "quoteId": "USDT",
+    "settleId": "USDT",
+    "type": "swap",
+    "spot": False,
+    "margin": False,
+    "swap": True,
+    "future": False,
+    "option": False,
+    "index": None,
+    "active": True,
+    "contract": True,
+    "linear": True,
+    "inverse": False,
+    "subType": "linear",
+    "taker": 0.0005,
+    "maker": 0.0002,
+    "contractSize": 1.0,
+    "expiry": None,
+    "expiryDatetime": None,
+    "strike": None,
+    "optionType": None,
+    "precision": {"amount": 0.001, "price": 0.1},
+    "limits": {
+        "leverage": {"min": 1, "max": 125},
+        "amount": {"min": 0.001, "max": 1000},
+        "price": {"min": 0.1, "max": 1000000},
+        "cost": {"min": 5, "max": None},
+        "market": {"min": 0.001, "max": 120},
+    },
+    "marginModes": {"isolated": None, "cross": None},
+    "created": None,
+    "tierBased": None,
+    "percentage": None,
+    "info": {"symbol": SYMBOL_ID},
+    "feeSide": "quote",
+}
+
+
+class LocalBinanceExchangeManager(BinanceExchangeManager):
+    """Binance exchange manager with a single BTCUSDT perpetual, no `load_markets` request."""
+
+    def load_markets(self):
+        mkt = msgspec.json.decode(orjson.dumps(MARKET), type=BinanceMarket)
+        mkt.symbol = self._parse_symbol(mkt, exchange_suffix="BINANCE")
+        self.market[mkt.symbol] = mkt
+        self.market_id[f"{mkt.id}_linear"] = mkt.symbol
+
+
+class FakeBinanceExchange:
+    def __init__(self, ticks: int, interval: float, result_queue: mp.Queue):
+        self._ticks = ticks
+        self._interval = interval
+        self._result_queue = result_queue
+        self._market_ws: web.WebSocketResponse | None = None
+        self._user_ws: web.WebSocketResponse | None = None
+        self._tick_task: asyncio.Task | None = None
+        self._send_ns = {}
+        self._order_ns = {}
+        self._order_id = 0
+        self._done = asyncio.Event()
+
+        self.app = web.Application()
+        self.app.router.add_get("/ws", self._handle_ws)
+        self.app.router.add_get("/ws-fapi/v1", self._handle_ws_api)
+        self.app.router.add_post("/fapi/v1/order", self._handle_order)
+        self.app.router.add_post("/fapi/v1/listenKey", self._handle_listen_key)
+        self.app.router.add_put("/fapi/v1/listenKey", self._handle_listen_key)
+        self.app.router.add_get("/fapi/v2/account", self._handle_account)
+
+    async def _handle_ws(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            data = orjson.loads(msg.data)
+            if data.get("method") != "SUBSCRIBE":
+                continue
+            for param in data["params"]:
+                if param == LISTEN_KEY:
+                    self._user_ws = ws
+                else:
+                    self._market_ws = ws
+            await ws.send_str(orjson.dumps({"result": None, "id": data["id"]}).decode())
+            # `WebSocketResponse` is a mapping and falsy while empty, compare with None
+            ready = self._market_ws is not None and self._user_ws is not None
+            if ready and not self._tick_task:
+                self._tick_task = asyncio.create_task(self._send_ticks())
+        return ws
+
+    async def _send_ticks(self):
+        await asyncio.sleep(1)  # let the engine finish starting up
+        for seq in range(1, self._ticks + 1):
+            now_ms = time.time_ns() // 1_000_000
+            payload = orjson.dumps(
+                {
+                    "e": "bookTicker",
+                    "u": seq,
+                    "E": now_ms,
+                    "T": now_ms,
+                    "s": SYMBOL_ID,
+                    "b": "60000.0",
+                    "B": str(seq),
+                    "a": "60000.1",
+                    "A": "1.000",
+                }
+            ).decode()
+            self._send_ns[seq] = time.monotonic_ns()
+            await self._market_ws.send_str(payload)
+            await asyncio.sleep(self._interval)
+
+        # grace period for the last orders
+        deadline = time.monotonic() + 5
+        while len(self._order_ns) < self._ticks and time.monotonic() < deadline:
+            await asyncio.sleep(0.1)
+        self._result_queue.put(("result", self._send_ns, self._order_ns))
+        self._done.set()
+
+    def _accept_order(self, params, arrival_ns: int) -> dict:
+        client_order_id = params.get("newClientOrderId", "")
+        seq = int(client_order_id.removeprefix(CLIENT_ORDER_PREFIX) or 0)
+        self._order_ns[seq] = arrival_ns
+        self._order_id += 1
+        order_id = self._order_id
+        now_ms = time.time_ns() // 1_000_000
+
+        asyncio.get_running_loop().call_soon(
+            asyncio.create_task,
+            self._push_filled(order_id, client_order_id, params["side"], params["quantity"]),
+        )
+        return {
+            "symbol": SYMBOL_ID,
+            "orderId": order_id,
+            "clientOrderId": client_order_id,
+            "price": "0",
+            "avgPrice": "0.00",
+            "origQty": params["quantity"],
+            "executedQty": "0",
+            "cumQuote": "0",
+            "status": "NEW",
+            "timeInForce": "GTC",
+            "type": params["type"],
+            "side": params["side"],
+            "reduceOnly": False,
+            "positionSide": "BOTH",
+            "updateTime": now_ms,
+        }
+
+    async def _handle_order(self, request: web.Request):
+        arrival_ns = time.monotonic_ns()
+        return web.json_response(
+            self._accept_order(request.query, arrival_ns),
+            dumps=lambda obj: orjson.dumps(obj).decode(),
+        )
+
+    async def _handle_ws_api(self, request: web.Request):
+        ws = web.WebSocketResponse()
+        await ws.prepare(request)
+        async for msg in ws:
+            arrival_ns = time.monotonic_ns()
+            data = orjson.loads(msg.data)
+            if data["method"] != "order.place":
+                continue
+            result = self._accept_order(data["params"], arrival_ns)
+            await ws.send_str(
+                orjson.dumps({"id": data["id"], "status": 200, "result": result}).decode()
+            )
+        return ws
+
+    async def _push_filled(self, order_id: int, client_order_id: str, side: str, quantity: str):
+        now_ms = time.time_ns() // 1_000_000
+        payload = {
+            "e": "ORDER_TRADE_UPDATE",
+            "E": now_ms,
+            "T": now_ms,
+            "o": {
+                "s": SYMBOL_ID,
+                "c": client_order_id,
+                "S": side,
+                "o": "MARKET",
+                "f": "GTC",
+                "q": quantity,
+                "p": "0",
+                "ap": "60000.1",
+                "sp": "0",
+                "x": "TRADE",
+                "X": "FILLED",
+                "i": order_id,
+                "l": quantity,
+                "z": quantity,
+                "L": "60000.1",
+                "N": "USDT",
+                "n": "0.03",
+                "T": now_ms,
+                "t": order_id,
+                "b": "0",
+                "a": "0",
+                "m": False,
+                "R": False,
+                "wt": "CONTRACT_PRICE",
+                "ot": "MARKET",
+                "ps": "BOTH",
+                "cp": False,
+                "rp": "0",
+                "pP": False,
+                "si": 0,
+                "ss": 0,
+                "V": "NONE",
+                "pm": "NONE",
+                "gtd": 0,
+            },
+        }
+        await self._user_ws.send_str(orjson.dumps(payload).decode())
+
+    async def _handle_listen_key(self, request: web.Request):
+        return web.json_response({"listenKey": LISTEN_KEY})
+
+    async def _handle_account(self, request: web.Request):
+        return web.json_response(
+            {
+                "feeTier": 0,
+                "canTrade": True,
+                "canDeposit": True,
+                "canWithdraw": True,
+                "updateTime": 0,
+                "assets": [
+                    {
+                        "asset": "USDT",
+                        "walletBalance": "100000",
+                        "unrealizedProfit": "0",
+                        "marginBalance": "100000",
+                        "maintMargin": "0",
+                        "initialMargin": "0",
+                        "positionInitialMargin": "0",
+                        "openOrderInitialMargin": "0",
+                        "crossWalletBalance": "100000",
+                        "crossUnPnl": "0",
+                        "availableBalance": "100000",
+                        "maxWithdrawAmount": "100000",
+                    }
+                ],
+                "positions": [],
+            }
+        )
+
+    async def serve(self, port: int):
+        runner = web.AppRunner(self.app, access_log=None)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", port)
+        await site.start()
+        self._result_queue.put(("ready",))
+        await self._done.wait()
+        await asyncio.sleep(1)
+        await runner.cleanup()
+
+
+def run_fake_exchange(port: int, ticks: int, interval: float, result_queue: mp.Queue):
+    exchange = FakeBinanceExchange(ticks, interval, result_queue)
+    asyncio.run(exchange.serve(port))
+
+
+class TickToOrder(Strategy):
+    def __init__(self, ticks: int, timeout: float):
+        super().__init__()
+        self.ticks = ticks
+        self.timeout = timeout
+        self.filled_ns = {}
+        self.failed = 0
+
+    def on_start(self):
+        self.subscribe_bookl1(symbols=[SYMBOL])
+        self._task_manager._loop.call_later(self.timeout, signal.raise_signal, signal.SIGINT)
+
+    def on_bookl1(self, bookl1: BookL1):
+        self.create_order(
+            symbol=SYMBOL,
+            side=OrderSide.BUY,
+            type=OrderType.MARKET,
+            amount=Decimal("0.001"),
+            newClientOrderId=f"{CLIENT_ORDER_PREFIX}{int(bookl1.bid_size)}",
+        )
+
+    def on_failed_order(self, order: Order):
+        self.failed += 1
+
+    def on_filled_order(self, order: Order):
+        seq = int(order.client_order_id.removeprefix(CLIENT_ORDER_PREFIX))
+        self.filled_ns[seq] = time.monotonic_ns()
+        if len(self.filled_ns) == self.ticks:
+            signal.raise_signal(signal.SIGINT)
+
+
+def report(name: str, latencies_ns: list[int]):
+    if not latencies_ns:
+        print(f"{name}: no samples")
+        return
+    us = np.array(latencies_ns) / 1000
+    p50, p99, p999 = np.percentile(us, [50, 99, 99.9])
+    print(
+        f"{name:<16} n={len(us):<6} p50={p50:9.1f}us  p99={p99:9.1f}us  "
+        f"p99.9={p999:9.1f}us  max={us.max():9.1f}us"
+    )
+
+
+def main(ticks: int, interval: float, port: int, ws_order: bool):
+    SpdLog.initialize(level="INFO", std_level="ERROR", production_mode=True)
+
+    result_queue = mp.Queue()
+    exchange_process = mp.Process(
+        target=run_fake_exchange, args=(port, ticks, interval, result_queue), daemon=True
+    )
+    exchange_process.start()
+    assert result_queue.get(timeout=10) == ("ready",)
+
+    BASE_URLS[BinanceAccountType.USD_M_FUTURE] = f"http://127.0.0.1:{port}"
+    STREAM_URLS[BinanceAccountType.USD_M_FUTURE] = f"ws://127.0.0.1:{port}/ws"
+    WS_API_URLS[BinanceAccountType.USD_M_FUTURE] = f"ws://127.0.0.1:{port}/ws-fapi/v1"
+    engine_module.BinanceExchangeManager = LocalBinanceExchangeManager
+
+    strategy = TickToOrder(ticks=ticks, timeout=ticks * interval + 30)
+    config = Config(
+        strategy_id="tick_to_order_benchmark",
+        user_id="benchmark",
+        strategy=strategy,
+        basic_config={
+            ExchangeType.BINANCE: BasicConfig(api_key="benchmark", secret="benchmark")
+        },
+        public_conn_config={
+            ExchangeType.BINANCE: [
+                PublicConnectorConfig(account_type=BinanceAccountType.USD_M_FUTURE)
+            ]
+        },
+        private_conn_config={
+            ExchangeType.BINANCE: [
+                PrivateConnectorConfig(
+                    account_type=BinanceAccountType.USD_M_FUTURE,
+                    enable_ws_order=ws_order,
+                )
+            ]
+        },
+        db_path=f"{tempfile.mkdtemp()}/cache.db",
+    )
+    engine = Engine(config)
+    try:
+        engine.start()
+    finally:
+        engine.dispose()
+
+    _, send_ns, order_ns = result_queue.get(timeout=30)
+    exchange_process.join(timeout=5)
+
+    print(
+        f"ticks={ticks} interval={interval * 1000:.1f}ms "
+        f"transport={'ws' if ws_order else 'rest'} failed={strategy.failed}"
+    )
+    report("tick -> order", [order_ns[s] - send_ns[s] for s in order_ns if s in send_ns])
+    report(
+        "tick -> FILLED",
+        [strategy.filled_ns[s] - send_ns[s] for s in strategy.filled_ns if s in send_ns],
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ticks", type=int, default=1000)
+    parser.add_argument("--interval", type=float, default=0.005, help="seconds between ticks")
+    parser.add_argument("--port", type=int, default=18765)
+    parser.add_argument("--ws-order", action="store_true", help="send orders over the WebSocket API")
+    args = parser.parse_args()
+    main(args.ticks, args.interval, args.port, args.ws_order)
@@ -3,6 +3,15 @@ from nexustrader.base.ws_client import WSClient
 from nexustrader.base.api_client import ApiClient
 from nexustrader.base.oms import OrderManagementSystem
 from nexustrader.base.ems import ExecutionManagementSystem
+from nexustrader.base.exec_algorithm import (
+    EXEC_ALGORITHMS,
+    ExecAlgorithm,
+    TwapAlgorithm,
+    VwapAlgorithm,
+    PovAlgorithm,
+    IcebergAlgorithm,
+    volume_profile,
+)
 from nexustrader.base.connector import PublicConnector, PrivateConnector, MockLinearConnector
 
 
@@ -12,6 +21,13 @@ __all__ = [
     "ApiClient",
     "OrderManagementSystem",
     "ExecutionManagementSystem",
+    "EXEC_ALGORITHMS",
+    "ExecAlgorithm",
+    "TwapAlgorithm",
+    "VwapAlgorithm",
+    "PovAlgorithm",
+    "IcebergAlgorithm",
+    "volume_profile",
     "PublicConnector",
     "PrivateConnector",
     "MockLinearConnector",
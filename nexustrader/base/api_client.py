@@ -1,41 +1,201 @@
 from abc import ABC
-from typing import Optional
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import urlsplit
 import ssl
+import asyncio
 import certifi
+import msgspec
 import orjson
 import aiohttp
+from nexustrader.base.http_transport import (
+    AiohttpTransport,
+    AiosonicTransport,
+    HttpTransport,
+    HttpTransportResponse,
+    NautilusTransport,
+)
+from nexustrader.constants import HttpBackend, RequestPriority
+from nexustrader.core.entity import HttpPoolConfig, TaskManager
 from nexustrader.core.log import SpdLog
 from nexustrader.core.nautilius_core import LiveClock
 
 
+class HttpPoolStats(msgspec.Struct, kw_only=True):
+    idle: int = 0
+    in_use: int = 0
+    created: int = 0  # connections opened, including the warm up
+    reused: int = 0  # requests sent on an existing keep-alive connection
+    reconnects: int = 0  # connections opened after the warm up, e.g. dropped by the server
+
+
 class ApiClient(ABC):
+    # response headers read by the client, the nautilus backend drops any other header
+    _response_headers: Tuple[str, ...] = ()
+
     def __init__(
         self,
         api_key: str = None,
         secret: str = None,
         timeout: int = 10,
+        enable_rate_limit: bool = True,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         self._api_key = api_key
         self._secret = secret
         self._timeout = timeout
+        self._enable_rate_limit = enable_rate_limit
+        self._http_pool = http_pool
         self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
         self._ssl_context = ssl.create_default_context(cafile=certifi.where())
-        self._session: Optional[aiohttp.ClientSession] = None
+        self._http_backend = http_backend
+        self._session: Optional[aiohttp.ClientSession] = None  # aiohttp backend only
+        self._transport: Optional[HttpTransport] = None
         self._clock = LiveClock()
+        self._time_offset_ms = 0  # server time - local time, see `ClockSync`
+        self._recv_window: int | None = None
+
+        self._pool_stats: Dict[str, HttpPoolStats] = {}  # host -> stats
+        self._ping_urls: Set[str] = set()
+        self._warm = False
+        self._keepalive_task: asyncio.Task | None = None
 
     def _init_session(self):
         """Initialize the session"""
-        if self._session is None:
+        if self._transport is not None:
+            return
+        if self._http_backend == HttpBackend.AIOSONIC:
+            self._transport = AiosonicTransport(self._ssl_context, self._timeout)
+        elif self._http_backend == HttpBackend.NAUTILUS:
+            self._transport = NautilusTransport(self._timeout, self._response_headers)
+        else:
+            pool = self._http_pool or HttpPoolConfig()
             timeout = aiohttp.ClientTimeout(total=self._timeout)
             tcp_connector = aiohttp.TCPConnector(
-                ssl=self._ssl_context, enable_cleanup_closed=True
-            )
+                ssl=self._ssl_context,
+                enable_cleanup_closed=True,
+                use_dns_cache=True,
+                ttl_dns_cache=pool.dns_ttl,
+                keepalive_timeout=pool.keepalive_timeout,
+            )  # aiohttp sets TCP_NODELAY on every connection
             self._session = aiohttp.ClientSession(
-                connector=tcp_connector, json_serialize=orjson.dumps, timeout=timeout
+                connector=tcp_connector,
+                json_serialize=orjson.dumps,
+                timeout=timeout,
+                trace_configs=[self._trace_config()],
             )
+            self._transport = AiohttpTransport(self._session)
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        if self._http_pool:
+            split = urlsplit(url)
+            if ping_path := self._ping_path(split.path):
+                self._ping_urls.add(f"{split.scheme}://{split.netloc}{ping_path}")
+        return await self._transport.request(method, url, headers, data)
+
+    def _trace_config(self) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+
+        async def on_request_start(session, ctx, params):
+            ctx.host = params.url.host
+
+        async def on_connection_create_end(session, ctx, params):
+            stats = self._pool_stats.setdefault(ctx.host, HttpPoolStats())
+            stats.created += 1
+            if self._warm:
+                stats.reconnects += 1
+
+        async def on_connection_reuseconn(session, ctx, params):
+            self._pool_stats.setdefault(ctx.host, HttpPoolStats()).reused += 1
+
+        trace_config.on_request_start.append(on_request_start)
+        trace_config.on_connection_create_end.append(on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(on_connection_reuseconn)
+        return trace_config
+
+    def _ping_path(self, path: str) -> str | None:
+        """Cheapest endpoint on the host of a request to `path`, used to keep connections warm"""
+        return None
+
+    async def _acquire_ping_rate_limit(self, path: str):
+        """Spend the rate limit of a keep-alive ping to `path`, a no-op without limiters"""
+
+    async def _ping(self, url: str):
+        try:
+            if self._enable_rate_limit:
+                # pings share the budget of the requests they keep warm
+                await self._acquire_ping_rate_limit(urlsplit(url).path)
+            await self._request("GET", url)
+        except Exception as e:
+            self._log.debug(f"Keep-alive ping failed {url}: {e}")
+
+    async def _fill_pool(self):
+        connections = self._http_pool.connections
+        await asyncio.gather(
+            *(self._ping(url) for url in self._ping_urls for _ in range(connections))
+        )
+
+    async def warmup(self, task_manager: TaskManager):
+        """
+        Open `HttpPoolConfig.connections` keep-alive connections to every host requested
+        so far and keep them warm with pings, in a task of `task_manager`, until the
+        session is closed
+        """
+        if not self._http_pool or self._keepalive_task:
+            return
+        self._init_session()
+        await self._fill_pool()
+        self._warm = True
+        self._keepalive_task = task_manager.create_task(self._keep_alive())
+
+    async def _keep_alive(self):
+        while True:
+            await asyncio.sleep(self._http_pool.keepalive_interval)
+            await self._fill_pool()
+
+    def pool_stats(self) -> Dict[str, HttpPoolStats]:
+        """Connection pool stats per host"""
+        connector = self._session.connector if self._session else None
+        for stats in self._pool_stats.values():
+            stats.idle = stats.in_use = 0
+        for key, conns in getattr(connector, "_conns", {}).items():
+            self._pool_stats.setdefault(key.host, HttpPoolStats()).idle = len(conns)
+        for key, conns in getattr(connector, "_acquired_per_host", {}).items():
+            self._pool_stats.setdefault(key.host, HttpPoolStats()).in_use = len(conns)
+        return self._pool_stats
+
+    def set_time_offset(self, offset_ms: int, recv_window: int | None = None):
+        """Correct the timestamp of signed requests, and optionally tighten their recv window"""
+        self._time_offset_ms = offset_ms
+        if recv_window is not None:
+            self._recv_window = recv_window
+
+    def _timestamp_ms(self) -> int:
+        """Local time corrected to the exchange server time"""
+        return self._clock.timestamp_ms() + self._time_offset_ms
+
+    @staticmethod
+    def _request_priority(method: str, endpoint: str) -> RequestPriority:
+        """Cancels first, then order entry, then everything else"""
+        endpoint = endpoint.lower()
+        if method == "DELETE" or "cancel" in endpoint:
+            return RequestPriority.CANCEL
+        if method != "GET" and "order" in endpoint:
+            return RequestPriority.ORDER
+        return RequestPriority.QUERY
 
     async def close_session(self):
         """Close the session"""
-        if self._session:
-            await self._session.close()
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            self._keepalive_task = None
+        if self._transport:
+            await self._transport.close()
+            self._transport = None
             self._session = None
@@ -1,18 +1,20 @@
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from decimal import Decimal
 import asyncio
 
 from aiolimiter import AsyncLimiter
 
 from nexustrader.base.ws_client import WSClient
-from nexustrader.base.api_client import ApiClient
+from nexustrader.base.api_client import ApiClient, HttpPoolStats
 from nexustrader.base.exchange import ExchangeManager
-from nexustrader.schema import Order, BaseMarket, Kline, Position, Balance
+from nexustrader.schema import Order, OrderSubmit, BaseMarket, Kline, Position, Balance
 from nexustrader.constants import ExchangeType, AccountType
 from nexustrader.core.log import SpdLog
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.entity import RateLimit, TaskManager
+from nexustrader.core.fixed_point import MarketFixedPoint
+from nexustrader.core.pnl import PnLEngine
 from nexustrader.error import OrderError
 from nexustrader.constants import (
     OrderSide,
@@ -61,6 +63,10 @@ class PublicConnector(ABC):
     def account_type(self):
         return self._account_type
 
+    def ws_clients(self) -> List[WSClient]:
+        """Every websocket client of the connector"""
+        return [self._ws_client]
+
     @abstractmethod
     def request_klines(
         self,
@@ -105,6 +111,7 @@ class PrivateConnector(ABC):
         api_client: ApiClient,
         msgbus: MessageBus,
         cache: AsyncCache,
+        task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
     ):
         self._log = SpdLog.get_logger(
@@ -119,6 +126,7 @@ class PrivateConnector(ABC):
         self._cache = cache
         self._clock = LiveClock()
         self._msgbus: MessageBus = msgbus
+        self._task_manager = task_manager
 
         if rate_limit:
             self._limiter = AsyncLimiter(rate_limit.max_rate, rate_limit.time_period)
@@ -129,6 +137,10 @@ class PrivateConnector(ABC):
     def account_type(self):
         return self._account_type
 
+    def ws_clients(self) -> List[WSClient]:
+        """Every websocket client of the connector"""
+        return [self._ws_client]
+
     @abstractmethod
     async def _init_account_balance(self):
         """Initialize the account balance"""
@@ -193,11 +205,87 @@ class PrivateConnector(ABC):
         """Cancel an order"""
         pass
 
+    @abstractmethod
+    async def amend_order(
+        self,
+        symbol: str,
+        order_id: str,
+        side: OrderSide,
+        price: Decimal | None,
+        amount: Decimal,
+        **kwargs,
+    ) -> Order:
+        """Amend the price and amount of an open order, keeping its id"""
+        pass
+
+    @abstractmethod
+    async def cancel_all_orders(self, symbol: str) -> List[str] | None:
+        """
+        Cancel all open orders of a symbol, returns the ids of the orders the exchange
+        failed to cancel, None if the request failed
+        """
+        pass
+
+    @abstractmethod
+    async def get_server_time(self) -> int:
+        """Exchange server time in ms, sampled by `ClockSync`"""
+        pass
+
+    def http_pool_stats(self) -> Dict[str, HttpPoolStats]:
+        """REST connection pool stats per host"""
+        return self._api_client.pool_stats()
+
+    def set_time_offset(self, offset_ms: int, recv_window: int | None = None):
+        """Apply the clock offset estimated by `ClockSync` to the signed requests"""
+        self._api_client.set_time_offset(offset_ms, recv_window)
+        for ws_client in self.ws_clients():
+            ws_client.set_time_offset(offset_ms, recv_window)
+
+    @staticmethod
+    def _chunks(items: List, size: int) -> List[List]:
+        return [items[i : i + size] for i in range(0, len(items), size)]
+
+    async def create_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        """Create orders, returns one `Order` per submit in the same order
+
+        Exchanges with a batch endpoint override this, the default sends one request per order.
+        """
+        return await asyncio.gather(
+            *(
+                self.create_order(
+                    symbol=order.symbol,
+                    side=order.side,
+                    type=order.type,
+                    amount=order.amount,
+                    price=order.price,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    **order.kwargs,
+                )
+                for order in orders
+            )
+        )
+
+    async def cancel_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        """Cancel orders by `OrderSubmit.order_id`, returns one `Order` per submit in the same order
+
+        Exchanges with a batch endpoint override this, the default sends one request per order.
+        """
+        return await asyncio.gather(
+            *(
+                self.cancel_order(
+                    symbol=order.symbol, order_id=order.order_id, **order.kwargs
+                )
+                for order in orders
+            )
+        )
+
     @abstractmethod
     async def connect(self):
         """Connect to the exchange"""
         await self._init_account_balance()
         await self._init_position()
+        await self._api_client.warmup(self._task_manager)
 
     async def disconnect(self):
         """Disconnect from the exchange"""
@@ -212,6 +300,12 @@ class MockLinearConnector:
 
     close long -> cache.update_position -> cache.update_balance -> realized_pnl
     close short -> cache.update_position -> cache.update_balance -> realized_pnl
+
+    With `fixed_point`, positions are kept as int lots and the entry cost as int
+    lots * ticks, the realized pnl of a fill is an exact integer.
+
+    With `pnl_engine`, `unrealized_pnl` and `total_notional` are the running totals of the
+    account instead of a pass over the positions.
     """
 
     def __init__(
@@ -228,6 +322,8 @@ class MockLinearConnector:
         quote_currency: str = "USDT",
         update_interval: int = 60, # seconds
         leverage: int = 1,
+        fixed_point: bool = False,
+        pnl_engine: PnLEngine | None = None,
     ):
         self._account_type = account_type
         self._market = exchange.market
@@ -244,6 +340,11 @@ class MockLinearConnector:
         self._clock = LiveClock()
         self._task_manager = task_manager
         self._leverage = leverage
+        self._fixed_point = fixed_point
+        self._fixed_points: Dict[str, MarketFixedPoint] = {}
+        # symbol -> signed lots, cost: sum of signed lots * ticks of the open amount
+        self._fixed_positions: Dict[str, Tuple[int, int]] = {}
+        self._pnl_engine = pnl_engine
         self._log = SpdLog.get_logger(
             name=type(self).__name__, level="DEBUG", flush=True
         )
@@ -397,6 +498,8 @@ class MockLinearConnector:
     
     @property
     def unrealized_pnl(self) -> float:
+        if self._pnl_engine:
+            return self._pnl_engine.account(self._account_type).unrealized_pnl
         pnl = 0
         for _, position in self._cache.get_all_positions(
             self._exchange_id
@@ -406,6 +509,8 @@ class MockLinearConnector:
     
     @property
     def total_notional(self) -> float:
+        if self._pnl_engine:
+            return self._pnl_engine.account(self._account_type).notional
         notional = 0
         for symbol, position in self._cache.get_all_positions(
             self._exchange_id
@@ -429,7 +534,7 @@ class MockLinearConnector:
                 self._log.warn(
                     f"Please subscribe to the `bookl1` data for {symbol} or data not ready"
                 )
-                return
+                continue
 
             if position.is_long:
                 unrealized_pnl = float(position.amount) * (book.mid - position.entry_price)
@@ -441,8 +546,11 @@ class MockLinearConnector:
         """
         apply fee to the balance
         """
-        self._cache._mem_account_balance[self._account_type]._update_free(
-            order.fee_currency, -order.fee
+        account_balance = self._cache._mem_account_balance[self._account_type]
+        account_balance._update_free(order.fee_currency, -order.fee)
+        # fee and realized pnl are applied in place, in the quote currency: publish it
+        self._cache._apply_balance(
+            self._account_type, [account_balance.balances[order.fee_currency]]
         )
 
     def _apply_position(self, order: Order):
@@ -454,6 +562,11 @@ class MockLinearConnector:
 
         position = self._cache.get_position(symbol).value_or(None)
 
+        if self._fixed_point:
+            self._cache._apply_position(self._apply_fixed_fill(order, market, position))
+            self._apply_fee(order)
+            return
+
         # Handle new position creation
         if not position or position.is_closed:
             if order.is_buy:
@@ -513,6 +626,70 @@ class MockLinearConnector:
         self._cache._apply_position(position)
         self._apply_fee(order)
         
+    def _apply_fixed_fill(
+        self, order: Order, market: BaseMarket, position: Position | None
+    ) -> Position:
+        """Update the position with a fill, on int lots and ticks"""
+        fixed_point = self._fixed_points.get(order.symbol)
+        if fixed_point is None:
+            fixed_point = MarketFixedPoint.from_market(market)
+            self._fixed_points[order.symbol] = fixed_point
+        try:
+            lots = fixed_point.lots(order.amount)
+            ticks = fixed_point.ticks(order.price)
+        except ValueError as e:
+            raise OrderError(f"Symbol {order.symbol}: {e}")
+        if order.is_sell:
+            lots = -lots
+
+        if not position or position.is_closed:
+            position = Position(symbol=order.symbol, exchange=self._exchange_id)
+            signed_lots, cost = 0, 0
+        else:
+            signed_lots, cost = self._fixed_positions.get(order.symbol) or (
+                self._restore_fixed_position(fixed_point, position)
+            )
+
+        realized = 0
+        if signed_lots == 0 or (signed_lots > 0) == (lots > 0):
+            signed_lots += lots
+            cost += lots * ticks
+        else:
+            sign = 1 if signed_lots > 0 else -1
+            closed = min(abs(signed_lots), abs(lots))
+            # closing all the lots takes all the cost, the realized pnl adds up exactly
+            closed_cost = cost * closed // abs(signed_lots)
+            realized = sign * closed * ticks - closed_cost
+            signed_lots += lots
+            cost -= closed_cost
+            if signed_lots and (signed_lots > 0) != (sign > 0):  # flipped
+                cost = signed_lots * ticks
+                position.unrealized_pnl = 0
+        self._fixed_positions[order.symbol] = (signed_lots, cost)
+
+        position.signed_amount = fixed_point.size.to_decimal(signed_lots)
+        if signed_lots:
+            position.side = PositionSide.LONG if signed_lots > 0 else PositionSide.SHORT
+            position.entry_price = fixed_point.price.to_float(cost / signed_lots)
+        else:
+            position.side = None
+        if realized:
+            realized_pnl = fixed_point.notional(realized)
+            position.realized_pnl += float(realized_pnl)
+            self._cache._mem_account_balance[self._account_type]._update_free(
+                market.quote, realized_pnl
+            )
+        return position
+
+    @staticmethod
+    def _restore_fixed_position(
+        fixed_point: MarketFixedPoint, position: Position
+    ) -> Tuple[int, int]:
+        """Lots and cost of a position loaded from the db, its entry price is an average"""
+        signed_lots = fixed_point.lots(position.signed_amount)
+        cost = round(position.entry_price * fixed_point.price.scale * signed_lots)
+        return signed_lots, cost
+
     async def _handle_pnl_update(self):
         while True:
             pnl, unrealized_pnl = self.pnl, self.unrealized_pnl
@@ -527,6 +704,9 @@ class MockLinearConnector:
         await self._init_balance()
         self._task_manager.create_task(self._handle_pnl_update())
     
+    def ws_clients(self) -> List[WSClient]:
+        return []
+
     async def disconnect(self):
         await self._cache._sync_pnl(self._clock.timestamp_ms(), self.pnl, self.unrealized_pnl)
 
@@ -1,25 +1,37 @@
 import asyncio
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from functools import partial
+from typing import Dict, List, Set, Tuple
 from typing import Literal
 from decimal import Decimal
-from decimal import ROUND_HALF_UP, ROUND_CEILING, ROUND_FLOOR
 
-from nexustrader.schema import Order, BaseMarket
+import numpy as np
+
+from nexustrader.schema import Order, BaseMarket, BookL1, Trade
 from nexustrader.core.log import SpdLog
 from nexustrader.core.entity import TaskManager
 from nexustrader.core.nautilius_core import MessageBus, LiveClock
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.event_log import EventLog
+from nexustrader.core.timer import TimerWheel
+from nexustrader.core.quantizer import Quantizer
+from nexustrader.core.fixed_point import MarketFixedPoint
+from nexustrader.core.risk import RiskEngine
 from nexustrader.constants import (
     AccountType,
     SubmitType,
-    OrderType,
     OrderSide,
+    OrderStatus,
     AlgoOrderStatus,
 )
-from nexustrader.schema import OrderSubmit, AlgoOrder
+from nexustrader.schema import OrderSubmit, BatchOrderSubmit, AlgoOrder, InstrumentId
 from nexustrader.base.connector import PrivateConnector
+from nexustrader.base.exec_algorithm import EXEC_ALGORITHMS, ExecAlgorithm
+
+
+# algorithm of the algo submit types submitted without `exec_algorithm`
+ALGO_SUBMIT_TYPES = {SubmitType.TWAP: "twap", SubmitType.VWAP: "vwap"}
 
 
 class ExecutionManagementSystem(ABC):
@@ -42,15 +54,96 @@ class ExecutionManagementSystem(ABC):
         self._task_manager = task_manager
         self._registry = registry
         self._clock = LiveClock()
-        self._order_submit_queues: Dict[AccountType, asyncio.Queue[OrderSubmit]] = {}
+        self._order_submit_queues: Dict[
+            AccountType, asyncio.Queue[OrderSubmit | BatchOrderSubmit]
+        ] = {}
         self._private_connectors: Dict[AccountType, PrivateConnector] | None = None
         self._is_mock = is_mock
-        
+        self._event_log: EventLog | None = None
+        self._risk_engine: RiskEngine | None = None
+        self._market_quantizers: Dict[str, Tuple[Quantizer, Quantizer]] = {}
+        self._market_fixed_points: Dict[str, MarketFixedPoint] = {}
+        self._timers = TimerWheel(clock=self._clock)
+        self._algos: Dict[str, ExecAlgorithm] = {}  # algo uuid -> algo
+        self._algo_children: Dict[str, ExecAlgorithm] = {}  # open child uuid -> algo
+        # topic -> symbol -> algos, the topic is subscribed once an algo needs it
+        self._algo_market_data: Dict[str, Dict[str, Set[ExecAlgorithm]]] = {}
+        self._msgbus.subscribe(topic="order_status", handler=self._on_order_status)
+
+    def set_event_log(self, event_log: EventLog | None):
+        """Log every order submit and order update sent to the strategy"""
+        self._event_log = event_log
+
+    def set_risk_engine(self, risk_engine: RiskEngine | None):
+        """Check every order to create with the pre-trade risk rules"""
+        self._risk_engine = risk_engine
+
+    def _risk_rejected(self, order_submit: OrderSubmit) -> Order | None:
+        """
+        The FAILED order of an order rejected by the risk engine, None if accepted
+        """
+        if self._risk_engine is None:
+            return None
+        reason = self._risk_engine.check(order_submit)
+        if reason is None:
+            return None
+        self._log.warn(
+            f"[RISK REJECTED] {reason}: symbol: {order_submit.symbol}, side: {order_submit.side}, amount: {order_submit.amount}, price: {order_submit.price}, uuid: {order_submit.uuid}"
+        )
+        order = Order(
+            exchange=order_submit.instrument_id.exchange,
+            symbol=order_submit.symbol,
+            status=OrderStatus.FAILED,
+            uuid=order_submit.uuid,
+            amount=order_submit.amount,
+            filled=Decimal(0),
+            remaining=order_submit.amount,
+            timestamp=self._clock.timestamp_ms(),
+            type=order_submit.type,
+            side=order_submit.side,
+            time_in_force=order_submit.time_in_force,
+            price=float(order_submit.price) if order_submit.price is not None else None,
+            trigger_price=float(order_submit.trigger_price)
+            if order_submit.trigger_price is not None
+            else None,
+            position_side=order_submit.position_side,
+        )
+        self._cache._order_status_update(order)  # INITIALIZED -> FAILED
+        self._send_order("failed", order)
+        return order
+
+    def set_timer_wheel(self, timers: TimerWheel):
+        """Run the algo timers on a wheel shared with the strategy"""
+        self._timers = timers
+
+    def _send_order(self, endpoint: str, order: Order):
+        if self._event_log:
+            self._event_log.order(endpoint, order)
+        self._msgbus.send(endpoint=endpoint, msg=order)
+        self._msgbus.publish(topic="order_status", msg=order)
+
     def _build(self, private_connectors: Dict[AccountType, PrivateConnector]):
         self._private_connectors = private_connectors
         self._build_order_submit_queues()
         self._set_account_type()
 
+    def _quantizers(self, symbol: str) -> Tuple[Quantizer, Quantizer]:
+        """Amount and price quantizers of the market, built on first use"""
+        quantizers = self._market_quantizers.get(symbol)
+        if quantizers is None:
+            precision = self._market[symbol].precision
+            quantizers = Quantizer(precision.amount), Quantizer(precision.price)
+            self._market_quantizers[symbol] = quantizers
+        return quantizers
+
+    def _fixed_point(self, symbol: str) -> MarketFixedPoint:
+        """Tick and lot conversion of the market, built on first use"""
+        fixed_point = self._market_fixed_points.get(symbol)
+        if fixed_point is None:
+            fixed_point = MarketFixedPoint.from_market(self._market[symbol])
+            self._market_fixed_points[symbol] = fixed_point
+        return fixed_point
+
     def _amount_to_precision(
         self,
         symbol: str,
@@ -60,30 +153,7 @@ class ExecutionManagementSystem(ABC):
         """
         Convert the amount to the precision of the market
         """
-        market = self._market[symbol]
-        amount: Decimal = Decimal(str(amount))
-        precision = market.precision.amount
-
-        if precision >= 1:
-            exp = Decimal(int(precision))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(precision))
-
-        if mode == "round":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_amount = (amount / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_amount
+        return self._quantizers(symbol)[0].quantize(amount, mode)
 
     def _price_to_precision(
         self,
@@ -94,31 +164,29 @@ class ExecutionManagementSystem(ABC):
         """
         Convert the price to the precision of the market
         """
-        market = self._market[symbol]
-        price: Decimal = Decimal(str(price))
+        return self._quantizers(symbol)[1].quantize(price, mode)
 
-        decimal = market.precision.price
+    def _amounts_to_precision(
+        self,
+        symbol: str,
+        amounts: np.ndarray,
+        mode: Literal["round", "ceil", "floor"] = "round",
+    ) -> np.ndarray:
+        """
+        Convert an array of amounts to the precision of the market, as float64
+        """
+        return self._quantizers(symbol)[0].quantize_array(amounts, mode)
 
-        if decimal >= 1:
-            exp = Decimal(int(decimal))
-            precision_decimal = Decimal("1")
-        else:
-            exp = Decimal("1")
-            precision_decimal = Decimal(str(decimal))
-
-        if mode == "round":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_HALF_UP
-            ) * exp
-        elif mode == "ceil":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_CEILING
-            ) * exp
-        elif mode == "floor":
-            format_price = (price / exp).quantize(
-                precision_decimal, rounding=ROUND_FLOOR
-            ) * exp
-        return format_price
+    def _prices_to_precision(
+        self,
+        symbol: str,
+        prices: np.ndarray,
+        mode: Literal["round", "ceil", "floor"] = "round",
+    ) -> np.ndarray:
+        """
+        Convert an array of prices to the precision of the market, as float64
+        """
+        return self._quantizers(symbol)[1].quantize_array(prices, mode)
 
     @abstractmethod
     def _build_order_submit_queues(self):
@@ -134,6 +202,13 @@ class ExecutionManagementSystem(ABC):
         """
         pass
 
+    @abstractmethod
+    def _instrument_id_to_account_type(self, instrument_id: InstrumentId) -> AccountType:
+        """
+        Get the account type of the instrument
+        """
+        pass
+
     @abstractmethod
     def _submit_order(
         self, order: OrderSubmit, account_type: AccountType | None = None
@@ -143,6 +218,27 @@ class ExecutionManagementSystem(ABC):
         """
         pass
 
+    def _submit_orders(
+        self,
+        orders: List[OrderSubmit],
+        submit_type: SubmitType,
+        account_type: AccountType | None = None,
+    ):
+        """
+        Submit orders as one `BatchOrderSubmit` per account type
+        """
+        batches: Dict[AccountType, List[OrderSubmit]] = {}
+        for order in orders:
+            batches.setdefault(
+                account_type
+                or self._instrument_id_to_account_type(order.instrument_id),
+                [],
+            ).append(order)
+        for batch_account_type, batch in batches.items():
+            self._order_submit_queues[batch_account_type].put_nowait(
+                BatchOrderSubmit(submit_type=submit_type, orders=batch)
+            )
+
     async def _cancel_order(self, order_submit: OrderSubmit, account_type: AccountType):
         """
         Cancel an order
@@ -157,20 +253,105 @@ class ExecutionManagementSystem(ABC):
             order.uuid = order_submit.uuid
             if order.success:
                 self._cache._order_status_update(order)  # SOME STATUS -> CANCELING
-                self._msgbus.send(endpoint="canceling", msg=order)
+                self._send_order("canceling", order)
             else:
                 # self._cache._order_status_update(order) # SOME STATUS -> FAILED
-                self._msgbus.send(endpoint="cancel_failed", msg=order)
+                self._send_order("cancel_failed", order)
             return order
         else:
             self._log.error(
                 f"Order ID not found for UUID: {order_submit.uuid}, The order may already be canceled or filled or not exist"
             )
 
+    async def _cancel_all_orders(
+        self, order_submit: OrderSubmit, account_type: AccountType
+    ) -> List[Order]:
+        """
+        Cancel all open orders of a symbol with the exchange cancel all endpoint, the
+        cached open orders are marked CANCELING together once the request is accepted,
+        except the orders the exchange failed to cancel, sent as cancel failed
+        """
+        symbol = order_submit.symbol
+        uuids = list(self._cache.get_open_orders(symbol=symbol))
+        if self._is_mock:
+            return [
+                await self._cancel_order(
+                    OrderSubmit(
+                        symbol=symbol,
+                        instrument_id=order_submit.instrument_id,
+                        submit_type=SubmitType.CANCEL,
+                        uuid=uuid,
+                    ),
+                    account_type,
+                )
+                for uuid in uuids
+            ]
+
+        failed_ids = await self._private_connectors[account_type].cancel_all_orders(
+            symbol=symbol
+        )
+        if failed_ids is None:  # the request failed
+            failed = set(uuids)
+        else:
+            failed_ids = set(failed_ids)
+            failed = {
+                uuid for uuid in uuids if self._registry.get_order_id(uuid) in failed_ids
+            }
+        if failed:
+            self._log.error(
+                f"[CANCEL ALL FAILED] symbol: {symbol}, {len(failed)}/{len(uuids)} orders not canceled: {sorted(failed)}"
+            )
+            for uuid in failed:
+                order = self._cache.get_order(uuid).value_or(None)
+                if order:
+                    self._send_order("cancel_failed", order)
+
+        orders = self._cache._orders_canceling(
+            [uuid for uuid in uuids if uuid not in failed], self._clock.timestamp_ms()
+        )  # SOME STATUS -> CANCELING
+        for order in orders:
+            self._send_order("canceling", order)
+        return orders
+
+    async def _amend_order(self, order_submit: OrderSubmit, account_type: AccountType):
+        """
+        Amend an order, the missing price or amount is taken from the cached order
+        """
+        order_id = self._registry.get_order_id(order_submit.uuid)
+        cached_order: Order | None = self._cache.get_order(order_submit.uuid).value_or(
+            None
+        )
+        if not order_id or not cached_order or cached_order.is_closed:
+            self._log.error(
+                f"Open order not found for UUID: {order_submit.uuid}, The order may already be canceled or filled or not exist"
+            )
+            return
+
+        price = order_submit.price
+        if price is None and cached_order.price is not None:
+            price = Decimal(str(cached_order.price))
+        order: Order = await self._private_connectors[account_type].amend_order(
+            symbol=order_submit.symbol,
+            order_id=order_id,
+            side=cached_order.side,
+            price=price,
+            amount=order_submit.amount or cached_order.amount,
+            **order_submit.kwargs,
+        )
+        order.uuid = order_submit.uuid
+        if order.success:
+            order = self._cache._order_amended(order) or order
+            self._send_order("amended", order)
+        else:
+            self._send_order("amend_failed", order)
+        return order
+
     async def _create_order(self, order_submit: OrderSubmit, account_type: AccountType):
         """
         Create an order
         """
+        if rejected := self._risk_rejected(order_submit):
+            return rejected
         order: Order = await self._private_connectors[account_type].create_order(
             symbol=order_submit.symbol,
             side=order_submit.side,
@@ -185,18 +366,90 @@ class ExecutionManagementSystem(ABC):
         if order.success:
             self._registry.register_order(order)
             self._cache._order_initialized(order) # INITIALIZED -> PENDING
-            self._msgbus.send(endpoint="pending", msg=order)
+            self._send_order("pending", order)
         else:
             self._cache._order_status_update(order) # INITIALIZED -> FAILED
-            self._msgbus.send(endpoint="failed", msg=order)
+            self._send_order("failed", order)
         return order
 
+    async def _create_batch_orders(
+        self, batch_submit: BatchOrderSubmit, account_type: AccountType
+    ) -> List[Order]:
+        """
+        Create orders with the exchange batch endpoint
+        """
+        if self._is_mock:
+            return [
+                await self._create_order(order_submit, account_type)
+                for order_submit in batch_submit.orders
+            ]
+
+        # the orders rejected by the risk engine keep their position in the result
+        results: List[Order | None] = [
+            self._risk_rejected(order_submit) for order_submit in batch_submit.orders
+        ]
+        order_submits = [
+            order_submit
+            for order_submit, rejected in zip(batch_submit.orders, results)
+            if rejected is None
+        ]
+        if not order_submits:
+            return results
+
+        orders: List[Order] = await self._private_connectors[
+            account_type
+        ].create_batch_orders(order_submits)
+        for order_submit, order in zip(order_submits, orders):
+            order.uuid = order_submit.uuid
+            if order.success:
+                self._registry.register_order(order)
+                self._cache._order_initialized(order)  # INITIALIZED -> PENDING
+                self._send_order("pending", order)
+            else:
+                self._cache._order_status_update(order)  # INITIALIZED -> FAILED
+                self._send_order("failed", order)
+        accepted = iter(orders)
+        return [order if order is not None else next(accepted) for order in results]
+
+    async def _cancel_batch_orders(
+        self, batch_submit: BatchOrderSubmit, account_type: AccountType
+    ) -> List[Order]:
+        """
+        Cancel orders with the exchange batch endpoint
+        """
+        order_submits: List[OrderSubmit] = []
+        for order_submit in batch_submit.orders:
+            order_id = self._registry.get_order_id(order_submit.uuid)
+            if order_id:
+                order_submit.order_id = order_id
+                order_submits.append(order_submit)
+            else:
+                self._log.error(
+                    f"Order ID not found for UUID: {order_submit.uuid}, The order may already be canceled or filled or not exist"
+                )
+        if not order_submits:
+            return []
+
+        orders: List[Order] = await self._private_connectors[
+            account_type
+        ].cancel_batch_orders(order_submits)
+        for order_submit, order in zip(order_submits, orders):
+            order.uuid = order_submit.uuid
+            if order.success:
+                self._cache._order_status_update(order)  # SOME STATUS -> CANCELING
+                self._send_order("canceling", order)
+            else:
+                self._send_order("cancel_failed", order)
+        return orders
+
     async def _create_stop_loss_order(
         self, order_submit: OrderSubmit, account_type: AccountType
     ):
         """
         Create a stop loss order
         """
+        if rejected := self._risk_rejected(order_submit):
+            return rejected
         order: Order = await self._private_connectors[
             account_type
         ].create_stop_loss_order(
@@ -215,10 +468,10 @@ class ExecutionManagementSystem(ABC):
         if order.success:
             self._registry.register_order(order)
             self._cache._order_initialized(order)  # INITIALIZED -> PENDING
-            self._msgbus.send(endpoint="pending", msg=order)
+            self._send_order("pending", order)
         else:
             self._cache._order_status_update(order)  # INITIALIZED -> FAILED
-            self._msgbus.send(endpoint="failed", msg=order)
+            self._send_order("failed", order)
         return order
 
     async def _create_take_profit_order(
@@ -227,6 +480,8 @@ class ExecutionManagementSystem(ABC):
         """
         Create a take profit order
         """
+        if rejected := self._risk_rejected(order_submit):
+            return rejected
         order: Order = await self._private_connectors[
             account_type
         ].create_take_profit_order(
@@ -245,10 +500,10 @@ class ExecutionManagementSystem(ABC):
         if order.success:
             self._registry.register_order(order)
             self._cache._order_initialized(order)  # INITIALIZED -> PENDING
-            self._msgbus.send(endpoint="pending", msg=order)
+            self._send_order("pending", order)
         else:
             self._cache._order_status_update(order)  # INITIALIZED -> FAILED
-            self._msgbus.send(endpoint="failed", msg=order)
+            self._send_order("failed", order)
         return order
 
     @abstractmethod
@@ -333,206 +588,94 @@ class ExecutionManagementSystem(ABC):
             else:
                 price = book.ask
         price = self._price_to_precision(symbol, price)
-        self._log.debug(f"CALCULATE LIMIT ORDER PRICE: symbol: {symbol}, side: {side}, price: {price}, ask: {book.ask}, bid: {book.bid}")
+        self._log.debug("CALCULATE LIMIT ORDER PRICE: symbol: %s, side: %s, price: %s, ask: %s, bid: %s", symbol, side, price, book.ask, book.bid)
         return price
 
-    async def _twap_order(self, order_submit: OrderSubmit, account_type: AccountType):
+    async def _create_algo_order(
+        self, order_submit: OrderSubmit, account_type: AccountType
+    ):
         """
-        Execute the twap order
+        Create an algo order hosted by the `ExecAlgorithm` registered under
+        `order_submit.exec_algorithm`
         """
-        symbol = order_submit.symbol
-        instrument_id = order_submit.instrument_id
-        side = order_submit.side
-        market = self._market[symbol]
-        position_side = order_submit.position_side
-        kwargs = order_submit.kwargs
-        twap_uuid = order_submit.uuid
-        check_interval = order_submit.check_interval
-        reduce_only = order_submit.kwargs.get("reduce_only", False)
-        
+        name = order_submit.exec_algorithm or ALGO_SUBMIT_TYPES.get(
+            order_submit.submit_type, "unknown"
+        )
         algo_order = AlgoOrder(
-            symbol=symbol,
-            uuid=twap_uuid,
-            side=side,
+            symbol=order_submit.symbol,
+            uuid=order_submit.uuid,
+            side=order_submit.side,
             amount=order_submit.amount,
             duration=order_submit.duration,
             wait=order_submit.wait,
             status=AlgoOrderStatus.RUNNING,
-            exchange=instrument_id.exchange,
+            exchange=order_submit.instrument_id.exchange,
             timestamp=self._clock.timestamp_ms(),
-            position_side=position_side,
+            position_side=order_submit.position_side,
+            algorithm=name,
         )
-
         self._cache._order_initialized(algo_order)
 
-        min_order_amount: Decimal = self._get_min_order_amount(symbol, market)
-        amount_list, wait = self._calculate_twap_orders(
-            symbol=symbol,
-            total_amount=order_submit.amount,
-            duration=order_submit.duration,
-            wait=order_submit.wait,
-            min_order_amount=min_order_amount,
-            reduce_only=reduce_only,
-        )
-
-        order_id = None
-        elapsed_time = 0
-
         try:
-            while amount_list:
-                if order_id:
-                    order = self._cache.get_order(order_id)
-
-                    is_opened = order.bind_optional(
-                        lambda order: order.is_opened
-                    ).value_or(False)
-                    on_flight = order.bind_optional(
-                        lambda order: order.on_flight
-                    ).value_or(False)
-                    is_closed = order.bind_optional(
-                        lambda order: order.is_closed
-                    ).value_or(False)
-
-                    # 检查现价单是否已成交，不然的话立刻下市价单成交 或者 把remaining amount加到下一个市价单上
-                    if is_opened and not on_flight:
-                        await self._cancel_order(
-                            order_submit=OrderSubmit(
-                                symbol=symbol,
-                                instrument_id=instrument_id,
-                                submit_type=SubmitType.CANCEL,
-                                uuid=order_id,
-                            ),
-                            account_type=account_type,
-                        )
-                    elif is_closed:
-                        order_id = None
-                        remaining = order.unwrap().remaining
-                        if remaining >= min_order_amount or (reduce_only and remaining > 0):
-                            order = await self._create_order(
-                                order_submit=OrderSubmit(
-                                    symbol=symbol,
-                                    instrument_id=instrument_id,
-                                    submit_type=SubmitType.CREATE,
-                                    side=side,
-                                    type=OrderType.MARKET,
-                                    amount=remaining,
-                                    position_side=position_side,
-                                    kwargs=kwargs,
-                                ),
-                                account_type=account_type,
-                            )
-                            if order.success:
-                                algo_order.orders.append(order.uuid)
-                                self._cache._order_status_update(algo_order)
-                            else:
-                                algo_order.status = AlgoOrderStatus.FAILED
-                                self._cache._order_status_update(algo_order)
-                                self._log.error(
-                                    f"TWAP ORDER FAILED: symbol: {symbol}, side: {side}"
-                                )
-                                break
-                        else:
-                            if amount_list:
-                                amount_list[-1] += remaining
-                    await asyncio.sleep(check_interval)
-                    elapsed_time += check_interval
-                else:
-                    price = self._cal_limit_order_price(
-                        symbol=symbol,
-                        side=side,
-                        market=market,
-                    )
-                    amount = amount_list.pop()
-                    if amount_list:
-                        order_submit = OrderSubmit(
-                            symbol=symbol,
-                            instrument_id=instrument_id,
-                            submit_type=SubmitType.CREATE,
-                            type=OrderType.LIMIT,
-                            side=side,
-                            amount=amount,
-                            price=price,
-                            position_side=position_side,
-                            kwargs=kwargs,
-                        )
-                    else:
-                        order_submit = OrderSubmit(
-                            symbol=symbol,
-                            instrument_id=instrument_id,
-                            submit_type=SubmitType.CREATE,
-                            type=OrderType.MARKET,
-                            side=side,
-                            amount=amount,
-                            position_side=position_side,
-                            kwargs=kwargs,
-                        )
-                    order = await self._create_order(order_submit, account_type)
-                    if order.success:
-                        order_id = order.uuid
-                        algo_order.orders.append(order_id)
-                        self._cache._order_status_update(algo_order)
-                        await asyncio.sleep(wait - elapsed_time)
-                        elapsed_time = 0
-                    else:
-                        algo_order.status = AlgoOrderStatus.FAILED
-                        self._cache._order_status_update(algo_order)
-
-                        self._log.error(
-                            f"TWAP ORDER FAILED: symbol: {symbol}, side: {side}, uuid: {twap_uuid}"
-                        )
-                        break
-
-            algo_order.status = AlgoOrderStatus.FINISHED
+            algo = EXEC_ALGORITHMS[name](self, algo_order, order_submit, account_type)
+        except Exception as e:
+            algo_order.status = AlgoOrderStatus.FAILED
             self._cache._order_status_update(algo_order)
-
-            self._log.info(
-                f"TWAP ORDER FINISHED: symbol: {symbol}, side: {side}, uuid: {twap_uuid}"
+            self._log.error(
+                f"{name.upper()} ORDER FAILED: symbol: {order_submit.symbol}, uuid: {order_submit.uuid}, {type(e).__name__}: {e}"
             )
-        except asyncio.CancelledError:
-            algo_order.status = AlgoOrderStatus.CANCELING
-            self._cache._order_status_update(algo_order)
-
-            open_orders = self._cache.get_open_orders(symbol=symbol)
-            for uuid in open_orders.copy():
-                await self._cancel_order(
-                    order_submit=OrderSubmit(
-                        symbol=symbol,
-                        instrument_id=instrument_id,
-                        submit_type=SubmitType.CANCEL,
-                        uuid=uuid,
-                    ),
-                    account_type=account_type,
+            return
+
+        self._algos[algo_order.uuid] = algo
+        for topic in algo.market_data:
+            if topic not in self._algo_market_data:
+                self._algo_market_data[topic] = {}
+                self._msgbus.subscribe(
+                    topic=topic, handler=partial(self._on_algo_market_data, topic)
                 )
+            self._algo_market_data[topic].setdefault(algo.symbol, set()).add(algo)
+        algo.check()
 
-            algo_order.status = AlgoOrderStatus.CANCELED
-            self._cache._order_status_update(algo_order)
-
-            self._log.info(
-                f"TWAP ORDER CANCELLED: symbol: {symbol}, side: {side}, uuid: {twap_uuid}"
-            )
-
-    async def _create_twap_order(
+    async def _cancel_algo_order(
         self, order_submit: OrderSubmit, account_type: AccountType
     ):
         """
-        Create a twap order
+        Cancel an algo order
         """
-        uuid = order_submit.uuid
-        self._task_manager.create_task(
-            self._twap_order(order_submit, account_type), name=uuid
-        )
+        algo = self._algos.get(order_submit.uuid)
+        if algo is not None:
+            algo.cancel()
 
-    async def _cancel_twap_order(
-        self, order_submit: OrderSubmit, account_type: AccountType 
-    ):
+    def _remove_algo(self, algo: ExecAlgorithm):
+        if self._algos.pop(algo.algo_order.uuid, None) is None:
+            return
+        for topic in algo.market_data:
+            algos = self._algo_market_data[topic].get(algo.symbol)
+            algos.discard(algo)
+            if not algos:
+                del self._algo_market_data[topic][algo.symbol]
+
+    def _on_order_status(self, order: Order):
         """
-        Cancel a twap order
+        Handle the order status published by `_send_order`, only algo children matter
         """
-        uuid = order_submit.uuid
-        self._task_manager.cancel_task(uuid)
+        algo = self._algo_children.get(order.uuid)
+        if algo is not None:
+            algo._on_child_status(order)
+
+    def _on_algo_market_data(self, topic: str, data: BookL1 | Trade):
+        algos = self._algo_market_data[topic].get(data.symbol)
+        if algos:
+            for algo in tuple(algos):
+                if topic == "bookl1":
+                    algo._on_bookl1(data)
+                else:
+                    algo._on_trade(data)
 
     async def _handle_submit_order(
-        self, account_type: AccountType, queue: asyncio.Queue[OrderSubmit]
+        self,
+        account_type: AccountType,
+        queue: asyncio.Queue[OrderSubmit | BatchOrderSubmit],
     ):
         """
         Handle the order submit
@@ -540,16 +683,26 @@ class ExecutionManagementSystem(ABC):
         submit_handlers = {
             SubmitType.CANCEL: self._cancel_order,
             SubmitType.CREATE: self._create_order,
-            SubmitType.TWAP: self._create_twap_order,
-            SubmitType.CANCEL_TWAP: self._cancel_twap_order,
+            SubmitType.TWAP: self._create_algo_order,
+            SubmitType.CANCEL_TWAP: self._cancel_algo_order,
+            SubmitType.VWAP: self._create_algo_order,
+            SubmitType.CANCEL_VWAP: self._cancel_algo_order,
+            SubmitType.ALGO: self._create_algo_order,
+            SubmitType.CANCEL_ALGO: self._cancel_algo_order,
             SubmitType.STOP_LOSS: self._create_stop_loss_order,
             SubmitType.TAKE_PROFIT: self._create_take_profit_order,
+            SubmitType.BATCH_CREATE: self._create_batch_orders,
+            SubmitType.BATCH_CANCEL: self._cancel_batch_orders,
+            SubmitType.AMEND: self._amend_order,
+            SubmitType.CANCEL_ALL: self._cancel_all_orders,
         }
 
         self._log.debug(f"Handling orders for account type: {account_type}")
         while True:
             order_submit = await queue.get()
-            self._log.debug(f"[ORDER SUBMIT]: {order_submit}")
+            self._log.debug("[ORDER SUBMIT]: %s", order_submit)
+            if self._event_log:
+                self._event_log.submit(order_submit)
             handler = submit_handlers[order_submit.submit_type]
             await handler(order_submit, account_type)
             queue.task_done()
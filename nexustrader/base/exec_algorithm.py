@@ -0,0 +1,572 @@
+from abc import ABC, abstractmethod
+from decimal import Decimal
+from functools import partial
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Coroutine,
+    Dict,
+    List,
+    Set,
+    Tuple,
+    Type,
+)
+
+from nexustrader.constants import (
+    AccountType,
+    AlgoOrderStatus,
+    OrderStatus,
+    OrderType,
+    SubmitType,
+)
+from nexustrader.core.timer import TimerHandle
+from nexustrader.schema import AlgoOrder, BookL1, Kline, Order, OrderSubmit, Trade
+
+if TYPE_CHECKING:
+    from nexustrader.base.ems import ExecutionManagementSystem
+
+
+EXEC_ALGORITHMS: Dict[str, Type["ExecAlgorithm"]] = {}
+
+
+class ExecAlgorithm(ABC):
+    """
+    An algo order hosted by the EMS, one instance per `AlgoOrder`.
+
+    Subclasses register under a name with `class MyAlgo(ExecAlgorithm, name="my_algo")`
+    and are started with `Strategy.create_algo_order(..., algorithm="my_algo")`, the
+    algorithm parameters are in `params`. The algo decides what to do in `on_check`, which
+    is called whenever its state may have changed: a status event of a child order, the
+    algo timer, a `bookl1`/`trade` of the symbol for the topics listed in `market_data`,
+    and the end of an order request. Nothing runs in between, an idle algo costs nothing.
+
+    Order requests go through `run`, one at a time: `on_check` is not called while a request
+    is in flight, and called again once it returns True or if an event arrived meanwhile.
+    A failed request is retried with `retry`, after a backoff. The fills of the child
+    orders created with `create_child` are aggregated into the `AlgoOrder`.
+    """
+
+    name: ClassVar[str]
+    market_data: ClassVar[Tuple[str, ...]] = ()  # "bookl1" and/or "trade"
+    retry_delay: ClassVar[float] = 0.1  # seconds, doubled on each retry
+    max_retry_delay: ClassVar[float] = 5.0
+
+    def __init_subclass__(cls, name: str | None = None, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if name is not None:
+            cls.name = name
+            EXEC_ALGORITHMS[name] = cls
+
+    def __init__(
+        self,
+        ems: "ExecutionManagementSystem",
+        algo_order: AlgoOrder,
+        order_submit: OrderSubmit,
+        account_type: AccountType,
+    ):
+        self._ems = ems
+        self._log = ems._log
+        self._timers = ems._timers
+        self.algo_order = algo_order
+        self.order_submit = order_submit
+        self.account_type = account_type
+        self.symbol = order_submit.symbol
+        self.side = order_submit.side
+        self.market = ems._market[self.symbol]
+        self.params: Dict[str, Any] = order_submit.exec_params
+        self.reduce_only: bool = order_submit.kwargs.get("reduce_only", False)
+        self.min_order_amount: Decimal = ems._get_min_order_amount(
+            self.symbol, self.market
+        )
+        self.start_time = self._timers.time()
+
+        self.working: Set[str] = set()  # uuids of the open child orders
+        self.filled = Decimal("0")
+        self.cost = 0.0
+        self._child_fills: Dict[str, Tuple[Decimal, float]] = {}  # uuid -> filled, cost
+        self._timer: TimerHandle | None = None
+        self._busy = False
+        self._dirty = False  # an event arrived during the request
+        self._retry_timer: TimerHandle | None = None
+        self._retries = 0
+        self._cancel_requested = False
+
+    @property
+    def remaining(self) -> Decimal:
+        return self.algo_order.amount - self.filled
+
+    def is_tradable(self, amount: Decimal) -> bool:
+        """Whether `amount` can be sent as an order"""
+        return amount >= self.min_order_amount or (self.reduce_only and amount > 0)
+
+    def child(self, uuid: str) -> Order | None:
+        """The cached state of a child order"""
+        return self._ems._cache.get_order(uuid).value_or(None)
+
+    def open_amount(self) -> Decimal:
+        """Amount of the open child orders not filled yet"""
+        amount = Decimal("0")
+        for uuid in self.working:
+            order = self.child(uuid)
+            if order is not None and not order.is_closed:
+                amount += order.amount - (order.filled or Decimal("0"))
+        return amount
+
+    @abstractmethod
+    def on_check(self):
+        """
+        Decide the next action from the current state, start order requests with `run`
+        """
+        pass
+
+    def on_timer(self):
+        """Called when the timer set with `set_timer` is due, before `on_check`"""
+        pass
+
+    def on_bookl1(self, bookl1: BookL1):
+        """Called on the bookl1 of the symbol if "bookl1" is in `market_data`"""
+        pass
+
+    def on_trade(self, trade: Trade):
+        """Called on the trades of the symbol if "trade" is in `market_data`"""
+        pass
+
+    def check(self):
+        if self.algo_order.is_closed:
+            return
+        if self._busy:
+            self._dirty = True
+            return
+        if self._cancel_requested:
+            self.run(self._stop())
+            return
+        self.on_check()
+
+    def run(self, request: Coroutine[Any, Any, bool]):
+        """
+        Run an order request, `on_check` is called again if it returns True or if an event
+        arrived during the request
+        """
+        self._busy = True
+        self._dirty = False
+        self._ems._task_manager.create_task(self._run(request))
+
+    async def _run(self, request: Coroutine[Any, Any, bool]):
+        try:
+            recheck = await request
+        finally:
+            self._busy = False
+        if recheck:
+            self._retries = 0
+        if recheck or self._dirty:
+            # the child status events arrived during the request are read from the cache
+            self.check()
+
+    def retry(self, callback: Callable[[], Any]):
+        """
+        Call `callback`, then `on_check`, after a backoff doubling with each retry until a
+        request succeeds, e.g. to allow again a request that failed
+        """
+        delay = min(self.retry_delay * 2**self._retries, self.max_retry_delay)
+        self._retries += 1
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+        self._retry_timer = self._timers.call_later(delay, lambda: self._on_retry(callback))
+
+    def _on_retry(self, callback: Callable[[], Any]):
+        self._retry_timer = None
+        callback()
+        self.check()
+
+    def set_timer(self, when: float):
+        """Call `on_timer` at time `when` in seconds, replaces the pending timer"""
+        if self._timer is not None:
+            self._timer.cancel()
+        self._timer = self._timers.call_at(int(when * 1_000_000_000), self._on_timer)
+
+    def _on_timer(self):
+        self._timer = None
+        self.on_timer()
+        self.check()
+
+    def _on_bookl1(self, bookl1: BookL1):
+        self.on_bookl1(bookl1)
+        self.check()
+
+    def _on_trade(self, trade: Trade):
+        self.on_trade(trade)
+        self.check()
+
+    def _on_child_status(self, order: Order):
+        """Aggregate the fills of a child order into the algo order"""
+        filled = order.filled or Decimal("0")
+        prev_filled, prev_cost = self._child_fills.get(order.uuid, (Decimal("0"), 0.0))
+        if filled > prev_filled:
+            if order.average:
+                cost = order.average * float(filled)
+            else:
+                price = order.last_filled_price or order.price or 0.0
+                cost = prev_cost + price * float(filled - prev_filled)
+            self._child_fills[order.uuid] = (filled, cost)
+            self.filled += filled - prev_filled
+            self.cost += cost - prev_cost
+
+            algo_order = self.algo_order
+            algo_order.filled = self.filled
+            algo_order.cost = self.cost
+            algo_order.average = self.cost / float(self.filled)
+            self._ems._cache._order_status_update(algo_order)
+
+        if order.is_closed:
+            self.working.discard(order.uuid)
+            self._ems._algo_children.pop(order.uuid, None)
+        self.check()
+
+    async def create_child(
+        self, type: OrderType, amount: Decimal, price: Decimal | None = None
+    ) -> Order | None:
+        """
+        Create a child order, the algo fails if the order fails
+        """
+        order_submit = self.order_submit
+        order = await self._ems._create_order(
+            order_submit=OrderSubmit(
+                symbol=self.symbol,
+                instrument_id=order_submit.instrument_id,
+                submit_type=SubmitType.CREATE,
+                type=type,
+                side=self.side,
+                amount=amount,
+                price=price,
+                position_side=order_submit.position_side,
+                kwargs=order_submit.kwargs,
+            ),
+            account_type=self.account_type,
+        )
+        if not order.success:
+            self.finish(AlgoOrderStatus.FAILED)
+            return None
+        self.working.add(order.uuid)
+        self._ems._algo_children[order.uuid] = self
+        self.algo_order.orders.append(order.uuid)
+        self._ems._cache._order_status_update(self.algo_order)
+        return order
+
+    async def cancel_child(self, uuid: str) -> bool:
+        """
+        Cancel a child order, returns whether the cancel is accepted
+        """
+        order = await self._ems._cancel_order(
+            order_submit=OrderSubmit(
+                symbol=self.symbol,
+                instrument_id=self.order_submit.instrument_id,
+                submit_type=SubmitType.CANCEL,
+                uuid=uuid,
+            ),
+            account_type=self.account_type,
+        )
+        return order is not None and order.success
+
+    def cancel(self):
+        """
+        Cancel the algo and its open child orders, an order request in flight finishes first
+        """
+        if self._cancel_requested or self.algo_order.is_closed:
+            return
+        self._cancel_requested = True
+        self.algo_order.status = AlgoOrderStatus.CANCELING
+        self._ems._cache._order_status_update(self.algo_order)
+        self.check()
+
+    async def _stop(self) -> bool:
+        self._close(AlgoOrderStatus.CANCELING)
+        for uuid in list(self.working):
+            order = self.child(uuid)
+            # a pending order is live on the exchange too, only a canceling one is skipped
+            if order is not None and order.is_opened and order.status != OrderStatus.CANCELING:
+                await self.cancel_child(uuid)
+        self._close(AlgoOrderStatus.CANCELED)
+        self._log.info(
+            f"{self.name.upper()} ORDER CANCELLED: symbol: {self.symbol}, side: {self.side}, uuid: {self.algo_order.uuid}"
+        )
+        return False
+
+    def finish(self, status: AlgoOrderStatus = AlgoOrderStatus.FINISHED):
+        self._close(status)
+        if status == AlgoOrderStatus.FAILED:
+            self._log.error(
+                f"{self.name.upper()} ORDER FAILED: symbol: {self.symbol}, side: {self.side}, uuid: {self.algo_order.uuid}"
+            )
+        else:
+            self._log.info(
+                f"{self.name.upper()} ORDER FINISHED: symbol: {self.symbol}, side: {self.side}, uuid: {self.algo_order.uuid}"
+            )
+
+    def _close(self, status: AlgoOrderStatus):
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._retry_timer is not None:
+            self._retry_timer.cancel()
+            self._retry_timer = None
+        # the open children stay mapped, so their last fills are still aggregated
+        self._ems._remove_algo(self)
+        self.algo_order.status = status
+        self._ems._cache._order_status_update(self.algo_order)
+
+
+class TwapAlgorithm(ExecAlgorithm, name="twap"):
+    """
+    Split the amount into equal slices, one every `wait` seconds over `duration` seconds.
+    Each slice is a limit order at the touch, the last one a market order. A slice not
+    filled when the next one is due is canceled, its remaining amount is sent as a market
+    order or added to the next slice if below the min order amount.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # (seconds from the start the slice is due, amount), the next slice last
+        self.schedule: List[Tuple[float, Decimal]] = self.slices()
+        self.slice: str | None = None  # uuid of the working slice order
+        self.slice_due = False
+        self.canceling = False
+
+    def slices(self) -> List[Tuple[float, Decimal]]:
+        amount_list, wait = self._ems._calculate_twap_orders(
+            symbol=self.symbol,
+            total_amount=self.algo_order.amount,
+            duration=self.algo_order.duration,
+            wait=self.algo_order.wait,
+            min_order_amount=self.min_order_amount,
+            reduce_only=self.reduce_only,
+        )
+        n = len(amount_list)
+        return [(wait * (n - i), amount) for i, amount in enumerate(amount_list)]
+
+    def on_timer(self):
+        self.slice_due = True
+
+    def on_check(self):
+        if self.slice is None:
+            self.run(self._next_slice())
+            return
+        if not self.slice_due:
+            return
+
+        order = self.child(self.slice)
+        if order is None or order.is_closed:
+            self.run(self._close_slice(order))
+        elif not order.on_flight and not self.canceling:
+            self.run(self._cancel_slice())
+
+    async def _next_slice(self) -> bool:
+        if not self.schedule:
+            self.finish()
+            return False
+
+        due, amount = self.schedule.pop()
+        if self.schedule:
+            price = self._ems._cal_limit_order_price(
+                symbol=self.symbol, side=self.side, market=self.market
+            )
+            order = await self.create_child(OrderType.LIMIT, amount, price)
+        else:
+            order = await self.create_child(OrderType.MARKET, amount)
+        if order is None:
+            return False
+
+        self.slice = order.uuid
+        self.slice_due = False
+        self.canceling = False
+        self.set_timer(self.start_time + due)
+        return True
+
+    async def _close_slice(self, order: Order | None) -> bool:
+        self.slice = None
+        remaining = order.remaining if order and order.remaining else Decimal("0")
+        if self.is_tradable(remaining):
+            if await self.create_child(OrderType.MARKET, remaining) is None:
+                return False
+        elif self.schedule:
+            due, amount = self.schedule[-1]
+            self.schedule[-1] = (due, amount + remaining)
+        return True
+
+    async def _cancel_slice(self) -> bool:
+        self.canceling = True
+        if not await self.cancel_child(self.slice):
+            # likely filled meanwhile, its status event is handled on the recheck; the
+            # cancel is allowed again after a backoff in case the order is still open
+            self.retry(partial(self._allow_cancel, self.slice))
+            return False
+        return True
+
+    def _allow_cancel(self, uuid: str):
+        if self.slice == uuid:
+            self.canceling = False
+
+
+class VwapAlgorithm(TwapAlgorithm, name="vwap"):
+    """
+    TWAP whose slice amounts follow a volume profile over `duration` seconds: `profile`
+    holds the relative volume of equal time buckets, see `volume_profile`. Buckets below
+    the min order amount are merged into the next one.
+    """
+
+    def slices(self) -> List[Tuple[float, Decimal]]:
+        profile: List[float] = self.params["profile"]
+        total = self.algo_order.amount
+        bucket = self.algo_order.duration / len(profile)
+        volume = sum(profile)
+        if volume <= 0:
+            profile, volume = [1.0] * len(profile), float(len(profile))
+
+        schedule: List[Tuple[float, Decimal]] = []
+        pending = Decimal("0")
+        for i, weight in enumerate(profile):
+            pending += self._ems._amount_to_precision(
+                self.symbol, float(total) * weight / volume, mode="floor"
+            )
+            if pending >= self.min_order_amount:
+                schedule.append(((i + 1) * bucket, pending))
+                pending = Decimal("0")
+
+        rest = total - sum(amount for _, amount in schedule)
+        if schedule:
+            schedule[-1] = (self.algo_order.duration, schedule[-1][1] + rest)
+        elif self.is_tradable(rest):
+            schedule.append((self.algo_order.duration, rest))
+        self._log.info(
+            f"VWAP ORDER: {self.symbol} Schedule: {schedule}"
+        )
+        return schedule[::-1]
+
+
+class PovAlgorithm(ExecAlgorithm, name="pov"):
+    """
+    Trade `rate` (e.g. 0.1 for 10%) of the volume of the symbol traded since the start,
+    with market orders of at least the min order amount and at most `max_clip` if given.
+    Finishes once the amount is filled, or after `duration` seconds if given. The trades
+    of the symbol must be subscribed, the own fills are part of the traded volume.
+    """
+
+    market_data = ("trade",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rate = float(self.params["rate"])
+        max_clip = self.params.get("max_clip")
+        self.max_clip = Decimal(str(max_clip)) if max_clip else None
+        self.volume = 0.0
+        self.expired = False
+        self._min_amount = float(self.min_order_amount)
+        if self.algo_order.duration:
+            self.set_timer(self.start_time + self.algo_order.duration)
+
+    def on_trade(self, trade: Trade):
+        self.volume += trade.size
+
+    def on_timer(self):
+        self.expired = True
+
+    def on_check(self):
+        open_amount = self.open_amount()
+        remaining = self.remaining - open_amount
+        if self.expired or not self.is_tradable(remaining):
+            if not self.working:
+                self.finish()
+            return
+
+        deficit = self.volume * self.rate - float(self.filled + open_amount)
+        if deficit <= 0 or (deficit < self._min_amount and not self.reduce_only):
+            return
+        amount = min(
+            self._ems._amount_to_precision(self.symbol, deficit, mode="floor"),
+            remaining,
+        )
+        if self.max_clip is not None:
+            amount = min(amount, self.max_clip)
+        if self.is_tradable(amount):
+            self.run(self._send(amount))
+
+    async def _send(self, amount: Decimal) -> bool:
+        return await self.create_child(OrderType.MARKET, amount) is not None
+
+
+class IcebergAlgorithm(ExecAlgorithm, name="iceberg"):
+    """
+    Work the amount with one limit order of at most `display` at a time, pegged to the
+    touch: the best bid for a buy, the best ask for a sell. An order left off the touch is
+    canceled and replaced at the new touch. The bookl1 of the symbol must be subscribed.
+    """
+
+    market_data = ("bookl1",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        display = self.params.get("display")
+        self.display = Decimal(str(display)) if display else self.algo_order.amount
+        self.touch: float | None = None
+        book = self._ems._cache.bookl1(self.symbol)
+        if book is not None:
+            self.on_bookl1(book)
+        self.slice: str | None = None  # uuid of the working order
+        self.canceling = False
+
+    def on_bookl1(self, bookl1: BookL1):
+        self.touch = bookl1.bid if self.side.is_buy else bookl1.ask
+
+    def on_check(self):
+        if self.slice is not None:
+            order = self.child(self.slice)
+            if order is not None and not order.is_closed:
+                if (
+                    not order.on_flight
+                    and not self.canceling
+                    and self.touch is not None
+                    and order.price != self.touch
+                ):
+                    self.run(self._cancel_slice())
+                return
+            self.slice = None
+
+        if not self.is_tradable(self.remaining):
+            self.finish()
+        elif self.touch is not None:
+            self.run(self._place(min(self.display, self.remaining)))
+
+    async def _place(self, amount: Decimal) -> bool:
+        price = self._ems._price_to_precision(self.symbol, self.touch)
+        order = await self.create_child(OrderType.LIMIT, amount, price)
+        if order is None:
+            return False
+        self.slice = order.uuid
+        self.canceling = False
+        return True
+
+    async def _cancel_slice(self) -> bool:
+        self.canceling = True
+        if not await self.cancel_child(self.slice):
+            self.retry(partial(self._allow_cancel, self.slice))
+            return False
+        return True
+
+    def _allow_cancel(self, uuid: str):
+        if self.slice == uuid:
+            self.canceling = False
+
+
+def volume_profile(*days: List[Kline]) -> List[float]:
+    """
+    Relative volume per bucket for `VwapAlgorithm`, averaged over the klines of several
+    days of the same time window, e.g. the klines of the next hour one and two days ago
+    from `Strategy.request_klines`
+    """
+    buckets = max(len(klines) for klines in days)
+    profile = []
+    for i in range(buckets):
+        volumes = [klines[i].volume for klines in days if i < len(klines)]
+        profile.append(sum(volumes) / len(volumes))
+    return profile
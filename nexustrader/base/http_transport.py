@@ -0,0 +1,139 @@
+from abc import ABC, abstractmethod
+from typing import Dict, Sequence
+import ssl
+import sys
+
+import aiohttp
+import msgspec
+from multidict import CIMultiDict, CIMultiDictProxy
+
+from nexustrader.core.nautilius_core import HttpClient, HttpMethod
+
+try:
+    import aiosonic
+except ImportError:
+    aiosonic = None
+
+
+class HttpTransportResponse(msgspec.Struct, frozen=True):
+    status: int
+    headers: CIMultiDictProxy  # case-insensitive, whatever the backend returns
+    body: bytes
+
+
+class HttpTransport(ABC):
+    """Sends a prepared request and returns the raw response.
+
+    Signing, rate limiting, error mapping and decoding stay in the `ApiClient`, so every
+    backend behaves the same for the exchange clients.
+    """
+
+    @abstractmethod
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        pass
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+
+class AiohttpTransport(HttpTransport):
+    def __init__(self, session: aiohttp.ClientSession):
+        self._session = session
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        async with self._session.request(
+            method=method, url=url, headers=headers, data=data
+        ) as response:
+            body = await response.read()
+            return HttpTransportResponse(response.status, response.headers, body)
+
+    async def close(self):
+        await self._session.close()
+
+
+class AiosonicTransport(HttpTransport):
+    def __init__(self, ssl_context: ssl.SSLContext, timeout: float = 10, pool_size: int = 25):
+        if aiosonic is None:
+            raise ImportError(
+                "aiosonic is required for the aiosonic http backend, install it with `pip install aiosonic`"
+            )
+        self._ssl_context = ssl_context
+        self._timeouts = aiosonic.timeout.Timeouts(request_timeout=timeout)
+        # aiosonic recycles a connection after 100 requests by default
+        connector = aiosonic.TCPConnector(pool_size=pool_size, conn_max_requests=sys.maxsize)
+        self._client = aiosonic.HTTPClient(connector)
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        response = await self._client.request(
+            url,
+            method=method,
+            headers=headers,
+            data=data,
+            ssl=self._ssl_context if url.startswith("https") else None,
+            timeouts=self._timeouts,
+        )
+        body = await response.content()
+        return HttpTransportResponse(
+            response.status_code,
+            CIMultiDictProxy(CIMultiDict(response.headers.items())),
+            body,
+        )
+
+    async def close(self):
+        await self._client.connector.cleanup()
+
+
+class NautilusTransport(HttpTransport):
+    """nautilus `HttpClient`, a reqwest client in Rust. The request is sent off the event loop.
+
+    Only the response headers in `header_keys` are returned.
+    """
+
+    def __init__(self, timeout: float = 10, header_keys: Sequence[str] = ()):
+        self._timeout = timeout
+        self._client = HttpClient(header_keys=[key.lower() for key in header_keys])
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str] | None = None,
+        data: bytes | str | None = None,
+    ) -> HttpTransportResponse:
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        response = await self._client.request(
+            method=getattr(HttpMethod, method),
+            url=url,
+            headers=headers or {},
+            body=data,
+            timeout_secs=self._timeout,
+        )
+        return HttpTransportResponse(
+            response.status,
+            CIMultiDictProxy(CIMultiDict(response.headers)),
+            bytes(response.body),
+        )
+
+    async def close(self):
+        pass
+
@@ -7,6 +7,7 @@ from nexustrader.core.entity import TaskManager
 from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.event_log import EventLog
 from nexustrader.constants import OrderStatus
 
 
@@ -30,6 +31,17 @@ class OrderManagementSystem(ABC):
         self._order_submit_timeout = order_submit_timeout
         self._order_msg_queue: asyncio.Queue[Order] = asyncio.Queue()
         self._waiting_order_msg_queue: asyncio.Queue[Order] = asyncio.Queue()
+        self._event_log: EventLog | None = None
+
+    def set_event_log(self, event_log: EventLog | None):
+        """Log every order update sent to the strategy"""
+        self._event_log = event_log
+
+    def _send_order(self, endpoint: str, order: Order):
+        if self._event_log:
+            self._event_log.order(endpoint, order)
+        self._msgbus.send(endpoint=endpoint, msg=order)
+        self._msgbus.publish(topic="order_status", msg=order)
 
     def _add_order_msg(self, order: Order):
         """
@@ -41,26 +53,29 @@ class OrderManagementSystem(ABC):
     def _order_status_update(self, order: Order):
         match order.status:
             case OrderStatus.ACCEPTED:
-                self._log.debug(f"ORDER STATUS ACCEPTED: {str(order)}")
+                self._log.debug("ORDER STATUS ACCEPTED: %s", order)
                 self._cache._order_status_update(order)
-                self._msgbus.send(endpoint="accepted", msg=order)
+                self._send_order("accepted", order)
             case OrderStatus.PARTIALLY_FILLED:
-                self._log.debug(f"ORDER STATUS PARTIALLY FILLED: {str(order)}")
+                self._log.debug("ORDER STATUS PARTIALLY FILLED: %s", order)
                 self._cache._order_status_update(order)
-                self._msgbus.send(endpoint="partially_filled", msg=order)
+                self._send_order("partially_filled", order)
             case OrderStatus.CANCELED:
-                self._log.debug(f"ORDER STATUS CANCELED: {str(order)}")
+                self._log.debug("ORDER STATUS CANCELED: %s", order)
                 self._cache._order_status_update(order)
-                self._msgbus.send(endpoint="canceled", msg=order)
+                self._send_order("canceled", order)
                 # self._registry.remove_order(order) #NOTE: order remove should be handle separately
             case OrderStatus.FILLED:
-                self._log.debug(f"ORDER STATUS FILLED: {str(order)}")
+                self._log.debug("ORDER STATUS FILLED: %s", order)
                 self._cache._order_status_update(order)
-                self._msgbus.send(endpoint="filled", msg=order)
+                self._send_order("filled", order)
                 # self._registry.remove_order(order) #NOTE: order remove should be handle separately
             case OrderStatus.EXPIRED:
-                self._log.debug(f"ORDER STATUS EXPIRED: {str(order)}")
+                self._log.debug("ORDER STATUS EXPIRED: %s", order)
                 self._cache._order_status_update(order)
+                if self._event_log:
+                    self._event_log.order("expired", order)
+                self._msgbus.publish(topic="order_status", msg=order)
             case _:
                 self._log.error(f"ORDER STATUS UNKNOWN: {str(order)}")
     
@@ -92,7 +107,7 @@ class OrderManagementSystem(ABC):
                 # handle the ACCEPTED, PARTIALLY_FILLED, CANCELED, FILLED, EXPIRED arived early than the order submit uuid
                 uuid = self._registry.get_uuid(order.id) # check if the order id is registered
                 if not uuid:
-                    self._log.debug(f"WAIT FOR ORDER ID: {order.id} TO BE REGISTERED")
+                    self._log.debug("WAIT FOR ORDER ID: %s TO BE REGISTERED", order.id)
                     self._registry.add_to_waiting(order.id)
                     await self._waiting_order_msg_queue.put(order)
                     # await self._registry.wait_for_order_id(order.id) #NOTE: need to wait for the order id to be registered
@@ -8,6 +8,8 @@ from typing import Callable, Literal
 from aiolimiter import AsyncLimiter
 from nexustrader.core.log import SpdLog
 from nexustrader.core.entity import TaskManager
+from nexustrader.core.recorder import FrameRecorder
+from nexustrader.core.latency import LatencyTracker
 from picows import (
     ws_connect,
     WSFrame,
@@ -37,17 +39,33 @@ class Listener(WSListener):
     Inherits from picows.WSListener to provide WebSocket event handling functionality.
     """
     
-    def __init__(self, callback, logger, specific_ping_msg=None, *args, **kwargs):
+    def __init__(
+        self,
+        callback,
+        logger,
+        specific_ping_msg=None,
+        recorder: FrameRecorder | None = None,
+        conn_id: int | None = None,
+        latency: LatencyTracker | None = None,
+        *args,
+        **kwargs,
+    ):
         """Initialize the WebSocket listener.
         
         Args:
             logger: Logger instance for logging events
             specific_ping_msg: Optional custom ping message
+            recorder: Optional frame recorder, every TEXT frame is appended to it
+            conn_id: Connection id registered in the recorder
+            latency: Optional latency tracker, stamps the receive time of every TEXT frame
         """
         super().__init__(*args, **kwargs)
         self._log = logger
         self._specific_ping_msg = specific_ping_msg
         self._callback = callback
+        self._recorder = recorder
+        self._conn_id = conn_id
+        self._latency = latency
         
     def send_user_specific_ping(self, transport: WSTransport) -> None:
         """Send a custom ping message or default ping frame.
@@ -94,7 +112,17 @@ class Listener(WSListener):
                     return
                 case WSMsgType.TEXT:
                     # Queue raw bytes for handler to decode
-                    self._callback(frame.get_payload_as_bytes())
+                    payload = frame.get_payload_as_bytes()
+                    if self._recorder:
+                        self._recorder.record(self._conn_id, payload)
+                    if self._latency:
+                        self._latency.begin_frame()
+                        try:
+                            self._callback(payload)
+                        finally:
+                            self._latency.end_frame()
+                    else:
+                        self._callback(payload)
                     return
                 case WSMsgType.CLOSE:
                     close_code = frame.get_close_code()
@@ -123,8 +151,11 @@ class WSClient(ABC):
         ] = "ping_when_idle",
         enable_auto_ping: bool = True,
         enable_auto_pong: bool = False,
+        recorder: FrameRecorder | None = None,
+        latency: LatencyTracker | None = None,
     ):
         self._clock = LiveClock()
+        self._time_offset_ms = 0  # server time - local time, see `ClockSync`
         self._url = url
         self._specific_ping_msg = specific_ping_msg
         self._reconnect_interval = reconnect_interval
@@ -137,6 +168,8 @@ class WSClient(ABC):
         self._subscriptions = []
         self._limiter = limiter
         self._callback = handler
+        self._recorder = recorder
+        self._latency = latency
         if auto_ping_strategy == "ping_when_idle":
             self._auto_ping_strategy = WSAutoPingStrategy.PING_WHEN_IDLE
         elif auto_ping_strategy == "ping_periodically":
@@ -148,8 +181,43 @@ class WSClient(ABC):
     def connected(self):
         return self._transport and self._listener
 
+    def set_recorder(self, recorder: FrameRecorder | None):
+        """Enable raw frame recording, takes effect from the next (re)connect."""
+        self._recorder = recorder
+
+    def set_latency_tracker(self, latency: LatencyTracker | None):
+        """Enable receive time stamping, takes effect from the next (re)connect."""
+        self._latency = latency
+
+    def set_time_offset(self, offset_ms: int, recv_window: int | None = None):
+        """Correct the timestamp of signed messages (login, orders), see `ClockSync`"""
+        self._time_offset_ms = offset_ms
+
+    def _timestamp_ms(self) -> int:
+        """Local time corrected to the exchange server time"""
+        return self._clock.timestamp_ms() + self._time_offset_ms
+
+    def _register_connection(self) -> int | None:
+        if not self._recorder:
+            return None
+        account_type = getattr(self, "_account_type", None)
+        return self._recorder.register(
+            self._url,
+            client=type(self).__name__,
+            handler=getattr(self._callback, "__qualname__", None),
+            account_type=str(account_type) if account_type else None,
+        )
+
     async def _connect(self):
-        WSListenerFactory = lambda: Listener(self._callback, self._log, self._specific_ping_msg)  # noqa: E731
+        conn_id = self._register_connection()
+        WSListenerFactory = lambda: Listener(  # noqa: E731
+            self._callback,
+            self._log,
+            self._specific_ping_msg,
+            recorder=self._recorder,
+            conn_id=conn_id,
+            latency=self._latency,
+        )
         self._transport, self._listener = await ws_connect(
             WSListenerFactory,
             self._url,
@@ -1,7 +1,9 @@
 from dataclasses import dataclass, field
-from typing import Dict, List
-from nexustrader.constants import AccountType, ExchangeType, StorageBackend
-from nexustrader.core.entity import RateLimit
+from typing import Dict, List, Tuple
+from nexustrader.constants import AccountType, ExchangeType, StorageBackend, HttpBackend
+from nexustrader.core.entity import RateLimit, HttpPoolConfig
+from nexustrader.core.risk import RiskConfig
+from nexustrader.core.portfolio import PEGGED_ASSETS
 from nexustrader.strategy import Strategy
 from zmq.asyncio import Socket
 
@@ -19,8 +21,28 @@ class PublicConnectorConfig:
 
 @dataclass
 class PrivateConnectorConfig:
+    """Private Connector Configuration Class.
+
+    Attributes:
+        account_type (`AccountType`): Account type of the connector
+        rate_limit (`RateLimit`, optional): Rate limit applied to order requests
+        enable_ws_order (`bool`, optional): Send orders over the exchange's authenticated
+            websocket order entry API instead of REST. While the connection is down,
+            Binance and Bybit fall back to REST and OKX resends after the re-login.
+            `None` uses the exchange default (websocket for OKX, REST otherwise)
+        http_pool (`HttpPoolConfig`, optional): Open and keep warm keep-alive REST
+            connections at connect time, so the first orders skip the DNS, TCP and TLS
+            handshakes. `None` opens connections on demand
+        http_backend (`HttpBackend`, optional): HTTP client used for REST requests:
+            aiohttp (default), aiosonic, or nautilus' Rust `HttpClient`. The pool
+            warm up stats are only reported for aiohttp
+    """
+
     account_type: AccountType
     rate_limit: RateLimit | None = None
+    enable_ws_order: bool | None = None
+    http_pool: HttpPoolConfig | None = None
+    http_backend: HttpBackend = HttpBackend.AIOHTTP
     
 @dataclass
 class ZeroMQSignalConfig:
@@ -41,6 +63,103 @@ class ZeroMQSignalConfig:
     """
     socket: Socket
     
+@dataclass
+class WSRecorderConfig:
+    """Raw websocket frame recorder configuration.
+
+    Every frame received by the public and private connectors is written to rotating,
+    length-prefixed binary files under `path`, see `nexustrader.core.recorder`.
+
+    Attributes:
+        path (`str`): Directory of the recording files
+        prefix (`str`): File name prefix of the recording files
+        max_bytes (`int`): Rotate the file once it holds this many (uncompressed) bytes
+        compress (`bool`): Compress the files with zstd, requires `zstandard`
+        flush_interval (`float`): Seconds between two writes of the background writer
+    """
+    path: str = ".log/ws_record"
+    prefix: str = "frames"
+    max_bytes: int = 256 * 1024 * 1024
+    compress: bool = False
+    flush_interval: float = 0.1
+
+@dataclass
+class BookL1ConflationConfig:
+    """BookL1 conflation configuration.
+
+    When set, `Strategy.on_bookl1` only receives the latest book of each symbol; updates
+    arriving while the strategy is busy overwrite each other instead of queueing up.
+
+    Attributes:
+        batch_size (`int`): Max number of symbols delivered per event loop iteration
+    """
+    batch_size: int = 100
+
+@dataclass
+class LatencyConfig:
+    """Tick-to-strategy latency instrumentation configuration.
+
+    Attributes:
+        log_interval (`int | None`): Seconds between two `[LATENCY]` log summaries, `None` to disable
+        sub_bucket_bits (`int`): Histogram precision, relative error is `2 ** (1 - sub_bucket_bits)`
+    """
+    log_interval: int | None = 60
+    sub_bucket_bits: int = 7
+
+@dataclass
+class ClockSyncConfig:
+    """Server clock offset estimation for signed requests, see `nexustrader.core.clock_sync`.
+
+    Attributes:
+        interval (`float`): Seconds between two syncs of every private connector
+        samples (`int`): Server time requests per sync
+        recv_window (`int | None`): Validity window (ms) of signed requests once the
+            offset is known, `None` keeps the exchange client defaults
+    """
+    interval: float = 60
+    samples: int = 8
+    recv_window: int | None = None
+
+@dataclass
+class EventLogConfig:
+    """Binary order event log configuration.
+
+    Every order submit and order update is appended as a msgpack record to one file per
+    UTC day under `path`, see `nexustrader.core.event_log`. Load the files with
+    `EventLogReader`.
+
+    Attributes:
+        path (`str`): Directory of the event log files
+        prefix (`str`): File name prefix of the event log files
+        flush_interval (`float`): Seconds between two writes of the background writer
+    """
+    path: str = ".log/events"
+    prefix: str = "events"
+    flush_interval: float = 0.5
+
+@dataclass
+class PnLConfig:
+    """Mark-to-market PnL engine configuration, see `nexustrader.core.pnl`.
+
+    Positions are marked on their `bookl1` mid, `trade` price or `mark_price`, and the
+    portfolio totals are published as `PnL` on the `pnl` topic (`Strategy.on_pnl`).
+
+    Attributes:
+        publish_interval (`float`): Min seconds between two `pnl` events
+    """
+    publish_interval: float = 1.0
+
+@dataclass
+class PortfolioConfig:
+    """Cross-exchange portfolio configuration, see `nexustrader.core.portfolio`.
+
+    Attributes:
+        currency (`str`): Valuation currency of the assets
+        pegged (`Tuple[str, ...]`): Assets priced 1.0 in `currency`
+    """
+    currency: str = "USDT"
+    pegged: Tuple[str, ...] = PEGGED_ASSETS
+
 @dataclass
 class MockConnectorConfig:
     initial_balance: Dict[str, float | int]
@@ -51,6 +170,7 @@ class MockConnectorConfig:
     overwrite_position: bool = False
     update_interval: int = 60
     leverage: float = 1.0
+    fixed_point: bool = False  # positions and realized pnl on int lots and ticks
     
     def __post_init__(self):
         if not self.account_type.is_mock:
@@ -70,6 +190,14 @@ class Config:
     cache_sync_interval: int = 60
     cache_expired_time: int = 3600
     is_mock: bool = False
+    ws_recorder_config: WSRecorderConfig | None = None
+    bookl1_conflation_config: BookL1ConflationConfig | None = None
+    latency_config: LatencyConfig | None = None
+    clock_sync_config: ClockSyncConfig | None = None
+    event_log_config: EventLogConfig | None = None
+    risk_config: RiskConfig | None = None
+    pnl_config: PnLConfig | None = None
+    portfolio_config: PortfolioConfig | None = None
     
     def __post_init__(self):
         # Check if any connector is mock, then all must be mock
@@ -1,7 +1,7 @@
 import os
 import sys
 from typing import Literal, Dict, List
-from enum import Enum
+from enum import Enum, IntEnum
 from dynaconf import Dynaconf
 
 
@@ -79,6 +79,14 @@ class KlineInterval(Enum):
     DAY_3 = "3d"
     WEEK_1 = "1w"
     MONTH_1 = "1M"
+
+    @property
+    def seconds(self) -> int:
+        """Length of the interval, months have no fixed length"""
+        if self == KlineInterval.MONTH_1:
+            raise ValueError("MONTH_1 has no fixed length")
+        unit = {"s": 1, "m": 60, "h": 3600, "d": 86400, "w": 604800}[self.value[-1]]
+        return int(self.value[:-1]) * unit
     
     
 class SubmitType(Enum):
@@ -90,6 +98,22 @@ class SubmitType(Enum):
     CANCEL_VWAP = 5
     STOP_LOSS = 6
     TAKE_PROFIT = 7
+    BATCH_CREATE = 8
+    BATCH_CANCEL = 9
+    AMEND = 10
+    CANCEL_ALL = 11
+    ALGO = 12
+    CANCEL_ALGO = 13
+
+
+class RequestPriority(IntEnum):
+    """
+    Order in which requests waiting for rate limit budget are served, lower first
+    """
+
+    CANCEL = 0
+    ORDER = 1
+    QUERY = 2
 
 
 class EventType(Enum):
@@ -250,6 +274,7 @@ STATUS_TRANSITIONS: Dict[OrderStatus, List[OrderStatus]] = {
         OrderStatus.FILLED,
     ],
     OrderStatus.ACCEPTED: [
+        OrderStatus.ACCEPTED,  # amended
         OrderStatus.PARTIALLY_FILLED,
         OrderStatus.FILLED,
         OrderStatus.CANCELING,
@@ -285,3 +310,9 @@ class DataType(Enum):
 class StorageBackend(Enum):
     REDIS = "redis"
     SQLITE = "sqlite"
+
+
+class HttpBackend(Enum):
+    AIOHTTP = "aiohttp"
+    AIOSONIC = "aiosonic"
+    NAUTILUS = "nautilus"
@@ -20,8 +20,14 @@ from nexustrader.schema import (
     AlgoOrder,
     AccountBalance,
     Balance,
+    BalanceUpdate,
+)
+from nexustrader.constants import (
+    STATUS_TRANSITIONS,
+    AccountType,
+    KlineInterval,
+    OrderStatus,
 )
-from nexustrader.constants import STATUS_TRANSITIONS, AccountType, KlineInterval
 from nexustrader.core.entity import TaskManager, RedisClient
 from nexustrader.core.log import SpdLog
 from nexustrader.core.registry import OrderRegistry
@@ -481,9 +487,14 @@ class AsyncCache:
             self._mem_positions.pop(position.symbol, None)
         else:
             self._mem_positions[position.symbol] = position
+        self._msgbus.publish(topic="position", msg=position)
 
     def _apply_balance(self, account_type: AccountType, balances: List[Balance]):
         self._mem_account_balance[account_type]._apply(balances)
+        self._msgbus.publish(
+            topic="balance",
+            msg=BalanceUpdate(account_type=account_type, balances=balances),
+        )
 
     def get_balance(self, account_type: AccountType) -> AccountBalance:
         return self._mem_account_balance[account_type]
@@ -524,6 +535,45 @@ class AsyncCache:
                 self._mem_symbol_open_orders[order.symbol].discard(order.uuid)
                 
 
+    def _order_amended(self, order: Order) -> Order | None:
+        """
+        Apply the price and amount of an acknowledged amend to an open order, the status
+        is left to the exchange order updates. Returns the updated order.
+        """
+        previous_order = self._mem_orders.get(order.uuid)
+        if not previous_order or previous_order.is_closed:
+            return None
+        amount = order.amount if order.amount is not None else previous_order.amount
+        amended_order = msgspec.structs.replace(
+            previous_order,
+            price=order.price if order.price is not None else previous_order.price,
+            amount=amount,
+            remaining=amount - (previous_order.filled or Decimal(0)),
+            timestamp=order.timestamp or previous_order.timestamp,
+        )
+        self._mem_orders[order.uuid] = amended_order
+        return amended_order
+
+    def _orders_canceling(self, uuids: List[str], timestamp: int) -> List[Order]:
+        """
+        Mark the open orders of an acknowledged cancel all request as CANCELING in one
+        pass, the final status is left to the exchange order updates. Returns the
+        updated orders.
+        """
+        orders = []
+        for uuid in uuids:
+            order = self._mem_orders.get(uuid)
+            if not order or order.is_closed:
+                continue
+            order = msgspec.structs.replace(
+                order, status=OrderStatus.CANCELING, timestamp=timestamp
+            )
+            if not self._check_status_transition(order):
+                continue
+            self._mem_orders[uuid] = order
+            orders.append(order)
+        return orders
+
     def _get_all_positions_from_redis(self, exchange_id: ExchangeType) -> Dict[str, Position]:
         positions = {}
         pattern = f"strategy:{self.strategy_id}:user_id:{self.user_id}:exchange:{exchange_id.value}:symbol_positions:*"
@@ -678,3 +728,12 @@ class AsyncCache:
             return self._mem_open_orders[exchange]
         else:
             raise ValueError("Either `symbol` or `exchange` must be specified")
+
+    def get_open_order_symbols(self, exchange: ExchangeType | None = None) -> Set[str]:
+        """Symbols with open orders, optionally of one exchange"""
+        return {
+            symbol
+            for symbol, uuids in self._mem_symbol_open_orders.items()
+            if uuids
+            and (exchange is None or InstrumentId.from_str(symbol).exchange == exchange)
+        }
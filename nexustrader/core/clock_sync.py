@@ -0,0 +1,137 @@
+import asyncio
+from collections import deque
+from statistics import median
+from typing import Awaitable, Callable, Deque, Dict, Tuple
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import LiveClock
+
+
+class ClockOffsetEstimator:
+    """NTP-style estimate of `server time - local time` from request/response samples.
+
+    A sample is the local send time, the server time in the response and the local
+    receive time. Its offset assumes the server stamped the response halfway through the
+    round trip, so the error of a sample is bounded by half its RTT. Only the lowest-RTT
+    half of the window is used, which drops samples delayed by queueing, and the median
+    of their offsets is reported.
+    """
+
+    def __init__(self, window: int = 32):
+        self._samples: Deque[Tuple[float, float]] = deque(maxlen=window)  # (rtt, offset)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def add_sample(self, send_ms: float, server_ms: float, recv_ms: float):
+        rtt = recv_ms - send_ms
+        if rtt < 0:
+            return
+        self._samples.append((rtt, server_ms - (send_ms + recv_ms) / 2))
+
+    def _best(self) -> list[Tuple[float, float]]:
+        samples = sorted(self._samples)
+        return samples[: max(1, len(samples) // 2)]
+
+    @property
+    def offset_ms(self) -> float | None:
+        if not self._samples:
+            return None
+        return median(offset for _, offset in self._best())
+
+    @property
+    def rtt_ms(self) -> float | None:
+        if not self._samples:
+            return None
+        return median(rtt for rtt, _ in self._best())
+
+    @property
+    def one_way_latency_ms(self) -> float | None:
+        rtt = self.rtt_ms
+        return None if rtt is None else rtt / 2
+
+
+class ClockSync:
+    """Keep the clock offset of every venue up to date in the background.
+
+    Every `interval` seconds `samples` server time requests are sent to each registered
+    venue, and the estimated offset is passed to its `apply` callback, which corrects
+    the timestamp of signed requests.
+    """
+
+    def __init__(
+        self,
+        task_manager: TaskManager,
+        interval: float = 60,
+        samples: int = 8,
+        recv_window: int | None = None,
+    ):
+        self._log = SpdLog.get_logger(type(self).__name__, level="INFO", flush=True)
+        self._task_manager = task_manager
+        self._clock = LiveClock()
+        self._interval = interval
+        self._samples = samples
+        self._recv_window = recv_window
+        self._venues: Dict[
+            str,
+            Tuple[Callable[[], Awaitable[int]], Callable[[int, int | None], None]],
+        ] = {}
+        self._estimators: Dict[str, ClockOffsetEstimator] = {}
+
+    def register(
+        self,
+        name: str,
+        get_server_time: Callable[[], Awaitable[int]],
+        apply: Callable[[int, int | None], None],
+    ):
+        """
+        `get_server_time` returns the server time in ms, `apply(offset_ms, recv_window)`
+        applies the offset and the configured recv window to the signed requests
+        """
+        self._venues[name] = (get_server_time, apply)
+        self._estimators[name] = ClockOffsetEstimator(window=4 * self._samples)
+
+    def estimator(self, name: str) -> ClockOffsetEstimator | None:
+        return self._estimators.get(name)
+
+    def offset_ms(self, name: str) -> float | None:
+        estimator = self._estimators.get(name)
+        return estimator.offset_ms if estimator else None
+
+    def one_way_latency_ms(self, name: str) -> float | None:
+        estimator = self._estimators.get(name)
+        return estimator.one_way_latency_ms if estimator else None
+
+    def _now_ms(self) -> float:
+        return self._clock.timestamp_ns() / 1_000_000
+
+    async def sync(self, name: str):
+        get_server_time, apply = self._venues[name]
+        estimator = self._estimators[name]
+        for _ in range(self._samples):
+            try:
+                send_ms = self._now_ms()
+                server_ms = await get_server_time()
+                estimator.add_sample(send_ms, server_ms, self._now_ms())
+            except Exception as e:
+                self._log.error(f"[CLOCK] {name} server time request failed: {e}")
+        offset = estimator.offset_ms
+        if offset is None:
+            return
+        apply(round(offset), self._recv_window)
+        self._log.info(
+            f"[CLOCK] {name} offset={offset:.1f}ms rtt={estimator.rtt_ms:.1f}ms "
+            f"one_way={estimator.one_way_latency_ms:.1f}ms"
+        )
+
+    async def _sync_periodically(self):
+        while True:
+            await asyncio.sleep(self._interval)
+            for name in self._venues:
+                await self.sync(name)
+
+    async def start(self):
+        """Sync every venue once before returning, then keep syncing in the background"""
+        await asyncio.gather(*(self.sync(name) for name in self._venues))
+        self._task_manager.create_task(self._sync_periodically())
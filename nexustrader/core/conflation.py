@@ -0,0 +1,97 @@
+from itertools import islice
+from typing import Callable, Dict
+
+import msgspec
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import MessageBus, LiveClock
+from nexustrader.schema import BookL1
+
+
+class ConflationStats(msgspec.Struct, kw_only=True):
+    received: int = 0
+    delivered: int = 0
+    conflated: int = 0  # updates dropped because a newer one of the same symbol arrived first
+    pending: int = 0
+    max_delay_ns: int = 0  # longest time a symbol stayed dirty before delivery
+    total_delay_ns: int = 0
+
+    @property
+    def avg_delay_ns(self) -> float:
+        return self.total_delay_ns / self.delivered if self.delivered else 0.0
+
+
+class BookL1Conflator:
+    """Keep only the latest `BookL1` per symbol between the connectors and a slow handler.
+
+    Incoming updates only overwrite the latest book and mark the symbol dirty. Dirty
+    symbols are delivered in arrival order, at most `batch_size` per event loop
+    iteration, so websocket frames buffered while the handler was busy are conflated
+    instead of queued.
+    """
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        task_manager: TaskManager,
+        batch_size: int = 100,
+        topic: str = "bookl1",
+    ):
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        self._msgbus = msgbus
+        self._task_manager = task_manager
+        self._clock = LiveClock()
+        self._batch_size = batch_size
+        self._topic = topic
+        self._handler: Callable[[BookL1], None] | None = None
+
+        self._latest: Dict[str, BookL1] = {}
+        self._dirty: Dict[str, int] = {}  # symbol -> dirty since (ns), insertion ordered
+        self._scheduled = False
+        self._stats = ConflationStats()
+
+    @property
+    def stats(self) -> ConflationStats:
+        self._stats.pending = len(self._dirty)
+        return self._stats
+
+    def subscribe(self, handler: Callable[[BookL1], None]):
+        self._handler = handler
+        self._msgbus.subscribe(topic=self._topic, handler=self._on_bookl1)
+
+    def latest(self, symbol: str) -> BookL1 | None:
+        return self._latest.get(symbol)
+
+    def _on_bookl1(self, bookl1: BookL1):
+        self._stats.received += 1
+        symbol = bookl1.symbol
+        self._latest[symbol] = bookl1
+        if symbol in self._dirty:
+            self._stats.conflated += 1
+        else:
+            self._dirty[symbol] = self._clock.timestamp_ns()
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._task_manager._loop.call_soon(self._drain)
+
+    def _drain(self):
+        self._scheduled = False
+        batch = list(islice(self._dirty.items(), self._batch_size))
+        stats = self._stats
+        for symbol, dirty_since in batch:
+            del self._dirty[symbol]
+            delay = self._clock.timestamp_ns() - dirty_since
+            stats.delivered += 1
+            stats.total_delay_ns += delay
+            if delay > stats.max_delay_ns:
+                stats.max_delay_ns = delay
+            try:
+                self._handler(self._latest[symbol])
+            except Exception as e:
+                self._log.error(f"Error handling bookl1 {symbol}: {e}")
+
+        if self._dirty and not self._scheduled:
+            self._scheduled = True
+            self._task_manager._loop.call_soon(self._drain)
@@ -26,6 +26,21 @@ class RateLimit:
     time_period: float = 60
 
 
+@dataclass
+class HttpPoolConfig:
+    """
+    connections: Keep-alive connections opened per host at connect time and kept warm.
+    keepalive_interval: Seconds between two rounds of keep-alive pings on idle connections.
+    keepalive_timeout: Seconds an idle connection is kept in the pool.
+    dns_ttl: Seconds a resolved host is cached.
+    """
+
+    connections: int = 2
+    keepalive_interval: float = 20
+    keepalive_timeout: float = 60
+    dns_ttl: int = 300
+
+
 class TaskManager:
     def __init__(
         self, loop: asyncio.AbstractEventLoop, enable_signal_handlers: bool = True
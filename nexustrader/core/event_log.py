@@ -0,0 +1,321 @@
+import gc
+import struct
+import threading
+from collections import deque
+from operator import attrgetter
+from pathlib import Path
+from typing import Dict, Iterator, List, Union
+
+import msgspec
+import numpy as np
+import pandas as pd
+
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import LiveClock
+from nexustrader.schema import BatchOrderSubmit, Order, OrderSubmit
+
+
+FILE_MAGIC = b"NXEV\x01"
+# length of the msgpack array of events written by one drain of the buffer
+BATCH_HEADER = struct.Struct("<I")
+
+
+class SubmitEvent(msgspec.Struct, tag_field="kind", tag="submit", array_like=True, gc=False):
+    """An `OrderSubmit` taken by the EMS, batch submits are logged per order"""
+
+    ts_ns: int
+    uuid: str
+    symbol: str
+    submit_type: str
+    side: str | None = None
+    type: str | None = None
+    amount: float | None = None
+    price: float | None = None
+    trigger_price: float | None = None
+    time_in_force: str | None = None
+    position_side: str | None = None
+    order_id: str | int | None = None
+
+
+class OrderEvent(msgspec.Struct, tag_field="kind", tag="order", array_like=True, gc=False):
+    """An order update sent to the strategy, `event` is its message bus endpoint"""
+
+    ts_ns: int
+    event: str
+    uuid: str | None
+    exchange: str
+    symbol: str
+    status: str
+    order_id: str | int | None = None
+    client_order_id: str | None = None
+    timestamp: int | None = None  # exchange time in ms
+    side: str | None = None
+    type: str | None = None
+    time_in_force: str | None = None
+    position_side: str | None = None
+    reduce_only: bool | None = None
+    amount: float | None = None
+    filled: float | None = None
+    remaining: float | None = None
+    price: float | None = None
+    trigger_price: float | None = None
+    average: float | None = None
+    last_filled: float | None = None
+    last_filled_price: float | None = None
+    fee: float | None = None
+    fee_currency: str | None = None
+    cost: float | None = None
+    cum_cost: float | None = None
+
+
+# The order fields are stored as is: the encoder writes enums as their value and
+# decimals as floats, which is what the reader decodes them to
+Event = Union[SubmitEvent, OrderEvent]
+EVENT_TYPES: Dict[str, type] = {"submit": SubmitEvent, "order": OrderEvent}
+
+
+class EventLog:
+    """Append-only binary log of order submits and order updates.
+
+    `submit` and `order` only build a fixed-schema event and append it to an in-memory
+    buffer. A background thread encodes the buffered events as one msgpack array and
+    appends it to the file of the current UTC day.
+
+    File layout: `FILE_MAGIC` followed by batches of `BATCH_HEADER` + msgpack array of
+    events, each event an array led by its tag, see `SubmitEvent` and `OrderEvent`.
+    """
+
+    def __init__(
+        self,
+        path: str = ".log/events",
+        prefix: str = "events",
+        flush_interval: float = 0.5,
+    ):
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        self._clock = LiveClock()
+        self._path = Path(path)
+        self._prefix = prefix
+        self._flush_interval = flush_interval
+        self._encoder = msgspec.msgpack.Encoder(decimal_format="number")
+
+        self._buffer: deque = deque()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._file = None
+        self._file_day: str | None = None
+        self.files: List[str] = []
+        self.events_logged = 0
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def submit(self, order_submit: OrderSubmit | BatchOrderSubmit):
+        ts_ns = self._clock.timestamp_ns()
+        if isinstance(order_submit, BatchOrderSubmit):
+            submit_type = order_submit.submit_type.name
+            for submit in order_submit.orders:
+                self._buffer.append(self._submit_event(ts_ns, submit, submit_type))
+        else:
+            self._buffer.append(
+                self._submit_event(ts_ns, order_submit, order_submit.submit_type.name)
+            )
+
+    @staticmethod
+    def _submit_event(ts_ns: int, submit: OrderSubmit, submit_type: str) -> SubmitEvent:
+        return SubmitEvent(
+            ts_ns=ts_ns,
+            uuid=submit.uuid,
+            symbol=submit.symbol,
+            submit_type=submit_type,
+            side=submit.side,
+            type=submit.type,
+            amount=submit.amount,
+            price=submit.price,
+            trigger_price=submit.trigger_price,
+            time_in_force=submit.time_in_force,
+            position_side=submit.position_side,
+            order_id=submit.order_id,
+        )
+
+    def order(self, event: str, order: Order):
+        self._buffer.append(
+            OrderEvent(
+                ts_ns=self._clock.timestamp_ns(),
+                event=event,
+                uuid=order.uuid,
+                exchange=order.exchange,
+                symbol=order.symbol,
+                status=order.status,
+                order_id=order.id,
+                client_order_id=order.client_order_id,
+                timestamp=order.timestamp,
+                side=order.side,
+                type=order.type,
+                time_in_force=order.time_in_force,
+                position_side=order.position_side,
+                reduce_only=order.reduce_only,
+                amount=order.amount,
+                filled=order.filled,
+                remaining=order.remaining,
+                price=order.price,
+                trigger_price=order.trigger_price,
+                average=order.average,
+                last_filled=order.last_filled,
+                last_filled_price=order.last_filled_price,
+                fee=order.fee,
+                fee_currency=order.fee_currency,
+                cost=order.cost,
+                cum_cost=order.cum_cost,
+            )
+        )
+
+    def start(self):
+        if self.running:
+            return
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        try:
+            while not self._stop_event.wait(self._flush_interval):
+                self._drain()
+            self._drain()
+        except Exception as e:
+            self._log.error(f"Error writing events: {e}")
+        finally:
+            self._close_file()
+
+    def _drain(self):
+        buffer = self._buffer
+        if not buffer:
+            return
+        events = [buffer.popleft() for _ in range(len(buffer))]
+        out = bytearray(BATCH_HEADER.size)
+        self._encoder.encode_into(events, out, BATCH_HEADER.size)
+        BATCH_HEADER.pack_into(out, 0, len(out) - BATCH_HEADER.size)
+
+        day = self._clock.utc_now().strftime("%Y%m%d")
+        if day != self._file_day:
+            self._close_file()
+            self._open_file(day)
+        self._file.write(out)
+        self._file.flush()
+        self.events_logged += len(events)
+
+    def _open_file(self, day: str):
+        file_name = self._path / f"{self._prefix}-{day}.bin"
+        self._file = open(file_name, "ab")
+        self._file_day = day
+        if self._file.tell() == 0:
+            self._file.write(FILE_MAGIC)
+        else:
+            # drop a batch cut short by a crash, so the appended batches stay readable
+            self._file.truncate(_complete_length(file_name))
+        self.files.append(str(file_name))
+        self._log.debug(f"Logging events to {file_name}")
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        self._file.close()
+        self._file, self._file_day = None, None
+
+
+def _complete_length(file_name: str) -> int:
+    """Length of the file up to the end of its last complete batch"""
+    with open(file_name, "rb") as f:
+        data = f.read()
+    offset = len(FILE_MAGIC)
+    while offset + BATCH_HEADER.size <= len(data):
+        (length,) = BATCH_HEADER.unpack_from(data, offset)
+        if offset + BATCH_HEADER.size + length > len(data):
+            break
+        offset += BATCH_HEADER.size + length
+    return offset
+
+
+class EventLogReader:
+    """Read events written by `EventLog` from a file or a directory of files.
+
+    Iterate for typed events, or load every event type as columns with `to_numpy` and
+    `to_pandas`.
+    """
+
+    def __init__(self, path: str, prefix: str = "events"):
+        path = Path(path)
+        if path.is_dir():
+            self._files = sorted(
+                str(p) for p in path.iterdir() if p.name.startswith(f"{prefix}-")
+            )
+        else:
+            self._files = [str(path)]
+
+    @property
+    def files(self) -> List[str]:
+        return self._files
+
+    def _batches(self) -> Iterator[memoryview]:
+        for file_name in self._files:
+            with open(file_name, "rb") as f:
+                data = f.read()
+            if not data.startswith(FILE_MAGIC):
+                raise ValueError(f"{file_name} is not an event log")
+            view = memoryview(data)
+            offset = len(FILE_MAGIC)
+            while offset + BATCH_HEADER.size <= len(data):
+                (length,) = BATCH_HEADER.unpack_from(view, offset)
+                offset += BATCH_HEADER.size
+                if offset + length > len(data):
+                    # truncated tail, e.g. the process was killed mid-write
+                    break
+                yield view[offset : offset + length]
+                offset += length
+
+    def __iter__(self) -> Iterator[Event]:
+        decoder = msgspec.msgpack.Decoder(List[Event])
+        for batch in self._batches():
+            yield from decoder.decode(batch)
+
+    def to_numpy(self) -> Dict[str, Dict[str, np.ndarray]]:
+        """Columns of every event type: int and float fields as int64 and float64
+        arrays (missing values as nan), the other fields as object arrays"""
+        # a day of events is millions of small objects, keep the collector out of it
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            events = list(self)
+            tables = {}
+            for tag, event_type in EVENT_TYPES.items():
+                rows = [event for event in events if type(event) is event_type]
+                tables[tag] = {
+                    field.name: _column(list(map(attrgetter(field.name), rows)), field.type)
+                    for field in msgspec.structs.fields(event_type)
+                }
+            return tables
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def to_pandas(self) -> Dict[str, pd.DataFrame]:
+        return {tag: pd.DataFrame(columns) for tag, columns in self.to_numpy().items()}
+
+
+def _column(values: list, annotation) -> np.ndarray:
+    if annotation is int:
+        return np.array(values, dtype=np.int64)
+    if annotation in (float | None, int | None):
+        return np.array(values, dtype=np.float64)  # None -> nan
+    return np.array(values, dtype=object)
@@ -0,0 +1,129 @@
+from decimal import Decimal
+
+import numpy as np
+
+from nexustrader.core.quantizer import MAX_TICKS, Quantizer
+from nexustrader.schema import BaseMarket
+
+
+class FixedPoint:
+    """
+    Lossless conversion between values on a decimal grid and integer units,
+    `value == units * 10 ** -decimals`.
+
+    Prices and sizes sent by the exchange are on the grid of the market precision, so they
+    convert exactly, and comparisons and sums of units are integer operations. A value off
+    the grid raises `ValueError` instead of being rounded, round it first with `Quantizer`.
+    """
+
+    __slots__ = ("decimals", "scale", "unit", "_float_scale")
+
+    def __init__(self, decimals: int):
+        if decimals < 0:
+            raise ValueError(f"decimals must be non-negative, got {decimals}")
+        self.decimals = decimals
+        self.scale = 10**decimals
+        self.unit = Decimal("1").scaleb(-decimals)
+        self._float_scale = float(self.scale)
+
+    @classmethod
+    def from_precision(cls, precision: float) -> "FixedPoint":
+        """The grid `Quantizer(precision)` rounds to, 1 for a precision of 1 or more"""
+        return cls(Quantizer(precision).decimals)
+
+    def parse(self, text: str) -> int:
+        """Units of a decimal string, e.g. the "0.0100" of an exchange message"""
+        if "e" in text or "E" in text:
+            return self.from_decimal(Decimal(text))
+        sign = 1
+        if text[0] in "+-":
+            sign = -1 if text[0] == "-" else 1
+            text = text[1:]
+        whole, _, frac = text.partition(".")
+        if len(frac) > self.decimals:
+            if frac[self.decimals :].strip("0"):
+                raise ValueError(f"{text} is not a multiple of {self.unit}")
+            frac = frac[: self.decimals]
+        return sign * int((whole or "0") + frac.ljust(self.decimals, "0"))
+
+    def from_float(self, value: float) -> int:
+        units = round(value * self._float_scale)
+        # the float of the grid point is the value: its shortest repr is the grid point
+        if abs(units) < MAX_TICKS and units / self._float_scale == value:
+            return units
+        return self.from_decimal(Decimal(str(value)))
+
+    def from_decimal(self, value: Decimal) -> int:
+        units = value.scaleb(self.decimals)
+        if units != units.to_integral_value():
+            raise ValueError(f"{value} is not a multiple of {self.unit}")
+        return int(units)
+
+    def to_decimal(self, units: int) -> Decimal:
+        return Decimal(units).scaleb(-self.decimals)
+
+    def to_float(self, units: int) -> float:
+        return units / self._float_scale
+
+    def to_str(self, units: int) -> str:
+        return str(self.to_decimal(units))
+
+    def from_float_array(self, values: np.ndarray) -> np.ndarray:
+        """Units of every value as int64"""
+        values = np.asarray(values, dtype=np.float64)
+        units = np.rint(values * self._float_scale)
+        slow = ~((np.abs(units) < MAX_TICKS) & (units / self._float_scale == values))
+        if not slow.any():
+            return units.astype(np.int64)
+        units = np.where(slow, 0.0, units).astype(np.int64)
+        units[slow] = [self.from_decimal(Decimal(str(value))) for value in values[slow]]
+        return units
+
+    def to_float_array(self, units: np.ndarray) -> np.ndarray:
+        return np.asarray(units, dtype=np.int64) / self._float_scale
+
+
+class MarketFixedPoint:
+    """
+    Prices as ticks and sizes as lots of one market, keyed by its precision.
+
+    The notional of `ticks` and `lots` is `ticks * lots` in units of
+    `10 ** -notional_decimals`.
+    """
+
+    __slots__ = ("price", "size", "notional_decimals")
+
+    def __init__(self, price: FixedPoint, size: FixedPoint):
+        self.price = price
+        self.size = size
+        self.notional_decimals = price.decimals + size.decimals
+
+    @classmethod
+    def from_market(cls, market: BaseMarket) -> "MarketFixedPoint":
+        return cls(
+            FixedPoint.from_precision(market.precision.price),
+            FixedPoint.from_precision(market.precision.amount),
+        )
+
+    def ticks(self, price: float | Decimal | str) -> int:
+        return _to_units(self.price, price)
+
+    def lots(self, amount: float | Decimal | str) -> int:
+        return _to_units(self.size, amount)
+
+    def notional(self, units: int) -> Decimal:
+        """Notional (or PnL) units as a `Decimal`"""
+        return Decimal(units).scaleb(-self.notional_decimals)
+
+    def notional_float(self, units: int) -> float:
+        return units / float(10**self.notional_decimals)
+
+
+def _to_units(fixed_point: FixedPoint, value: float | Decimal | str) -> int:
+    if type(value) is float:
+        return fixed_point.from_float(value)
+    if isinstance(value, Decimal):
+        return fixed_point.from_decimal(value)
+    if isinstance(value, str):
+        return fixed_point.parse(value)
+    return fixed_point.from_decimal(Decimal(str(value)))
@@ -0,0 +1,221 @@
+import math
+import asyncio
+from collections import defaultdict
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import MessageBus, LiveClock
+
+
+class LatencyHistogram:
+    """HDR-style log-linear histogram of non-negative integer values (ns).
+
+    Values below `2 ** sub_bucket_bits` are counted exactly; above that every power of
+    two is split into `2 ** (sub_bucket_bits - 1)` linear buckets, which bounds the
+    relative error of reported percentiles by `2 ** (1 - sub_bucket_bits)`.
+    Recording is a couple of integer operations and a list increment.
+    """
+
+    def __init__(self, sub_bucket_bits: int = 7):
+        self._bits = sub_bucket_bits
+        self._half = 1 << (sub_bucket_bits - 1)
+        self._counts = [0] * ((64 - sub_bucket_bits + 2) * self._half)
+        self.count = 0
+        self.total = 0
+        self.min = 0
+        self.max = 0
+
+    def _index(self, value: int) -> int:
+        exponent = value.bit_length() - self._bits
+        if exponent <= 0:
+            return value
+        return exponent * self._half + (value >> exponent)
+
+    def _value(self, index: int) -> int:
+        """Highest value counted in bucket `index`."""
+        if index < 2 * self._half:
+            return index
+        exponent = index // self._half - 1
+        mantissa = index - exponent * self._half
+        return ((mantissa + 1) << exponent) - 1
+
+    def record(self, value: int):
+        if value < 0:
+            value = 0
+        self._counts[self._index(value)] += 1
+        if self.count == 0 or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+        self.count += 1
+        self.total += value
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def value_at_percentile(self, percentile: float) -> int:
+        if not self.count:
+            return 0
+        target = max(1, math.ceil(self.count * percentile / 100 - 1e-9))
+        seen = 0
+        for index, count in enumerate(self._counts):
+            seen += count
+            if seen >= target:
+                return min(self._value(index), self.max)
+        return self.max
+
+    def percentiles(self, percentiles: Iterable[float] = (50, 90, 99, 99.9)) -> Dict[float, int]:
+        return {p: self.value_at_percentile(p) for p in percentiles}
+
+    def merge(self, other: "LatencyHistogram"):
+        if other._bits != self._bits:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in enumerate(other._counts):
+            if count:
+                self._counts[index] += count
+        if other.count:
+            self.min = other.min if not self.count else min(self.min, other.min)
+            self.max = max(self.max, other.max)
+        self.count += other.count
+        self.total += other.total
+
+    def reset(self):
+        self._counts = [0] * len(self._counts)
+        self.count = self.total = self.min = self.max = 0
+
+
+class LatencyTracker:
+    """Tick-to-strategy latency per (exchange, topic, stage).
+
+    Stages:
+        - `exchange_to_receive`: exchange event time -> websocket frame received
+        - `receive_to_decode`: frame received -> message decoded and published
+        - `decode_to_strategy`: published -> strategy callback called (cache, conflation, ...)
+        - `callback`: strategy callback duration
+        - `exchange_to_strategy`: exchange event time -> strategy callback called
+
+    The exchange timestamps are in ms and compared against the local clock, so the
+    `exchange_*` stages include clock offset.
+    """
+
+    STAGES = (
+        "exchange_to_receive",
+        "receive_to_decode",
+        "decode_to_strategy",
+        "callback",
+        "exchange_to_strategy",
+    )
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        task_manager: TaskManager,
+        topics: Tuple[str, ...] = ("bookl1", "trade", "kline"),
+        log_interval: int | None = 60,
+        sub_bucket_bits: int = 7,
+    ):
+        self._log = SpdLog.get_logger(type(self).__name__, level="INFO", flush=True)
+        self._msgbus = msgbus
+        self._task_manager = task_manager
+        self._clock = LiveClock()
+        self._timestamp_ns = self._clock.timestamp_ns
+        self._topics = topics
+        self._log_interval = log_interval
+        self._histograms: Dict[Tuple[str, str, str], LatencyHistogram] = defaultdict(
+            lambda: LatencyHistogram(sub_bucket_bits)
+        )
+
+        self.recv_ns = 0  # receive time of the frame being handled, 0 outside a frame
+        self._last_msg = None
+        self._last_decode_ns = 0
+
+        for topic in topics:
+            self._msgbus.subscribe(
+                topic=topic,
+                handler=lambda msg, topic=topic: self._on_publish(topic, msg),
+                priority=100,
+            )
+
+    def begin_frame(self):
+        self.recv_ns = self._timestamp_ns()
+
+    def end_frame(self):
+        self.recv_ns = 0
+
+    def _on_publish(self, topic: str, msg: Any):
+        now = self._timestamp_ns()
+        self._last_msg = msg
+        self._last_decode_ns = now
+        recv_ns = self.recv_ns
+        if recv_ns:
+            exchange = msg.exchange.value
+            self._histograms[(exchange, topic, "exchange_to_receive")].record(
+                recv_ns - msg.timestamp * 1_000_000
+            )
+            self._histograms[(exchange, topic, "receive_to_decode")].record(
+                now - recv_ns
+            )
+
+    def wrap(self, topic: str, handler: Callable[[Any], None]) -> Callable[[Any], None]:
+        """Wrap a strategy callback to measure the strategy side stages."""
+        histograms = self._histograms
+        timestamp_ns = self._timestamp_ns
+
+        def wrapper(msg):
+            start = timestamp_ns()
+            try:
+                handler(msg)
+            finally:
+                end = timestamp_ns()
+                exchange = msg.exchange.value
+                histograms[(exchange, topic, "exchange_to_strategy")].record(
+                    start - msg.timestamp * 1_000_000
+                )
+                histograms[(exchange, topic, "callback")].record(end - start)
+                if msg is self._last_msg:
+                    histograms[(exchange, topic, "decode_to_strategy")].record(
+                        start - self._last_decode_ns
+                    )
+
+        return wrapper
+
+    def histogram(self, exchange: str, topic: str, stage: str) -> LatencyHistogram | None:
+        return self._histograms.get((exchange, topic, stage))
+
+    def stats(
+        self, percentiles: Iterable[float] = (50, 90, 99, 99.9)
+    ) -> Dict[Tuple[str, str, str], Dict[str, float]]:
+        """Summary in microseconds per (exchange, topic, stage)."""
+        percentiles = tuple(percentiles)
+        result = {}
+        for key, hist in self._histograms.items():
+            if not hist.count:
+                continue
+            summary = {"count": hist.count, "mean": hist.mean / 1000, "max": hist.max / 1000}
+            for p, value in hist.percentiles(percentiles).items():
+                summary[f"p{p:g}"] = value / 1000
+            result[key] = summary
+        return result
+
+    def reset(self):
+        for hist in self._histograms.values():
+            hist.reset()
+
+    def log_stats(self):
+        for (exchange, topic, stage), summary in sorted(self.stats().items()):
+            self._log.info(
+                f"[LATENCY] {exchange} {topic} {stage} count={summary['count']} "
+                f"p50={summary['p50']:.1f}us p99={summary['p99']:.1f}us "
+                f"p99.9={summary['p99.9']:.1f}us max={summary['max']:.1f}us"
+            )
+
+    async def _log_periodically(self):
+        while True:
+            await asyncio.sleep(self._log_interval)
+            self.log_stats()
+
+    async def start(self):
+        if self._log_interval:
+            self._task_manager.create_task(self._log_periodically())
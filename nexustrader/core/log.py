@@ -6,6 +6,62 @@ import asyncio
 import spdlog as spd
 
 
+class Logger:
+    """
+    Level-checking facade over `spdlog.Logger`.
+
+    Messages take lazy `%` args, which are only formatted when the level is enabled:
+
+        log.debug("Request: %s", url)
+
+    For messages that are expensive to build, guard them with the level flags:
+
+        if log.is_debug:
+            log.debug(f"Order update: {msg}")
+    """
+
+    __slots__ = ("_logger", "is_debug", "is_info", "is_warn", "is_error")
+
+    def __init__(self, logger: spd.Logger):
+        self._logger = logger
+        self._update_flags()
+
+    def _update_flags(self):
+        level = self._logger.level()
+        self.is_debug = level <= spd.LogLevel.DEBUG
+        self.is_info = level <= spd.LogLevel.INFO
+        self.is_warn = level <= spd.LogLevel.WARN
+        self.is_error = level <= spd.LogLevel.ERR
+
+    def set_level(self, level: spd.LogLevel):
+        self._logger.set_level(level)
+        self._update_flags()
+
+    def debug(self, msg: str, *args):
+        if self.is_debug:
+            self._logger.debug(msg % args if args else msg)
+
+    def info(self, msg: str, *args):
+        if self.is_info:
+            self._logger.info(msg % args if args else msg)
+
+    def warn(self, msg: str, *args):
+        if self.is_warn:
+            self._logger.warn(msg % args if args else msg)
+
+    warning = warn
+
+    def error(self, msg: str, *args):
+        if self.is_error:
+            self._logger.error(msg % args if args else msg)
+
+    def critical(self, msg: str, *args):
+        self._logger.critical(msg % args if args else msg)
+
+    def __getattr__(self, name: str):
+        return getattr(self._logger, name)
+
+
 class SpdLog:
     """
     Log registration class responsible for creating and managing loggers.
@@ -24,6 +80,8 @@ class SpdLog:
     async_mode = True
     error_logger = None
     sinks = None
+    sink_level = None  # lowest level written by any sink in production mode
+    flush_level = None
     production_mode = False
 
     @classmethod
@@ -64,21 +122,25 @@ class SpdLog:
         name: str,
         level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] = "INFO",
         flush: bool = False,
-    ) -> spd.Logger:
+    ) -> Logger:
         """
         Get the logger with the specified name. If it doesn't exist, create a new logger.
 
         :param name: Logger name
         :param level: Log level
-        :param flush: Whether to flush after each log entry
-        :return: spdlog.Logger instance
+        :param flush: Whether to flush after each log entry. In production mode only
+            entries at `flush_level` and above are flushed
+        :return: Logger instance
         """
         if name not in cls.loggers:
             if not cls.log_dir_created:
                 cls.log_dir.mkdir(parents=True, exist_ok=True)
                 cls.log_dir_created = True
+            log_level = cls.parse_level(level)
             if cls.production_mode:
                 logger_instance = spd.SinkLogger(name=name, sinks=cls.sinks)
+                # messages no sink writes are dropped before they are formatted
+                log_level = max(log_level, cls.sink_level)
             else:
                 logger_instance = spd.DailyLogger(
                     name=name,
@@ -87,10 +149,13 @@ class SpdLog:
                     minute=0,
                     async_mode=cls.async_mode,
                 )
-            logger_instance.set_level(cls.parse_level(level))
+            logger_instance.set_level(log_level)
             if flush:
-                logger_instance.flush_on(cls.parse_level(level))
-            cls.loggers[name] = logger_instance
+                if cls.flush_level is not None:
+                    logger_instance.flush_on(max(log_level, cls.flush_level))
+                else:
+                    logger_instance.flush_on(log_level)
+            cls.loggers[name] = Logger(logger_instance)
         return cls.loggers[name]
 
     @classmethod
@@ -119,7 +184,7 @@ class SpdLog:
         """
         for logger in cls.loggers.values():
             logger.flush()
-            logger.drop()
+            logger.close()
 
     @classmethod
     def initialize(
@@ -130,6 +195,7 @@ class SpdLog:
         file_dir: str = ".log",
         async_mode: bool = True,
         production_mode: bool = True,
+        flush_level: Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"] | None = "ERROR",
     ):
         """
         Initialize the log registry.
@@ -139,6 +205,7 @@ class SpdLog:
         :param file_dir: Log file directory
         :param async_mode: Whether to enable asynchronous mode
         :param production_mode: Whether to enable production mode, if enable, log will be written to one file and stdout. Otherwise, each `class` will have its own log file (easy to debug)
+        :param flush_level: In production mode, the lowest level that is flushed to the file right away, lower levels are flushed by spdlog in batches. `None` flushes every entry
         """
         cls.production_mode = production_mode
         cls.log_dir = Path(file_dir)
@@ -160,6 +227,8 @@ class SpdLog:
                 daily_sink,
                 stdout_sink,
             ]
+            cls.sink_level = min(cls.parse_level(level), cls.parse_level(std_level))
+            cls.flush_level = cls.parse_level(flush_level) if flush_level else None
 
     @classmethod
     def __del__(cls):
@@ -0,0 +1,251 @@
+from collections import defaultdict
+from typing import Callable, Dict
+
+from nexustrader.constants import AccountType, ExchangeType
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.nautilius_core import MessageBus
+from nexustrader.core.timer import TimerHandle, TimerWheel
+from nexustrader.schema import BookL1, InstrumentId, MarkPrice, PnL, Position, Trade
+
+
+# a mark from a source of a higher rank replaces the marks of the lower ones
+MARK_RANKS = {"trade": 0, "bookl1": 1, "mark_price": 2}
+
+
+class PnLTotals:
+    """Sums of the positions of an account, an exchange or the portfolio"""
+
+    __slots__ = ("unrealized_pnl", "realized_pnl", "notional")
+
+    def __init__(self):
+        self.unrealized_pnl = 0.0
+        self.realized_pnl = 0.0
+        self.notional = 0.0  # sum of |amount| * mark
+
+    def __repr__(self) -> str:
+        return (
+            f"PnLTotals(unrealized_pnl={self.unrealized_pnl}, "
+            f"realized_pnl={self.realized_pnl}, notional={self.notional})"
+        )
+
+
+class PositionPnL:
+    """Mark-to-market state of the position of one symbol"""
+
+    __slots__ = (
+        "symbol",
+        "exchange",
+        "account_type",
+        "linear",
+        "amount",
+        "entry_price",
+        "mark",
+        "mark_rank",
+        "unrealized_pnl",
+        "realized_pnl",
+        "notional",
+        "_reported_realized_pnl",
+        "_reported_unrealized_pnl",
+    )
+
+    def __init__(
+        self,
+        symbol: str,
+        exchange: ExchangeType,
+        account_type: AccountType | None,
+        linear: bool,
+    ):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.account_type = account_type
+        self.linear = linear
+        self.amount = 0.0  # signed, 0 once closed
+        self.entry_price = 0.0
+        self.mark = 0.0  # 0 if unknown
+        self.mark_rank = -1
+        self.unrealized_pnl = 0.0
+        self.realized_pnl = 0.0  # since the engine started, over every position of the symbol
+        self.notional = 0.0
+        self._reported_realized_pnl = 0.0  # `realized_pnl` of the open position
+        self._reported_unrealized_pnl = 0.0
+
+
+class PnLEngine:
+    """
+    Incremental unrealized and realized PnL of every position.
+
+    Positions come from the `position` events of the cache. Each one keeps its mark, the
+    price of its latest `mark_price`, else `bookl1` mid, else `trade` (see `MARK_RANKS`),
+    and a mark tick only revalues the position of its symbol: the change of its
+    unrealized PnL and notional is added to the totals of its account, its exchange and
+    the portfolio, so reading a total is O(1) whatever the number of positions.
+
+    Unrealized PnL is `amount * (mark - entry_price)` in quote currency for spot and linear
+    instruments, inverse positions keep the `unrealized_pnl` reported with the position.
+    Realized PnL is the sum of the changes of the reported `realized_pnl`.
+
+    A `PnL` of the portfolio totals is published on the `pnl` topic after a change, at
+    most once per `publish_interval` seconds.
+    """
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        cache: AsyncCache,
+        timers: TimerWheel,
+        account_type: Callable[[InstrumentId], AccountType] | None = None,
+        publish_interval: float = 1.0,
+    ):
+        self._msgbus = msgbus
+        self._cache = cache
+        self._timers = timers
+        self._account_type = account_type
+        self._publish_interval_ns = int(publish_interval * 1_000_000_000)
+
+        self._positions: Dict[str, PositionPnL] = {}
+        self._accounts: Dict[AccountType, PnLTotals] = defaultdict(PnLTotals)
+        self._exchanges: Dict[ExchangeType, PnLTotals] = defaultdict(PnLTotals)
+        self._portfolio = PnLTotals()
+
+        self._published_ns: int | None = None
+        self._publish_timer: TimerHandle | None = None
+        self.published = 0
+
+        msgbus.subscribe(topic="position", handler=self._on_position)
+        msgbus.subscribe(topic="bookl1", handler=self._on_bookl1)
+        msgbus.subscribe(topic="trade", handler=self._on_trade)
+        msgbus.subscribe(topic="mark_price", handler=self._on_mark_price)
+
+    @property
+    def portfolio(self) -> PnLTotals:
+        return self._portfolio
+
+    @property
+    def unrealized_pnl(self) -> float:
+        return self._portfolio.unrealized_pnl
+
+    @property
+    def realized_pnl(self) -> float:
+        return self._portfolio.realized_pnl
+
+    def account(self, account_type: AccountType) -> PnLTotals:
+        return self._accounts[account_type]
+
+    def exchange(self, exchange: ExchangeType) -> PnLTotals:
+        return self._exchanges[exchange]
+
+    def position(self, symbol: str) -> PositionPnL | None:
+        return self._positions.get(symbol)
+
+    def _state(self, symbol: str, exchange: ExchangeType) -> PositionPnL:
+        state = self._positions.get(symbol)
+        if state is None:
+            instrument_id = InstrumentId.from_str(symbol)
+            state = PositionPnL(
+                symbol,
+                exchange,
+                self._account_type(instrument_id) if self._account_type else None,
+                not instrument_id.is_inverse,
+            )
+            if book := self._cache.bookl1(symbol):
+                self._set_mark(state, book.mid, MARK_RANKS["bookl1"])
+            self._positions[symbol] = state
+        return state
+
+    def _on_position(self, position: Position):
+        state = self._state(position.symbol, position.exchange)
+        realized_pnl = 0.0
+        # a closed position reported without its realized pnl keeps the one reported open
+        if position.is_opened or position.realized_pnl:
+            realized_pnl = position.realized_pnl - state._reported_realized_pnl
+        if position.is_opened:
+            state.amount = float(position.signed_amount)
+            state.entry_price = position.entry_price
+            state._reported_realized_pnl = position.realized_pnl
+            state._reported_unrealized_pnl = position.unrealized_pnl
+        else:  # the next position of the symbol reports its realized pnl from 0
+            state.amount = 0.0
+            state._reported_realized_pnl = 0.0
+            state._reported_unrealized_pnl = 0.0
+        if realized_pnl:
+            state.realized_pnl += realized_pnl
+            self._add(state, 0.0, realized_pnl, 0.0)
+        self._revalue(state)
+
+    def _on_bookl1(self, bookl1: BookL1):
+        state = self._positions.get(bookl1.symbol)
+        if state is not None and self._set_mark(state, bookl1.mid, MARK_RANKS["bookl1"]):
+            self._revalue(state)
+
+    def _on_trade(self, trade: Trade):
+        state = self._positions.get(trade.symbol)
+        if state is not None and self._set_mark(state, trade.price, MARK_RANKS["trade"]):
+            self._revalue(state)
+
+    def _on_mark_price(self, mark_price: MarkPrice):
+        state = self._positions.get(mark_price.symbol)
+        if state is not None and self._set_mark(state, mark_price.price, MARK_RANKS["mark_price"]):
+            self._revalue(state)
+
+    @staticmethod
+    def _set_mark(state: PositionPnL, price: float, rank: int) -> bool:
+        if rank < state.mark_rank or not price:
+            return False
+        state.mark_rank = rank
+        state.mark = price
+        return True
+
+    def _revalue(self, state: PositionPnL):
+        if not state.amount:
+            unrealized_pnl = 0.0
+        elif not state.linear:
+            unrealized_pnl = state._reported_unrealized_pnl
+        elif state.mark:
+            unrealized_pnl = state.amount * (state.mark - state.entry_price)
+        else:  # no price yet
+            unrealized_pnl = state.unrealized_pnl
+        notional = abs(state.amount) * state.mark
+        unrealized_change = unrealized_pnl - state.unrealized_pnl
+        notional_change = notional - state.notional
+        if unrealized_change or notional_change:
+            state.unrealized_pnl = unrealized_pnl
+            state.notional = notional
+            self._add(state, unrealized_change, 0.0, notional_change)
+
+    def _add(self, state: PositionPnL, unrealized_pnl: float, realized_pnl: float, notional: float):
+        totals = (self._portfolio, self._exchanges[state.exchange])
+        if state.account_type is not None:
+            totals += (self._accounts[state.account_type],)
+        for total in totals:
+            total.unrealized_pnl += unrealized_pnl
+            total.realized_pnl += realized_pnl
+            total.notional += notional
+        self._schedule_publish()
+
+    def _schedule_publish(self):
+        if self._publish_timer is not None:
+            return
+        now_ns = self._timers.timestamp_ns()
+        if (
+            self._published_ns is None
+            or now_ns - self._published_ns >= self._publish_interval_ns
+        ):
+            self._publish()
+        else:
+            self._publish_timer = self._timers.call_at(
+                self._published_ns + self._publish_interval_ns, self._publish
+            )
+
+    def _publish(self):
+        self._publish_timer = None
+        self._published_ns = self._timers.timestamp_ns()
+        self.published += 1
+        self._msgbus.publish(
+            topic="pnl",
+            msg=PnL(
+                timestamp=self._timers.clock.timestamp_ms(),
+                unrealized_pnl=self._portfolio.unrealized_pnl,
+                realized_pnl=self._portfolio.realized_pnl,
+                notional=self._portfolio.notional,
+            ),
+        )
@@ -0,0 +1,193 @@
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Tuple
+
+from nexustrader.constants import AccountType, ExchangeType
+from nexustrader.core.nautilius_core import MessageBus
+from nexustrader.schema import AssetExposure, BalanceUpdate, BaseMarket, BookL1, Position
+
+
+PEGGED_ASSETS = ("USDT", "USDC", "USD", "FDUSD", "BUSD", "DAI")
+
+
+class SymbolInfo:
+    """Assets of a symbol and how its positions convert to the base asset"""
+
+    __slots__ = ("base", "quote", "contract_size", "inverse")
+
+    def __init__(self, market: BaseMarket):
+        self.base = market.base
+        self.quote = market.quote
+        self.contract_size = market.contractSize or 1.0
+        self.inverse = bool(market.inverse)
+
+
+class AssetState:
+    """Running sums of one asset"""
+
+    __slots__ = (
+        "asset",
+        "balance",
+        "position",
+        "inverse_notional",
+        "exchange_amount",
+        "exchange_inverse_notional",
+        "net",
+        "value",
+    )
+
+    def __init__(self, asset: str):
+        self.asset = asset
+        self.balance = 0.0
+        self.position = 0.0  # linear and spot positions in the asset
+        self.inverse_notional = 0.0  # inverse positions in quote, the asset amount moves with the price
+        self.exchange_amount: Dict[ExchangeType, float] = defaultdict(float)
+        self.exchange_inverse_notional: Dict[ExchangeType, float] = defaultdict(float)
+        self.net = 0.0
+        self.value = 0.0  # 0 while the price is unknown
+
+
+class Portfolio:
+    """
+    Net exposure of each asset over the accounts of every exchange, valued in `currency`.
+
+    The balances come from the `balance` events of the cache and the positions from its
+    `position` events, a position counts in the base asset of its symbol (`amount *
+    contractSize`, an inverse position is its notional over the price). Each event only
+    adds its change to the sums of its asset, and a `bookl1` tick of a symbol only updates
+    the price of its base asset, `mid * price of its quote`, so the hedging reads `net`,
+    `value` and `exposure` are O(1) and `snapshot` is O(number of assets).
+
+    The `pegged` assets are priced 1.0 in `currency` and count as cash: they are left out
+    of `gross_value`, the sum of the absolute values of the other assets.
+    """
+
+    def __init__(
+        self,
+        msgbus: MessageBus,
+        market: Callable[[str], BaseMarket | None],
+        account_exchange: Callable[[AccountType], ExchangeType | None],
+        currency: str = "USDT",
+        pegged: Iterable[str] = PEGGED_ASSETS,
+    ):
+        self._market = market
+        self._account_exchange = account_exchange
+        self.currency = currency
+        self._pegged = set(pegged) | {currency}
+
+        self._prices: Dict[str, float] = {asset: 1.0 for asset in self._pegged}
+        self._symbols: Dict[str, SymbolInfo | None] = {}
+        self._assets: Dict[str, AssetState] = {}
+        self._balances: Dict[Tuple[AccountType, str], float] = {}
+        # symbol -> signed amount * contract size, a notional for inverse symbols
+        self._positions: Dict[str, float] = {}
+        self.gross_value = 0.0
+
+        msgbus.subscribe(topic="balance", handler=self._on_balance)
+        msgbus.subscribe(topic="position", handler=self._on_position)
+        msgbus.subscribe(topic="bookl1", handler=self._on_bookl1)
+
+    def price(self, asset: str) -> float | None:
+        return self._prices.get(asset)
+
+    def net(self, asset: str) -> float:
+        """Net amount of an asset, balances and positions of every exchange"""
+        state = self._assets.get(asset)
+        return state.net if state else 0.0
+
+    def value(self, asset: str) -> float:
+        """`net` valued in `currency`, 0 while the price is unknown"""
+        state = self._assets.get(asset)
+        return state.value if state else 0.0
+
+    def exposure(self, asset: str) -> AssetExposure | None:
+        state = self._assets.get(asset)
+        if state:
+            return self._exposure(state)
+
+    def snapshot(self) -> Dict[str, AssetExposure]:
+        return {asset: self._exposure(state) for asset, state in self._assets.items()}
+
+    def _exposure(self, state: AssetState) -> AssetExposure:
+        price = self._prices.get(state.asset)
+        exchanges = dict(state.exchange_amount)
+        if price:
+            for exchange, notional in state.exchange_inverse_notional.items():
+                exchanges[exchange] = exchanges.get(exchange, 0.0) + notional / price
+        return AssetExposure(
+            asset=state.asset,
+            balance=state.balance,
+            position=state.net - state.balance,
+            net=state.net,
+            price=price,
+            value=state.value if price else None,
+            exchanges=exchanges,
+        )
+
+    def _symbol(self, symbol: str) -> SymbolInfo | None:
+        try:
+            return self._symbols[symbol]
+        except KeyError:
+            market = self._market(symbol)
+            info = self._symbols[symbol] = SymbolInfo(market) if market else None
+            return info
+
+    def _asset(self, asset: str) -> AssetState:
+        state = self._assets.get(asset)
+        if state is None:
+            state = self._assets[asset] = AssetState(asset)
+        return state
+
+    def _on_balance(self, update: BalanceUpdate):
+        exchange = self._account_exchange(update.account_type)
+        for balance in update.balances:
+            key = (update.account_type, balance.asset)
+            total = float(balance.total)
+            change = total - self._balances.get(key, 0.0)
+            if not change:
+                continue
+            self._balances[key] = total
+            state = self._asset(balance.asset)
+            state.balance += change
+            state.exchange_amount[exchange] += change
+            self._revalue(state)
+
+    def _on_position(self, position: Position):
+        info = self._symbol(position.symbol)
+        if info is None:
+            return
+        amount = float(position.signed_amount) * info.contract_size if position.is_opened else 0.0
+        change = amount - self._positions.get(position.symbol, 0.0)
+        if not change:
+            return
+        self._positions[position.symbol] = amount
+        state = self._asset(info.base)
+        if info.inverse:
+            state.inverse_notional += change
+            state.exchange_inverse_notional[position.exchange] += change
+        else:
+            state.position += change
+            state.exchange_amount[position.exchange] += change
+        self._revalue(state)
+
+    def _on_bookl1(self, bookl1: BookL1):
+        info = self._symbol(bookl1.symbol)
+        if info is None or info.base in self._pegged:
+            return
+        quote_price = self._prices.get(info.quote)
+        if not quote_price:
+            return
+        self._prices[info.base] = bookl1.mid * quote_price
+        state = self._assets.get(info.base)
+        if state is not None:
+            self._revalue(state)
+
+    def _revalue(self, state: AssetState):
+        price = self._prices.get(state.asset)
+        net = state.balance + state.position
+        if state.inverse_notional and price:
+            net += state.inverse_notional / price
+        state.net = net
+        value = net * price if price else 0.0
+        if state.asset not in self._pegged:
+            self.gross_value += abs(value) - abs(state.value)
+        state.value = value
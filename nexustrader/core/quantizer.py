@@ -0,0 +1,152 @@
+import math
+from decimal import ROUND_CEILING, ROUND_FLOOR, ROUND_HALF_UP, Decimal
+from typing import Literal
+
+import numpy as np
+
+
+ROUNDING = {"round": ROUND_HALF_UP, "ceil": ROUND_CEILING, "floor": ROUND_FLOOR}
+# above 2 ** 48 ticks a float no longer separates the grid points from the half ticks
+MAX_TICKS = float(2**48)
+
+
+class Quantizer:
+    """
+    Rounding to a market precision (`BaseMarket.precision.amount` or `.price`), the
+    rounding metadata is built once.
+
+    The result is the one of quantizing `Decimal(str(value))`: a precision below 1 rounds
+    to its number of decimals (0.5 rounds to 0.1), a precision of 1 or more to a multiple
+    of `int(precision)`, "round" is half up.
+
+    Positive floats of less than 2 ** 48 ticks take an integer fast path: the tick
+    count is estimated in float, then settled by comparing the value with the float of the
+    grid point or half tick next to it. `float(str(value))` is `value`, and float rounding
+    is monotonic, so each comparison has the same outcome as with `Decimal(str(value))`.
+    Other values go through `Decimal`.
+    """
+
+    __slots__ = (
+        "precision",
+        "decimals",
+        "tick",
+        "_step",
+        "_scale",
+        "_quantum",
+        "_exp",
+        "_limit",
+    )
+
+    def __init__(self, precision: float):
+        self.precision = precision
+        if precision >= 1:
+            self.decimals = 0
+            self._step = int(precision)
+            self._scale = None
+            self._quantum = Decimal("1")
+            self._exp = Decimal(self._step)
+            self._limit = MAX_TICKS * self._step
+            self.tick = self._exp  # distance between two grid points
+        else:
+            self._quantum = Decimal(str(precision))
+            self.decimals = -self._quantum.as_tuple().exponent
+            self._step = None
+            self._scale = float(10**self.decimals)
+            self._exp = Decimal("1")
+            self._limit = MAX_TICKS / self._scale
+            self.tick = Decimal("1").scaleb(-self.decimals)
+
+    def quantize(
+        self, value: float, mode: Literal["round", "ceil", "floor"] = "round"
+    ) -> Decimal:
+        if type(value) is float and 0.0 < value < self._limit:
+            ticks = self._float_ticks(value, mode)
+            if self._step is None:
+                return Decimal(ticks).scaleb(-self.decimals)
+            return Decimal(ticks * self._step)
+        return (Decimal(str(value)) / self._exp).quantize(
+            self._quantum, rounding=ROUNDING[mode]
+        ) * self._exp
+
+    def ticks(self, value: float, mode: Literal["round", "ceil", "floor"] = "round") -> int:
+        """Number of ticks of the rounded value, `quantize(value) == ticks * tick`"""
+        if type(value) is float and 0.0 < value < self._limit:
+            return self._float_ticks(value, mode)
+        return int(self.quantize(value, mode) / self.tick)
+
+    def _float_ticks(self, value: float, mode: str) -> int:
+        scale = self._scale
+        if scale is None:
+            step = self._step
+            n = math.floor(value / step)
+            if n * step > value:
+                n -= 1
+            elif (n + 1) * step <= value:
+                n += 1
+            if mode == "floor":
+                return n
+            if mode == "ceil":
+                return n if n * step == value else n + 1
+            return n + 1 if value >= (2 * n + 1) * step / 2 else n
+
+        n = math.floor(value * scale)
+        if n / scale > value:
+            n -= 1
+        elif (n + 1) / scale <= value:
+            n += 1
+        if mode == "floor":
+            return n
+        if mode == "ceil":
+            return n if n / scale == value else n + 1
+        return n + 1 if value >= (2 * n + 1) / (2 * scale) else n
+
+    def ticks_array(
+        self, values: np.ndarray, mode: Literal["round", "ceil", "floor"] = "round"
+    ) -> np.ndarray:
+        """`ticks` of every value as int64"""
+        values = np.asarray(values, dtype=np.float64)
+        ticks, slow = self._array_ticks(values, mode)
+        if not slow.any():
+            return ticks.astype(np.int64)
+        ticks = np.where(slow, 0.0, ticks).astype(np.int64)
+        ticks[slow] = [self.ticks(str(value), mode) for value in values[slow]]
+        return ticks
+
+    def quantize_array(
+        self, values: np.ndarray, mode: Literal["round", "ceil", "floor"] = "round"
+    ) -> np.ndarray:
+        """Rounded values as float64, each the float of the `quantize` result"""
+        values = np.asarray(values, dtype=np.float64)
+        ticks, slow = self._array_ticks(values, mode)
+        if self._scale is None:
+            result = ticks * float(self._step)
+        else:
+            result = ticks / self._scale
+        if slow.any():
+            result[slow] = [float(self.quantize(str(value), mode)) for value in values[slow]]
+        return result
+
+    def _array_ticks(self, values: np.ndarray, mode: str):
+        """Tick counts as float64 and the mask of the values left to the slow path"""
+        scale, step = self._scale, self._step
+        if scale is None:
+            n = np.floor(values / step)
+            n -= n * step > values
+            n += (n + 1) * step <= values
+            if mode == "floor":
+                ticks = n
+            elif mode == "ceil":
+                ticks = n + (n * step != values)
+            else:
+                ticks = n + (values >= (2 * n + 1) * step / 2)
+        else:
+            n = np.floor(values * scale)
+            n -= n / scale > values
+            n += (n + 1) / scale <= values
+            if mode == "floor":
+                ticks = n
+            elif mode == "ceil":
+                ticks = n + (n / scale != values)
+            else:
+                ticks = n + (values >= (2 * n + 1) / (2 * scale))
+        return ticks, ~((values > 0.0) & (values < self._limit))
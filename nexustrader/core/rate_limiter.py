@@ -0,0 +1,125 @@
+import time
+import heapq
+import asyncio
+from itertools import count
+from typing import ClassVar, Dict, Hashable, List
+
+from nexustrader.constants import RequestPriority
+
+
+class WeightedRateLimiter:
+    """Token bucket of `max_weight` per `time_period` seconds with priority.
+
+    Requests acquire their endpoint weight and are served by `RequestPriority`, then in
+    arrival order. Lower priorities may not spend the last `reserve[priority]` share of
+    the budget, so cancels still go through when new orders and kline backfill are
+    throttled. The local estimate is corrected with the usage reported by the exchange
+    (`sync_used`, `sync_remaining`) and a 418/429 `Retry-After` blocks every request.
+
+    Limiters returned by `shared` are shared by every client using the same key, e.g.
+    the connectors of one API key.
+    """
+
+    DEFAULT_RESERVE: ClassVar[Dict[RequestPriority, float]] = {
+        RequestPriority.CANCEL: 0.0,
+        RequestPriority.ORDER: 0.05,
+        RequestPriority.QUERY: 0.2,
+    }
+
+    _shared: ClassVar[Dict[Hashable, "WeightedRateLimiter"]] = {}
+
+    def __init__(
+        self,
+        max_weight: float,
+        time_period: float = 60,
+        reserve: Dict[RequestPriority, float] | None = None,
+    ):
+        self.max_weight = max_weight
+        self.time_period = time_period
+        self._reserve = reserve or self.DEFAULT_RESERVE
+        self._tokens = float(max_weight)
+        self._last = time.monotonic()
+        self._blocked_until = 0.0
+        self._waiters: List[list] = []  # heap of [priority, seq]
+        self._seq = count()
+        self._changed = asyncio.Event()
+
+    @classmethod
+    def shared(
+        cls, key: Hashable, max_weight: float, time_period: float = 60
+    ) -> "WeightedRateLimiter":
+        limiter = cls._shared.get(key)
+        if limiter is None:
+            limiter = cls._shared[key] = cls(max_weight, time_period)
+        return limiter
+
+    @property
+    def remaining(self) -> float:
+        self._refill()
+        return self._tokens
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(
+            self.max_weight,
+            self._tokens + (now - self._last) * self.max_weight / self.time_period,
+        )
+        self._last = now
+
+    def _delay(self, weight: float, priority: RequestPriority) -> float:
+        """Seconds until `weight` can be spent without going below the reserve"""
+        self._refill()
+        floor = self._reserve.get(priority, 0.0) * self.max_weight
+        # a request heavier than the headroom goes through once the bucket is full
+        deficit = min(weight + floor, self.max_weight) - self._tokens
+        delay = deficit * self.time_period / self.max_weight
+        return max(delay, self._blocked_until - time.monotonic())
+
+    def _notify(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def acquire(
+        self, weight: float = 1, priority: RequestPriority = RequestPriority.QUERY
+    ):
+        entry = [priority, next(self._seq)]
+        heapq.heappush(self._waiters, entry)
+        try:
+            while True:
+                if self._waiters[0] is entry:
+                    delay = self._delay(weight, priority)
+                    if delay <= 0:
+                        heapq.heappop(self._waiters)
+                        self._tokens -= weight
+                        self._notify()
+                        return
+                    changed = self._changed
+                    try:
+                        await asyncio.wait_for(changed.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                else:
+                    await self._changed.wait()
+        except BaseException:
+            if entry in self._waiters:
+                self._waiters.remove(entry)
+                heapq.heapify(self._waiters)
+                self._notify()
+            raise
+
+    def sync_used(self, used: float):
+        """Apply the weight the exchange reports as used in the current window"""
+        self.sync_remaining(self.max_weight - used)
+
+    def sync_remaining(self, remaining: float, limit: float | None = None):
+        """Apply the budget the exchange reports as remaining, and its limit if given"""
+        self._refill()
+        if limit:
+            self.max_weight = limit
+        self._tokens = min(self._tokens, float(remaining))
+
+    def block(self, seconds: float):
+        """Hold every request for `seconds`, e.g. after a 418/429 with `Retry-After`"""
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = min(self._tokens, 0.0)
+        self._notify()
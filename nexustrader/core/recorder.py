@@ -0,0 +1,265 @@
+import struct
+import threading
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Dict, Iterator, List, Tuple
+
+import msgspec
+import orjson
+
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import LiveClock
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+FILE_MAGIC = b"NXWS\x02"
+# files of the first version have no session id, their session is the file name
+FILE_MAGIC_V1 = b"NXWS\x01"
+SESSION_ID_SIZE = 16
+# ts_ns (uint64) | conn_id (uint32) | payload length (uint32)
+RECORD_HEADER = struct.Struct("<QII")
+# conn_id reserved for connection metadata records, re-emitted at the head of every file
+META_CONN_ID = 0xFFFFFFFF
+
+
+class RecordedFrame(msgspec.Struct, gc=False):
+    ts_ns: int
+    conn_id: int
+    payload: bytes
+    session: str = ""  # id of the recorder, connection ids are unique within a session
+
+
+class FrameRecorder:
+    """Opt-in recorder for raw websocket frames.
+
+    `record` is called from `Listener.on_ws_frame` and only appends to an in-memory
+    buffer. A background thread drains the buffer, writes length-prefixed records and
+    rotates the output file once `max_bytes` (uncompressed) is reached.
+
+    File layout: `FILE_MAGIC`, the session id of the recorder, then records of
+    `RECORD_HEADER` + payload. Connection ids restart at 0 in every recorder, a connection
+    is identified by its (session, conn_id).
+    """
+
+    def __init__(
+        self,
+        path: str = ".log/ws_record",
+        prefix: str = "frames",
+        max_bytes: int = 256 * 1024 * 1024,
+        compress: bool = False,
+        compress_level: int = 3,
+        flush_interval: float = 0.1,
+    ):
+        if compress and zstandard is None:
+            raise ImportError(
+                "zstandard is required for compressed recording, install it with `pip install zstandard`"
+            )
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        self._clock = LiveClock()
+        self._path = Path(path)
+        self._prefix = prefix
+        self._max_bytes = max_bytes
+        self._compress = compress
+        self._compress_level = compress_level
+        self._flush_interval = flush_interval
+
+        self._session = uuid.uuid4()
+        self._buffer: deque = deque()
+        self._connections: Dict[int, dict] = {}
+        self._next_conn_id = 0
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        self._file = None
+        self._raw_file = None
+        self._file_seq = 0
+        self._file_bytes = 0
+        self.files: List[str] = []
+        self.frames_recorded = 0
+        self.bytes_recorded = 0
+
+    @property
+    def session(self) -> str:
+        return self._session.hex
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def register(self, url: str, **info) -> int:
+        """Register a new websocket connection and return its connection id."""
+        with self._lock:
+            conn_id = self._next_conn_id
+            self._next_conn_id += 1
+            meta = {"session": self.session, "conn_id": conn_id, "url": url, **info}
+            self._connections[conn_id] = meta
+        self._buffer.append(
+            (self._clock.timestamp_ns(), META_CONN_ID, orjson.dumps(meta))
+        )
+        return conn_id
+
+    def record(self, conn_id: int, payload: bytes):
+        self._buffer.append((self._clock.timestamp_ns(), conn_id, payload))
+
+    def start(self):
+        if self.running:
+            return
+        self._path.mkdir(parents=True, exist_ok=True)
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name=type(self).__name__, daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if not self.running:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def _run(self):
+        self._open_file()
+        try:
+            while not self._stop_event.wait(self._flush_interval):
+                self._drain()
+            self._drain()
+        except Exception as e:
+            self._log.error(f"Error writing frames: {e}")
+        finally:
+            self._close_file()
+
+    def _drain(self):
+        buffer = self._buffer
+        if not buffer:
+            return
+        out = bytearray()
+        pack = RECORD_HEADER.pack
+        count = 0
+        while buffer:
+            ts_ns, conn_id, payload = buffer.popleft()
+            out += pack(ts_ns, conn_id, len(payload))
+            out += payload
+            if conn_id != META_CONN_ID:
+                count += 1
+        self._write(out)
+        self.frames_recorded += count
+        self.bytes_recorded += len(out)
+
+    def _write(self, data: bytearray):
+        self._file.write(data)
+        self._file.flush()
+        self._file_bytes += len(data)
+        if self._file_bytes >= self._max_bytes:
+            self._close_file()
+            self._open_file()
+
+    def _open_file(self):
+        timestamp = self._clock.utc_now().strftime("%Y%m%d-%H%M%S")
+        suffix = ".bin.zst" if self._compress else ".bin"
+        # the session keeps the files of recorders started in the same second apart
+        file_name = (
+            self._path
+            / f"{self._prefix}-{timestamp}-{self.session[:8]}-{self._file_seq:04d}{suffix}"
+        )
+        self._file_seq += 1
+
+        self._raw_file = open(file_name, "wb")
+        if self._compress:
+            compressor = zstandard.ZstdCompressor(level=self._compress_level)
+            self._file = compressor.stream_writer(self._raw_file, closefd=False)
+        else:
+            self._file = self._raw_file
+        self.files.append(str(file_name))
+        self._log.debug(f"Recording websocket frames to {file_name}")
+
+        header = bytearray(FILE_MAGIC) + self._session.bytes
+        with self._lock:
+            connections = list(self._connections.values())
+        for meta in connections:
+            payload = orjson.dumps(meta)
+            header += RECORD_HEADER.pack(self._clock.timestamp_ns(), META_CONN_ID, len(payload))
+            header += payload
+        self._file.write(header)
+        self._file_bytes = len(header)
+
+    def _close_file(self):
+        if self._file is None:
+            return
+        if self._compress:
+            self._file.flush(zstandard.FLUSH_FRAME)
+            self._file.close()
+        self._raw_file.close()
+        self._file, self._raw_file = None, None
+
+
+class FrameReader:
+    """Read frames written by `FrameRecorder` from a file or a directory of files.
+
+    Connection metadata records are collected into `connections`, keyed by (session,
+    conn_id), instead of being yielded.
+    """
+
+    def __init__(self, path: str, prefix: str = "frames"):
+        path = Path(path)
+        if path.is_dir():
+            self._files = sorted(
+                str(p) for p in path.iterdir() if p.name.startswith(f"{prefix}-")
+            )
+        else:
+            self._files = [str(path)]
+        self.connections: Dict[Tuple[str, int], dict] = {}
+
+    @property
+    def files(self) -> List[str]:
+        return self._files
+
+    def __iter__(self) -> Iterator[RecordedFrame]:
+        for file_name in self._files:
+            yield from self._read_file(file_name)
+
+    def _read_file(self, file_name: str) -> Iterator[RecordedFrame]:
+        with open(file_name, "rb") as f:
+            data = f.read()
+        if file_name.endswith(".zst"):
+            if zstandard is None:
+                raise ImportError(
+                    "zstandard is required to read compressed recordings, install it with `pip install zstandard`"
+                )
+            data = zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+        view = memoryview(data)
+        if data.startswith(FILE_MAGIC):
+            offset = len(FILE_MAGIC) + SESSION_ID_SIZE
+            session = bytes(view[len(FILE_MAGIC) : offset]).hex()
+        elif data.startswith(FILE_MAGIC_V1):
+            offset = len(FILE_MAGIC_V1)
+            session = file_name
+        else:
+            raise ValueError(f"{file_name} is not a websocket frame recording")
+
+        size = len(data)
+        header_size = RECORD_HEADER.size
+        unpack_from = RECORD_HEADER.unpack_from
+        while offset + header_size <= size:
+            ts_ns, conn_id, length = unpack_from(view, offset)
+            offset += header_size
+            if offset + length > size:
+                # truncated tail, e.g. the process was killed mid-write
+                break
+            payload = bytes(view[offset : offset + length])
+            offset += length
+            if conn_id == META_CONN_ID:
+                meta = orjson.loads(payload)
+                meta.setdefault("session", session)
+                self.connections[(session, meta["conn_id"])] = meta
+                continue
+            yield RecordedFrame(
+                ts_ns=ts_ns, conn_id=conn_id, payload=payload, session=session
+            )
@@ -18,9 +18,9 @@ class OrderRegistry:
         self._uuid_to_order_id[order.uuid] = order.id
         self._order_id_to_uuid[order.id] = order.uuid
         if order.id in self._futures and not self._futures[order.id].done():
-            self._log.debug(f"[ORDER REGISTER]: release the waiting task for order id {order.id}")
+            self._log.debug("[ORDER REGISTER]: release the waiting task for order id %s", order.id)
             self._futures[order.id].set_result(None) # release the waiting task
-        self._log.debug(f"[ORDER REGISTER]: linked order id {order.id} with uuid {order.uuid}")
+        self._log.debug("[ORDER REGISTER]: linked order id %s with uuid %s", order.id, order.uuid)
 
     def get_order_id(self, uuid: str) -> Optional[str]:
         """Get order ID by UUID"""
@@ -39,7 +39,7 @@ class OrderRegistry:
         """Wait for an order ID to be registered"""
         future = self._futures.get(order_id)
         if not future:
-            self._log.debug(f"order id {order_id} already registered")
+            self._log.debug("order id %s already registered", order_id)
             return False
         
         if future.cancelled():
@@ -47,13 +47,13 @@ class OrderRegistry:
             return True
             
         if future.done():
-            self._log.debug(f"order id {order_id} already registered")
+            self._log.debug("order id %s already registered", order_id)
             self._futures.pop(order_id, None)
             return False
             
         try:
             await asyncio.wait_for(future, timeout)
-            self._log.debug(f"order id {order_id} registered")
+            self._log.debug("order id %s registered", order_id)
             return False
         except asyncio.TimeoutError:
             self._log.warn(f"order id {order_id} registered timeout")
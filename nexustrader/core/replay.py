@@ -0,0 +1,159 @@
+import time
+import asyncio
+from typing import Any, Callable, Dict, List, Tuple
+
+import msgspec
+
+from nexustrader.core.log import SpdLog
+from nexustrader.core.recorder import FrameReader, RecordedFrame
+
+
+class RouteStats(msgspec.Struct, kw_only=True):
+    name: str
+    frames: int = 0
+    errors: int = 0
+    handler_ns: int = 0
+
+    @property
+    def msgs_per_sec(self) -> float:
+        """Throughput of the handler itself (decode -> msgbus -> cache -> strategy)."""
+        return self.frames / (self.handler_ns / 1e9) if self.handler_ns else 0.0
+
+
+class ReplayStats(msgspec.Struct, kw_only=True):
+    frames: int = 0
+    skipped: int = 0
+    errors: int = 0
+    elapsed: float = 0.0
+    routes: Dict[str, RouteStats] = {}
+
+    @property
+    def msgs_per_sec(self) -> float:
+        return self.frames / self.elapsed if self.elapsed else 0.0
+
+    def __str__(self) -> str:
+        lines = [
+            f"frames={self.frames} skipped={self.skipped} errors={self.errors} "
+            f"elapsed={self.elapsed:.3f}s msgs/sec={self.msgs_per_sec:,.0f}"
+        ]
+        for route in self.routes.values():
+            lines.append(
+                f"  {route.name}: frames={route.frames} errors={route.errors} "
+                f"msgs/sec={route.msgs_per_sec:,.0f}"
+            )
+        return "\n".join(lines)
+
+
+class FrameReplayer:
+    """Feed frames recorded by `FrameRecorder` into websocket message handlers.
+
+    Frames of a recorded connection are routed to the first handler whose match fields
+    equal the connection metadata (`url`, `client`, `handler`, `account_type`, `conn_id`,
+    `session`). A connection is identified by its (session, conn_id), so a directory
+    holding the recordings of several runs is replayed run by run. Connections without a
+    matching route are skipped.
+
+    Args:
+        path: A recording file or a directory of recording files
+        speed: `None` replays at max speed, otherwise the recorded inter-arrival times are
+            scaled by `1 / speed` (e.g. `speed=10` replays ten times faster than live)
+        yield_every: At max speed, yield to the event loop every `yield_every` frames so
+            tasks spawned by the handlers (OMS queues, cache sync, ...) make progress
+
+    Example:
+        >>> replayer = FrameReplayer(".log/ws_record")
+        >>> replayer.add_connector(binance_public_connector)
+        >>> stats = await replayer.run()
+    """
+
+    def __init__(self, path: str, speed: float | None = None, yield_every: int = 1000):
+        if speed is not None and speed <= 0:
+            raise ValueError(f"speed must be positive, got {speed}")
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        self._reader = FrameReader(path)
+        self._speed = speed
+        self._yield_every = yield_every
+        self._routes: List[Tuple[Dict[str, Any], Callable[[bytes], Any], str]] = []
+
+    def add_handler(
+        self, callback: Callable[[bytes], Any], name: str | None = None, **match
+    ):
+        """Route frames of every recorded connection whose metadata matches `match`."""
+        name = name or getattr(callback, "__qualname__", repr(callback))
+        self._routes.append((match, callback, name))
+
+    def add_connector(self, connector):
+        """Route the frames recorded by `connector`'s websocket client back into it."""
+        handler = connector._ws_msg_handler
+        account_type = str(connector._account_type)
+        self.add_handler(
+            handler,
+            name=f"{handler.__qualname__}[{account_type}]",
+            handler=handler.__qualname__,
+            account_type=account_type,
+        )
+
+    def _resolve(
+        self, session: str, conn_id: int
+    ) -> Tuple[Callable[[bytes], Any], str] | None:
+        meta = self._reader.connections.get(
+            (session, conn_id), {"session": session, "conn_id": conn_id}
+        )
+        for match, handler, name in self._routes:
+            if all(meta.get(key) == value for key, value in match.items()):
+                return handler, name
+        return None
+
+    async def run(self) -> ReplayStats:
+        stats = ReplayStats()
+        resolved: Dict[
+            Tuple[str, int], Tuple[Callable[[bytes], Any], RouteStats] | None
+        ] = {}
+        perf_counter_ns = time.perf_counter_ns
+
+        first_ts_ns = None
+        start = perf_counter_ns()
+        frame: RecordedFrame
+        for frame in self._reader:
+            key = (frame.session, frame.conn_id)
+            route = resolved.get(key, False)
+            if route is False:
+                target = self._resolve(frame.session, frame.conn_id)
+                if target:
+                    handler, name = target
+                    route_stats = stats.routes.setdefault(name, RouteStats(name=name))
+                    route = (handler, route_stats)
+                else:
+                    route = None
+                resolved[key] = route
+            if route is None:
+                stats.skipped += 1
+                continue
+
+            if self._speed:
+                if first_ts_ns is None:
+                    first_ts_ns = frame.ts_ns
+                delay = (frame.ts_ns - first_ts_ns) / self._speed - (
+                    perf_counter_ns() - start
+                )
+                if delay > 0:
+                    await asyncio.sleep(delay / 1e9)
+            elif stats.frames % self._yield_every == 0:
+                await asyncio.sleep(0)
+
+            handler, route_stats = route
+            t0 = perf_counter_ns()
+            try:
+                handler(frame.payload)
+            except Exception as e:
+                # e.g. pong frames try to notify a transport that does not exist in replay
+                route_stats.errors += 1
+                stats.errors += 1
+                self._log.debug(f"Error replaying frame: {e}")
+            route_stats.handler_ns += perf_counter_ns() - t0
+            route_stats.frames += 1
+            stats.frames += 1
+
+        await asyncio.sleep(0)
+        stats.elapsed = (perf_counter_ns() - start) / 1e9
+        return stats
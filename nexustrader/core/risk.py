@@ -0,0 +1,267 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Dict, Tuple
+
+from nexustrader.constants import ExchangeType, OrderStatus
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.nautilius_core import LiveClock, MessageBus
+from nexustrader.schema import BookL1, Order, OrderSubmit, Position
+
+
+@dataclass
+class RiskConfig:
+    """Pre-trade risk rules of the EMS, a rule left to `None` is not checked.
+
+    Exposure is `max(|position + open buys|, |position - open sells|)` of a symbol, valued at
+    its bookl1 mid; an order that does not increase the exposure is never rejected by the
+    exposure rules.
+
+    Attributes:
+        max_order_amount (`float | None`): Max amount of an order
+        max_order_notional (`float | None`): Max amount * price of an order
+        max_symbol_notional (`float | None`): Max exposure notional of a symbol
+        max_exchange_notional (`float | None`): Max sum of the exposure notionals of an exchange
+        max_portfolio_notional (`float | None`): Max sum of the exposure notionals
+        max_open_orders (`int | None`): Max open orders of a symbol
+        max_total_open_orders (`int | None`): Max open orders
+        price_band (`float | None`): Max relative distance of a limit price from the mid,
+            e.g. 0.05 rejects a buy limit 5% above the mid
+        max_orders_per_second (`float | None`): Order rate, bursts up to the same count
+            and at least 1 order
+        symbol_max_notional (`Dict[str, float]`): `max_symbol_notional` of given symbols
+    """
+    max_order_amount: float | None = None
+    max_order_notional: float | None = None
+    max_symbol_notional: float | None = None
+    max_exchange_notional: float | None = None
+    max_portfolio_notional: float | None = None
+    max_open_orders: int | None = None
+    max_total_open_orders: int | None = None
+    price_band: float | None = None
+    max_orders_per_second: float | None = None
+    symbol_max_notional: Dict[str, float] = field(default_factory=dict)
+
+
+class SymbolExposure:
+    """Incremental exposure state of one symbol"""
+
+    __slots__ = (
+        "symbol",
+        "exchange",
+        "position",
+        "open_buy",
+        "open_sell",
+        "open_orders",
+        "mark",
+        "notional",
+        "max_notional",
+    )
+
+    def __init__(self, symbol: str, exchange: ExchangeType, max_notional: float | None):
+        self.symbol = symbol
+        self.exchange = exchange
+        self.position = 0.0  # signed amount
+        self.open_buy = 0.0  # remaining amount of the open orders
+        self.open_sell = 0.0
+        self.open_orders = 0
+        self.mark = 0.0  # last mid, 0 if unknown
+        self.notional = 0.0  # exposure * mark, as counted in the exchange and portfolio sums
+        self.max_notional = max_notional
+
+    def exposure(self, buy: float = 0.0, sell: float = 0.0) -> float:
+        return max(
+            abs(self.position + self.open_buy + buy),
+            abs(self.position - self.open_sell - sell),
+        )
+
+
+class RiskEngine:
+    """
+    Pre-trade checks of the orders created by the EMS, see `RiskConfig`.
+
+    The exposure of a symbol is updated in place from the orders it accepts, the
+    `order_status` of these orders (fills and cancels release their open amount), the
+    `position` events of the cache and the `bookl1` mid of the symbol. The exchange and
+    portfolio notionals are sums kept up to date with the change of the symbol notional,
+    so a check is a few dict lookups and float comparisons whatever the number of
+    positions. `check` returns the reason of a rejection, counted in `rejected`.
+    """
+
+    def __init__(self, msgbus: MessageBus, cache: AsyncCache, config: RiskConfig):
+        self._cache = cache
+        self._config = config
+        self._clock = LiveClock()
+
+        self._symbols: Dict[str, SymbolExposure] = {}
+        self._open: Dict[str, Tuple[SymbolExposure, bool, float]] = {}  # uuid -> symbol, is_buy, remaining
+        self._exchange_notional: Dict[ExchangeType, float] = defaultdict(float)
+        self.portfolio_notional = 0.0
+        self.total_open_orders = 0
+
+        # a bucket below 1 token would never allow an order
+        self._burst = max(config.max_orders_per_second or 0.0, 1.0)
+        self._tokens = self._burst
+        self._tokens_ns = self._clock.timestamp_ns()
+
+        self.checked = 0
+        self.rejected: Dict[str, int] = defaultdict(int)
+
+        msgbus.subscribe(topic="order_status", handler=self._on_order_status)
+        msgbus.subscribe(topic="position", handler=self._on_position)
+        msgbus.subscribe(topic="bookl1", handler=self._on_bookl1)
+
+    def exchange_notional(self, exchange: ExchangeType) -> float:
+        return self._exchange_notional[exchange]
+
+    def symbol_exposure(self, symbol: str) -> SymbolExposure | None:
+        return self._symbols.get(symbol)
+
+    def stats(self) -> Dict[str, int]:
+        return {"checked": self.checked, **self.rejected}
+
+    def _symbol(self, symbol: str, exchange: ExchangeType) -> SymbolExposure:
+        state = self._symbols.get(symbol)
+        if state is None:
+            state = SymbolExposure(
+                symbol,
+                exchange,
+                self._config.symbol_max_notional.get(symbol, self._config.max_symbol_notional),
+            )
+            if position := self._cache.get_position(symbol).value_or(None):
+                state.position = float(position.signed_amount)
+            if book := self._cache.bookl1(symbol):
+                state.mark = book.mid
+            self._symbols[symbol] = state
+            self._revalue(state)
+        return state
+
+    def check(self, order_submit: OrderSubmit) -> str | None:
+        """Check an order to create, an accepted order is counted as open"""
+        self.checked += 1
+        reason = self._check(order_submit)
+        if reason is not None:
+            self.rejected[reason] += 1
+        return reason
+
+    def _check(self, order_submit: OrderSubmit) -> str | None:
+        config = self._config
+        state = self._symbol(order_submit.symbol, order_submit.instrument_id.exchange)
+        amount = float(order_submit.amount)
+        is_buy = order_submit.side.is_buy
+        price = float(order_submit.price) if order_submit.price is not None else state.mark
+
+        if config.max_order_amount is not None and amount > config.max_order_amount:
+            return "max_order_amount"
+        if config.price_band is not None and order_submit.price is not None and state.mark:
+            if (price - state.mark if is_buy else state.mark - price) > config.price_band * state.mark:
+                return "price_band"
+        if config.max_order_notional is not None and amount * price > config.max_order_notional:
+            return "max_order_notional"
+        if config.max_open_orders is not None and state.open_orders >= config.max_open_orders:
+            return "max_open_orders"
+        if (
+            config.max_total_open_orders is not None
+            and self.total_open_orders >= config.max_total_open_orders
+        ):
+            return "max_total_open_orders"
+
+        if (
+            state.max_notional is not None
+            or config.max_exchange_notional is not None
+            or config.max_portfolio_notional is not None
+        ):
+            exposure = (
+                state.exposure(buy=amount) if is_buy else state.exposure(sell=amount)
+            )
+            if exposure > state.exposure():
+                mark = state.mark or price
+                if not mark:
+                    return "no_price"
+                increase = exposure * mark - state.notional
+                if state.max_notional is not None and exposure * mark > state.max_notional:
+                    return "max_symbol_notional"
+                if (
+                    config.max_exchange_notional is not None
+                    and self._exchange_notional[state.exchange] + increase
+                    > config.max_exchange_notional
+                ):
+                    return "max_exchange_notional"
+                if (
+                    config.max_portfolio_notional is not None
+                    and self.portfolio_notional + increase > config.max_portfolio_notional
+                ):
+                    return "max_portfolio_notional"
+
+        if config.max_orders_per_second is not None and not self._take_token():
+            return "throttled"
+
+        self._open[order_submit.uuid] = (state, is_buy, amount)
+        self._add_open(state, is_buy, amount)
+        state.open_orders += 1
+        self.total_open_orders += 1
+        if not state.mark and price:
+            state.mark = price
+        self._revalue(state)
+        return None
+
+    def _take_token(self) -> bool:
+        rate = self._config.max_orders_per_second
+        now_ns = self._clock.timestamp_ns()
+        self._tokens = min(self._burst, self._tokens + (now_ns - self._tokens_ns) * rate / 1e9)
+        self._tokens_ns = now_ns
+        if self._tokens < 1:
+            return False
+        self._tokens -= 1
+        return True
+
+    @staticmethod
+    def _add_open(state: SymbolExposure, is_buy: bool, amount: float):
+        if is_buy:
+            state.open_buy += amount
+        else:
+            state.open_sell += amount
+
+    def _revalue(self, state: SymbolExposure):
+        notional = state.exposure() * state.mark
+        change = notional - state.notional
+        if change:
+            state.notional = notional
+            self._exchange_notional[state.exchange] += change
+            self.portfolio_notional += change
+
+    def _on_order_status(self, order: Order):
+        entry = self._open.get(order.uuid)
+        if entry is None:
+            return
+        state, is_buy, remaining = entry
+        if order.status in (
+            OrderStatus.FILLED,
+            OrderStatus.CANCELED,
+            OrderStatus.EXPIRED,
+            OrderStatus.FAILED,
+        ):
+            del self._open[order.uuid]
+            self._add_open(state, is_buy, -remaining)
+            state.open_orders -= 1
+            self.total_open_orders -= 1
+        elif order.filled:
+            left = float(order.amount - order.filled)
+            self._open[order.uuid] = (state, is_buy, left)
+            self._add_open(state, is_buy, left - remaining)
+        else:
+            return
+        self._revalue(state)
+
+    def _on_position(self, position: Position):
+        state = self._symbols.get(position.symbol)
+        if state is None:
+            return
+        state.position = float(position.signed_amount) if position.is_opened else 0.0
+        self._revalue(state)
+
+    def _on_bookl1(self, bookl1: BookL1):
+        state = self._symbols.get(bookl1.symbol)
+        if state is None:
+            return
+        state.mark = bookl1.mid
+        self._revalue(state)
@@ -0,0 +1,317 @@
+import asyncio
+import inspect
+from typing import Any, Callable, Dict, List
+
+from nexustrader.constants import KlineInterval
+from nexustrader.core.latency import LatencyHistogram
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import LiveClock
+
+
+# weekly klines open on Monday 00:00 UTC, the epoch was a Thursday
+KLINE_ORIGIN_NS: Dict[KlineInterval, int] = {KlineInterval.WEEK_1: 4 * 86400 * 1_000_000_000}
+
+
+class TimerHandle:
+    """A timer of a `TimerWheel`, stopped with `cancel`"""
+
+    __slots__ = ("callback", "deadline_ns", "interval_ns", "_tick", "_cancelled", "_wheel")
+
+    def __init__(
+        self,
+        wheel: "TimerWheel",
+        callback: Callable[[], Any],
+        deadline_ns: int,
+        interval_ns: int | None = None,
+    ):
+        self.callback = callback
+        self.deadline_ns = deadline_ns  # next time the timer is due
+        self.interval_ns = interval_ns
+        self._tick = 0
+        self._cancelled = False
+        self._wheel = wheel
+
+    @property
+    def active(self) -> bool:
+        """Not cancelled, nor fired if one-shot"""
+        return not self._cancelled
+
+    @property
+    def periodic(self) -> bool:
+        return self.interval_ns is not None
+
+    def cancel(self):
+        if not self._cancelled:
+            self._cancelled = True
+            if self._tick >= 0:  # not firing
+                self._wheel._cancel(self)
+
+    def __repr__(self) -> str:
+        return (
+            f"TimerHandle(callback={self.callback!r}, deadline_ns={self.deadline_ns}, "
+            f"interval_ns={self.interval_ns}, active={not self._cancelled})"
+        )
+
+
+class TimerWheel:
+    """
+    Hashed timing wheel of one-shot, periodic and kline-aligned timers on a clock in ns.
+
+    A timer is appended to the slot of its deadline tick (`deadline // tick_ns` modulo the
+    wheel size), scheduling and cancelling are O(1) whatever the number of timers.
+    Periodic timers are rescheduled from their previous deadline, they do not drift.
+
+    Live (`live=True`): the wheel keeps a single event loop callback, at the earliest
+    deadline, a wheel without timers keeps none. Deadlines missed by a periodic timer
+    (e.g. a blocked loop) are skipped and counted in `missed`.
+
+    Backtest (`live=False`): nothing runs by itself, the driver calls `advance_to` with the
+    time of each replayed event. Due timers fire in deadline order with the clock (a
+    `TestClock`) set to their deadline, missed periods included.
+
+    `jitter` is the histogram of fire time - deadline in ns.
+    """
+
+    def __init__(
+        self,
+        clock=None,
+        tick: float = 0.001,
+        wheel_size: int = 1024,
+        live: bool = True,
+    ):
+        if wheel_size <= 0 or wheel_size & (wheel_size - 1):
+            raise ValueError(f"wheel_size must be a power of two, got {wheel_size}")
+        self._log = SpdLog.get_logger(type(self).__name__, level="DEBUG", flush=True)
+        self._clock = clock or LiveClock()
+        self._tick_ns = int(tick * 1_000_000_000)
+        if self._tick_ns <= 0:
+            raise ValueError(f"tick must be positive, got {tick}")
+        self._mask = wheel_size - 1
+        self._slots: List[List[TimerHandle]] = [[] for _ in range(wheel_size)]
+        self._tick = self._clock.timestamp_ns() // self._tick_ns  # current tick
+        self._count = 0
+        self._live = live
+        self._expiring = False
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.TimerHandle | None = None
+        self._wakeup_ns: int | None = None
+
+        self.jitter = LatencyHistogram()
+        self.fired = 0
+        self.cancelled = 0
+        self.missed = 0
+
+    @property
+    def clock(self):
+        return self._clock
+
+    def __len__(self) -> int:
+        return self._count
+
+    def timestamp_ns(self) -> int:
+        return self._clock.timestamp_ns()
+
+    def time(self) -> float:
+        """Clock time in seconds"""
+        return self._clock.timestamp_ns() / 1_000_000_000
+
+    def call_at(self, ts_ns: int, callback: Callable[[], Any]) -> TimerHandle:
+        """Call `callback` once at clock time `ts_ns`"""
+        return self._schedule(TimerHandle(self, callback, int(ts_ns)))
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> TimerHandle:
+        """Call `callback` once in `delay` seconds"""
+        return self.call_at(
+            self._clock.timestamp_ns() + int(delay * 1_000_000_000), callback
+        )
+
+    def call_every(
+        self,
+        interval: float,
+        callback: Callable[[], Any],
+        start_ns: int | None = None,
+    ) -> TimerHandle:
+        """Call `callback` every `interval` seconds, first at `start_ns` or in `interval`"""
+        interval_ns = int(interval * 1_000_000_000)
+        if interval_ns < self._tick_ns:
+            raise ValueError(
+                f"interval must be at least the tick of {self._tick_ns} ns, got {interval}s"
+            )
+        if start_ns is None:
+            start_ns = self._clock.timestamp_ns() + interval_ns
+        return self._schedule(TimerHandle(self, callback, int(start_ns), interval_ns))
+
+    def call_on_kline(
+        self,
+        interval: KlineInterval,
+        callback: Callable[[], Any],
+        offset: float = 0.0,
+    ) -> TimerHandle:
+        """
+        Call `callback` at every close of an `interval` kline, `offset` seconds after it,
+        e.g. `offset=-1` to act one second before the close
+        """
+        interval_ns = interval.seconds * 1_000_000_000
+        origin_ns = KLINE_ORIGIN_NS.get(interval, 0) + int(offset * 1_000_000_000)
+        now_ns = self._clock.timestamp_ns()
+        start_ns = (now_ns - origin_ns) // interval_ns * interval_ns + origin_ns
+        if start_ns <= now_ns:
+            start_ns += interval_ns
+        return self._schedule(TimerHandle(self, callback, start_ns, interval_ns))
+
+    def advance_to(self, ts_ns: int):
+        """Backtest: fire the timers due up to `ts_ns` and move the clock to `ts_ns`"""
+        if self._live:
+            raise RuntimeError("advance_to drives a backtest wheel, use `live=False`")
+        self._expire(ts_ns)
+        self._clock.set_time(ts_ns)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "timers": self._count,
+            "fired": self.fired,
+            "cancelled": self.cancelled,
+            "missed": self.missed,
+            "jitter_ns": self.jitter.percentiles((50, 99, 100)),
+        }
+
+    def close(self):
+        """Cancel every timer"""
+        for slot in self._slots:
+            for handle in slot:
+                handle._cancelled = True
+            slot.clear()
+        self.cancelled += self._count
+        self._count = 0
+        self._disarm()
+
+    def _schedule(self, handle: TimerHandle) -> TimerHandle:
+        # a deadline in the past goes to the current tick, it fires on the next expiry
+        tick = max(handle.deadline_ns // self._tick_ns, self._tick)
+        handle._tick = tick
+        self._slots[tick & self._mask].append(handle)
+        self._count += 1
+        if self._live and not self._expiring:
+            if self._wakeup_ns is None or handle.deadline_ns < self._wakeup_ns:
+                self._arm(handle.deadline_ns)
+        return handle
+
+    def _cancel(self, handle: TimerHandle):
+        # the handle is dropped from its slot the next time the slot is visited
+        self._count -= 1
+        self.cancelled += 1
+        if not self._count:
+            self._disarm()
+
+    def _expire(self, now_ns: int):
+        now_tick = now_ns // self._tick_ns
+        if self._count and now_tick - self._tick > self._mask:
+            # more than a revolution since the last expiry, start from the earliest timer
+            self._tick = max(self._tick, self._earliest_ns() // self._tick_ns)
+        self._expiring = True
+        try:
+            while self._count and self._tick <= now_tick:
+                tick = self._tick
+                slot = self._slots[tick & self._mask]
+                if not slot:
+                    self._tick += 1
+                    continue
+                due, keep = [], []
+                pending = False  # a timer of this tick due later than `now_ns`
+                for handle in slot:
+                    if handle._cancelled:
+                        continue
+                    if handle._tick > tick:
+                        keep.append(handle)
+                    elif handle.deadline_ns <= now_ns:
+                        due.append(handle)
+                    else:
+                        keep.append(handle)
+                        pending = True
+                self._slots[tick & self._mask] = keep
+                if not due:
+                    if pending:
+                        # the wheel stays on this tick until the timer is due
+                        break
+                    self._tick += 1
+                    continue
+                if len(due) > 1:
+                    due.sort(key=_deadline)
+                self._count -= len(due)
+                for handle in due:
+                    self._fire(handle, now_ns)
+                # the fired periodic timers and new timers may be due in this tick again
+        finally:
+            self._expiring = False
+        self._tick = max(self._tick, now_tick)
+
+    def _fire(self, handle: TimerHandle, now_ns: int):
+        if handle._cancelled:  # cancelled by a timer fired before it
+            return
+        handle._tick = -1  # out of the wheel while its callback runs
+        if not self._live:
+            self._clock.set_time(handle.deadline_ns)
+        self.jitter.record(self._clock.timestamp_ns() - handle.deadline_ns)
+        self.fired += 1
+        try:
+            result = handle.callback()
+            if inspect.iscoroutine(result):
+                asyncio.get_running_loop().create_task(result)
+        except Exception as e:
+            self._log.error(f"Error in timer {handle.callback!r}: {e}")
+
+        if handle.interval_ns is None or handle._cancelled:
+            handle._cancelled = True
+            return
+        handle.deadline_ns += handle.interval_ns
+        if self._live and handle.deadline_ns <= now_ns:
+            skipped = (now_ns - handle.deadline_ns) // handle.interval_ns + 1
+            handle.deadline_ns += skipped * handle.interval_ns
+            self.missed += skipped
+        self._schedule(handle)
+
+    def _earliest_ns(self) -> int:
+        # the first slot holding a timer of its own revolution holds the earliest timers
+        for tick in range(self._tick, self._tick + self._mask + 1):
+            deadlines = [
+                handle.deadline_ns
+                for handle in self._slots[tick & self._mask]
+                if handle._tick <= tick and not handle._cancelled
+            ]
+            if deadlines:
+                return min(deadlines)
+        return min(
+            handle.deadline_ns
+            for slot in self._slots
+            for handle in slot
+            if not handle._cancelled
+        )
+
+    def _arm(self, deadline_ns: int):
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        delay = (deadline_ns - self._clock.timestamp_ns()) / 1_000_000_000
+        self._wakeup = self._loop.call_at(
+            self._loop.time() + max(delay, 0.0), self._on_wakeup
+        )
+        self._wakeup_ns = deadline_ns
+
+    def _disarm(self):
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+        self._wakeup = None
+        self._wakeup_ns = None
+
+    def _on_wakeup(self):
+        self._wakeup = None
+        self._wakeup_ns = None
+        self._expire(self._clock.timestamp_ns())
+        if self._count:
+            self._arm(self._earliest_ns())
+
+
+def _deadline(handle: TimerHandle) -> int:
+    return handle.deadline_ns
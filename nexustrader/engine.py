@@ -7,6 +7,15 @@ from nexustrader.config import Config
 from nexustrader.strategy import Strategy
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.recorder import FrameRecorder
+from nexustrader.core.conflation import BookL1Conflator
+from nexustrader.core.latency import LatencyTracker
+from nexustrader.core.clock_sync import ClockSync
+from nexustrader.core.event_log import EventLog
+from nexustrader.core.timer import TimerWheel
+from nexustrader.core.risk import RiskEngine
+from nexustrader.core.pnl import PnLEngine
+from nexustrader.core.portfolio import Portfolio
 from nexustrader.error import EngineBuildError, SubscriptionError
 from nexustrader.base import (
     ExchangeManager,
@@ -42,7 +51,7 @@ from nexustrader.exchange.okx import (
 )
 from nexustrader.core.entity import TaskManager, ZeroMQSignalRecv
 from nexustrader.core.nautilius_core import MessageBus, TraderId, LiveClock
-from nexustrader.schema import InstrumentId
+from nexustrader.schema import BaseMarket, InstrumentId
 from nexustrader.constants import DataType
 
 class Engine:
@@ -68,6 +77,9 @@ class Engine:
         trader_id = f"{self._config.strategy_id}-{self._config.user_id}"
 
         self._custom_signal_recv = None
+        self._ws_recorder: FrameRecorder | None = None
+        self._clock_sync: ClockSync | None = None
+        self._event_log: EventLog | None = None
 
         self._msgbus = MessageBus(
             trader_id=TraderId(trader_id),
@@ -92,6 +104,53 @@ class Engine:
         self._oms: Dict[ExchangeType, OrderManagementSystem] = {}
         self._ems: Dict[ExchangeType, ExecutionManagementSystem] = {}
 
+        self._bookl1_conflator: BookL1Conflator | None = None
+        if config.bookl1_conflation_config:
+            self._bookl1_conflator = BookL1Conflator(
+                msgbus=self._msgbus,
+                task_manager=self._task_manager,
+                batch_size=config.bookl1_conflation_config.batch_size,
+            )
+
+        self._latency_tracker: LatencyTracker | None = None
+        if config.latency_config:
+            self._latency_tracker = LatencyTracker(
+                msgbus=self._msgbus,
+                task_manager=self._task_manager,
+                log_interval=config.latency_config.log_interval,
+                sub_bucket_bits=config.latency_config.sub_bucket_bits,
+            )
+
+        self._timers = TimerWheel()
+
+        self._risk_engine: RiskEngine | None = None
+        if config.risk_config:
+            self._risk_engine = RiskEngine(
+                msgbus=self._msgbus,
+                cache=self._cache,
+                config=config.risk_config,
+            )
+
+        self._pnl_engine: PnLEngine | None = None
+        if config.pnl_config:
+            self._pnl_engine = PnLEngine(
+                msgbus=self._msgbus,
+                cache=self._cache,
+                timers=self._timers,
+                account_type=self._private_account_type,
+                publish_interval=config.pnl_config.publish_interval,
+            )
+
+        self._portfolio: Portfolio | None = None
+        if config.portfolio_config:
+            self._portfolio = Portfolio(
+                msgbus=self._msgbus,
+                market=self._symbol_market,
+                account_exchange=self._account_exchange,
+                currency=config.portfolio_config.currency,
+                pegged=config.portfolio_config.pegged,
+            )
+
         self._strategy: Strategy = config.strategy
         self._strategy._init_core(
             cache=self._cache,
@@ -101,6 +160,12 @@ class Engine:
             exchanges=self._exchanges,
             private_connectors=self._private_connectors,
             public_connectors=self._public_connectors,
+            bookl1_conflator=self._bookl1_conflator,
+            latency_tracker=self._latency_tracker,
+            timers=self._timers,
+            risk_engine=self._risk_engine,
+            pnl_engine=self._pnl_engine,
+            portfolio=self._portfolio,
         )
 
     def _public_connector_check(self):
@@ -237,6 +302,8 @@ class Engine:
                             quote_currency=mock_conn_config.quote_currency,
                             update_interval=mock_conn_config.update_interval,
                             leverage=mock_conn_config.leverage,
+                            fixed_point=mock_conn_config.fixed_point,
+                            pnl_engine=self._pnl_engine,
                         )
                         self._private_connectors[account_type] = private_connector
                     elif mock_conn_config.account_type.is_inverse_mock:
@@ -275,6 +342,9 @@ class Engine:
                             msgbus=self._msgbus,
                             rate_limit=config.rate_limit,
                             task_manager=self._task_manager,
+                            enable_ws_order=config.enable_ws_order,
+                            http_pool=config.http_pool,
+                            http_backend=config.http_backend,
                         )
                         self._private_connectors[account_type] = private_connector
 
@@ -296,6 +366,9 @@ class Engine:
                             msgbus=self._msgbus,
                             rate_limit=config.rate_limit,
                             task_manager=self._task_manager,
+                            enable_ws_order=config.enable_ws_order,
+                            http_pool=config.http_pool,
+                            http_backend=config.http_backend,
                         )
                         self._private_connectors[account_type] = private_connector
 
@@ -311,6 +384,9 @@ class Engine:
                                 msgbus=self._msgbus,
                                 rate_limit=config.rate_limit,
                                 task_manager=self._task_manager,
+                                enable_ws_order=config.enable_ws_order,
+                                http_pool=config.http_pool,
+                                http_backend=config.http_backend,
                             )
                             self._private_connectors[account_type] = private_connector
 
@@ -343,6 +419,56 @@ class Engine:
                 zmq_config, self._strategy.on_custom_signal, self._task_manager
             )
 
+    def _build_ws_instrumentation(self):
+        recorder_config = self._config.ws_recorder_config
+        if recorder_config:
+            self._ws_recorder = FrameRecorder(
+                path=recorder_config.path,
+                prefix=recorder_config.prefix,
+                max_bytes=recorder_config.max_bytes,
+                compress=recorder_config.compress,
+                flush_interval=recorder_config.flush_interval,
+            )
+
+        connectors = list(self._public_connectors.values()) + list(
+            self._private_connectors.values()
+        )
+        for connector in connectors:
+            for ws_client in connector.ws_clients():
+                ws_client.set_recorder(self._ws_recorder)
+                ws_client.set_latency_tracker(self._latency_tracker)
+
+    def _build_clock_sync(self):
+        clock_sync_config = self._config.clock_sync_config
+        if not clock_sync_config or self._config.is_mock:
+            return
+        self._clock_sync = ClockSync(
+            task_manager=self._task_manager,
+            interval=clock_sync_config.interval,
+            samples=clock_sync_config.samples,
+            recv_window=clock_sync_config.recv_window,
+        )
+        for account_type, connector in self._private_connectors.items():
+            self._clock_sync.register(
+                name=str(account_type),
+                get_server_time=connector.get_server_time,
+                apply=connector.set_time_offset,
+            )
+
+    def _build_event_log(self):
+        event_log_config = self._config.event_log_config
+        if not event_log_config:
+            return
+        self._event_log = EventLog(
+            path=event_log_config.path,
+            prefix=event_log_config.prefix,
+            flush_interval=event_log_config.flush_interval,
+        )
+        for ems in self._ems.values():
+            ems.set_event_log(self._event_log)
+        for oms in self._oms.values():
+            oms.set_event_log(self._event_log)
+
     def _build_ems(self):
         for exchange_id in self._exchanges.keys():
             match exchange_id:
@@ -380,6 +506,10 @@ class Engine:
                     )
                     self._ems[exchange_id]._build(self._private_connectors)
 
+        for ems in self._ems.values():
+            ems.set_timer_wheel(self._timers)
+            ems.set_risk_engine(self._risk_engine)
+
     def _build_oms(self):
         for exchange_id in self._exchanges.keys():
             match exchange_id:
@@ -409,11 +539,30 @@ class Engine:
         self._build_exchanges()
         self._build_public_connectors()
         self._build_private_connectors()
+        self._build_ws_instrumentation()
+        self._build_clock_sync()
         self._build_ems()
         self._build_oms()
+        self._build_event_log()
         self._build_custom_signal_recv()
         self._is_built = True
 
+    def _symbol_market(self, symbol: str) -> BaseMarket | None:
+        exchange = self._exchanges.get(InstrumentId.from_str(symbol).exchange)
+        if exchange:
+            return exchange.market.get(symbol)
+
+    def _account_exchange(self, account_type: AccountType) -> ExchangeType | None:
+        connector = self._private_connectors.get(account_type)
+        if connector:
+            return connector._exchange_id
+
+    def _private_account_type(self, instrument_id: InstrumentId) -> AccountType | None:
+        """Account type of the positions of an instrument, mock account types included"""
+        ems = self._ems.get(instrument_id.exchange)
+        if ems:
+            return ems._instrument_id_to_account_type(instrument_id)
+
     def _instrument_id_to_account_type(
         self, instrument_id: InstrumentId
     ) -> AccountType:
@@ -571,6 +720,14 @@ class Engine:
 
     async def _start(self):
         await self._cache.start() #NOTE: this must be the first thing to call
+        if self._ws_recorder:
+            self._ws_recorder.start()
+        if self._event_log:
+            self._event_log.start()
+        if self._latency_tracker:
+            await self._latency_tracker.start()
+        if self._clock_sync:
+            await self._clock_sync.start()
         await self._start_oms()
         await self._start_ems()
         await self._start_connectors()
@@ -582,6 +739,7 @@ class Engine:
     async def _dispose(self):
         if self._scheduler_started:
             self._strategy._scheduler.shutdown()
+        self._timers.close()
         for connector in self._public_connectors.values():
             await connector.disconnect()
         for connector in self._private_connectors.values():
@@ -591,6 +749,10 @@ class Engine:
 
         await self._task_manager.cancel()
         await self._cache.close()
+        if self._ws_recorder:
+            self._ws_recorder.stop()
+        if self._event_log:
+            self._event_log.stop()
 
     def start(self):
         self._build()
@@ -3,7 +3,7 @@ import msgspec
 import sys
 from typing import Dict, Any, List
 from decimal import Decimal
-from nexustrader.base import PublicConnector, PrivateConnector
+from nexustrader.base import PublicConnector, PrivateConnector, WSClient
 from nexustrader.constants import (
     OrderSide,
     OrderStatus,
@@ -12,13 +12,15 @@ from nexustrader.constants import (
     TimeInForce,
     KlineInterval,
     TriggerType,
+    HttpBackend,
 )
-from nexustrader.schema import Order, Position
+from nexustrader.schema import Order, OrderSubmit, Position
 from nexustrader.schema import BookL1, Trade, Kline, MarkPrice, FundingRate, IndexPrice
 from nexustrader.exchange.binance.schema import BinanceMarket
 from nexustrader.exchange.binance.rest_api import BinanceApiClient
 from nexustrader.exchange.binance.constants import BinanceAccountType
-from nexustrader.exchange.binance.websockets import BinanceWSClient
+from nexustrader.exchange.binance.websockets import BinanceWSClient, BinanceWSApiClient
+from nexustrader.exchange.binance.error import BinanceWsApiUnavailable
 from nexustrader.exchange.binance.exchange import BinanceExchangeManager
 from nexustrader.exchange.binance.constants import (
     BinanceWsEventType,
@@ -27,6 +29,8 @@ from nexustrader.exchange.binance.constants import (
     BinanceEnumParser,
 )
 from nexustrader.exchange.binance.schema import (
+    BinanceOrder,
+    BinanceBatchOrderError,
     BinanceResponseKline,
     BinanceWsMessageGeneral,
     BinanceTradeData,
@@ -44,7 +48,7 @@ from nexustrader.exchange.binance.schema import (
 )
 from nexustrader.core.cache import AsyncCache
 from nexustrader.core.nautilius_core import MessageBus
-from nexustrader.core.entity import TaskManager, RateLimit
+from nexustrader.core.entity import TaskManager, RateLimit, HttpPoolConfig
 
 
 class BinancePublicConnector(PublicConnector):
@@ -376,6 +380,9 @@ class BinancePrivateConnector(PrivateConnector):
     _market_id: Dict[str, str]
     _api_client: BinanceApiClient
 
+    BATCH_ORDER_LIMIT = 5
+    BATCH_CANCEL_LIMIT = 10
+
     def __init__(
         self,
         account_type: BinanceAccountType,
@@ -384,6 +391,9 @@ class BinancePrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        enable_ws_order: bool | None = None,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         super().__init__(
             account_type=account_type,
@@ -400,13 +410,29 @@ class BinancePrivateConnector(PrivateConnector):
                 secret=exchange.secret,
                 testnet=account_type.is_testnet,
                 recv_window=60000,
+                http_pool=http_pool,
+                http_backend=http_backend,
             ),
             cache=cache,
             msgbus=msgbus,
+            task_manager=task_manager,
             rate_limit=rate_limit,
         )
 
-        self._task_manager = task_manager
+        # orders go over the WebSocket API when enabled and supported, REST otherwise
+        self._ws_api_client: BinanceWSApiClient | None = None
+        if enable_ws_order and account_type.ws_api_url:
+            self._ws_api_client = BinanceWSApiClient(
+                account_type=account_type,
+                api_key=exchange.api_key,
+                secret=exchange.secret,
+                task_manager=task_manager,
+            )
+        elif enable_ws_order:
+            self._log.warn(
+                f"WebSocket API is not supported for {account_type}, orders use REST"
+            )
+
         self._ws_msg_general_decoder = msgspec.json.Decoder(BinanceUserDataStreamMsg)
         self._ws_msg_spot_order_update_decoder = msgspec.json.Decoder(
             BinanceSpotOrderUpdateMsg
@@ -528,6 +554,12 @@ class BinancePrivateConnector(PrivateConnector):
                     )
                     break
 
+    def ws_clients(self) -> List[WSClient]:
+        clients = super().ws_clients()
+        if self._ws_api_client:
+            clients.append(self._ws_api_client)
+        return clients
+
     async def connect(self):
         await super().connect()
         listen_key = await self._start_user_data_stream()
@@ -540,6 +572,29 @@ class BinancePrivateConnector(PrivateConnector):
         else:
             raise RuntimeError("Failed to start user data stream")
 
+        if self._ws_api_client:
+            await self._ws_api_client.connect()
+
+    async def disconnect(self):
+        if self._ws_api_client:
+            self._ws_api_client.disconnect()
+        await super().disconnect()
+
+    async def _ws_api_request(
+        self, method: str, params: Dict[str, Any]
+    ) -> BinanceOrder | None:
+        """Send an order request over the WebSocket API.
+
+        Returns `None` if the request could not be sent and should go over REST instead.
+        """
+        if not self._ws_api_client:
+            return None
+        try:
+            return await self._ws_api_client.request(method, params)
+        except BinanceWsApiUnavailable as e:
+            self._log.warn(f"{e}, falling back to REST")
+            return None
+
     def _ws_msg_handler(self, raw: bytes):
         try:
             msg = self._ws_msg_general_decoder.decode(raw)
@@ -625,24 +680,30 @@ class BinancePrivateConnector(PrivateConnector):
             symbol = self._market_id[id]
 
         # we use the last filled quantity to calculate the cost, instead of the accumulated filled quantity
+        # each exchange string is parsed once
+        amount = Decimal(event_data.q)
+        filled = Decimal(event_data.z)
+        last_filled = Decimal(event_data.l)
+        average = Decimal(event_data.ap)
+
         type = event_data.o
         if type.is_market:
-            cost = Decimal(event_data.l) * Decimal(event_data.ap)
-            cum_cost = Decimal(event_data.z) * Decimal(event_data.ap)
+            cost = last_filled * average
+            cum_cost = filled * average
         elif type.is_limit:
-            price = Decimal(event_data.ap) or Decimal(
+            price = average or Decimal(
                 event_data.p
             )  # if average price is 0 or empty, use price
-            cost = Decimal(event_data.l) * price
-            cum_cost = Decimal(event_data.z) * price
+            cost = last_filled * price
+            cum_cost = filled * price
 
         order = Order(
             exchange=self._exchange_id,
             symbol=symbol,
             status=BinanceEnumParser.parse_order_status(event_data.X),
             id=event_data.i,
-            amount=Decimal(event_data.q),
-            filled=Decimal(event_data.z),
+            amount=amount,
+            filled=filled,
             client_order_id=event_data.c,
             timestamp=res.E,
             type=BinanceEnumParser.parse_futures_order_type(event_data.o),
@@ -652,7 +713,7 @@ class BinancePrivateConnector(PrivateConnector):
             average=float(event_data.ap),
             last_filled_price=float(event_data.L),
             last_filled=float(event_data.l),
-            remaining=Decimal(event_data.q) - Decimal(event_data.z),
+            remaining=amount - filled,
             fee=Decimal(event_data.n),
             fee_currency=event_data.N,
             cum_cost=cum_cost,
@@ -722,7 +783,8 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_api_v3_order(**params)
+            res = await self._ws_api_request("order.place", params)
+            return res or await self._api_client.post_api_v3_order(**params)
 
         elif self._account_type.is_isolated_margin_or_margin:
             if not market.margin:
@@ -736,14 +798,16 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_fapi_v1_order(**params)
+            res = await self._ws_api_request("order.place", params)
+            return res or await self._api_client.post_fapi_v1_order(**params)
 
         elif self._account_type.is_inverse:
             if not market.inverse:
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.post_dapi_v1_order(**params)
+            res = await self._ws_api_request("order.place", params)
+            return res or await self._api_client.post_dapi_v1_order(**params)
 
         elif self._account_type.is_portfolio_margin:
             if market.margin:
@@ -883,9 +947,9 @@ class BinancePrivateConnector(PrivateConnector):
             )
             return order
 
-    async def create_order(
+    def _create_order_params(
         self,
-        symbol: str,
+        market: BinanceMarket,
         side: OrderSide,
         type: OrderType,
         amount: Decimal,
@@ -893,16 +957,9 @@ class BinancePrivateConnector(PrivateConnector):
         time_in_force: TimeInForce = TimeInForce.GTC,
         position_side: PositionSide | None = None,
         **kwargs,
-    ):
-        if self._limiter:
-            await self._limiter.acquire()
-        market = self._market.get(symbol)
-        if not market:
-            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
-        id = market.id
-
+    ) -> Dict[str, Any]:
         params = {
-            "symbol": id,
+            "symbol": market.id,
             "side": BinanceEnumParser.to_binance_order_side(side).value,
             "type": BinanceEnumParser.to_binance_order_type(type).value,
             "quantity": amount,
@@ -928,48 +985,188 @@ class BinancePrivateConnector(PrivateConnector):
             params["reduceOnly"] = True
 
         params.update(kwargs)
+        return params
+
+    def _parse_created_order(
+        self,
+        symbol: str,
+        res: BinanceOrder,
+        type: OrderType,
+        side: OrderSide,
+        amount: Decimal,
+        time_in_force: TimeInForce,
+    ) -> Order:
+        return Order(
+            exchange=self._exchange_id,
+            symbol=symbol,
+            status=OrderStatus.PENDING,
+            id=res.orderId,
+            amount=amount,
+            filled=Decimal(0),
+            client_order_id=res.clientOrderId,
+            timestamp=res.updateTime,
+            type=type,
+            side=side,
+            time_in_force=time_in_force,
+            price=float(res.price) if res.price else None,
+            average=float(res.avgPrice) if res.avgPrice else None,
+            remaining=amount,
+            reduce_only=res.reduceOnly if res.reduceOnly else None,
+            position_side=BinanceEnumParser.parse_position_side(res.positionSide)
+            if res.positionSide
+            else None,
+        )
+
+    def _failed_create_order(
+        self,
+        symbol: str,
+        type: OrderType,
+        side: OrderSide,
+        amount: Decimal,
+        price: Decimal | None,
+        time_in_force: TimeInForce,
+        position_side: PositionSide | None,
+    ) -> Order:
+        return Order(
+            exchange=self._exchange_id,
+            timestamp=self._clock.timestamp_ms(),
+            symbol=symbol,
+            type=type,
+            side=side,
+            amount=amount,
+            price=float(price) if price else None,
+            time_in_force=time_in_force,
+            position_side=position_side,
+            status=OrderStatus.FAILED,
+            filled=Decimal(0),
+            remaining=amount,
+        )
+
+    async def create_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        amount: Decimal,
+        price: Decimal | None = None,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        position_side: PositionSide | None = None,
+        **kwargs,
+    ):
+        if self._limiter:
+            await self._limiter.acquire()
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+
+        params = self._create_order_params(
+            market, side, type, amount, price, time_in_force, position_side, **kwargs
+        )
 
         try:
             res = await self._execute_order_request(market, symbol, params)
-            order = Order(
-                exchange=self._exchange_id,
-                symbol=symbol,
-                status=OrderStatus.PENDING,
-                id=res.orderId,
-                amount=amount,
-                filled=Decimal(0),
-                client_order_id=res.clientOrderId,
-                timestamp=res.updateTime,
-                type=type,
-                side=side,
-                time_in_force=time_in_force,
-                price=float(res.price) if res.price else None,
-                average=float(res.avgPrice) if res.avgPrice else None,
-                remaining=amount,
-                reduce_only=res.reduceOnly if res.reduceOnly else None,
-                position_side=BinanceEnumParser.parse_position_side(res.positionSide)
-                if res.positionSide
-                else None,
+            return self._parse_created_order(
+                symbol, res, type, side, amount, time_in_force
             )
-            return order
         except Exception as e:
             error_msg = f"{e.__class__.__name__}: {str(e)}"
             self._log.error(f"Error creating order: {error_msg} params: {str(params)}")
-            order = Order(
-                exchange=self._exchange_id,
-                timestamp=self._clock.timestamp_ms(),
-                symbol=symbol,
-                type=type,
-                side=side,
-                amount=amount,
-                price=float(price) if price else None,
-                time_in_force=time_in_force,
-                position_side=position_side,
-                status=OrderStatus.FAILED,
-                filled=Decimal(0),
-                remaining=amount,
+            return self._failed_create_order(
+                symbol, type, side, amount, price, time_in_force, position_side
             )
-            return order
+
+    async def _create_batch_orders_chunk(
+        self, orders: List[OrderSubmit]
+    ) -> List[Order]:
+        results: List[Order | None] = [None] * len(orders)
+        batch_params = []
+        batch_index = []
+        for i, order in enumerate(orders):
+            try:
+                market = self._market.get(order.symbol)
+                if not market:
+                    raise ValueError(
+                        f"Symbol {order.symbol} formated wrongly, or not supported"
+                    )
+                batch_params.append(
+                    self._create_order_params(
+                        market,
+                        order.side,
+                        order.type,
+                        order.amount,
+                        order.price,
+                        order.time_in_force,
+                        order.position_side,
+                        **order.kwargs,
+                    )
+                )
+                batch_index.append(i)
+            except Exception as e:
+                self._log.error(f"Error creating order: {type(e).__name__}: {str(e)}")
+
+        if batch_params:
+            if self._limiter:
+                await self._limiter.acquire()
+            try:
+                if self._account_type.is_linear:
+                    res = await self._api_client.post_fapi_v1_batch_orders(batch_params)
+                else:
+                    res = await self._api_client.post_dapi_v1_batch_orders(batch_params)
+            except Exception as e:
+                error_msg = f"{type(e).__name__}: {str(e)}"
+                self._log.error(
+                    f"Error creating batch orders: {error_msg} params: {str(batch_params)}"
+                )
+                res = []
+
+            for i, params, item in zip(batch_index, batch_params, res):
+                order = orders[i]
+                if isinstance(item, BinanceBatchOrderError):
+                    self._log.error(
+                        f"Error creating order: {item.code} {item.msg} params: {str(params)}"
+                    )
+                    continue
+                results[i] = self._parse_created_order(
+                    order.symbol,
+                    item,
+                    order.type,
+                    order.side,
+                    order.amount,
+                    order.time_in_force,
+                )
+
+        return [
+            result
+            or self._failed_create_order(
+                order.symbol,
+                order.type,
+                order.side,
+                order.amount,
+                order.price,
+                order.time_in_force,
+                order.position_side,
+            )
+            for order, result in zip(orders, results)
+        ]
+
+    async def create_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        if not (self._account_type.is_linear or self._account_type.is_inverse):
+            # spot, margin and portfolio margin have no batch order endpoint
+            return await super().create_batch_orders(orders)
+
+        results = await asyncio.gather(
+            *(
+                self._create_batch_orders_chunk(chunk)
+                for chunk in self._chunks(orders, self.BATCH_ORDER_LIMIT)
+            )
+        )
+        return [order for chunk in results for order in chunk]
+
+    @staticmethod
+    def _ws_cancel_params(params: Dict[str, Any]) -> Dict[str, Any]:
+        ws_params = dict(params)
+        ws_params["orderId"] = ws_params.pop("order_id")
+        return ws_params
 
     async def _execute_cancel_order_request(
         self, market: BinanceMarket, symbol: str, params: Dict[str, Any]
@@ -979,7 +1176,10 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_api_v3_order(**params)
+            res = await self._ws_api_request(
+                "order.cancel", self._ws_cancel_params(params)
+            )
+            return res or await self._api_client.delete_api_v3_order(**params)
         elif self._account_type.is_isolated_margin_or_margin:
             if not market.margin:
                 raise ValueError(
@@ -991,13 +1191,19 @@ class BinancePrivateConnector(PrivateConnector):
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_fapi_v1_order(**params)
+            res = await self._ws_api_request(
+                "order.cancel", self._ws_cancel_params(params)
+            )
+            return res or await self._api_client.delete_fapi_v1_order(**params)
         elif self._account_type.is_inverse:
             if not market.inverse:
                 raise ValueError(
                     f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
                 )
-            return await self._api_client.delete_dapi_v1_order(**params)
+            res = await self._ws_api_request(
+                "order.cancel", self._ws_cancel_params(params)
+            )
+            return res or await self._api_client.delete_dapi_v1_order(**params)
         elif self._account_type.is_portfolio_margin:
             if market.margin:
                 return await self._api_client.delete_papi_v1_margin_order(**params)
@@ -1006,6 +1212,30 @@ class BinancePrivateConnector(PrivateConnector):
             elif market.inverse:
                 return await self._api_client.delete_papi_v1_cm_order(**params)
 
+    def _parse_canceled_order(self, symbol: str, res: BinanceOrder) -> Order:
+        return Order(
+            exchange=self._exchange_id,
+            symbol=symbol,
+            status=OrderStatus.CANCELING,
+            id=res.orderId,
+            amount=res.origQty,
+            filled=Decimal(res.executedQty),
+            client_order_id=res.clientOrderId,
+            timestamp=res.updateTime,
+            type=BinanceEnumParser.parse_order_type(res.type) if res.type else None,
+            side=BinanceEnumParser.parse_order_side(res.side) if res.side else None,
+            time_in_force=BinanceEnumParser.parse_time_in_force(res.timeInForce)
+            if res.timeInForce
+            else None,
+            price=res.price,
+            average=res.avgPrice,
+            remaining=Decimal(res.origQty) - Decimal(res.executedQty),
+            reduce_only=res.reduceOnly,
+            position_side=BinanceEnumParser.parse_position_side(res.positionSide)
+            if res.positionSide
+            else None,
+        )
+
     async def cancel_order(self, symbol: str, order_id: int, **kwargs):
         if self._limiter:
             await self._limiter.acquire()
@@ -1022,38 +1252,216 @@ class BinancePrivateConnector(PrivateConnector):
             }
 
             res = await self._execute_cancel_order_request(market, symbol, params)
-
+            return self._parse_canceled_order(symbol, res)
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error canceling order: {error_msg} params: {str(params)}")
             order = Order(
                 exchange=self._exchange_id,
+                timestamp=self._clock.timestamp_ms(),
                 symbol=symbol,
-                status=OrderStatus.CANCELING,
+                id=order_id,
+                status=OrderStatus.FAILED,
+            )
+            return order
+
+    async def get_server_time(self) -> int:
+        if self._account_type.is_spot_or_margin:
+            return await self._api_client.get_api_v3_time()
+        elif self._account_type.is_inverse:
+            return await self._api_client.get_dapi_v1_time()
+        # portfolio margin has no time endpoint, it runs next to the USD-M cluster
+        return await self._api_client.get_fapi_v1_time()
+
+    async def _execute_cancel_all_orders_request(self, market: BinanceMarket, symbol: str):
+        if self._account_type.is_spot:
+            if not market.spot:
+                raise ValueError(
+                    f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
+                )
+            return await self._api_client.delete_api_v3_open_orders(symbol=symbol)
+        elif self._account_type.is_isolated_margin_or_margin:
+            if not market.margin:
+                raise ValueError(
+                    f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
+                )
+            return await self._api_client.delete_sapi_v1_margin_open_orders(symbol=symbol)
+        elif self._account_type.is_linear:
+            if not market.linear:
+                raise ValueError(
+                    f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
+                )
+            return await self._api_client.delete_fapi_v1_all_open_orders(symbol=symbol)
+        elif self._account_type.is_inverse:
+            if not market.inverse:
+                raise ValueError(
+                    f"BinanceAccountType.{self._account_type.value} is not supported for {symbol}"
+                )
+            return await self._api_client.delete_dapi_v1_all_open_orders(symbol=symbol)
+        elif self._account_type.is_portfolio_margin:
+            if market.margin:
+                return await self._api_client.delete_papi_v1_margin_all_open_orders(
+                    symbol=symbol
+                )
+            elif market.linear:
+                return await self._api_client.delete_papi_v1_um_all_open_orders(
+                    symbol=symbol
+                )
+            elif market.inverse:
+                return await self._api_client.delete_papi_v1_cm_all_open_orders(
+                    symbol=symbol
+                )
+
+    async def cancel_all_orders(self, symbol: str) -> List[str] | None:
+        if self._limiter:
+            await self._limiter.acquire()
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+            await self._execute_cancel_all_orders_request(market, market.id)
+            return []
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error canceling all orders: {error_msg} symbol: {symbol}")
+            return None
+
+    async def amend_order(
+        self,
+        symbol: str,
+        order_id: int,
+        side: OrderSide,
+        price: Decimal | None,
+        amount: Decimal,
+        **kwargs,
+    ) -> Order:
+        if self._limiter:
+            await self._limiter.acquire()
+        params = {}
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+            if not (self._account_type.is_linear or self._account_type.is_inverse):
+                # spot only supports cancel-replace, which changes the order id
+                raise ValueError(
+                    f"BinanceAccountType.{self._account_type.value} does not support amending orders"
+                )
+            if not price:
+                raise ValueError("Price is required to amend an order")
+
+            params = {
+                "symbol": market.id,
+                "side": BinanceEnumParser.to_binance_order_side(side).value,
+                "quantity": amount,
+                "price": price,
+                "order_id": order_id,
+                **kwargs,
+            }
+            res = await self._ws_api_request(
+                "order.modify", self._ws_cancel_params(params)
+            )
+            if not res and self._account_type.is_linear:
+                res = await self._api_client.put_fapi_v1_order(**params)
+            elif not res:
+                res = await self._api_client.put_dapi_v1_order(**params)
+
+            return Order(
+                exchange=self._exchange_id,
+                symbol=symbol,
+                status=BinanceEnumParser.parse_order_status(res.status)
+                if res.status
+                else OrderStatus.ACCEPTED,
                 id=res.orderId,
-                amount=res.origQty,
-                filled=Decimal(res.executedQty),
+                amount=Decimal(res.origQty) if res.origQty else amount,
+                filled=Decimal(res.executedQty) if res.executedQty else None,
                 client_order_id=res.clientOrderId,
                 timestamp=res.updateTime,
-                type=BinanceEnumParser.parse_order_type(res.type) if res.type else None,
-                side=BinanceEnumParser.parse_order_side(res.side) if res.side else None,
-                time_in_force=BinanceEnumParser.parse_time_in_force(res.timeInForce)
-                if res.timeInForce
-                else None,
-                price=res.price,
-                average=res.avgPrice,
-                remaining=Decimal(res.origQty) - Decimal(res.executedQty),
-                reduce_only=res.reduceOnly,
-                position_side=BinanceEnumParser.parse_position_side(res.positionSide)
-                if res.positionSide
-                else None,
+                side=side,
+                price=float(res.price) if res.price else float(price),
             )
-            return order
         except Exception as e:
             error_msg = f"{type(e).__name__}: {str(e)}"
-            self._log.error(f"Error canceling order: {error_msg} params: {str(params)}")
-            order = Order(
+            self._log.error(f"Error amending order: {error_msg} params: {str(params)}")
+            return Order(
                 exchange=self._exchange_id,
                 timestamp=self._clock.timestamp_ms(),
                 symbol=symbol,
                 id=order_id,
+                side=side,
+                amount=amount,
+                price=float(price) if price else None,
                 status=OrderStatus.FAILED,
             )
-            return order
+
+    async def _cancel_batch_orders_chunk(
+        self, symbol: str, orders: List[OrderSubmit]
+    ) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+        order_ids = [order.order_id for order in orders]
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+            if self._account_type.is_linear:
+                res = await self._api_client.delete_fapi_v1_batch_orders(
+                    market.id, order_ids
+                )
+            else:
+                res = await self._api_client.delete_dapi_v1_batch_orders(
+                    market.id, order_ids
+                )
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} symbol: {symbol} order_ids: {order_ids}"
+            )
+            res = [None] * len(orders)
+
+        results = []
+        for order_id, item in zip(order_ids, res):
+            if isinstance(item, BinanceOrder):
+                results.append(self._parse_canceled_order(symbol, item))
+                continue
+            if item:
+                self._log.error(
+                    f"Error canceling order: {item.code} {item.msg} order_id: {order_id}"
+                )
+            results.append(
+                Order(
+                    exchange=self._exchange_id,
+                    timestamp=self._clock.timestamp_ms(),
+                    symbol=symbol,
+                    id=order_id,
+                    status=OrderStatus.FAILED,
+                )
+            )
+        return results
+
+    async def cancel_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        if not (self._account_type.is_linear or self._account_type.is_inverse):
+            return await super().cancel_batch_orders(orders)
+
+        # the batch cancel endpoint takes a single symbol
+        positions: Dict[str, List[int]] = {}
+        for i, order in enumerate(orders):
+            positions.setdefault(order.symbol, []).append(i)
+
+        chunks = [
+            (symbol, chunk)
+            for symbol, indices in positions.items()
+            for chunk in self._chunks(indices, self.BATCH_CANCEL_LIMIT)
+        ]
+        chunk_results = await asyncio.gather(
+            *(
+                self._cancel_batch_orders_chunk(symbol, [orders[i] for i in chunk])
+                for symbol, chunk in chunks
+            )
+        )
+
+        results: List[Order | None] = [None] * len(orders)
+        for (_, chunk), chunk_result in zip(chunks, chunk_results):
+            for i, order in zip(chunk, chunk_result):
+                results[i] = order
+        return results
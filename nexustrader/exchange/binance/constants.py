@@ -258,6 +258,10 @@ class BinanceAccountType(AccountType):
     @property
     def ws_url(self):
         return STREAM_URLS[self]
+
+    @property
+    def ws_api_url(self):
+        return WS_API_URLS.get(self)
     
     @property
     def is_mock(self):
@@ -308,6 +312,15 @@ STREAM_URLS = {
     BinanceAccountType.COIN_M_FUTURE_TESTNET: "wss://dstream.binancefuture.com/ws",
 }
 
+WS_API_URLS = {
+    BinanceAccountType.SPOT: "wss://ws-api.binance.com:443/ws-api/v3",
+    BinanceAccountType.USD_M_FUTURE: "wss://ws-fapi.binance.com/ws-fapi/v1",
+    BinanceAccountType.COIN_M_FUTURE: "wss://ws-dapi.binance.com/ws-dapi/v1",
+    BinanceAccountType.SPOT_TESTNET: "wss://testnet.binance.vision/ws-api/v3",
+    BinanceAccountType.USD_M_FUTURE_TESTNET: "wss://testnet.binancefuture.com/ws-fapi/v1",
+    BinanceAccountType.COIN_M_FUTURE_TESTNET: "wss://testnet.binancefuture.com/ws-dapi/v1",
+}
+
 ENDPOINTS = {
     EndpointsType.USER_DATA_STREAM: {
         BinanceAccountType.SPOT: "/api/v3/userDataStream",
@@ -334,6 +347,29 @@ ENDPOINTS = {
 }
 
 
+# request weight per minute and orders per 10 seconds of every api family, the defaults
+# are corrected by the `X-MBX-USED-WEIGHT-1M`/`X-MBX-ORDER-COUNT-10S` response headers
+RATE_LIMITS = {
+    "api": (6000, 100),
+    "sapi": (12000, 100),
+    "fapi": (2400, 300),
+    "dapi": (2400, 300),
+    "papi": (6000, 300),
+}
+
+# request weight of the endpoints that are heavier than 1, klines depend on `limit`
+ENDPOINT_WEIGHTS = {
+    ("GET", "/api/v3/account"): 20,
+    ("GET", "/fapi/v2/account"): 5,
+    ("GET", "/dapi/v1/account"): 5,
+    ("GET", "/api/v3/klines"): 2,
+    ("POST", "/fapi/v1/batchOrders"): 5,
+    ("POST", "/dapi/v1/batchOrders"): 5,
+    ("POST", "/api/v3/userDataStream"): 2,
+    ("PUT", "/api/v3/userDataStream"): 2,
+}
+
+
 class BinanceErrorCode(Enum):
     """
     Represents a Binance error code (covers futures).
@@ -31,6 +31,12 @@ class BinanceClientError(BinanceError):
         super().__init__(status, message, headers)
 
 
+class BinanceWsApiUnavailable(Exception):
+    """
+    Raised when a WebSocket API request could not be sent, it is safe to retry it over REST.
+    """
+
+
 def should_retry(error: BaseException) -> bool:
     """
     Determine if a retry should be attempted based on the error code.
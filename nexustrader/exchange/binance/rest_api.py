@@ -6,16 +6,30 @@ import asyncio
 import aiohttp
 
 
-from typing import Any, Dict
+from typing import Any, Dict, List, Tuple
 from urllib.parse import urljoin, urlencode
 
 from nexustrader.base import ApiClient
-from nexustrader.exchange.binance.schema import BinanceOrder, BinanceListenKey, BinanceSpotAccountInfo, BinanceFuturesAccountInfo, BinanceResponseKline
-from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.binance.schema import BinanceOrder, BinanceBatchOrderError, BinanceCancelAllOrdersResponse, BinanceListenKey, BinanceSpotAccountInfo, BinanceFuturesAccountInfo, BinanceResponseKline
+from nexustrader.exchange.binance.constants import (
+    BinanceAccountType,
+    ENDPOINT_WEIGHTS,
+    RATE_LIMITS,
+)
 from nexustrader.exchange.binance.error import BinanceClientError, BinanceServerError
 from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.rate_limiter import WeightedRateLimiter
+from nexustrader.core.entity import HttpPoolConfig
+from nexustrader.constants import HttpBackend, RequestPriority
 
 class BinanceApiClient(ApiClient):
+    _response_headers = (
+        "X-MBX-USED-WEIGHT-1M",
+        "X-SAPI-USED-IP-WEIGHT-1M",
+        "X-MBX-ORDER-COUNT-10S",
+        "Retry-After",
+    )
+
     def __init__(
         self,
         api_key: str = None,
@@ -23,11 +37,17 @@ class BinanceApiClient(ApiClient):
         testnet: bool = False,
         timeout: int = 10,
         recv_window: int = 60000,
+        enable_rate_limit: bool = True,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         super().__init__(
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            enable_rate_limit=enable_rate_limit,
+            http_pool=http_pool,
+            http_backend=http_backend,
         )
         self._headers = {
             "Content-Type": "application/json",
@@ -44,6 +64,10 @@ class BinanceApiClient(ApiClient):
         self._futures_account_decoder = msgspec.json.Decoder(BinanceFuturesAccountInfo)
         self._listen_key_decoder = msgspec.json.Decoder(BinanceListenKey)
         self._kline_response_decoder = msgspec.json.Decoder(list[BinanceResponseKline])
+        self._batch_order_decoder = msgspec.json.Decoder(list[Dict[str, Any]])
+        self._cancel_all_orders_decoder = msgspec.json.Decoder(
+            BinanceCancelAllOrdersResponse
+        )
 
     def _generate_signature(self, query: str) -> str:
         signature = hmac.new(
@@ -63,13 +87,16 @@ class BinanceApiClient(ApiClient):
         payload: Dict[str, Any] = None,
         signed: bool = False,
         required_timestamp: bool = True,
+        order_count: int = 1,
     ) -> Any:
         self._init_session()
-        
+        if self._enable_rate_limit:
+            await self._acquire_rate_limit(method, endpoint, payload, order_count)
+
         url = urljoin(base_url, endpoint)
         payload = payload or {}
         if required_timestamp:
-            payload["timestamp"] = self._clock.timestamp_ms()
+            payload["timestamp"] = self._timestamp_ms()
             payload["recvWindow"] = self._recv_window
         payload = urlencode(payload)
 
@@ -78,15 +105,13 @@ class BinanceApiClient(ApiClient):
             payload += f"&signature={signature}"
 
         url += f"?{payload}"
-        self._log.debug(f"Request: {url}")
+        self._log.debug("Request: %s", url)
 
         try:
-            response = await self._session.request(
-                method=method,
-                url=url,
-                headers=self._headers,
-            )
-            raw = await response.read()
+            response = await self._request(method, url, self._headers)
+            raw = response.body
+            if self._enable_rate_limit:
+                self._sync_rate_limit(endpoint, response.status, response.headers)
             self.raise_error(raw, response.status, response.headers)
             return raw
         except aiohttp.ClientError as e:
@@ -99,6 +124,106 @@ class BinanceApiClient(ApiClient):
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
 
+    def _ping_path(self, path: str) -> str | None:
+        return {
+            "api": "/api/v3/ping",
+            "sapi": "/api/v3/ping",
+            "fapi": "/fapi/v1/ping",
+            "dapi": "/dapi/v1/ping",
+            "papi": "/papi/v1/ping",
+        }.get(path.split("/")[1])
+
+    async def _acquire_ping_rate_limit(self, path: str):
+        await self._acquire_rate_limit("GET", path, None, 0)
+
+    def _rate_limiters(
+        self, endpoint: str
+    ) -> Tuple[WeightedRateLimiter, WeightedRateLimiter]:
+        """
+        Request weight limiter of the api family, shared by every client on this IP, and
+        order count limiter, shared by every client on this API key
+        """
+        family = endpoint.split("/")[1]
+        max_weight, max_orders = RATE_LIMITS[family]
+        return (
+            WeightedRateLimiter.shared(
+                ("binance", self._testnet, family, "weight"), max_weight, 60
+            ),
+            WeightedRateLimiter.shared(
+                ("binance", self._testnet, family, self._api_key, "orders"),
+                max_orders,
+                10,
+            ),
+        )
+
+    @staticmethod
+    def _request_weight(method: str, endpoint: str, payload: Dict[str, Any] | None) -> int:
+        if endpoint in ("/fapi/v1/klines", "/dapi/v1/klines"):
+            limit = int((payload or {}).get("limit") or 500)
+            if limit < 100:
+                return 1
+            elif limit < 500:
+                return 2
+            elif limit <= 1000:
+                return 5
+            return 10
+        return ENDPOINT_WEIGHTS.get((method, endpoint), 1)
+
+    async def _acquire_rate_limit(
+        self,
+        method: str,
+        endpoint: str,
+        payload: Dict[str, Any] | None,
+        order_count: int,
+    ):
+        weight_limiter, order_limiter = self._rate_limiters(endpoint)
+        priority = self._request_priority(method, endpoint)
+        await weight_limiter.acquire(
+            self._request_weight(method, endpoint, payload), priority
+        )
+        if priority == RequestPriority.ORDER:
+            await order_limiter.acquire(order_count, priority)
+
+    def _sync_rate_limit(self, endpoint: str, status: int, headers: Dict[str, Any]):
+        weight_limiter, order_limiter = self._rate_limiters(endpoint)
+        used_weight = headers.get("X-MBX-USED-WEIGHT-1M") or headers.get(
+            "X-SAPI-USED-IP-WEIGHT-1M"
+        )
+        if used_weight:
+            weight_limiter.sync_used(int(used_weight))
+        if order_count := headers.get("X-MBX-ORDER-COUNT-10S"):
+            order_limiter.sync_used(int(order_count))
+        if status in (418, 429):
+            # 429 is a warning, 418 the ban that follows if requests continue
+            weight_limiter.block(float(headers.get("Retry-After") or 60))
+
+    @staticmethod
+    def _batch_param(value: Any) -> str:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        return str(value)
+
+    def _encode_batch_orders(self, batch_orders: List[Dict[str, Any]]) -> str:
+        return orjson.dumps(
+            [
+                {key: self._batch_param(value) for key, value in order.items()}
+                for order in batch_orders
+            ]
+        ).decode()
+
+    def _decode_batch_orders(
+        self, raw: bytes
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        Items of a batch response are either an order or an error, in request order
+        """
+        return [
+            msgspec.convert(item, BinanceBatchOrderError)
+            if "code" in item and "orderId" not in item
+            else msgspec.convert(item, BinanceOrder)
+            for item in self._batch_order_decoder.decode(raw)
+        ]
+
     def raise_error(self, raw: bytes, status: int, headers: Dict[str, Any]):
         if 400 <= status < 500:
             raise BinanceClientError(status, orjson.loads(raw), headers)
@@ -125,6 +250,33 @@ class BinanceApiClient(ApiClient):
         elif account_type == BinanceAccountType.PORTFOLIO_MARGIN:
             return BinanceAccountType.PORTFOLIO_MARGIN.base_url
 
+    async def get_api_v3_time(self) -> int:
+        """
+        https://developers.binance.com/docs/binance-spot-api-docs/rest-api/general-endpoints#check-server-time
+        """
+        base_url = self._get_base_url(BinanceAccountType.SPOT)
+        end_point = "/api/v3/time"
+        raw = await self._fetch("GET", base_url, end_point, required_timestamp=False)
+        return orjson.loads(raw)["serverTime"]
+
+    async def get_fapi_v1_time(self) -> int:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/market-data/rest-api/Check-Server-Time
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/time"
+        raw = await self._fetch("GET", base_url, end_point, required_timestamp=False)
+        return orjson.loads(raw)["serverTime"]
+
+    async def get_dapi_v1_time(self) -> int:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/market-data/Check-Server-time
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/time"
+        raw = await self._fetch("GET", base_url, end_point, required_timestamp=False)
+        return orjson.loads(raw)["serverTime"]
+
     async def put_dapi_v1_listen_key(self):
         """
         https://developers.binance.com/docs/derivatives/coin-margined-futures/user-data-streams/Keepalive-User-Data-Stream
@@ -449,6 +601,164 @@ class BinanceApiClient(ApiClient):
         raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
         return self._order_decoder.decode(raw)
 
+    async def put_fapi_v1_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: str,
+        price: str,
+        order_id: int,
+        **kwargs,
+    ) -> BinanceOrder:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Modify-Order
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/order"
+        data = {
+            "symbol": symbol,
+            "side": side,
+            "quantity": quantity,
+            "price": price,
+            "orderId": order_id,
+            **kwargs,
+        }
+        raw = await self._fetch("PUT", base_url, end_point, payload=data, signed=True)
+        return self._order_decoder.decode(raw)
+
+    async def put_dapi_v1_order(
+        self,
+        symbol: str,
+        side: str,
+        quantity: str,
+        price: str,
+        order_id: int,
+        **kwargs,
+    ) -> BinanceOrder:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Modify-Order
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/order"
+        data = {
+            "symbol": symbol,
+            "side": side,
+            "quantity": quantity,
+            "price": price,
+            "orderId": order_id,
+            **kwargs,
+        }
+        raw = await self._fetch("PUT", base_url, end_point, payload=data, signed=True)
+        return self._order_decoder.decode(raw)
+
+    async def post_fapi_v1_batch_orders(
+        self, batch_orders: List[Dict[str, Any]]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Place-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/batchOrders"
+        data = {"batchOrders": self._encode_batch_orders(batch_orders)}
+        raw = await self._fetch(
+            "POST",
+            base_url,
+            end_point,
+            payload=data,
+            signed=True,
+            order_count=len(batch_orders),
+        )
+        return self._decode_batch_orders(raw)
+
+    async def post_dapi_v1_batch_orders(
+        self, batch_orders: List[Dict[str, Any]]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Place-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/batchOrders"
+        data = {"batchOrders": self._encode_batch_orders(batch_orders)}
+        raw = await self._fetch(
+            "POST",
+            base_url,
+            end_point,
+            payload=data,
+            signed=True,
+            order_count=len(batch_orders),
+        )
+        return self._decode_batch_orders(raw)
+
+    async def delete_fapi_v1_batch_orders(
+        self, symbol: str, order_ids: List[int]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Cancel-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/batchOrders"
+        data = {
+            "symbol": symbol,
+            "orderIdList": orjson.dumps([int(order_id) for order_id in order_ids]).decode(),
+        }
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
+    async def delete_dapi_v1_batch_orders(
+        self, symbol: str, order_ids: List[int]
+    ) -> List[BinanceOrder | BinanceBatchOrderError]:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Cancel-Multiple-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/batchOrders"
+        data = {
+            "symbol": symbol,
+            "orderIdList": orjson.dumps([int(order_id) for order_id in order_ids]).decode(),
+        }
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._decode_batch_orders(raw)
+
+    async def delete_api_v3_open_orders(self, symbol: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        https://developers.binance.com/docs/binance-spot-api-docs/rest-api/trading-endpoints#cancel-all-open-orders-on-a-symbol-trade
+        """
+        base_url = self._get_base_url(BinanceAccountType.SPOT)
+        end_point = "/api/v3/openOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._batch_order_decoder.decode(raw)
+
+    async def delete_sapi_v1_margin_open_orders(self, symbol: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        https://developers.binance.com/docs/margin_trading/trade/Margin-Account-Cancel-All-Open-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.MARGIN)
+        end_point = "/sapi/v1/margin/openOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._batch_order_decoder.decode(raw)
+
+    async def delete_fapi_v1_all_open_orders(self, symbol: str, **kwargs) -> BinanceCancelAllOrdersResponse:
+        """
+        https://developers.binance.com/docs/derivatives/usds-margined-futures/trade/rest-api/Cancel-All-Open-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.USD_M_FUTURE)
+        end_point = "/fapi/v1/allOpenOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._cancel_all_orders_decoder.decode(raw)
+
+    async def delete_dapi_v1_all_open_orders(self, symbol: str, **kwargs) -> BinanceCancelAllOrdersResponse:
+        """
+        https://developers.binance.com/docs/derivatives/coin-margined-futures/trade/Cancel-All-Open-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.COIN_M_FUTURE)
+        end_point = "/dapi/v1/allOpenOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._cancel_all_orders_decoder.decode(raw)
+
     async def delete_papi_v1_um_order(self, symbol: str, order_id: int, **kwargs) -> BinanceOrder:
         """
         https://developers.binance.com/docs/derivatives/portfolio-margin/trade/Cancel-UM-Order
@@ -491,6 +801,36 @@ class BinanceApiClient(ApiClient):
         raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
         return self._order_decoder.decode(raw)
     
+    async def delete_papi_v1_um_all_open_orders(self, symbol: str, **kwargs) -> BinanceCancelAllOrdersResponse:
+        """
+        https://developers.binance.com/docs/derivatives/portfolio-margin/trade/Cancel-All-UM-Open-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.PORTFOLIO_MARGIN)
+        end_point = "/papi/v1/um/allOpenOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._cancel_all_orders_decoder.decode(raw)
+
+    async def delete_papi_v1_cm_all_open_orders(self, symbol: str, **kwargs) -> BinanceCancelAllOrdersResponse:
+        """
+        https://developers.binance.com/docs/derivatives/portfolio-margin/trade/Cancel-All-CM-Open-Orders
+        """
+        base_url = self._get_base_url(BinanceAccountType.PORTFOLIO_MARGIN)
+        end_point = "/papi/v1/cm/allOpenOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._cancel_all_orders_decoder.decode(raw)
+
+    async def delete_papi_v1_margin_all_open_orders(self, symbol: str, **kwargs) -> List[Dict[str, Any]]:
+        """
+        https://developers.binance.com/docs/derivatives/portfolio-margin/trade/Cancel-Margin-Account-All-Open-Orders-on-a-Symbol
+        """
+        base_url = self._get_base_url(BinanceAccountType.PORTFOLIO_MARGIN)
+        end_point = "/papi/v1/margin/allOpenOrders"
+        data = {"symbol": symbol, **kwargs}
+        raw = await self._fetch("DELETE", base_url, end_point, payload=data, signed=True)
+        return self._batch_order_decoder.decode(raw)
+
     async def get_api_v3_account(self) -> BinanceSpotAccountInfo:
         """
         https://developers.binance.com/docs/binance-spot-api-docs/rest-api/account-endpoints#account-information-user_data
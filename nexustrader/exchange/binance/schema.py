@@ -376,6 +376,49 @@ class BinanceOrder(msgspec.Struct, frozen=True):
     pair: str | None = None  # COIN-M FUTURES only
 
 
+class BinanceWsApiRateLimit(msgspec.Struct):
+    rateLimitType: str
+    interval: str
+    intervalNum: int
+    limit: int
+    count: int | None = None
+
+
+class BinanceWsApiError(msgspec.Struct):
+    code: int
+    msg: str
+
+
+class BinanceBatchOrderError(msgspec.Struct):
+    """
+    Failed item of a batch order response
+    """
+
+    code: int
+    msg: str
+
+
+class BinanceCancelAllOrdersResponse(msgspec.Struct):
+    """
+    Response of the futures cancel all open orders endpoints
+    """
+
+    code: int
+    msg: str
+
+
+class BinanceWsApiOrderResponse(msgspec.Struct, kw_only=True):
+    """
+    https://developers.binance.com/docs/binance-spot-api-docs/web-socket-api/response-format
+    """
+
+    id: int | str | None = None
+    status: int
+    result: BinanceOrder | None = None
+    error: BinanceWsApiError | None = None
+    rateLimits: list[BinanceWsApiRateLimit] | None = None
+
+
 class BinanceMarketInfo(msgspec.Struct):
     symbol: str = None
     status: str = None
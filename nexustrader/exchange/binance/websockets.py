@@ -1,11 +1,23 @@
-from typing import Callable, List
+import asyncio
+import orjson
+import msgspec
+from decimal import Decimal
+from typing import Callable, List, Dict
 from typing import Any
 from aiolimiter import AsyncLimiter
+from picows import WSMsgType
 
 
 from nexustrader.base import WSClient
 from nexustrader.exchange.binance.constants import BinanceAccountType, BinanceKlineInterval
+from nexustrader.exchange.binance.schema import BinanceOrder, BinanceWsApiOrderResponse
+from nexustrader.exchange.binance.error import (
+    BinanceClientError,
+    BinanceServerError,
+    BinanceWsApiUnavailable,
+)
 from nexustrader.core.entity import TaskManager
+from nexustrader.core.nautilius_core import hmac_signature
 
 
 class BinanceWSClient(WSClient):
@@ -113,3 +125,134 @@ class BinanceWSClient(WSClient):
 
     async def _resubscribe(self):
         await self._send_payload(self._subscriptions)
+
+
+class BinanceWSApiClient(WSClient):
+    """Order entry over the Binance WebSocket API (`order.place`, `order.cancel`, `order.modify`).
+
+    Requests are HMAC signed one by one and correlated with their responses by `id`.
+    A request is only sent over a live connection, otherwise `BinanceWsApiUnavailable`
+    is raised and the caller may safely retry it over REST. Requests in flight when the
+    connection drops fail with `ConnectionAbortedError`, their outcome is unknown.
+
+    https://developers.binance.com/docs/derivatives/usds-margined-futures/websocket-api-general-info
+    """
+
+    def __init__(
+        self,
+        account_type: BinanceAccountType,
+        api_key: str,
+        secret: str,
+        task_manager: TaskManager,
+        timeout: int = 10,
+        recv_window: int = 60000,
+    ):
+        if not account_type.ws_api_url:
+            raise ValueError(f"WebSocket API is not supported for {account_type}")
+        self._account_type = account_type
+        self._api_key = api_key
+        self._secret = secret
+        self._timeout = timeout
+        self._recv_window = recv_window
+        self._request_id = 0
+        self._pending: Dict[int, asyncio.Future] = {}
+        self._response_decoder = msgspec.json.Decoder(BinanceWsApiOrderResponse)
+        self.rate_limits = []
+        super().__init__(
+            account_type.ws_api_url,
+            limiter=AsyncLimiter(max_rate=300, time_period=10),
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+            enable_auto_ping=False,
+        )
+
+    @staticmethod
+    def _format_value(value: Any) -> Any:
+        if isinstance(value, bool):
+            return "true" if value else "false"
+        if isinstance(value, (Decimal, float)):
+            return str(value)
+        return value
+
+    def set_time_offset(self, offset_ms: int, recv_window: int | None = None):
+        super().set_time_offset(offset_ms, recv_window)
+        if recv_window is not None:
+            self._recv_window = recv_window
+
+    def _sign(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        params = {
+            key: self._format_value(value)
+            for key, value in params.items()
+            if value is not None
+        }
+        params["apiKey"] = self._api_key
+        params["timestamp"] = self._timestamp_ms()
+        params["recvWindow"] = self._recv_window
+        query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+        params["signature"] = hmac_signature(self._secret, query)
+        return params
+
+    async def request(self, method: str, params: Dict[str, Any]) -> BinanceOrder:
+        if not self.connected:
+            raise BinanceWsApiUnavailable(f"{method}: websocket api is not connected")
+
+        self._request_id += 1
+        request_id = self._request_id
+        payload = {"id": request_id, "method": method, "params": self._sign(params)}
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # no limiter here, order pace is governed by the connector's `rate_limit`
+            self._transport.send(WSMsgType.TEXT, orjson.dumps(payload))
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            raise BinanceWsApiUnavailable(f"{method}: {type(e).__name__}: {e}") from e
+
+        try:
+            return await asyncio.wait_for(future, self._timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def place_order(self, **params) -> BinanceOrder:
+        return await self.request("order.place", params)
+
+    async def cancel_order(self, **params) -> BinanceOrder:
+        return await self.request("order.cancel", params)
+
+    async def modify_order(self, **params) -> BinanceOrder:
+        return await self.request("order.modify", params)
+
+    def _ws_msg_handler(self, raw: bytes):
+        try:
+            msg = self._response_decoder.decode(raw)
+        except msgspec.DecodeError:
+            self._log.error(f"Error decoding message: {str(raw)}")
+            return
+
+        if msg.rateLimits:
+            self.rate_limits = msg.rateLimits
+
+        future = self._pending.pop(msg.id, None)
+        if future is None or future.done():
+            self._log.debug("Response without pending request: %s", raw)
+            return
+
+        if msg.status == 200:
+            future.set_result(msg.result)
+        else:
+            error = {"code": msg.error.code, "msg": msg.error.msg} if msg.error else {}
+            error_cls = BinanceServerError if msg.status >= 500 else BinanceClientError
+            future.set_exception(error_cls(msg.status, error, None))
+
+    def disconnect(self):
+        super().disconnect()
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionAbortedError("websocket api disconnected before response")
+                )
+
+    async def _resubscribe(self):
+        # requests are signed one by one, nothing to restore after a reconnect
+        pass
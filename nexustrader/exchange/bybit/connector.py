@@ -1,12 +1,13 @@
+import asyncio
 import msgspec
-from typing import Dict, List
+from typing import Any, Dict, List
 from decimal import Decimal
 from collections import defaultdict
-from nexustrader.base import PublicConnector, PrivateConnector
+from nexustrader.base import PublicConnector, PrivateConnector, WSClient
 from nexustrader.core.nautilius_core import MessageBus
-from nexustrader.core.entity import TaskManager, RateLimit
+from nexustrader.core.entity import TaskManager, RateLimit, HttpPoolConfig
 from nexustrader.core.cache import AsyncCache
-from nexustrader.schema import BookL1, Order, Trade, Position, Kline
+from nexustrader.schema import BookL1, Order, OrderSubmit, Trade, Position, Kline
 from nexustrader.constants import (
     OrderSide,
     OrderStatus,
@@ -15,6 +16,7 @@ from nexustrader.constants import (
     PositionSide,
     KlineInterval,
     TriggerType,
+    HttpBackend,
 )
 from nexustrader.exchange.bybit.schema import (
     BybitWsMessageGeneral,
@@ -28,9 +30,12 @@ from nexustrader.exchange.bybit.schema import (
     BybitWsKlineMsg,
     BybitWalletBalanceResponse,
     BybitPositionResponse,
+    BybitOrderResponse,
+    BybitBatchOrderResult,
 )
 from nexustrader.exchange.bybit.rest_api import BybitApiClient
-from nexustrader.exchange.bybit.websockets import BybitWSClient
+from nexustrader.exchange.bybit.websockets import BybitWSClient, BybitWSApiClient
+from nexustrader.exchange.bybit.error import BybitWsApiUnavailable
 from nexustrader.exchange.bybit.constants import (
     BybitAccountType,
     BybitEnumParser,
@@ -94,7 +99,7 @@ class BybitPublicConnector(PublicConnector):
             ws_msg: BybitWsMessageGeneral = self._ws_msg_general_decoder.decode(raw)
             if ws_msg.ret_msg == "pong":
                 self._ws_client._transport.notify_user_specific_pong_received()
-                self._log.debug(f"Pong received {str(ws_msg)}")
+                self._log.debug("Pong received %s", ws_msg)
                 return
             if ws_msg.success is False:
                 self._log.error(f"WebSocket error: {ws_msg}")
@@ -228,6 +233,8 @@ class BybitPrivateConnector(PrivateConnector):
     _market_id: Dict[str, str]
     _api_client: BybitApiClient
 
+    BATCH_ORDER_LIMITS = {"spot": 10, "linear": 20, "inverse": 20}
+
     def __init__(
         self,
         exchange: BybitExchangeManager,
@@ -236,6 +243,9 @@ class BybitPrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        enable_ws_order: bool | None = None,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         # all the private endpoints are the same for all account types, so no need to pass account_type
         # only need to determine if it's testnet or not
@@ -267,29 +277,65 @@ class BybitPrivateConnector(PrivateConnector):
                 api_key=exchange.api_key,
                 secret=exchange.secret,
                 testnet=account_type.is_testnet,
+                http_pool=http_pool,
+                http_backend=http_backend,
             ),
             msgbus=msgbus,
             cache=cache,
+            task_manager=task_manager,
             rate_limit=rate_limit,
         )
 
+        # orders go over the `/v5/trade` websocket when enabled, REST otherwise
+        self._ws_api_client: BybitWSApiClient | None = None
+        if enable_ws_order:
+            self._ws_api_client = BybitWSApiClient(
+                account_type=account_type,
+                api_key=exchange.api_key,
+                secret=exchange.secret,
+                task_manager=task_manager,
+            )
+
         self._ws_msg_general_decoder = msgspec.json.Decoder(BybitWsMessageGeneral)
         self._ws_msg_order_update_decoder = msgspec.json.Decoder(BybitWsOrderMsg)
         self._ws_msg_position_decoder = msgspec.json.Decoder(BybitWsPositionMsg)
         self._ws_msg_wallet_decoder = msgspec.json.Decoder(BybitWsAccountWalletMsg)
 
+    def ws_clients(self) -> List[WSClient]:
+        clients = super().ws_clients()
+        if self._ws_api_client:
+            clients.append(self._ws_api_client)
+        return clients
+
     async def connect(self):
         await super().connect()
         await self._ws_client.subscribe_order()
         await self._ws_client.subscribe_position()
         await self._ws_client.subscribe_wallet()
+        if self._ws_api_client:
+            await self._ws_api_client.connect()
+
+    async def _ws_api_request(
+        self, op: str, params: Dict[str, Any]
+    ) -> BybitOrderResponse | None:
+        """Send an order request over the trade websocket.
+
+        Returns `None` if the request could not be sent and should go over REST instead.
+        """
+        if not self._ws_api_client:
+            return None
+        try:
+            return await self._ws_api_client.order_request(op, params)
+        except BybitWsApiUnavailable as e:
+            self._log.warn(f"{e}, falling back to REST")
+            return None
 
     def _ws_msg_handler(self, raw: bytes):
         try:
             ws_msg = self._ws_msg_general_decoder.decode(raw)
             if ws_msg.op == "pong":
                 self._ws_client._transport.notify_user_specific_pong_received()
-                self._log.debug(f"Pong received {str(ws_msg)}")
+                self._log.debug("Pong received %s", ws_msg)
                 return
             if ws_msg.success is False:
                 self._log.error(f"WebSocket error: {ws_msg}")
@@ -331,7 +377,10 @@ class BybitPrivateConnector(PrivateConnector):
                 **kwargs,
             }
 
-            res = await self._api_client.post_v5_order_cancel(**params)
+            ws_params = dict(params)
+            ws_params["orderId"] = ws_params.pop("order_id")
+            res = await self._ws_api_request("order.cancel", ws_params)
+            res = res or await self._api_client.post_v5_order_cancel(**params)
             order = Order(
                 exchange=self._exchange_id,
                 id=res.result.orderId,
@@ -352,6 +401,162 @@ class BybitPrivateConnector(PrivateConnector):
             )
             return order
 
+    async def get_server_time(self) -> int:
+        return await self._api_client.get_v5_market_time()
+
+    async def cancel_all_orders(self, symbol: str) -> List[str] | None:
+        if self._limiter:
+            await self._limiter.acquire()
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+            await self._api_client.post_v5_order_cancel_all(
+                category=self._get_category(market), symbol=market.id
+            )
+            return []
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error canceling all orders: {error_msg} symbol: {symbol}")
+            return None
+
+    async def amend_order(
+        self,
+        symbol: str,
+        order_id: str,
+        side: OrderSide,
+        price: Decimal | None,
+        amount: Decimal,
+        **kwargs,
+    ) -> Order:
+        if self._limiter:
+            await self._limiter.acquire()
+        params = {}
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+
+            params = {
+                "category": self._get_category(market),
+                "symbol": market.id,
+                "orderId": order_id,
+                "qty": str(amount),
+                **kwargs,
+            }
+            if price:
+                params["price"] = str(price)
+
+            res = await self._ws_api_request("order.amend", params)
+            res = res or await self._api_client.post_v5_order_amend(**params)
+            return Order(
+                exchange=self._exchange_id,
+                id=res.result.orderId,
+                client_order_id=res.result.orderLinkId,
+                timestamp=res.time,
+                symbol=symbol,
+                side=side,
+                amount=amount,
+                price=float(price) if price else None,
+                status=OrderStatus.ACCEPTED,
+            )
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error amending order: {error_msg} params: {str(params)}")
+            return Order(
+                exchange=self._exchange_id,
+                timestamp=self._clock.timestamp_ms(),
+                symbol=symbol,
+                id=order_id,
+                side=side,
+                amount=amount,
+                price=float(price) if price else None,
+                status=OrderStatus.FAILED,
+            )
+
+    async def _cancel_batch_orders_chunk(
+        self, category: str, orders: List[OrderSubmit], requests: List[Dict[str, Any]]
+    ) -> List[Order]:
+        try:
+            res = await self._batch_request("cancel", category, requests)
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} params: {str(requests)}"
+            )
+            res = []
+
+        results = []
+        for i, order in enumerate(orders):
+            item = res[i] if i < len(res) else None
+            if item and item.code == 0:
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=item.orderId,
+                        client_order_id=item.orderLinkId,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=order.symbol,
+                        status=OrderStatus.CANCELING,
+                    )
+                )
+                continue
+            if item:
+                self._log.error(
+                    f"Error canceling order: {item.code} {item.msg} params: {str(requests[i])}"
+                )
+            results.append(
+                Order(
+                    exchange=self._exchange_id,
+                    timestamp=self._clock.timestamp_ms(),
+                    symbol=order.symbol,
+                    id=order.order_id,
+                    status=OrderStatus.CANCEL_FAILED,
+                )
+            )
+        return results
+
+    async def cancel_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        results: List[Order | None] = [None] * len(orders)
+        groups: Dict[str, List[tuple[int, Dict[str, Any]]]] = defaultdict(list)
+        for i, order in enumerate(orders):
+            market = self._market.get(order.symbol)
+            if not market:
+                self._log.error(
+                    f"Symbol {order.symbol} formated wrongly, or not supported"
+                )
+                results[i] = Order(
+                    exchange=self._exchange_id,
+                    timestamp=self._clock.timestamp_ms(),
+                    symbol=order.symbol,
+                    id=order.order_id,
+                    status=OrderStatus.CANCEL_FAILED,
+                )
+                continue
+            groups[self._get_category(market)].append(
+                (i, {"symbol": market.id, "orderId": order.order_id, **order.kwargs})
+            )
+
+        chunks = [
+            (category, chunk)
+            for category, items in groups.items()
+            for chunk in self._chunks(items, self.BATCH_ORDER_LIMITS[category])
+        ]
+        chunk_results = await asyncio.gather(
+            *(
+                self._cancel_batch_orders_chunk(
+                    category,
+                    [orders[i] for i, _ in chunk],
+                    [params for _, params in chunk],
+                )
+                for category, chunk in chunks
+            )
+        )
+        for (_, chunk), chunk_result in zip(chunks, chunk_results):
+            for (i, _), order in zip(chunk, chunk_result):
+                results[i] = order
+        return results
+
     async def _init_account_balance(self):
         res: BybitWalletBalanceResponse = (
             await self._api_client.get_v5_account_wallet_balance(account_type="UNIFIED")
@@ -450,9 +655,9 @@ class BybitPrivateConnector(PrivateConnector):
         # TODO: implement
         pass
     
-    async def create_order(
+    def _create_order_params(
         self,
-        symbol: str,
+        market: BybitMarket,
         side: OrderSide,
         type: OrderType,
         amount: Decimal,
@@ -460,19 +665,10 @@ class BybitPrivateConnector(PrivateConnector):
         time_in_force: TimeInForce = TimeInForce.GTC,
         position_side: PositionSide | None = None,
         **kwargs,
-    ):
-        if self._limiter:
-            await self._limiter.acquire()
-        market = self._market.get(symbol)
-        if not market:
-            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
-        symbol = market.id
-
-        category = self._get_category(market)
-
+    ) -> Dict[str, Any]:
         params = {
-            "category": category,
-            "symbol": symbol,
+            "category": self._get_category(market),
+            "symbol": market.id,
             "order_type": BybitEnumParser.to_bybit_order_type(type).value,
             "side": BybitEnumParser.to_bybit_order_side(side).value,
             "qty": str(amount),
@@ -497,9 +693,35 @@ class BybitPrivateConnector(PrivateConnector):
         if reduce_only:
             params["reduceOnly"] = True
         params.update(kwargs)
+        return params
+
+    async def create_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        amount: Decimal,
+        price: Decimal | None = None,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        position_side: PositionSide | None = None,
+        **kwargs,
+    ):
+        if self._limiter:
+            await self._limiter.acquire()
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+        symbol = market.id
+
+        params = self._create_order_params(
+            market, side, type, amount, price, time_in_force, position_side, **kwargs
+        )
 
         try:
-            res = await self._api_client.post_v5_order_create(**params)
+            ws_params = dict(params)
+            ws_params["orderType"] = ws_params.pop("order_type")
+            res = await self._ws_api_request("order.create", ws_params)
+            res = res or await self._api_client.post_v5_order_create(**params)
 
             order = Order(
                 exchange=self._exchange_id,
@@ -516,7 +738,7 @@ class BybitPrivateConnector(PrivateConnector):
                 status=OrderStatus.PENDING,
                 filled=Decimal(0),
                 remaining=amount,
-                reduce_only=reduce_only,
+                reduce_only=params.get("reduceOnly", False),
             )
             return order
         except Exception as e:
@@ -538,9 +760,138 @@ class BybitPrivateConnector(PrivateConnector):
             )
             return order
 
+    async def _batch_request(
+        self, op: str, category: str, requests: List[Dict[str, Any]]
+    ) -> List[BybitBatchOrderResult]:
+        """Send a batch op over the trade websocket if available, REST otherwise"""
+        if self._limiter:
+            await self._limiter.acquire()
+        if self._ws_api_client:
+            try:
+                if op == "create":
+                    return await self._ws_api_client.create_batch_orders(
+                        category, requests
+                    )
+                return await self._ws_api_client.cancel_batch_orders(category, requests)
+            except BybitWsApiUnavailable as e:
+                self._log.warn(f"{e}, falling back to REST")
+        if op == "create":
+            res = await self._api_client.post_v5_order_create_batch(category, requests)
+        else:
+            res = await self._api_client.post_v5_order_cancel_batch(category, requests)
+        return res.results
+
+    async def _create_batch_orders_chunk(
+        self, category: str, orders: List[OrderSubmit], requests: List[Dict[str, Any]]
+    ) -> List[Order]:
+        try:
+            res = await self._batch_request("create", category, requests)
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error creating batch orders: {error_msg} params: {str(requests)}"
+            )
+            res = []
+
+        results = []
+        for i, order in enumerate(orders):
+            item = res[i] if i < len(res) else None
+            if item and item.code == 0:
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=item.orderId,
+                        client_order_id=item.orderLinkId,
+                        timestamp=self._clock.timestamp_ms(),
+                        symbol=order.symbol,
+                        type=order.type,
+                        side=order.side,
+                        amount=order.amount,
+                        price=float(order.price) if order.price else None,
+                        time_in_force=order.time_in_force,
+                        position_side=order.position_side,
+                        status=OrderStatus.PENDING,
+                        filled=Decimal(0),
+                        remaining=order.amount,
+                        reduce_only=requests[i].get("reduceOnly", False),
+                    )
+                )
+                continue
+            if item:
+                self._log.error(
+                    f"Error creating order: {item.code} {item.msg} params: {str(requests[i])}"
+                )
+            results.append(self._failed_create_order(order))
+        return results
+
+    def _failed_create_order(self, order: OrderSubmit) -> Order:
+        return Order(
+            exchange=self._exchange_id,
+            timestamp=self._clock.timestamp_ms(),
+            symbol=order.symbol,
+            type=order.type,
+            side=order.side,
+            amount=order.amount,
+            price=float(order.price) if order.price else None,
+            time_in_force=order.time_in_force,
+            position_side=order.position_side,
+            status=OrderStatus.FAILED,
+            filled=Decimal(0),
+            remaining=order.amount,
+        )
+
+    async def create_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        results: List[Order | None] = [None] * len(orders)
+        # a batch request holds orders of a single category
+        groups: Dict[str, List[tuple[int, Dict[str, Any]]]] = defaultdict(list)
+        for i, order in enumerate(orders):
+            try:
+                market = self._market.get(order.symbol)
+                if not market:
+                    raise ValueError(
+                        f"Symbol {order.symbol} formated wrongly, or not supported"
+                    )
+                params = self._create_order_params(
+                    market,
+                    order.side,
+                    order.type,
+                    order.amount,
+                    order.price,
+                    order.time_in_force,
+                    order.position_side,
+                    **order.kwargs,
+                )
+            except Exception as e:
+                self._log.error(f"Error creating order: {type(e).__name__}: {str(e)}")
+                results[i] = self._failed_create_order(order)
+                continue
+            category = params.pop("category")
+            params["orderType"] = params.pop("order_type")
+            groups[category].append((i, params))
+
+        chunks = [
+            (category, chunk)
+            for category, items in groups.items()
+            for chunk in self._chunks(items, self.BATCH_ORDER_LIMITS[category])
+        ]
+        chunk_results = await asyncio.gather(
+            *(
+                self._create_batch_orders_chunk(
+                    category,
+                    [orders[i] for i, _ in chunk],
+                    [params for _, params in chunk],
+                )
+                for category, chunk in chunks
+            )
+        )
+        for (_, chunk), chunk_result in zip(chunks, chunk_results):
+            for (i, _), order in zip(chunk, chunk_result):
+                results[i] = order
+        return results
+
     def _parse_order_update(self, raw: bytes):
         order_msg = self._ws_msg_order_update_decoder.decode(raw)
-        self._log.debug(f"Order update: {str(order_msg)}")
+        self._log.debug("Order update: %s", order_msg)
         for data in order_msg.data:
             category = data.category
             if category.is_spot:
@@ -580,7 +931,7 @@ class BybitPrivateConnector(PrivateConnector):
 
     def _parse_position_update(self, raw: bytes):
         position_msg = self._ws_msg_position_decoder.decode(raw)
-        self._log.debug(f"Position update: {str(position_msg)}")
+        self._log.debug("Position update: %s", position_msg)
 
         for data in position_msg.data:
             category = data.category
@@ -613,12 +964,14 @@ class BybitPrivateConnector(PrivateConnector):
 
     def _parse_wallet_update(self, raw: bytes):
         wallet_msg = self._ws_msg_wallet_decoder.decode(raw)
-        self._log.debug(f"Wallet update: {str(wallet_msg)}")
+        self._log.debug("Wallet update: %s", wallet_msg)
 
         for data in wallet_msg.data:
             balances = data.parse_to_balances()
             self._cache._apply_balance(self._account_type, balances)
 
     async def disconnect(self):
+        if self._ws_api_client:
+            self._ws_api_client.disconnect()
         await super().disconnect()
         await self._api_client.close_session()
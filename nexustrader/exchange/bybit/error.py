@@ -16,3 +16,9 @@ class BybitError(Exception):
         return f"{type(self).__name__}(code={self.code}, message='{self.message}')"
     
     __str__ = __repr__
+
+
+class BybitWsApiUnavailable(Exception):
+    """
+    Raised when a WebSocket trade request could not be sent, it is safe to retry it over REST.
+    """
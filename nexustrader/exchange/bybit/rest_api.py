@@ -4,7 +4,7 @@ import aiohttp
 import asyncio
 import msgspec
 import orjson
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 from urllib.parse import urljoin, urlencode
 from decimal import Decimal
 
@@ -12,9 +12,13 @@ from nexustrader.base import ApiClient
 from nexustrader.exchange.bybit.constants import BybitBaseUrl
 from nexustrader.exchange.bybit.error import BybitError
 from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.rate_limiter import WeightedRateLimiter
+from nexustrader.core.entity import HttpPoolConfig
+from nexustrader.constants import HttpBackend
 from nexustrader.exchange.bybit.schema import (
     BybitResponse,
     BybitOrderResponse,
+    BybitBatchOrderResponse,
     BybitPositionResponse,
     BybitOrderHistoryResponse,
     BybitOpenOrdersResponse,
@@ -23,12 +27,17 @@ from nexustrader.exchange.bybit.schema import (
 
 
 class BybitApiClient(ApiClient):
+    _response_headers = ("X-Bapi-Limit-Status", "X-Bapi-Limit")
+
     def __init__(
         self,
         api_key: str = None,
         secret: str = None,
         timeout: int = 10,
         testnet: bool = False,
+        enable_rate_limit: bool = True,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         """
         ### Testnet:
@@ -50,6 +59,9 @@ class BybitApiClient(ApiClient):
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            enable_rate_limit=enable_rate_limit,
+            http_pool=http_pool,
+            http_backend=http_backend,
         )
         self._recv_window = 5000
 
@@ -68,6 +80,9 @@ class BybitApiClient(ApiClient):
 
         self._response_decoder = msgspec.json.Decoder(BybitResponse)
         self._order_response_decoder = msgspec.json.Decoder(BybitOrderResponse)
+        self._batch_order_response_decoder = msgspec.json.Decoder(
+            BybitBatchOrderResponse
+        )
         self._position_response_decoder = msgspec.json.Decoder(BybitPositionResponse)
         self._order_history_response_decoder = msgspec.json.Decoder(
             BybitOrderHistoryResponse
@@ -80,7 +95,7 @@ class BybitApiClient(ApiClient):
         )
 
     def _generate_signature(self, payload: str) -> List[str]:
-        timestamp = str(self._clock.timestamp_ms())
+        timestamp = str(self._timestamp_ms())
 
         param = str(timestamp) + self._api_key + str(self._recv_window) + payload
         hash = hmac.new(
@@ -90,11 +105,55 @@ class BybitApiClient(ApiClient):
         return [signature, timestamp]
 
     def _generate_signature_v2(self, payload: str) -> List[str]:
-        timestamp = str(self._clock.timestamp_ms())
+        timestamp = str(self._timestamp_ms())
         param = f"{timestamp}{self._api_key}{self._recv_window}{payload}"
         signature = hmac_signature(self._secret, param)  # return hex digest string
         return [signature, timestamp]
 
+    def _ping_path(self, path: str) -> str | None:
+        return "/v5/market/time"
+
+    def _rate_limiters(
+        self, endpoint: str, signed: bool
+    ) -> Tuple[WeightedRateLimiter, WeightedRateLimiter | None]:
+        """
+        IP limiter shared by every client, and for signed requests the limiter of the
+        endpoint shared by every client on this API key, its limit is taken from the
+        `X-Bapi-Limit` header
+        """
+        ip_limiter = WeightedRateLimiter.shared(("bybit", self._base_url, "ip"), 600, 5)
+        if not signed:
+            return ip_limiter, None
+        return ip_limiter, WeightedRateLimiter.shared(
+            ("bybit", self._base_url, self._api_key, endpoint), 10, 1
+        )
+
+    async def _acquire_rate_limit(
+        self, method: str, endpoint: str, signed: bool, weight: int
+    ):
+        ip_limiter, endpoint_limiter = self._rate_limiters(endpoint, signed)
+        priority = self._request_priority(method, endpoint)
+        await ip_limiter.acquire(1, priority)
+        if endpoint_limiter:
+            await endpoint_limiter.acquire(weight, priority)
+
+    async def _acquire_ping_rate_limit(self, path: str):
+        await self._acquire_rate_limit("GET", path, False, 1)
+
+    def _sync_rate_limit(
+        self, endpoint: str, signed: bool, status: int, headers: Dict[str, Any]
+    ):
+        ip_limiter, endpoint_limiter = self._rate_limiters(endpoint, signed)
+        remaining = headers.get("X-Bapi-Limit-Status")
+        if endpoint_limiter and remaining is not None:
+            limit = headers.get("X-Bapi-Limit")
+            endpoint_limiter.sync_remaining(
+                int(remaining), int(limit) if limit else None
+            )
+        if status in (403, 429):
+            # 403 is returned when the IP limit is exceeded, banned for 10 minutes
+            ip_limiter.block(600 if status == 403 else 1)
+
     async def _fetch(
         self,
         method: str,
@@ -102,8 +161,11 @@ class BybitApiClient(ApiClient):
         endpoint: str,
         payload: Dict[str, Any] = None,
         signed: bool = False,
+        weight: int = 1,
     ):
         self._init_session()
+        if self._enable_rate_limit:
+            await self._acquire_rate_limit(method, endpoint, signed, weight)
 
         url = urljoin(base_url, endpoint)
         payload = payload or {}
@@ -129,14 +191,11 @@ class BybitApiClient(ApiClient):
             payload_str = None
 
         try:
-            self._log.debug(f"Request: {url} {payload_str}")
-            response = await self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=payload_str,
-            )
-            raw = await response.read()
+            self._log.debug("Request: %s %s", url, payload_str)
+            response = await self._request(method, url, headers, payload_str)
+            raw = response.body
+            if self._enable_rate_limit:
+                self._sync_rate_limit(endpoint, signed, response.status, response.headers)
             if response.status >= 400:
                 raise BybitError(
                     code=response.status,
@@ -160,6 +219,14 @@ class BybitApiClient(ApiClient):
             self._log.error(f"Error {method} Url: {url} {e}")
             raise
 
+    async def get_v5_market_time(self) -> int:
+        """
+        https://bybit-exchange.github.io/docs/v5/market/time
+        """
+        endpoint = "/v5/market/time"
+        raw = await self._fetch("GET", self._base_url, endpoint)
+        return int(self._response_decoder.decode(raw).result["timeNano"]) // 1_000_000
+
     async def post_v5_order_create(
         self,
         category: str,
@@ -184,6 +251,47 @@ class BybitApiClient(ApiClient):
         raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
         return self._order_response_decoder.decode(raw)
 
+    async def post_v5_order_amend(
+        self, category: str, symbol: str, **kwargs
+    ) -> BybitOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/amend-order
+        """
+        endpoint = "/v5/order/amend"
+        payload = {
+            "category": category,
+            "symbol": symbol,
+            **kwargs,
+        }
+        raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
+        return self._order_response_decoder.decode(raw)
+
+    async def post_v5_order_create_batch(
+        self, category: str, orders: List[Dict[str, Any]]
+    ) -> BybitBatchOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-place
+        """
+        endpoint = "/v5/order/create-batch"
+        payload = {"category": category, "request": orders}
+        raw = await self._fetch(
+            "POST", self._base_url, endpoint, payload, signed=True, weight=len(orders)
+        )
+        return self._batch_order_response_decoder.decode(raw)
+
+    async def post_v5_order_cancel_batch(
+        self, category: str, orders: List[Dict[str, Any]]
+    ) -> BybitBatchOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-cancel
+        """
+        endpoint = "/v5/order/cancel-batch"
+        payload = {"category": category, "request": orders}
+        raw = await self._fetch(
+            "POST", self._base_url, endpoint, payload, signed=True, weight=len(orders)
+        )
+        return self._batch_order_response_decoder.decode(raw)
+
     async def post_v5_order_cancel(
         self, category: str, symbol: str, **kwargs
     ) -> BybitOrderResponse:
@@ -199,6 +307,21 @@ class BybitApiClient(ApiClient):
         raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
         return self._order_response_decoder.decode(raw)
 
+    async def post_v5_order_cancel_all(
+        self, category: str, symbol: str, **kwargs
+    ) -> BybitResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/cancel-all
+        """
+        endpoint = "/v5/order/cancel-all"
+        payload = {
+            "category": category,
+            "symbol": symbol,
+            **kwargs,
+        }
+        raw = await self._fetch("POST", self._base_url, endpoint, payload, signed=True)
+        return self._response_decoder.decode(raw)
+
     async def get_v5_position_list(
         self, category: str, **kwargs
     ) -> BybitPositionResponse:
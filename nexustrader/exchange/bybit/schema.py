@@ -158,6 +158,71 @@ class BybitResponse(msgspec.Struct, frozen=True):
     retExtInfo: Dict[str, Any] | None = None
 
 
+class BybitRateLimitStatus(msgspec.Struct):
+    limit: int
+    remaining: int
+    reset_timestamp: int
+
+
+class BybitBatchOrderResult(msgspec.Struct):
+    category: str = ""
+    symbol: str = ""
+    orderId: str = ""
+    orderLinkId: str = ""
+    code: int = 0  # per order `retExtInfo` code, 0 means success
+    msg: str = ""
+
+    @classmethod
+    def parse_list(
+        cls, result: Dict[str, Any] | None, ret_ext_info: Dict[str, Any] | None
+    ) -> List["BybitBatchOrderResult"]:
+        """Zip `result.list` with the per order codes in `retExtInfo.list`"""
+        results = (result or {}).get("list", [])
+        infos = (ret_ext_info or {}).get("list", [])
+        return [
+            cls(
+                category=item.get("category", ""),
+                symbol=item.get("symbol", ""),
+                orderId=item.get("orderId", ""),
+                orderLinkId=item.get("orderLinkId", ""),
+                code=info.get("code", 0),
+                msg=info.get("msg", ""),
+            )
+            for item, info in zip(results, infos)
+        ]
+
+
+class BybitBatchOrderResponse(msgspec.Struct):
+    """
+    https://bybit-exchange.github.io/docs/v5/order/batch-place
+    """
+
+    retCode: int
+    retMsg: str
+    result: Dict[str, Any]
+    retExtInfo: Dict[str, Any]
+    time: int
+
+    @property
+    def results(self) -> List[BybitBatchOrderResult]:
+        return BybitBatchOrderResult.parse_list(self.result, self.retExtInfo)
+
+
+class BybitWsTradeResponse(msgspec.Struct, kw_only=True):
+    """
+    https://bybit-exchange.github.io/docs/v5/websocket/trade/guideline
+    """
+
+    reqId: str = ""
+    retCode: int = 0
+    retMsg: str = ""
+    op: str = ""
+    data: Any = None  # `pong` carries a list
+    retExtInfo: Dict[str, Any] | None = None
+    header: Dict[str, str] | None = None
+    connId: str = ""
+
+
 class BybitWsMessageGeneral(msgspec.Struct):
     success: bool | None = None
     conn_id: str = ""
@@ -1,13 +1,23 @@
 import hmac
 import orjson
+import msgspec
 import asyncio
 
-from typing import Any, Callable, List
+from typing import Any, Callable, Dict, List
 from aiolimiter import AsyncLimiter
+from picows import WSMsgType
 
 from nexustrader.base import WSClient
 from nexustrader.core.entity import TaskManager
 from nexustrader.exchange.bybit.constants import BybitAccountType, BybitKlineInterval
+from nexustrader.exchange.bybit.schema import (
+    BybitOrderResponse,
+    BybitOrderResult,
+    BybitBatchOrderResult,
+    BybitRateLimitStatus,
+    BybitWsTradeResponse,
+)
+from nexustrader.exchange.bybit.error import BybitError, BybitWsApiUnavailable
 
 
 class BybitWSClient(WSClient):
@@ -44,7 +54,7 @@ class BybitWSClient(WSClient):
         return self._api_key is not None or self._secret is not None
 
     def _generate_signature(self):
-        expires = self._clock.timestamp_ms() + 1_000
+        expires = self._timestamp_ms() + 1_000
         signature = str(
             hmac.new(
                 bytes(self._secret, "utf-8"),
@@ -127,3 +137,225 @@ class BybitWSClient(WSClient):
     async def subscribe_wallet(self, topic: str = "wallet"):
         """subscribe to wallet"""
         await self._subscribe([topic], auth=True)
+
+
+class BybitWSApiClient(WSClient):
+    """Order entry over the Bybit `/v5/trade` websocket (`order.create`, `order.cancel`,
+    `order.amend` and their batch variants).
+
+    Requests are correlated with their responses by `reqId` and only sent over a live,
+    authenticated connection, otherwise `BybitWsApiUnavailable` is raised and the caller
+    may safely retry over REST. Requests in flight when the connection drops fail with
+    `ConnectionAbortedError`, their outcome is unknown. The rate limit headers of the
+    last response of every op are kept in `rate_limits`.
+
+    https://bybit-exchange.github.io/docs/v5/websocket/trade/guideline
+    """
+
+    def __init__(
+        self,
+        account_type: BybitAccountType,
+        api_key: str,
+        secret: str,
+        task_manager: TaskManager,
+        timeout: int = 10,
+        recv_window: int = 5000,
+    ):
+        self._account_type = account_type
+        self._api_key = api_key
+        self._secret = secret
+        self._timeout = timeout
+        self._recv_window = str(recv_window)
+        self._authed = False
+        self._logged_in = asyncio.Event()
+        self._request_id = 0
+        self._pending: Dict[str, asyncio.Future] = {}
+        self._response_decoder = msgspec.json.Decoder(BybitWsTradeResponse)
+        self.rate_limits: Dict[str, BybitRateLimitStatus] = {}
+        super().__init__(
+            account_type.ws_trade_url,
+            limiter=AsyncLimiter(max_rate=500, time_period=5 * 60),
+            handler=self._ws_msg_handler,
+            task_manager=task_manager,
+            ping_idle_timeout=5,
+            ping_reply_timeout=2,
+            specific_ping_msg=orjson.dumps({"op": "ping"}),
+            auto_ping_strategy="ping_when_idle",
+        )
+
+    def _get_auth_payload(self):
+        expires = self._timestamp_ms() + 1_000
+        signature = hmac.new(
+            bytes(self._secret, "utf-8"),
+            bytes(f"GET/realtime{expires}", "utf-8"),
+            digestmod="sha256",
+        ).hexdigest()
+        return {"op": "auth", "args": [self._api_key, expires, signature]}
+
+    async def _auth(self):
+        if not self._authed:
+            self._authed = True
+            self._logged_in.clear()
+            await self._send(self._get_auth_payload())
+            try:
+                await asyncio.wait_for(self._logged_in.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self._log.warn("No auth response within 5s")
+
+    def set_time_offset(self, offset_ms: int, recv_window: int | None = None):
+        super().set_time_offset(offset_ms, recv_window)
+        if recv_window is not None:
+            self._recv_window = str(recv_window)
+
+    async def connect(self):
+        await super().connect()
+        await self._auth()
+
+    async def request(self, op: str, args: List[Dict[str, Any]]) -> BybitWsTradeResponse:
+        if not (self.connected and self._logged_in.is_set()):
+            raise BybitWsApiUnavailable(f"{op}: trade websocket is not connected")
+
+        self._request_id += 1
+        request_id = str(self._request_id)
+        payload = {
+            "reqId": request_id,
+            "header": {
+                "X-BAPI-TIMESTAMP": str(self._timestamp_ms()),
+                "X-BAPI-RECV-WINDOW": self._recv_window,
+            },
+            "op": op,
+            "args": args,
+        }
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            # no limiter here, order pace is governed by the connector's `rate_limit`
+            self._transport.send(WSMsgType.TEXT, orjson.dumps(payload))
+        except Exception as e:
+            self._pending.pop(request_id, None)
+            raise BybitWsApiUnavailable(f"{op}: {type(e).__name__}: {e}") from e
+
+        try:
+            return await asyncio.wait_for(future, self._timeout)
+        finally:
+            self._pending.pop(request_id, None)
+
+    def _order_response(self, msg: BybitWsTradeResponse) -> BybitOrderResponse:
+        header = msg.header or {}
+        return BybitOrderResponse(
+            retCode=msg.retCode,
+            retMsg=msg.retMsg,
+            result=msgspec.convert(msg.data, BybitOrderResult),
+            time=int(header.get("Timenow") or self._clock.timestamp_ms()),
+        )
+
+    @staticmethod
+    def _batch_results(msg: BybitWsTradeResponse) -> List[BybitBatchOrderResult]:
+        return BybitBatchOrderResult.parse_list(msg.data, msg.retExtInfo)
+
+    async def order_request(self, op: str, params: Dict[str, Any]) -> BybitOrderResponse:
+        """Single order op, answered like the REST endpoint of the same name."""
+        return self._order_response(await self.request(op, [params]))
+
+    async def create_order(self, **params) -> BybitOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/create-order
+        """
+        return await self.order_request("order.create", params)
+
+    async def cancel_order(self, **params) -> BybitOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/cancel-order
+        """
+        return await self.order_request("order.cancel", params)
+
+    async def amend_order(self, **params) -> BybitOrderResponse:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/amend-order
+        """
+        return await self.order_request("order.amend", params)
+
+    async def create_batch_orders(
+        self, category: str, orders: List[Dict[str, Any]]
+    ) -> List[BybitBatchOrderResult]:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-place
+        """
+        msg = await self.request(
+            "order.create-batch", [{"category": category, "request": orders}]
+        )
+        return self._batch_results(msg)
+
+    async def cancel_batch_orders(
+        self, category: str, orders: List[Dict[str, Any]]
+    ) -> List[BybitBatchOrderResult]:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-cancel
+        """
+        msg = await self.request(
+            "order.cancel-batch", [{"category": category, "request": orders}]
+        )
+        return self._batch_results(msg)
+
+    async def amend_batch_orders(
+        self, category: str, orders: List[Dict[str, Any]]
+    ) -> List[BybitBatchOrderResult]:
+        """
+        https://bybit-exchange.github.io/docs/v5/order/batch-amend
+        """
+        msg = await self.request(
+            "order.amend-batch", [{"category": category, "request": orders}]
+        )
+        return self._batch_results(msg)
+
+    def _update_rate_limit(self, msg: BybitWsTradeResponse):
+        header = msg.header
+        if not header or "X-Bapi-Limit" not in header:
+            return
+        self.rate_limits[msg.op] = BybitRateLimitStatus(
+            limit=int(header["X-Bapi-Limit"]),
+            remaining=int(header.get("X-Bapi-Limit-Status", 0)),
+            reset_timestamp=int(header.get("X-Bapi-Limit-Reset-Timestamp", 0)),
+        )
+
+    def _ws_msg_handler(self, raw: bytes):
+        try:
+            msg = self._response_decoder.decode(raw)
+        except msgspec.DecodeError:
+            self._log.error(f"Error decoding message: {str(raw)}")
+            return
+
+        if msg.op == "pong":
+            self._transport.notify_user_specific_pong_received()
+            return
+        if msg.op == "auth":
+            if msg.retCode == 0:
+                self._log.debug("Auth success")
+                self._logged_in.set()
+            else:
+                self._log.error(f"Auth failed: {msg.retCode} {msg.retMsg}")
+            return
+
+        self._update_rate_limit(msg)
+        future = self._pending.pop(msg.reqId, None)
+        if future is None or future.done():
+            self._log.debug("Response without pending request: %s", raw)
+            return
+        if msg.retCode == 0:
+            future.set_result(msg)
+        else:
+            future.set_exception(BybitError(msg.retCode, msg.retMsg))
+
+    def disconnect(self):
+        self._logged_in.clear()
+        super().disconnect()
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(
+                    ConnectionAbortedError("trade websocket disconnected before response")
+                )
+
+    async def _resubscribe(self):
+        self._authed = False
+        await self._auth()
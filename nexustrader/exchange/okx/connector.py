@@ -1,12 +1,13 @@
+import asyncio
 import msgspec
 import sys
-from typing import Dict, List
+from typing import Any, Dict, List
 from decimal import Decimal
 from nexustrader.exchange.okx import OkxAccountType
 from nexustrader.exchange.okx.websockets import OkxWSClient
 from nexustrader.exchange.okx.exchange import OkxExchangeManager
 from nexustrader.exchange.okx.schema import OkxWsGeneralMsg
-from nexustrader.schema import Trade, BookL1, Kline, Order, Position
+from nexustrader.schema import Trade, BookL1, Kline, Order, OrderSubmit, Position, InstrumentId
 from nexustrader.exchange.okx.schema import (
     OkxMarket,
     OkxWsBboTbtMsg,
@@ -26,11 +27,13 @@ from nexustrader.constants import (
     PositionSide,
     KlineInterval,
     TriggerType,
+    SubmitType,
+    HttpBackend,
 )
 from nexustrader.base import PublicConnector, PrivateConnector
 from nexustrader.core.nautilius_core import MessageBus
 from nexustrader.core.cache import AsyncCache
-from nexustrader.core.entity import TaskManager, RateLimit
+from nexustrader.core.entity import TaskManager, RateLimit, HttpPoolConfig
 from nexustrader.exchange.okx.rest_api import OkxApiClient
 from nexustrader.constants import OrderSide, OrderType
 from nexustrader.exchange.okx.constants import (
@@ -190,7 +193,7 @@ class OkxPublicConnector(PublicConnector):
     def _business_ws_msg_handler(self, raw: bytes):
         if raw == b"pong":
             self._business_ws_client._transport.notify_user_specific_pong_received()
-            self._log.debug(f"Pong received:{str(raw)}")
+            self._log.debug("Pong received:%s", raw)
             return
         try:
             ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
@@ -206,7 +209,7 @@ class OkxPublicConnector(PublicConnector):
     def _ws_msg_handler(self, raw: bytes):
         if raw == b"pong":
             self._ws_client._transport.notify_user_specific_pong_received()
-            self._log.debug(f"Pong received:{str(raw)}")
+            self._log.debug("Pong received:%s", raw)
             return
         try:
             ws_msg: OkxWsGeneralMsg = self._ws_msg_general_decoder.decode(raw)
@@ -303,6 +306,9 @@ class OkxPublicConnector(PublicConnector):
             confirm=False if int(kline.confirm) == 0 else True,
         )
             
+    def ws_clients(self) -> List[OkxWSClient]:
+        return super().ws_clients() + [self._business_ws_client]
+
     async def disconnect(self):
         await super().disconnect()
         self._business_ws_client.disconnect()
@@ -315,6 +321,16 @@ class OkxPrivateConnector(PrivateConnector):
     _market: Dict[str, OkxMarket]
     _market_id: Dict[str, str]
 
+    BATCH_ORDER_LIMIT = 20
+    BATCH_CANCEL_LIMIT = 20
+    BATCH_PARAM_KEYS = {
+        "inst_id": "instId",
+        "td_mode": "tdMode",
+        "ord_type": "ordType",
+        "ord_id": "ordId",
+        "cl_ord_id": "clOrdId",
+    }
+
     def __init__(
         self,
         exchange: OkxExchangeManager,
@@ -323,6 +339,9 @@ class OkxPrivateConnector(PrivateConnector):
         msgbus: MessageBus,
         task_manager: TaskManager,
         rate_limit: RateLimit | None = None,
+        enable_ws_order: bool | None = None,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         if not exchange.api_key or not exchange.secret or not exchange.passphrase:
             raise ValueError(
@@ -347,12 +366,18 @@ class OkxPrivateConnector(PrivateConnector):
                 secret=exchange.secret,
                 passphrase=exchange.passphrase,
                 testnet=account_type.is_testnet,
+                http_pool=http_pool,
+                http_backend=http_backend,
             ),
             msgbus=msgbus,
             cache=cache,
+            task_manager=task_manager,
             rate_limit=rate_limit,
         )
 
+        # orders go over the private websocket by default
+        self._ws_order = enable_ws_order is not False
+
         self._decoder_ws_general_msg = msgspec.json.Decoder(OkxWsGeneralMsg)
         self._decoder_ws_order_msg = msgspec.json.Decoder(OkxWsOrderMsg, strict=False)
         self._decoder_ws_position_msg = msgspec.json.Decoder(
@@ -410,18 +435,21 @@ class OkxPrivateConnector(PrivateConnector):
             self._log.error(msg)
         elif msg.event == "login":
             self._log.debug("Login success")
+            self._ws_client.on_login()
         elif msg.event == "subscribe":
             self._log.debug(f"Subscribed to {msg.arg.channel}")
 
     def _ws_msg_handler(self, raw: bytes):
         if raw == b"pong":
             self._ws_client._transport.notify_user_specific_pong_received()
-            self._log.debug(f"Pong received: {str(raw)}")
+            self._log.debug("Pong received: %s", raw)
             return
         try:
             ws_msg: OkxWsGeneralMsg = self._decoder_ws_general_msg.decode(raw)
             if ws_msg.is_event_msg:
                 self._handle_event_msg(ws_msg)
+            elif ws_msg.is_op_msg:
+                self._ws_client.on_order_response(raw)
             else:
                 channel = ws_msg.arg.channel
                 if channel == "orders":
@@ -435,7 +463,7 @@ class OkxPrivateConnector(PrivateConnector):
 
     def _handle_orders(self, raw: bytes):
         msg: OkxWsOrderMsg = self._decoder_ws_order_msg.decode(raw)
-        self._log.debug(f"Order update: {str(msg)}")
+        self._log.debug("Order update: %s", msg)
         for data in msg.data:
             symbol = self._market_id[data.instId]
             order = Order(
@@ -466,7 +494,7 @@ class OkxPrivateConnector(PrivateConnector):
 
     def _handle_positions(self, raw: bytes):
         position_msg = self._decoder_ws_position_msg.decode(raw)
-        self._log.debug(f"Position update: {str(position_msg)}")
+        self._log.debug("Position update: %s", position_msg)
 
         for data in position_msg.data:
             symbol = self._market_id[data.instId]
@@ -502,7 +530,7 @@ class OkxPrivateConnector(PrivateConnector):
 
     def _handle_account(self, raw: bytes):
         account_msg: OkxWsAccountMsg = self._decoder_ws_account_msg.decode(raw)
-        self._log.debug(f"Account update: {str(account_msg)}")
+        self._log.debug("Account update: %s", account_msg)
 
         for data in account_msg.data:
             balances = data.parse_to_balance()
@@ -541,9 +569,9 @@ class OkxPrivateConnector(PrivateConnector):
     ) -> Order:
         pass
 
-    async def create_order(
+    def _create_order_params(
         self,
-        symbol: str,
+        market: OkxMarket,
         side: OrderSide,
         type: OrderType,
         amount: Decimal,
@@ -551,21 +579,13 @@ class OkxPrivateConnector(PrivateConnector):
         time_in_force: TimeInForce = TimeInForce.GTC,
         position_side: PositionSide = None,
         **kwargs,
-    ):
-        if self._limiter:
-            await self._limiter.acquire()
-
-        market = self._market.get(symbol)
-        if not market:
-            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
-        symbol = market.id
-
+    ) -> Dict[str, Any]:
         td_mode = kwargs.pop("td_mode", None)
         if not td_mode:
             td_mode = self._get_td_mode(market)
 
         params = {
-            "inst_id": symbol,
+            "inst_id": market.id,
             "td_mode": td_mode.value,
             "side": OkxEnumParser.to_okx_order_side(side).value,
             "ord_type": OkxEnumParser.to_okx_order_type(type, time_in_force).value,
@@ -591,10 +611,55 @@ class OkxPrivateConnector(PrivateConnector):
             params["reduceOnly"] = True
 
         params.update(kwargs)
+        return params
+
+    def _to_batch_params(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        return {self.BATCH_PARAM_KEYS.get(key, key): value for key, value in params.items()}
+
+    def _failed_create_order(self, order: OrderSubmit) -> Order:
+        return Order(
+            exchange=self._exchange_id,
+            timestamp=self._clock.timestamp_ms(),
+            symbol=order.symbol,
+            type=order.type,
+            side=order.side,
+            amount=order.amount,
+            price=float(order.price) if order.price else None,
+            time_in_force=order.time_in_force,
+            position_side=order.position_side,
+            status=OrderStatus.FAILED,
+            filled=Decimal(0),
+            remaining=order.amount,
+        )
+
+    async def create_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        type: OrderType,
+        amount: Decimal,
+        price: Decimal = None,
+        time_in_force: TimeInForce = TimeInForce.GTC,
+        position_side: PositionSide = None,
+        **kwargs,
+    ):
+        if self._limiter:
+            await self._limiter.acquire()
+
+        market = self._market.get(symbol)
+        if not market:
+            raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+
+        params = self._create_order_params(
+            market, side, type, amount, price, time_in_force, position_side, **kwargs
+        )
 
         try:
-            res = await self._api_client.post_api_v5_trade_order(**params)
-            res = res.data[0]
+            if self._ws_order:
+                res = await self._ws_client.place_order(**params)
+            else:
+                res = await self._api_client.post_api_v5_trade_order(**params)
+                res = res.data[0]
             order = Order(
                 exchange=self._exchange_id,
                 id=res.ordId,
@@ -631,6 +696,90 @@ class OkxPrivateConnector(PrivateConnector):
             )
             return order
 
+    async def _create_batch_orders_chunk(
+        self, orders: List[OrderSubmit]
+    ) -> List[Order]:
+        results: List[Order | None] = [None] * len(orders)
+        batch_params = []
+        batch_index = []
+        for i, order in enumerate(orders):
+            try:
+                market = self._market.get(order.symbol)
+                if not market:
+                    raise ValueError(
+                        f"Symbol {order.symbol} formated wrongly, or not supported"
+                    )
+                params = self._create_order_params(
+                    market,
+                    order.side,
+                    order.type,
+                    order.amount,
+                    order.price,
+                    order.time_in_force,
+                    order.position_side,
+                    **order.kwargs,
+                )
+                batch_params.append(self._to_batch_params(params))
+                batch_index.append(i)
+            except Exception as e:
+                self._log.error(f"Error creating order: {type(e).__name__}: {str(e)}")
+
+        if batch_params:
+            if self._limiter:
+                await self._limiter.acquire()
+            try:
+                if self._ws_order:
+                    data = await self._ws_client.batch_place_orders(batch_params)
+                else:
+                    res = await self._api_client.post_api_v5_trade_batch_orders(
+                        batch_params
+                    )
+                    data = res.data
+            except Exception as e:
+                error_msg = f"{type(e).__name__}: {str(e)}"
+                self._log.error(
+                    f"Error creating batch orders: {error_msg} params: {str(batch_params)}"
+                )
+                data = []
+
+            for i, params, item in zip(batch_index, batch_params, data):
+                if item.sCode != "0":
+                    self._log.error(
+                        f"Error creating order: {item.sCode} {item.sMsg} params: {str(params)}"
+                    )
+                    continue
+                order = orders[i]
+                results[i] = Order(
+                    exchange=self._exchange_id,
+                    id=item.ordId,
+                    client_order_id=item.clOrdId,
+                    timestamp=int(item.ts),
+                    symbol=order.symbol,
+                    type=order.type,
+                    side=order.side,
+                    amount=order.amount,
+                    price=float(order.price) if order.price else None,
+                    time_in_force=order.time_in_force,
+                    position_side=order.position_side,
+                    status=OrderStatus.PENDING,
+                    filled=Decimal(0),
+                    remaining=order.amount,
+                )
+
+        return [
+            result or self._failed_create_order(order)
+            for order, result in zip(orders, results)
+        ]
+
+    async def create_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        results = await asyncio.gather(
+            *(
+                self._create_batch_orders_chunk(chunk)
+                for chunk in self._chunks(orders, self.BATCH_ORDER_LIMIT)
+            )
+        )
+        return [order for chunk in results for order in chunk]
+
     async def cancel_order(self, symbol: str, order_id: str, **kwargs):
         if self._limiter:
             await self._limiter.acquire()
@@ -643,8 +792,11 @@ class OkxPrivateConnector(PrivateConnector):
         params = {"inst_id": symbol, "ord_id": order_id, **kwargs}
 
         try:
-            res = await self._api_client.post_api_v5_trade_cancel_order(**params)
-            res = res.data[0]
+            if self._ws_order:
+                res = await self._ws_client.cancel_order(**params)
+            else:
+                res = await self._api_client.post_api_v5_trade_cancel_order(**params)
+                res = res.data[0]
             order = Order(
                 exchange=self._exchange_id,
                 id=res.ordId,
@@ -665,6 +817,181 @@ class OkxPrivateConnector(PrivateConnector):
             )
             return order
 
+    async def amend_order(
+        self,
+        symbol: str,
+        order_id: str,
+        side: OrderSide,
+        price: Decimal | None,
+        amount: Decimal,
+        **kwargs,
+    ) -> Order:
+        if self._limiter:
+            await self._limiter.acquire()
+
+        params = {"ordId": order_id, "newSz": str(amount), **kwargs}
+        if price:
+            params["newPx"] = str(price)
+
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(
+                    f"Symbol {symbol} formated wrongly, or not supported"
+                )
+            if self._ws_order:
+                res = await self._ws_client.amend_order(inst_id=market.id, **params)
+            else:
+                res = await self._api_client.post_api_v5_trade_amend_order(
+                    inst_id=market.id, **params
+                )
+                res = res.data[0]
+            return Order(
+                exchange=self._exchange_id,
+                id=res.ordId,
+                client_order_id=res.clOrdId,
+                timestamp=int(res.ts),
+                symbol=symbol,
+                side=side,
+                amount=amount,
+                price=float(price) if price else None,
+                status=OrderStatus.ACCEPTED,
+            )
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error amending order: {error_msg} params: {str(params)}")
+            return Order(
+                exchange=self._exchange_id,
+                timestamp=self._clock.timestamp_ms(),
+                symbol=symbol,
+                id=order_id,
+                side=side,
+                amount=amount,
+                price=float(price) if price else None,
+                status=OrderStatus.FAILED,
+            )
+
+    async def _cancel_batch_orders_chunk(
+        self, orders: List[OrderSubmit]
+    ) -> List[Order]:
+        if self._limiter:
+            await self._limiter.acquire()
+        batch_params = []
+        try:
+            for order in orders:
+                market = self._market.get(order.symbol)
+                if not market:
+                    raise ValueError(
+                        f"Symbol {order.symbol} formated wrongly, or not supported"
+                    )
+                batch_params.append(
+                    self._to_batch_params(
+                        {"inst_id": market.id, "ord_id": order.order_id, **order.kwargs}
+                    )
+                )
+            if self._ws_order:
+                data = await self._ws_client.batch_cancel_orders(batch_params)
+            else:
+                res = await self._api_client.post_api_v5_trade_cancel_batch_orders(
+                    batch_params
+                )
+                data = res.data
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(
+                f"Error canceling batch orders: {error_msg} params: {str(batch_params)}"
+            )
+            data = []
+
+        results = []
+        for i, order in enumerate(orders):
+            item = data[i] if i < len(data) else None
+            if item and item.sCode == "0":
+                results.append(
+                    Order(
+                        exchange=self._exchange_id,
+                        id=item.ordId,
+                        client_order_id=item.clOrdId,
+                        timestamp=int(item.ts),
+                        symbol=order.symbol,
+                        status=OrderStatus.CANCELING,
+                    )
+                )
+                continue
+            if item:
+                self._log.error(
+                    f"Error canceling order: {item.sCode} {item.sMsg} order_id: {order.order_id}"
+                )
+            results.append(
+                Order(
+                    exchange=self._exchange_id,
+                    timestamp=self._clock.timestamp_ms(),
+                    symbol=order.symbol,
+                    id=order.order_id,
+                    status=OrderStatus.CANCEL_FAILED,
+                )
+            )
+        return results
+
+    async def cancel_batch_orders(self, orders: List[OrderSubmit]) -> List[Order]:
+        results = await asyncio.gather(
+            *(
+                self._cancel_batch_orders_chunk(chunk)
+                for chunk in self._chunks(orders, self.BATCH_CANCEL_LIMIT)
+            )
+        )
+        return [order for chunk in results for order in chunk]
+
+    async def get_server_time(self) -> int:
+        return await self._api_client.get_api_v5_public_time()
+
+    async def _pending_order_ids(self, inst_id: str) -> List[str]:
+        order_ids = []
+        after = None
+        while True:
+            res = await self._api_client.get_api_v5_trade_orders_pending(
+                inst_id=inst_id, after=after
+            )
+            order_ids.extend(item.ordId for item in res.data)
+            if len(res.data) < 100:
+                return order_ids
+            after = res.data[-1].ordId
+
+    async def cancel_all_orders(self, symbol: str) -> List[str] | None:
+        """
+        OKX has no cancel all endpoint for regular orders, the open orders of the symbol
+        are fetched and canceled with the batch endpoint
+        """
+        if self._limiter:
+            await self._limiter.acquire()
+        try:
+            market = self._market.get(symbol)
+            if not market:
+                raise ValueError(f"Symbol {symbol} formated wrongly, or not supported")
+            order_ids = await self._pending_order_ids(market.id)
+        except Exception as e:
+            error_msg = f"{type(e).__name__}: {str(e)}"
+            self._log.error(f"Error canceling all orders: {error_msg} symbol: {symbol}")
+            return None
+
+        instrument_id = InstrumentId.from_str(symbol)
+        orders = await self.cancel_batch_orders(
+            [
+                OrderSubmit(
+                    symbol=symbol,
+                    instrument_id=instrument_id,
+                    submit_type=SubmitType.CANCEL,
+                    order_id=order_id,
+                )
+                for order_id in order_ids
+            ]
+        )
+        return [
+            order_id
+            for order_id, order in zip(order_ids, orders)
+            if not order.success
+        ]
+
     async def disconnect(self):
         await super().disconnect()
         await self._api_client.close_session()
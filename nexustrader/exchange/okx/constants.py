@@ -95,6 +95,21 @@ REST_URLS = {
 }
 
 
+# requests (orders for the batch endpoints) per 2 seconds, per user id for private and
+# per IP for public endpoints, OKX does not return the usage in the REST headers
+RATE_LIMITS = {
+    "/api/v5/trade/order": 60,
+    "/api/v5/trade/batch-orders": 300,
+    "/api/v5/trade/cancel-order": 60,
+    "/api/v5/trade/cancel-batch-orders": 300,
+    "/api/v5/trade/amend-order": 60,
+    "/api/v5/trade/orders-pending": 60,
+    "/api/v5/account/balance": 10,
+    "/api/v5/account/positions": 10,
+    "/api/v5/market/candles": 40,
+}
+
+
 @unique
 class OkxTdMode(Enum):
     CASH = "cash"  # 现货
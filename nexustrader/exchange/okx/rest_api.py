@@ -1,17 +1,20 @@
 import msgspec
-from typing import Dict, Any
+from typing import Dict, Any, List
 import orjson
 import hmac
 import base64
 import asyncio
 import aiohttp
+from datetime import datetime, timezone
 from urllib.parse import urljoin, urlencode
 from nexustrader.base import ApiClient
-from nexustrader.exchange.okx.constants import OkxRestUrl
+from nexustrader.exchange.okx.constants import OkxRestUrl, RATE_LIMITS
 from nexustrader.exchange.okx.error import OkxHttpError, OkxRequestError
 from nexustrader.exchange.okx.schema import (
     OkxPlaceOrderResponse,
     OkxCancelOrderResponse,
+    OkxAmendOrderResponse,
+    OkxPendingOrdersResponse,
     OkxGeneralResponse,
     OkxErrorResponse,
     OkxBalanceResponse,
@@ -19,6 +22,9 @@ from nexustrader.exchange.okx.schema import (
     OkxCandlesticksResponse,
 )
 from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.core.rate_limiter import WeightedRateLimiter
+from nexustrader.core.entity import HttpPoolConfig
+from nexustrader.constants import HttpBackend
 
 
 class OkxApiClient(ApiClient):
@@ -29,11 +35,17 @@ class OkxApiClient(ApiClient):
         passphrase: str = None,
         testnet: bool = False,
         timeout: int = 10,
+        enable_rate_limit: bool = True,
+        http_pool: HttpPoolConfig | None = None,
+        http_backend: HttpBackend = HttpBackend.AIOHTTP,
     ):
         super().__init__(
             api_key=api_key,
             secret=secret,
             timeout=timeout,
+            enable_rate_limit=enable_rate_limit,
+            http_pool=http_pool,
+            http_backend=http_backend,
         )
 
         self._base_url = OkxRestUrl.DEMO.value if testnet else OkxRestUrl.LIVE.value
@@ -41,6 +53,10 @@ class OkxApiClient(ApiClient):
         self._testnet = testnet
         self._place_order_decoder = msgspec.json.Decoder(OkxPlaceOrderResponse)
         self._cancel_order_decoder = msgspec.json.Decoder(OkxCancelOrderResponse)
+        self._amend_order_decoder = msgspec.json.Decoder(OkxAmendOrderResponse)
+        self._pending_orders_decoder = msgspec.json.Decoder(
+            OkxPendingOrdersResponse, strict=False
+        )
         self._general_response_decoder = msgspec.json.Decoder(OkxGeneralResponse)
         self._error_response_decoder = msgspec.json.Decoder(OkxErrorResponse)
         self._balance_response_decoder = msgspec.json.Decoder(
@@ -128,6 +144,64 @@ class OkxApiClient(ApiClient):
         raw = await self._fetch("POST", endpoint, payload=payload, signed=True)
         return self._cancel_order_decoder.decode(raw)
 
+    async def post_api_v5_trade_amend_order(
+        self, inst_id: str, **kwargs
+    ) -> OkxAmendOrderResponse:
+        """
+        Amend an incomplete order, `newSz` is the total size including the filled part
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-amend-order
+        """
+        endpoint = "/api/v5/trade/amend-order"
+        payload = {"instId": inst_id, **kwargs}
+        raw = await self._fetch("POST", endpoint, payload=payload, signed=True)
+        return self._amend_order_decoder.decode(raw)
+
+    async def post_api_v5_trade_batch_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> OkxPlaceOrderResponse:
+        """
+        Place up to 20 orders in OKX format, check `sCode` of every result
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-place-multiple-orders
+        """
+        endpoint = "/api/v5/trade/batch-orders"
+        raw = await self._fetch(
+            "POST", endpoint, payload=orders, signed=True, batch=True
+        )
+        return self._place_order_decoder.decode(raw)
+
+    async def post_api_v5_trade_cancel_batch_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> OkxCancelOrderResponse:
+        """
+        Cancel up to 20 `{"instId", "ordId" | "clOrdId"}`, check `sCode` of every result
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-post-cancel-multiple-orders
+        """
+        endpoint = "/api/v5/trade/cancel-batch-orders"
+        raw = await self._fetch(
+            "POST", endpoint, payload=orders, signed=True, batch=True
+        )
+        return self._cancel_order_decoder.decode(raw)
+
+    async def get_api_v5_trade_orders_pending(
+        self, inst_id: str | None = None, after: str | None = None, limit: int = 100
+    ) -> OkxPendingOrdersResponse:
+        """
+        Open orders, newest first, `after` is the `ordId` to page from
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-get-order-list
+        """
+        endpoint = "/api/v5/trade/orders-pending"
+        payload = {
+            k: v
+            for k, v in {
+                "instId": inst_id,
+                "after": after,
+                "limit": str(limit),
+            }.items()
+            if v is not None
+        }
+        raw = await self._fetch("GET", endpoint, payload=payload, signed=True)
+        return self._pending_orders_decoder.decode(raw)
+
     def _generate_signature(self, message: str) -> str:
         mac = hmac.new(
             bytes(self._secret, encoding="utf8"),
@@ -154,7 +228,7 @@ class OkxApiClient(ApiClient):
 
     def _get_timestamp(self) -> str:
         return (
-            self._clock.utc_now()
+            datetime.fromtimestamp(self._timestamp_ms() / 1000, tz=timezone.utc)
             .isoformat(timespec="milliseconds")
             .replace("+00:00", "Z")
         )
@@ -174,8 +248,18 @@ class OkxApiClient(ApiClient):
         )
         if self._testnet:
             headers["x-simulated-trading"] = "1"
+        if self._recv_window:
+            headers["expTime"] = str(self._timestamp_ms() + self._recv_window)
         return headers
 
+    async def get_api_v5_public_time(self) -> int:
+        """
+        https://www.okx.com/docs-v5/en/#public-data-rest-api-get-system-time
+        """
+        endpoint = "/api/v5/public/time"
+        raw = await self._fetch("GET", endpoint, signed=False)
+        return int(orjson.loads(raw)["data"][0]["ts"])
+
     async def get_api_v5_market_candles(
         self,
         instId: str,
@@ -200,14 +284,40 @@ class OkxApiClient(ApiClient):
         raw = await self._fetch("GET", endpoint, payload=payload, signed=False)
         return self._candles_response_decoder.decode(raw)
 
+    def _ping_path(self, path: str) -> str | None:
+        return "/api/v5/public/time"
+
+    def _rate_limiter(self, endpoint: str, signed: bool) -> WeightedRateLimiter:
+        """Limiter of the endpoint shared by every client on this API key (or IP)"""
+        return WeightedRateLimiter.shared(
+            ("okx", self._testnet, self._api_key if signed else None, endpoint),
+            RATE_LIMITS.get(endpoint, 20),
+            2,
+        )
+
+    async def _acquire_ping_rate_limit(self, path: str):
+        await self._rate_limiter(path, False).acquire(
+            1, self._request_priority("GET", path)
+        )
+
     async def _fetch(
         self,
         method: str,
         endpoint: str,
-        payload: Dict[str, Any] = None,
+        payload: Dict[str, Any] | List[Dict[str, Any]] = None,
         signed: bool = False,
+        batch: bool = False,
     ) -> bytes:
+        """
+        `batch` ops report the error of every order in `sCode`, so a "1" (all failed) or
+        "2" (partially succeeded) response code is returned instead of raised.
+        """
         self._init_session()
+        if self._enable_rate_limit:
+            await self._rate_limiter(endpoint, signed).acquire(
+                len(payload) if isinstance(payload, list) else 1,
+                self._request_priority(method, endpoint),
+            )
         url = urljoin(self._base_url, endpoint)
         request_path = endpoint
         headers = self._headers
@@ -226,17 +336,14 @@ class OkxApiClient(ApiClient):
 
         try:
             self._log.debug(
-                f"Request {method} Url: {url} Headers: {headers} Payload: {payload_json}"
+                "Request %s Url: %s Headers: %s Payload: %s", method, url, headers, payload_json
             )
 
-            response = await self._session.request(
-                method=method,
-                url=url,
-                headers=headers,
-                data=payload_json,
-            )
-            raw = await response.read()
+            response = await self._request(method, url, headers, payload_json)
+            raw = response.body
 
+            if response.status == 429 and self._enable_rate_limit:
+                self._rate_limiter(endpoint, signed).block(1)
             if response.status >= 400:
                 raise OkxHttpError(
                     status_code=response.status,
@@ -244,7 +351,7 @@ class OkxApiClient(ApiClient):
                     headers=response.headers,
                 )
             okx_response = self._general_response_decoder.decode(raw)
-            if okx_response.code == "0":
+            if okx_response.code == "0" or (batch and okx_response.code in ("1", "2")):
                 return raw
             else:
                 okx_error_response = self._error_response_decoder.decode(raw)
@@ -31,11 +31,44 @@ class OkxWsGeneralMsg(msgspec.Struct):
     connId: str | None = None
     channel: str | None = None
     arg: OkxWsArgMsg | None = None
+    id: str | None = None
+    op: str | None = None
 
     @property
     def is_event_msg(self) -> bool:
         return self.event is not None
 
+    @property
+    def is_op_msg(self) -> bool:
+        return self.op is not None
+
+
+class OkxWsOrderResponseData(msgspec.Struct, kw_only=True):
+    ordId: str = ""
+    clOrdId: str = ""
+    tag: str = ""
+    ts: str = ""
+    reqId: str = ""  # amend ops only
+    sCode: str  # event code, "0" means success
+    sMsg: str = ""
+
+
+class OkxWsOrderResponseMsg(msgspec.Struct, kw_only=True):
+    """
+    Response of the private websocket trade ops (`order`, `cancel-order`, `amend-order` and batch variants)
+    https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-place-order
+
+    code: "0" success, "1" all failed, "2" partially succeeded (batch ops)
+    """
+
+    id: str
+    op: str
+    code: str
+    msg: str = ""
+    data: list[OkxWsOrderResponseData] = []
+    inTime: str = ""
+    outTime: str = ""
+
 
 class OkxWsBboTbtData(msgspec.Struct):
     ts: str
@@ -225,6 +258,40 @@ class OkxCancelOrderResponse(msgspec.Struct):
     outTime: str  # milliseconds when response leaves REST gateway
 
 
+################################################################################
+# Amend order: POST /api/v5/trade/amend-order
+################################################################################
+
+
+class OkxAmendOrderData(msgspec.Struct):
+    ordId: str
+    clOrdId: str
+    ts: str  # milliseconds when OKX finished order request processing
+    reqId: str  # client request ID as assigned by the client for order amendment
+    sCode: str  # event code, "0" means success
+    sMsg: str  # rejection or success message of event execution
+
+
+class OkxAmendOrderResponse(msgspec.Struct):
+    code: str
+    msg: str
+    data: list[OkxAmendOrderData]
+    inTime: str  # milliseconds when request hit REST gateway
+    outTime: str  # milliseconds when response leaves REST gateway
+
+
+class OkxPendingOrderData(msgspec.Struct):
+    instId: str
+    ordId: str
+    clOrdId: str
+
+
+class OkxPendingOrdersResponse(msgspec.Struct):
+    code: str
+    msg: str
+    data: list[OkxPendingOrderData]
+
+
 class OkxMarketInfo(msgspec.Struct):
     """
     {
@@ -1,13 +1,18 @@
-import time
 import hmac
+import uuid
 import base64
 import asyncio
+import orjson
+import msgspec
 
 from typing import Literal, Any, Callable, Dict, List
 from aiolimiter import AsyncLimiter
+from picows import WSMsgType
 
 from nexustrader.base import WSClient
 from nexustrader.exchange.okx.constants import OkxAccountType, OkxKlineInterval
+from nexustrader.exchange.okx.schema import OkxWsOrderResponseMsg, OkxWsOrderResponseData
+from nexustrader.exchange.okx.error import OkxRequestError
 from nexustrader.core.entity import TaskManager
 
 class OkxWSClient(WSClient):
@@ -20,13 +25,21 @@ class OkxWSClient(WSClient):
         secret: str | None = None,
         passphrase: str | None = None,
         business_url: bool = False,
+        request_timeout: int = 10,
     ):
         self._api_key = api_key
         self._secret = secret
         self._passphrase = passphrase
         self._account_type = account_type
         self._authed = False
+        self._logged_in = asyncio.Event()
         self._business_url = business_url
+        self._request_timeout = request_timeout
+        self._request_id = 0
+        self._pending: Dict[str, asyncio.Future] = {}  # id -> future, until answered
+        # id -> encoded request, made while the connection is down and sent after the login
+        self._unsent: Dict[str, bytes] = {}
+        self._order_response_decoder = msgspec.json.Decoder(OkxWsOrderResponseMsg)
         if self.is_private:
             url = f"{account_type.stream_url}/v5/private"
         else:
@@ -54,7 +67,7 @@ class OkxWSClient(WSClient):
         )
 
     def _get_auth_payload(self):
-        timestamp = int(time.time())
+        timestamp = self._timestamp_ms() // 1000
         message = str(timestamp) + "GET" + "/users/self/verify"
         mac = hmac.new(
             bytes(self._secret, encoding="utf8"),
@@ -76,20 +89,87 @@ class OkxWSClient(WSClient):
 
     async def _auth(self):
         if not self._authed:
-            await self._send(self._get_auth_payload())
             self._authed = True
-            await asyncio.sleep(5)
-    
-    async def _submit(self, op: str, params: Dict[str, Any]):
-        await self.connect()
-        await self._auth()
-        
-        payload = {
-            "id": self._clock.timestamp_ms(),
-            "op": op,
-            "args": [params],
-        }
-        await self._send(payload)
+            self._logged_in.clear()
+            await self._send(self._get_auth_payload())
+            try:
+                await asyncio.wait_for(self._logged_in.wait(), timeout=5)
+            except asyncio.TimeoutError:
+                self._log.warn("No login response within 5s")
+
+    def on_login(self):
+        """Called by the message handler on the `login` event."""
+        self._logged_in.set()
+        self._flush_pending()
+
+    def _flush_pending(self):
+        """Send the requests made while the connection was down."""
+        for request_id, raw in list(self._unsent.items()):
+            if not self._send_raw(raw):
+                return
+            del self._unsent[request_id]
+
+    def _send_raw(self, raw: bytes) -> bool:
+        if not (self.connected and self._logged_in.is_set()):
+            return False
+        try:
+            self._transport.send(WSMsgType.TEXT, raw)
+            return True
+        except Exception as e:
+            self._log.error(f"Error sending request: {e}")
+            return False
+
+    async def _request(self, op: str, args: List[Dict[str, Any]]) -> OkxWsOrderResponseMsg:
+        """Send a trade op and wait for its response.
+
+        Requests made while the connection is down are queued and sent after the
+        re-login. A request in flight when the connection drops is not sent again, it
+        fails with `ConnectionAbortedError` as its outcome is unknown: an order may
+        have been accepted, it can be found by its `clOrdId`.
+        """
+        if not self._authed:
+            # first use, afterwards the connection handler reconnects and logs in again
+            await self.connect()
+            await self._auth()
+
+        self._request_id += 1
+        request_id = str(self._request_id)
+        raw = orjson.dumps({"id": request_id, "op": op, "args": args})
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        if not self._send_raw(raw):
+            self._unsent[request_id] = raw
+        try:
+            return await asyncio.wait_for(future, self._request_timeout)
+        finally:
+            self._pending.pop(request_id, None)
+            self._unsent.pop(request_id, None)
+
+    def on_order_response(self, raw: bytes):
+        """Called by the message handler on trade op responses."""
+        msg = self._order_response_decoder.decode(raw)
+        future = self._pending.pop(msg.id, None)
+        if future is None or future.done():
+            self._log.debug("Response without pending request: %s", raw)
+            return
+        future.set_result(msg)
+
+    @staticmethod
+    def _raise_for_error(msg: OkxWsOrderResponseMsg) -> OkxWsOrderResponseData:
+        data = msg.data[0] if msg.data else None
+        if msg.code == "0" and data:
+            return data
+        raise OkxRequestError(
+            error_code=data.sCode if data else msg.code,
+            status_code=None,
+            message=data.sMsg if data else msg.msg,
+        )
+
+    @staticmethod
+    def _with_cl_ord_id(params: Dict[str, Any]) -> Dict[str, Any]:
+        if not params.get("clOrdId"):
+            params["clOrdId"] = uuid.uuid4().hex
+        return params
     
     async def _send_payload(self, params: List[Dict[str, Any]], chunk_size: int = 100):
         # Split params into chunks of 100 if length exceeds 100
@@ -121,7 +201,12 @@ class OkxWSClient(WSClient):
         await self._send_payload(params)
         
     
-    async def place_order(self, inst_id: str, td_mode: str, side: str, ord_type: str, sz: str, **kwargs):
+    async def place_order(
+        self, inst_id: str, td_mode: str, side: str, ord_type: str, sz: str, **kwargs
+    ) -> OkxWsOrderResponseData:
+        """
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-place-order
+        """
         params = {
             "instId": inst_id,
             "tdMode": td_mode,
@@ -130,9 +215,15 @@ class OkxWSClient(WSClient):
             "sz": sz,
             **kwargs,
         }
-        await self._submit("order", params)
-    
-    async def cancel_order(self, inst_id: str, ord_id: str | None = None, cl_ord_id: str | None = None):
+        msg = await self._request("order", [self._with_cl_ord_id(params)])
+        return self._raise_for_error(msg)
+
+    async def cancel_order(
+        self, inst_id: str, ord_id: str | None = None, cl_ord_id: str | None = None
+    ) -> OkxWsOrderResponseData:
+        """
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-cancel-order
+        """
         params = {
             "instId": inst_id,
         }
@@ -140,8 +231,36 @@ class OkxWSClient(WSClient):
             params["ordId"] = ord_id
         if cl_ord_id:
             params["clOrdId"] = cl_ord_id
-        await self._submit("cancel-order", params)
-        
+        msg = await self._request("cancel-order", [params])
+        return self._raise_for_error(msg)
+
+    async def amend_order(self, inst_id: str, **kwargs) -> OkxWsOrderResponseData:
+        """
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-amend-order
+        """
+        msg = await self._request("amend-order", [{"instId": inst_id, **kwargs}])
+        return self._raise_for_error(msg)
+
+    async def batch_place_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> List[OkxWsOrderResponseData]:
+        """
+        Up to 20 orders in OKX format, check `sCode` of every result
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-place-multiple-orders
+        """
+        args = [self._with_cl_ord_id(dict(order)) for order in orders]
+        msg = await self._request("batch-orders", args)
+        return msg.data
+
+    async def batch_cancel_orders(
+        self, orders: List[Dict[str, Any]]
+    ) -> List[OkxWsOrderResponseData]:
+        """
+        Up to 20 `{"instId", "ordId" | "clOrdId"}`, check `sCode` of every result
+        https://www.okx.com/docs-v5/en/#order-book-trading-trade-ws-cancel-multiple-orders
+        """
+        msg = await self._request("batch-cancel-orders", list(orders))
+        return msg.data
 
     async def subscribe_order_book(
         self,
@@ -201,6 +320,18 @@ class OkxWSClient(WSClient):
         params = {"channel": "fills"}
         await self._subscribe([params], auth=True)
 
+    def disconnect(self):
+        self._logged_in.clear()
+        super().disconnect()
+        # the requests already sent are not answered on the next connection
+        sent = [request_id for request_id in self._pending if request_id not in self._unsent]
+        for request_id in sent:
+            future = self._pending.pop(request_id)
+            if not future.done():
+                future.set_exception(
+                    ConnectionAbortedError("websocket disconnected before response")
+                )
+
     async def _resubscribe(self):
         if self.is_private:
             self._authed = False
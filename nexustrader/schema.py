@@ -15,6 +15,7 @@ from nexustrader.constants import (
     AlgoOrderStatus,
     KlineInterval,
     TriggerType,
+    AccountType,
 )
 
 
@@ -131,6 +132,15 @@ class IndexPrice(Struct, gc=False):
     timestamp: int
 
 
+class PnL(Struct, gc=False):
+    """Portfolio totals published on the `pnl` topic, see `nexustrader.core.pnl`"""
+
+    timestamp: int
+    unrealized_pnl: float
+    realized_pnl: float
+    notional: float
+
+
 class OrderSubmit(Struct):
     symbol: str
     instrument_id: InstrumentId
@@ -144,12 +154,24 @@ class OrderSubmit(Struct):
     time_in_force: TimeInForce | None = TimeInForce.GTC
     position_side: PositionSide | None = None
     duration: int | None = None
-    check_interval: float = 0.1
+    check_interval: float = 0.1  # unused, twap slices are driven by order status events
     wait: float | None = None
     trigger_price: Decimal | None = None
     trigger_type: TriggerType = TriggerType.LAST_PRICE
     kwargs: Dict[str, Any] = {}
     status: OrderStatus = OrderStatus.INITIALIZED
+    exec_algorithm: str | None = None  # name of the `ExecAlgorithm` of an algo order
+    exec_params: Dict[str, Any] = {}  # parameters of the `ExecAlgorithm`
+
+
+class BatchOrderSubmit(Struct):
+    """
+    Orders of one account type submitted together, see `SubmitType.BATCH_CREATE` and
+    `SubmitType.BATCH_CANCEL`.
+    """
+
+    submit_type: SubmitType
+    orders: List[OrderSubmit]
 
 
 class Order(Struct):
@@ -228,8 +250,8 @@ class AlgoOrder(Struct, kw_only=True):
     uuid: str  # start with "ALGO-"
     side: OrderSide
     amount: Optional[Decimal] = None
-    duration: int
-    wait: int
+    duration: int | None = None
+    wait: int | None = None
     status: AlgoOrderStatus
     exchange: ExchangeType
     timestamp: int
@@ -238,6 +260,7 @@ class AlgoOrder(Struct, kw_only=True):
     filled: Optional[Decimal] = None
     cost: Optional[float] = None
     average: Optional[float] = None
+    algorithm: str = "twap"
 
     @property
     def success(self) -> bool:
@@ -304,6 +327,13 @@ class Balance(Struct):
         return self.free + self.locked
 
 
+class BalanceUpdate(Struct):
+    """Balances applied to the cache for an account, published on the `balance` topic"""
+
+    account_type: AccountType
+    balances: List[Balance]
+
+
 class AccountBalance(Struct):
     balances: Dict[str, Balance] = field(default_factory=dict)
 
@@ -338,6 +368,18 @@ class AccountBalance(Struct):
         return {asset: balance.locked for asset, balance in self.balances.items()}
 
 
+class AssetExposure(Struct, gc=False):
+    """Net exposure of an asset over every account, see `nexustrader.core.portfolio`"""
+
+    asset: str
+    balance: float  # sum of the balances
+    position: float  # sum of the positions in the asset
+    net: float  # balance + position
+    price: float | None  # in the valuation currency, `None` if unknown
+    value: float | None  # net * price
+    exchanges: Dict[ExchangeType, float]  # net of each exchange
+
+
 class Precision(Struct):
     """
      "precision": {
@@ -1,11 +1,19 @@
-from typing import Dict, List, Set, Callable, Literal
+from typing import Any, Dict, List, Set, Callable, Literal
 from decimal import Decimal
+import numpy as np
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from collections import defaultdict
 from nexustrader.core.log import SpdLog
 from nexustrader.base import ExchangeManager
 from nexustrader.core.entity import TaskManager
 from nexustrader.core.cache import AsyncCache
+from nexustrader.core.conflation import BookL1Conflator, ConflationStats
+from nexustrader.core.latency import LatencyTracker
+from nexustrader.core.timer import TimerHandle, TimerWheel
+from nexustrader.core.fixed_point import MarketFixedPoint
+from nexustrader.core.risk import RiskEngine
+from nexustrader.core.pnl import PnLEngine
+from nexustrader.core.portfolio import Portfolio
 from nexustrader.error import StrategyBuildError
 from nexustrader.base import (
     ExecutionManagementSystem,
@@ -22,6 +30,7 @@ from nexustrader.schema import (
     InstrumentId,
     BaseMarket,
     AccountBalance,
+    PnL,
 )
 from nexustrader.constants import (
     DataType,
@@ -50,6 +59,11 @@ class Strategy:
         }
 
         self._initialized = False
+        self._bookl1_conflator: BookL1Conflator | None = None
+        self._latency_tracker: LatencyTracker | None = None
+        self._risk_engine: RiskEngine | None = None
+        self._pnl_engine: PnLEngine | None = None
+        self._portfolio: Portfolio | None = None
         self._scheduler = AsyncIOScheduler()
 
     def _init_core(
@@ -61,21 +75,44 @@ class Strategy:
         msgbus: MessageBus,
         task_manager: TaskManager,
         ems: Dict[ExchangeType, ExecutionManagementSystem],
+        bookl1_conflator: BookL1Conflator | None = None,
+        latency_tracker: LatencyTracker | None = None,
+        timers: TimerWheel | None = None,
+        risk_engine: RiskEngine | None = None,
+        pnl_engine: PnLEngine | None = None,
+        portfolio: Portfolio | None = None,
     ):
         if self._initialized:
             return
 
         self.cache = cache
         self.clock = LiveClock()
+        self.timers = timers or TimerWheel(clock=self.clock)
         self._ems = ems
         self._task_manager = task_manager
         self._msgbus = msgbus
         self._private_connectors = private_connectors
         self._public_connectors = public_connectors
         self._exchanges = exchanges
-        self._msgbus.subscribe(topic="trade", handler=self.on_trade)
-        self._msgbus.subscribe(topic="bookl1", handler=self.on_bookl1)
-        self._msgbus.subscribe(topic="kline", handler=self.on_kline)
+        self._bookl1_conflator = bookl1_conflator
+        self._latency_tracker = latency_tracker
+        self._risk_engine = risk_engine
+        self._pnl_engine = pnl_engine
+        self._portfolio = portfolio
+
+        on_trade, on_bookl1, on_kline = self.on_trade, self.on_bookl1, self.on_kline
+        if latency_tracker:
+            on_trade = latency_tracker.wrap("trade", on_trade)
+            on_bookl1 = latency_tracker.wrap("bookl1", on_bookl1)
+            on_kline = latency_tracker.wrap("kline", on_kline)
+
+        self._msgbus.subscribe(topic="trade", handler=on_trade)
+        if bookl1_conflator:
+            bookl1_conflator.subscribe(on_bookl1)
+        else:
+            self._msgbus.subscribe(topic="bookl1", handler=on_bookl1)
+        self._msgbus.subscribe(topic="kline", handler=on_kline)
+        self._msgbus.subscribe(topic="pnl", handler=self.on_pnl)
 
         self._msgbus.register(endpoint="pending", handler=self.on_pending_order)
         self._msgbus.register(endpoint="accepted", handler=self.on_accepted_order)
@@ -89,6 +126,10 @@ class Strategy:
         self._msgbus.register(
             endpoint="cancel_failed", handler=self.on_cancel_failed_order
         )
+        self._msgbus.register(endpoint="amended", handler=self.on_amended_order)
+        self._msgbus.register(
+            endpoint="amend_failed", handler=self.on_amend_failed_order
+        )
 
         self._msgbus.register(endpoint="balance", handler=self.on_balance)
 
@@ -129,6 +170,35 @@ class Strategy:
 
         self._scheduler.add_job(func, trigger=trigger, **kwargs)
 
+    def _check_timers(self, method: str):
+        if not self._initialized:
+            raise RuntimeError(
+                f"Strategy not initialized, please use `{method}` in `on_start` method"
+            )
+
+    def call_later(self, delay: float, func: Callable) -> TimerHandle:
+        """
+        Run `func` once in `delay` seconds, on the timer wheel of the event loop.
+        Returns a handle, `handle.cancel()` stops the timer
+        """
+        self._check_timers("call_later")
+        return self.timers.call_later(delay, func)
+
+    def call_every(self, interval: float, func: Callable) -> TimerHandle:
+        """Run `func` every `interval` seconds, without drift"""
+        self._check_timers("call_every")
+        return self.timers.call_every(interval, func)
+
+    def call_on_kline(
+        self, interval: KlineInterval, func: Callable, offset: float = 0.0
+    ) -> TimerHandle:
+        """
+        Run `func` at every kline close of `interval`, shifted by `offset` seconds,
+        e.g. `self.call_on_kline(KlineInterval.MINUTE_1, self.rebalance, offset=-0.5)`
+        """
+        self._check_timers("call_on_kline")
+        return self.timers.call_on_kline(interval, func, offset)
+
     def market(self, symbol: str) -> BaseMarket:
         instrument_id = InstrumentId.from_str(symbol)
         exchange = self._exchanges[instrument_id.exchange]
@@ -154,6 +224,84 @@ class Strategy:
         ems = self._ems[instrument_id.exchange]
         return ems._price_to_precision(instrument_id.symbol, price, mode)
 
+    def fixed_point(self, symbol: str) -> MarketFixedPoint:
+        """
+        Prices as int ticks and sizes as int lots of the market, e.g.
+        `fp.ticks(bookl1.bid)`, `fp.lots(order.filled)`, `fp.notional(ticks * lots)`.
+        The conversions are lossless and raise for values off the market precision
+        """
+        instrument_id = InstrumentId.from_str(symbol)
+        ems = self._ems[instrument_id.exchange]
+        return ems._fixed_point(instrument_id.symbol)
+
+    def amounts_to_precision(
+        self,
+        symbol: str,
+        amounts: np.ndarray,
+        mode: Literal["round", "ceil", "floor"] = "round",
+    ) -> np.ndarray:
+        """
+        Round an array of amounts at once, e.g. the sizes of a quote ladder. Each value is
+        the float of what `amount_to_precision` returns
+        """
+        instrument_id = InstrumentId.from_str(symbol)
+        ems = self._ems[instrument_id.exchange]
+        return ems._amounts_to_precision(instrument_id.symbol, amounts, mode)
+
+    def prices_to_precision(
+        self,
+        symbol: str,
+        prices: np.ndarray,
+        mode: Literal["round", "ceil", "floor"] = "round",
+    ) -> np.ndarray:
+        """
+        Round an array of prices at once, e.g. the levels of a quote ladder. Each value is
+        the float of what `price_to_precision` returns
+        """
+        instrument_id = InstrumentId.from_str(symbol)
+        ems = self._ems[instrument_id.exchange]
+        return ems._prices_to_precision(instrument_id.symbol, prices, mode)
+
+    def bookl1_conflation_stats(self) -> ConflationStats | None:
+        """
+        Received/delivered/conflated counts and queueing delay of the bookl1 conflation
+        stage, `None` if `Config.bookl1_conflation_config` is not set.
+        """
+        if self._bookl1_conflator:
+            return self._bookl1_conflator.stats
+
+    def latency_stats(self) -> Dict[tuple, Dict[str, float]] | None:
+        """
+        Tick-to-strategy latency in microseconds keyed by `(exchange, topic, stage)`,
+        `None` if `Config.latency_config` is not set.
+        """
+        if self._latency_tracker:
+            return self._latency_tracker.stats()
+
+    def risk_stats(self) -> Dict[str, int] | None:
+        """
+        Orders checked and rejections per rule of the pre-trade risk engine, `None` if
+        `Config.risk_config` is not set.
+        """
+        if self._risk_engine:
+            return self._risk_engine.stats()
+
+    @property
+    def pnl(self) -> PnLEngine | None:
+        """
+        Mark-to-market PnL of the positions, with totals per account, exchange and of the
+        portfolio, `None` if `Config.pnl_config` is not set.
+        """
+        return self._pnl_engine
+
+    @property
+    def portfolio(self) -> Portfolio | None:
+        """
+        Net exposure per asset over the accounts of every exchange, `None` if
+        `Config.portfolio_config` is not set.
+        """
+        return self._portfolio
+
     def create_order(
         self,
         symbol: str,
@@ -205,6 +353,134 @@ class Strategy:
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
 
+    def amend_order(
+        self,
+        symbol: str,
+        uuid: str,
+        price: Decimal | None = None,
+        amount: Decimal | None = None,
+        account_type: AccountType | None = None,
+        **kwargs,
+    ) -> str:
+        """
+        Change the price and/or amount of an open order in place, keeping its uuid and,
+        where the exchange allows it, its queue priority. `amount` is the new total
+        amount of the order, including the filled part.
+
+        The cache is updated when the exchange acknowledges the amend, followed by
+        `on_amended_order`, or `on_amend_failed_order` if it was rejected.
+        """
+        order = OrderSubmit(
+            symbol=symbol,
+            instrument_id=InstrumentId.from_str(symbol),
+            submit_type=SubmitType.AMEND,
+            uuid=uuid,
+            price=price,
+            amount=amount,
+            kwargs=kwargs,
+        )
+        self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
+        return order.uuid
+
+    def create_orders(
+        self,
+        orders: List[Dict[str, Any]],
+        account_type: AccountType | None = None,
+    ) -> List[str]:
+        """
+        Create several orders with the exchange batch endpoints, each dict holds the
+        arguments of `create_order`. Orders are split by exchange and by the batch size
+        limit of the exchange, results arrive in `on_pending_order`/`on_failed_order`.
+
+        Returns the uuids in the same order as `orders`.
+        """
+        uuids = []
+        submits: Dict[ExchangeType, List[OrderSubmit]] = defaultdict(list)
+        for params in orders:
+            params = dict(params)
+            symbol = params.pop("symbol")
+            type = params.pop("type")
+            if type.is_stop_loss or type.is_take_profit:
+                raise ValueError(f"Batch orders do not support {type} orders")
+            order = OrderSubmit(
+                symbol=symbol,
+                instrument_id=InstrumentId.from_str(symbol),
+                submit_type=SubmitType.CREATE,
+                side=params.pop("side"),
+                type=type,
+                amount=params.pop("amount"),
+                price=params.pop("price", None),
+                time_in_force=params.pop("time_in_force", TimeInForce.GTC),
+                position_side=params.pop("position_side", None),
+                kwargs=params,
+            )
+            submits[order.instrument_id.exchange].append(order)
+            uuids.append(order.uuid)
+
+        for exchange, exchange_orders in submits.items():
+            self._ems[exchange]._submit_orders(
+                exchange_orders, SubmitType.BATCH_CREATE, account_type
+            )
+        return uuids
+
+    def cancel_orders(
+        self,
+        symbol: str,
+        uuids: List[str],
+        account_type: AccountType | None = None,
+        **kwargs,
+    ) -> List[str]:
+        """
+        Cancel several orders of `symbol` with the exchange batch endpoints, results
+        arrive in `on_canceling_order`/`on_cancel_failed_order`.
+        """
+        instrument_id = InstrumentId.from_str(symbol)
+        orders = [
+            OrderSubmit(
+                symbol=symbol,
+                instrument_id=instrument_id,
+                submit_type=SubmitType.CANCEL,
+                uuid=uuid,
+                kwargs=kwargs,
+            )
+            for uuid in uuids
+        ]
+        self._ems[instrument_id.exchange]._submit_orders(
+            orders, SubmitType.BATCH_CANCEL, account_type
+        )
+        return uuids
+
+    def cancel_all_orders(
+        self,
+        symbol: str | None = None,
+        exchange: ExchangeType | None = None,
+        account_type: AccountType | None = None,
+    ) -> List[str]:
+        """
+        Cancel all open orders of `symbol`, or of every symbol with open orders in the
+        cache on `exchange` (all exchanges if both are None), with one cancel all request
+        per symbol. The affected cached orders are marked CANCELING together and arrive in
+        `on_canceling_order`/`on_cancel_failed_order`.
+
+        Returns the symbols a cancel all request was submitted for.
+        """
+        if symbol is not None:
+            symbols = [symbol]
+        else:
+            symbols = sorted(
+                symbol
+                for symbol in self.cache.get_open_order_symbols(exchange)
+                if InstrumentId.from_str(symbol).exchange in self._ems
+            )
+        for symbol in symbols:
+            order = OrderSubmit(
+                symbol=symbol,
+                instrument_id=InstrumentId.from_str(symbol),
+                submit_type=SubmitType.CANCEL_ALL,
+            )
+            self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
+        return symbols
+
     def create_twap(
         self,
         symbol: str,
@@ -229,6 +505,7 @@ class Strategy:
             check_interval=check_interval,
             position_side=position_side,
             kwargs=kwargs,
+            exec_algorithm="twap",
         )
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
@@ -245,6 +522,92 @@ class Strategy:
         self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
         return order.uuid
 
+    def create_vwap(
+        self,
+        symbol: str,
+        side: OrderSide,
+        amount: Decimal,
+        duration: int,
+        profile: List[float],
+        position_side: PositionSide | None = None,
+        account_type: AccountType | None = None,
+        **kwargs,
+    ) -> str:
+        """
+        Execute `amount` over `duration` seconds following a volume profile, the relative
+        volume of equal time buckets, e.g. from `volume_profile` of the klines of the same
+        time window on previous days. Cancel with `cancel_algo_order`.
+        """
+        return self.create_algo_order(
+            symbol=symbol,
+            side=side,
+            amount=amount,
+            algorithm="vwap",
+            duration=duration,
+            params={"profile": list(profile)},
+            position_side=position_side,
+            account_type=account_type,
+            submit_type=SubmitType.VWAP,
+            **kwargs,
+        )
+
+    def create_algo_order(
+        self,
+        symbol: str,
+        side: OrderSide,
+        amount: Decimal,
+        algorithm: str,
+        duration: int | None = None,
+        params: Dict[str, Any] | None = None,
+        position_side: PositionSide | None = None,
+        account_type: AccountType | None = None,
+        submit_type: SubmitType = SubmitType.ALGO,
+        **kwargs,
+    ) -> str:
+        """
+        Execute `amount` with the `ExecAlgorithm` registered as `algorithm`, `params` are
+        the parameters of the algorithm:
+
+        - twap: `wait` seconds between slices over `duration`, see `create_twap`
+        - vwap: `profile`, see `create_vwap`
+        - pov: `rate` of the traded volume, optional `max_clip`, over `duration` if given,
+          needs the trades of the symbol subscribed
+        - iceberg: `display` amount pegged to the touch, needs the bookl1 of the symbol
+          subscribed
+
+        The algo order is cached under the returned uuid, with the aggregated fills of its
+        child orders. Cancel with `cancel_algo_order`.
+        """
+        params = dict(params or {})
+        order = OrderSubmit(
+            symbol=symbol,
+            instrument_id=InstrumentId.from_str(symbol),
+            uuid=f"ALGO-{UUID4().value}",
+            submit_type=submit_type,
+            side=side,
+            amount=amount,
+            duration=duration,
+            wait=params.get("wait"),
+            position_side=position_side,
+            kwargs=kwargs,
+            exec_algorithm=algorithm,
+            exec_params=params,
+        )
+        self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
+        return order.uuid
+
+    def cancel_algo_order(
+        self, symbol: str, uuid: str, account_type: AccountType | None = None
+    ) -> str:
+        order = OrderSubmit(
+            symbol=symbol,
+            instrument_id=InstrumentId.from_str(symbol),
+            submit_type=SubmitType.CANCEL_ALGO,
+            uuid=uuid,
+        )
+        self._ems[order.instrument_id.exchange]._submit_order(order, account_type)
+        return order.uuid
+
     def subscribe_bookl1(self, symbols: str | List[str]):
         """
         Subscribe to level 1 book data for the given symbols.
@@ -357,5 +720,14 @@ class Strategy:
     def on_cancel_failed_order(self, order: Order):
         pass
 
+    def on_amended_order(self, order: Order):
+        pass
+
+    def on_amend_failed_order(self, order: Order):
+        pass
+
     def on_balance(self, balance: AccountBalance):
         pass
+
+    def on_pnl(self, pnl: PnL):
+        pass
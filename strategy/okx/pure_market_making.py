@@ -35,7 +35,10 @@ class PureMarketMaking(Strategy):
         
         # 状态变量
         self.last_order_refresh_timestamp = 0
-        self.active_orders = set()  # 追踪活跃订单
+        self.quotes: dict[OrderSide, str | None] = {  # 追踪活跃订单 uuid
+            OrderSide.BUY: None,
+            OrderSide.SELL: None,
+        }
 
         # store balance
         self.balance: dict[str, Decimal] = {}
@@ -98,25 +101,59 @@ class PureMarketMaking(Strategy):
         
         return bid_amount, ask_amount
 
+    def _quote_closed(self, order: Order):
+        for side, uuid in self.quotes.items():
+            if uuid == order.uuid:
+                self.quotes[side] = None
+
     def on_failed_order(self, order: Order):
-        self.active_orders.discard(order.id)
+        self._quote_closed(order)
         print(f"Order failed: {order}")
     
     def on_pending_order(self, order: Order):
         print(f"Order pending: {order}")
     
     def on_accepted_order(self, order: Order):
-        self.active_orders.add(order.id)
         print(f"Order accepted: {order}")
     
+    def on_amended_order(self, order: Order):
+        print(f"Order amended: {order}")
+
+    def on_amend_failed_order(self, order: Order):
+        # e.g. filled in the meantime, the next refresh places a new quote
+        self._quote_closed(order)
+        print(f"Order amend failed: {order}")
+
     def on_filled_order(self, order: Order):
-        self.active_orders.discard(order.id)
+        self._quote_closed(order)
         print(f"Order filled: {order}")
         
     def on_canceled_order(self, order: Order):
-        self.active_orders.discard(order.id)
+        self._quote_closed(order)
         print(f"Order canceled: {order}")
 
+    def requote(self, side: OrderSide, price: float, amount: float):
+        """改单而不是撤单重下: 一次请求, 保留队列优先级"""
+        symbol = "BTCUSDT.OKX"
+        price = self.price_to_precision(symbol, price)
+        amount = self.amount_to_precision(symbol, amount)
+        if uuid := self.quotes[side]:
+            self.amend_order(symbol=symbol, uuid=uuid, price=price, amount=amount)
+        else:
+            self.quotes[side] = self.create_order(
+                symbol=symbol,
+                side=side,
+                type=OrderType.LIMIT,
+                price=price,
+                amount=amount,
+            )
+
+    def withdraw(self, side: OrderSide):
+        """撤掉该方向的报价 (数量为 0 或价差不足时, 不能留下过期报价)"""
+        if uuid := self.quotes[side]:
+            self.cancel_order(symbol="BTCUSDT.OKX", uuid=uuid)
+            self.quotes[side] = None
+
     def on_bookl1(self, bookl1: BookL1):
         current_timestamp = self.clock.timestamp_ms()
         
@@ -124,10 +161,6 @@ class PureMarketMaking(Strategy):
         if current_timestamp - self.last_order_refresh_timestamp < self.order_refresh_time:
             return
             
-        # 取消现有订单
-        for order_id in list(self.active_orders):
-            self.cancel_order(symbol="BTCUSDT.OKX", order_id=order_id)
-        
         # 计算买卖价格
         mid_price = (bookl1.bid + bookl1.ask) / 2
         bid_price = mid_price * (1 - self.bid_spread)
@@ -136,29 +169,23 @@ class PureMarketMaking(Strategy):
         # 检查价差是否满足最小要求
         current_spread = (ask_price - bid_price) / mid_price
         if current_spread < self.min_spread:
+            self.withdraw(OrderSide.BUY)
+            self.withdraw(OrderSide.SELL)
             return
             
         # 获取考虑库存因素后的订单数量
         bid_amount, ask_amount = self.get_adjusted_amounts(mid_price)
             
-        # 创建新的买卖订单
+        # 改单或创建新的买卖订单
         if bid_amount > 0:
-            self.create_order(
-                symbol="BTCUSDT.OKX",
-                side=OrderSide.BUY,
-                type=OrderType.LIMIT,
-                price=self.price_to_precision("BTCUSDT.OKX", bid_price),
-                amount=self.amount_to_precision("BTCUSDT.OKX", bid_amount)
-            )
+            self.requote(OrderSide.BUY, bid_price, bid_amount)
+        else:
+            self.withdraw(OrderSide.BUY)
         
         if ask_amount > 0:
-            self.create_order(
-                symbol="BTCUSDT.OKX",
-                side=OrderSide.SELL,
-                type=OrderType.LIMIT,
-                price=self.price_to_precision("BTCUSDT.OKX", ask_price),
-                amount=self.amount_to_precision("BTCUSDT.OKX", ask_amount)
-            )
+            self.requote(OrderSide.SELL, ask_price, ask_amount)
+        else:
+            self.withdraw(OrderSide.SELL)
         
         self.last_order_refresh_timestamp = current_timestamp
 
@@ -0,0 +1,88 @@
+import asyncio
+
+import orjson
+import pytest
+from aiohttp import web
+
+from nexustrader.constants import HttpBackend
+from nexustrader.core.entity import HttpPoolConfig
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+
+
+async def test_warmup_keeps_connections_open(task_manager):
+    pings = []
+
+    async def ping(request: web.Request):
+        pings.append(request.path)
+        await asyncio.sleep(0.01)  # keep the concurrent pings on separate connections
+        return web.json_response({})
+
+    app = web.Application()
+    app.router.add_get("/fapi/v1/time", ping)
+    app.router.add_get("/fapi/v1/ping", ping)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    client = BinanceApiClient(
+        http_pool=HttpPoolConfig(connections=3, keepalive_interval=0.05)
+    )
+    try:
+        client._init_session()
+        await client._request("GET", f"http://127.0.0.1:{port}/fapi/v1/time")
+        await client.warmup(task_manager)
+
+        stats = client.pool_stats()["127.0.0.1"]
+        assert (stats.idle, stats.in_use, stats.created, stats.reconnects) == (3, 0, 3, 0)
+        assert client._ping_urls == {f"http://127.0.0.1:{port}/fapi/v1/ping"}
+
+        await asyncio.sleep(0.1)  # keep-alive round reuses the warm connections
+        stats = client.pool_stats()["127.0.0.1"]
+        assert stats.reconnects == 0
+        assert stats.reused >= 3
+        assert pings.count("/fapi/v1/ping") >= 6
+    finally:
+        await client.close_session()
+        await runner.cleanup()
+
+
+@pytest.mark.parametrize("backend", list(HttpBackend))
+async def test_http_backends_return_the_same_response(backend):
+    if backend == HttpBackend.AIOSONIC:
+        pytest.importorskip("aiosonic")
+
+    async def order(request: web.Request):
+        body = await request.read()
+        return web.json_response(
+            {"path": request.path, "query": request.query_string, "body": body.decode()},
+            status=400 if request.query.get("fail") else 200,
+            headers={"X-MBX-USED-WEIGHT-1M": "7"},
+        )
+
+    app = web.Application()
+    app.router.add_route("*", "/fapi/v1/order", order)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+
+    client = BinanceApiClient(http_backend=backend)
+    try:
+        client._init_session()
+        url = f"http://127.0.0.1:{port}/fapi/v1/order"
+        response = await client._request("POST", f"{url}?a=1", {"X-Test": "1"}, "payload")
+        assert response.status == 200
+        assert response.headers["x-mbx-used-weight-1m"] == "7"  # case-insensitive
+        assert orjson.loads(response.body) == {
+            "path": "/fapi/v1/order",
+            "query": "a=1",
+            "body": "payload",
+        }
+        response = await client._request("DELETE", f"{url}?fail=1")
+        assert response.status == 400
+    finally:
+        await client.close_session()
+        await runner.cleanup()
@@ -1,9 +1,40 @@
+import asyncio
 import pytest
 import types
 from decimal import Decimal
-from typing import List
-from nexustrader.exchange.binance import BinanceExecutionManagementSystem
-from nexustrader.schema import BaseMarket
+from types import SimpleNamespace
+from typing import Dict, List, Tuple
+
+import msgspec
+from nautilus_trader.common.component import TestClock
+
+from nexustrader.base import OrderManagementSystem, volume_profile
+from nexustrader.constants import (
+    AlgoOrderStatus,
+    ExchangeType,
+    KlineInterval,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    SubmitType,
+)
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.risk import RiskConfig, RiskEngine
+from nexustrader.core.timer import TimerWheel
+from nexustrader.exchange.binance import (
+    BinanceAccountType,
+    BinanceExecutionManagementSystem,
+)
+from nexustrader.schema import (
+    BaseMarket,
+    BatchOrderSubmit,
+    BookL1,
+    InstrumentId,
+    Kline,
+    Order,
+    OrderSubmit,
+    Trade,
+)
 
 
 
@@ -57,3 +88,514 @@ def test_cal_twap_orders(ems: BinanceExecutionManagementSystem, total_amount: De
     )
     assert amount_list == expected_amounts
     assert wait == expected_wait
+
+
+class FakeAlgoConnector:
+    """Private connector whose limit orders are accepted, and filled if the next `fill_limit`
+    is True, market orders filled and cancels confirmed, all through the OMS like exchange
+    events"""
+
+    def __init__(
+        self,
+        oms: OrderManagementSystem,
+        fill_limit: List[bool] = (),
+        accept_limit: bool = True,
+        cancel_fills: bool = False,
+        fail_cancels: int = 0,
+    ):
+        self._oms = oms
+        self._fill_limit = list(fill_limit)
+        self._accept_limit = accept_limit  # False: limit orders stay PENDING
+        self._cancel_fills = cancel_fills  # True: the order fills and the cancel fails
+        self._fail_cancels = fail_cancels  # number of cancels failing, the order stays open
+        self.requests: List[Tuple] = []
+        self._orders: Dict[str, Order] = {}
+
+    def _push(self, order: Order, status: OrderStatus, filled: Decimal):
+        order = msgspec.structs.replace(
+            order,
+            status=status,
+            filled=filled,
+            remaining=order.amount - filled,
+            average=(order.price or 60000.0) if filled else None,
+        )
+        self._orders[order.id] = order
+        self._oms._add_order_msg(order)
+
+    async def create_order(self, symbol, side, type, amount, price, **kwargs) -> Order:
+        order = Order(
+            exchange=ExchangeType.BINANCE,
+            symbol=symbol,
+            status=OrderStatus.PENDING,
+            id=str(len(self.requests)),
+            amount=amount,
+            filled=Decimal("0"),
+            remaining=amount,
+            side=side,
+            type=type,
+            price=float(price) if price else None,
+        )
+        self.requests.append(("create", type, amount) + ((order.price,) if price else ()))
+        self._orders[order.id] = order
+        if type == OrderType.MARKET:
+            self._push(order, OrderStatus.FILLED, amount)
+        elif self._accept_limit:
+            self._push(order, OrderStatus.ACCEPTED, Decimal("0"))
+            if self._fill_limit and self._fill_limit.pop(0):
+                self._push(order, OrderStatus.FILLED, amount)
+        return order
+
+    async def cancel_order(self, symbol, order_id, **kwargs) -> Order:
+        order = self._orders[order_id]
+        self.requests.append(("cancel", order.type, order.amount))
+        if self._cancel_fills:
+            self._push(order, OrderStatus.FILLED, order.amount)
+            await asyncio.sleep(0.01)  # the fill is handled while the cancel is in flight
+            return msgspec.structs.replace(order, status=OrderStatus.CANCEL_FAILED)
+        if self._fail_cancels:
+            self._fail_cancels -= 1
+            return msgspec.structs.replace(order, status=OrderStatus.CANCEL_FAILED)
+        self._push(order, OrderStatus.CANCELED, order.filled)
+        return msgspec.structs.replace(order, status=OrderStatus.CANCELING)
+
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+START_NS = 1_704_067_200 * 1_000_000_000
+
+
+@pytest.fixture
+def algo_ems(tmp_path, message_bus, task_manager, order_registry):
+    market = SimpleNamespace(precision=SimpleNamespace(amount=0.001, price=0.1))
+    cache = AsyncCache(
+        strategy_id="strategy-mock",
+        user_id="user-mock",
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
+    )
+    cache._bookl1_cache[SYMBOL] = book(60000.0)
+    oms = OrderManagementSystem(cache, message_bus, task_manager, order_registry)
+    ems = BinanceExecutionManagementSystem(
+        {SYMBOL: market}, cache, message_bus, task_manager, order_registry
+    )
+    ems._get_min_order_amount = lambda symbol, market: Decimal("0.001")
+    return ems, oms
+
+
+@pytest.fixture
+def backtest_timers(algo_ems):
+    """Timer wheel of the algos on a test clock, moved forward with `advance`"""
+    ems, _ = algo_ems
+    clock = TestClock()
+    clock.set_time(START_NS)
+    timers = TimerWheel(clock=clock, live=False)
+    ems.set_timer_wheel(timers)
+    return timers
+
+
+async def advance(timers: TimerWheel, seconds: float):
+    timers.advance_to(timers.timestamp_ns() + int(seconds * 1_000_000_000))
+    await asyncio.sleep(0.02)  # let the order requests started by the timers run
+
+
+def book(bid: float) -> BookL1:
+    return BookL1(
+        exchange=ExchangeType.BINANCE,
+        symbol=SYMBOL,
+        bid=bid,
+        ask=bid + 0.5,
+        bid_size=1,
+        ask_size=1,
+        timestamp=0,
+    )
+
+
+async def start_algo(ems, connector, uuid: str, submit_type=SubmitType.ALGO, **kwargs):
+    ems._private_connectors = {BinanceAccountType.USD_M_FUTURE: connector}
+    await ems._create_algo_order(
+        OrderSubmit(
+            symbol=SYMBOL,
+            instrument_id=InstrumentId.from_str(SYMBOL),
+            submit_type=submit_type,
+            uuid=uuid,
+            side=OrderSide.BUY,
+            **kwargs,
+        ),
+        BinanceAccountType.USD_M_FUTURE,
+    )
+
+
+async def wait_for_algo(ems, uuid: str, status: AlgoOrderStatus, timeout: float = 2):
+    async def reached():
+        while ems._cache.get_order(uuid).unwrap().status != status:
+            await asyncio.sleep(0.005)
+
+    await asyncio.wait_for(reached(), timeout)
+
+
+async def test_twap_driven_by_order_events(algo_ems, backtest_timers, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    # slice 1 filled in time, slice 2 not filled: canceled and sent as a market order
+    connector = FakeAlgoConnector(oms, fill_limit=[True, False])
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-1",
+        submit_type=SubmitType.TWAP,
+        amount=Decimal("0.003"),
+        duration=0.4,
+        wait=0.1,
+    )
+    await asyncio.sleep(0.02)
+    # 3 slices, one every 0.4 / 3 seconds: nothing is sent before a slice is due
+    await advance(backtest_timers, 0.1)
+    assert len(connector.requests) == 1
+
+    # slice 1 filled: slice 2 is sent when it is due
+    await advance(backtest_timers, 0.05)
+    assert len(connector.requests) == 2
+    # slice 2 not filled when slice 3 is due: canceled, its amount sent at market
+    await advance(backtest_timers, 0.15)
+    assert len(connector.requests) == 5
+    assert ems._cache.get_order("ALGO-1").unwrap().status == AlgoOrderStatus.RUNNING
+    await advance(backtest_timers, 0.1)
+    await wait_for_algo(ems, "ALGO-1", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.001")),
+    ]
+    algo_order = ems._cache.get_order("ALGO-1").unwrap()
+    assert len(algo_order.orders) == 4
+    assert algo_order.algorithm == "twap"
+    assert not ems._algos and not ems._algo_children
+    await task_manager.cancel()
+
+
+async def test_twap_proceeds_when_slice_fills_during_cancel(
+    algo_ems, backtest_timers, task_manager
+):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms, fill_limit=[False], cancel_fills=True)
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-7",
+        submit_type=SubmitType.TWAP,
+        amount=Decimal("0.002"),
+        duration=0.2,
+        wait=0.1,
+    )
+    await asyncio.sleep(0.02)
+    # slice 1 due: its cancel fails because it filled, the fill event arrived meanwhile
+    await advance(backtest_timers, 0.1)
+    await advance(backtest_timers, 0.1)
+    await wait_for_algo(ems, "ALGO-7", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.001")),
+    ]
+    assert ems._cache.get_order("ALGO-7").unwrap().filled == Decimal("0.002")
+    await task_manager.cancel()
+
+
+async def test_failed_slice_cancel_retried_after_backoff(
+    algo_ems, backtest_timers, task_manager
+):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms, fill_limit=[False], fail_cancels=2)
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-8",
+        submit_type=SubmitType.TWAP,
+        amount=Decimal("0.002"),
+        duration=0.2,
+        wait=0.1,
+    )
+    await asyncio.sleep(0.02)
+    await advance(backtest_timers, 0.1)
+    assert [request[0] for request in connector.requests] == ["create", "cancel"]
+    # retried after 0.1s, then 0.2s
+    await advance(backtest_timers, 0.1)
+    assert [request[0] for request in connector.requests] == ["create", "cancel", "cancel"]
+    await advance(backtest_timers, 0.1)
+    assert len(connector.requests) == 3
+    await advance(backtest_timers, 0.1)
+    await advance(backtest_timers, 0.1)
+    await wait_for_algo(ems, "ALGO-8", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.001")),
+    ]
+    await task_manager.cancel()
+
+
+async def test_cancel_algo_cancels_working_child(algo_ems, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms)
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-2",
+        submit_type=SubmitType.TWAP,
+        amount=Decimal("0.003"),
+        duration=30,
+        wait=10,
+    )
+    await asyncio.sleep(0.05)
+    await ems._cancel_algo_order(
+        OrderSubmit(
+            symbol=SYMBOL,
+            instrument_id=InstrumentId.from_str(SYMBOL),
+            submit_type=SubmitType.CANCEL_TWAP,
+            uuid="ALGO-2",
+        ),
+        BinanceAccountType.USD_M_FUTURE,
+    )
+    await wait_for_algo(ems, "ALGO-2", AlgoOrderStatus.CANCELED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+    ]
+    await asyncio.sleep(0.05)
+    assert not ems._algos and not ems._algo_children
+    await task_manager.cancel()
+
+
+async def test_cancel_algo_cancels_pending_child(algo_ems, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms, accept_limit=False)
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-6",
+        amount=Decimal("0.002"),
+        exec_algorithm="iceberg",
+        exec_params={"display": "0.001"},
+    )
+    await asyncio.sleep(0.05)
+    (child,) = ems._cache.get_order("ALGO-6").unwrap().orders
+    assert ems._cache.get_order(child).unwrap().status == OrderStatus.PENDING
+    ems._algos["ALGO-6"].cancel()
+    await wait_for_algo(ems, "ALGO-6", AlgoOrderStatus.CANCELED)
+    await asyncio.sleep(0.05)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.0),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+    ]
+    assert ems._cache.get_order(child).unwrap().status == OrderStatus.CANCELED
+    await task_manager.cancel()
+
+
+async def test_vwap_follows_volume_profile(algo_ems, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms, fill_limit=[True])
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-3",
+        amount=Decimal("0.004"),
+        duration=0.3,
+        exec_algorithm="vwap",
+        exec_params={"profile": volume_profile([kline(10), kline(0), kline(30)])},
+    )
+    await wait_for_algo(ems, "ALGO-3", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.4),
+        ("create", OrderType.MARKET, Decimal("0.003")),
+    ]
+    algo_order = ems._cache.get_order("ALGO-3").unwrap()
+    assert algo_order.filled == Decimal("0.004")
+    assert algo_order.average == pytest.approx((60000.4 * 0.001 + 60000 * 0.003) / 0.004)
+    await task_manager.cancel()
+
+
+async def test_pov_follows_traded_volume(algo_ems, message_bus, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms)
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-4",
+        amount=Decimal("0.003"),
+        exec_algorithm="pov",
+        exec_params={"rate": 0.5},
+    )
+    for size in [0.001, 0.001, 0.004]:
+        message_bus.publish(topic="trade", msg=trade(size))
+        await asyncio.sleep(0.02)
+    await wait_for_algo(ems, "ALGO-4", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.MARKET, Decimal("0.001")),
+        ("create", OrderType.MARKET, Decimal("0.002")),
+    ]
+    assert not ems._algo_market_data["trade"]
+    await task_manager.cancel()
+
+
+async def test_iceberg_pegs_to_touch(algo_ems, message_bus, task_manager):
+    ems, oms = algo_ems
+    await oms.start()
+    connector = FakeAlgoConnector(oms, fill_limit=[False, True, True])
+
+    await start_algo(
+        ems,
+        connector,
+        "ALGO-5",
+        amount=Decimal("0.002"),
+        exec_algorithm="iceberg",
+        exec_params={"display": "0.001"},
+    )
+    await asyncio.sleep(0.02)
+    message_bus.publish(topic="bookl1", msg=book(60001.0))
+    await wait_for_algo(ems, "ALGO-5", AlgoOrderStatus.FINISHED)
+
+    assert connector.requests == [
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60000.0),
+        ("cancel", OrderType.LIMIT, Decimal("0.001")),
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60001.0),
+        ("create", OrderType.LIMIT, Decimal("0.001"), 60001.0),
+    ]
+    assert ems._cache.get_order("ALGO-5").unwrap().filled == Decimal("0.002")
+    await task_manager.cancel()
+
+
+async def test_batch_orders_rejected_by_risk_keep_their_position(algo_ems, message_bus):
+    ems, _ = algo_ems
+    ems.set_risk_engine(RiskEngine(message_bus, ems._cache, RiskConfig(max_order_amount=1)))
+    sent: List[OrderSubmit] = []
+
+    async def create_batch_orders(orders: List[OrderSubmit]) -> List[Order]:
+        sent.extend(orders)
+        return [
+            Order(
+                exchange=ExchangeType.BINANCE,
+                symbol=SYMBOL,
+                status=OrderStatus.PENDING,
+                id=str(i),
+                amount=order_submit.amount,
+                type=order_submit.type,
+                side=order_submit.side,
+            )
+            for i, order_submit in enumerate(orders)
+        ]
+
+    ems._private_connectors = {
+        BinanceAccountType.USD_M_FUTURE: SimpleNamespace(create_batch_orders=create_batch_orders)
+    }
+    order_submits = [
+        OrderSubmit(
+            symbol=SYMBOL,
+            instrument_id=InstrumentId.from_str(SYMBOL),
+            submit_type=SubmitType.CREATE,
+            side=OrderSide.BUY,
+            type=OrderType.MARKET,
+            amount=Decimal(amount),
+        )
+        for amount in ("2", "0.5", "3", "1")
+    ]
+    orders = await ems._create_batch_orders(
+        BatchOrderSubmit(submit_type=SubmitType.BATCH_CREATE, orders=order_submits),
+        BinanceAccountType.USD_M_FUTURE,
+    )
+
+    assert [order_submit.amount for order_submit in sent] == [Decimal("0.5"), Decimal("1")]
+    assert [order.status for order in orders] == [
+        OrderStatus.FAILED,
+        OrderStatus.PENDING,
+        OrderStatus.FAILED,
+        OrderStatus.PENDING,
+    ]
+    assert [order.uuid for order in orders] == [order_submit.uuid for order_submit in order_submits]
+
+
+async def test_cancel_all_reports_the_orders_not_canceled(algo_ems, message_bus):
+    ems, _ = algo_ems
+    events: Dict[str, List[str]] = {"canceling": [], "cancel_failed": []}
+    for endpoint, uuids in events.items():
+        message_bus.register(
+            endpoint=endpoint, handler=lambda order, uuids=uuids: uuids.append(order.uuid)
+        )
+    for order_id in ("1", "2", "3"):
+        order = Order(
+            exchange=ExchangeType.BINANCE,
+            symbol=SYMBOL,
+            status=OrderStatus.PENDING,
+            id=order_id,
+            uuid=f"uuid-{order_id}",
+            amount=Decimal("0.001"),
+            type=OrderType.LIMIT,
+            side=OrderSide.BUY,
+        )
+        ems._registry.register_order(order)
+        ems._cache._order_initialized(order)
+
+    async def cancel_all_orders(symbol: str) -> List[str]:
+        return ["2"]
+
+    ems._private_connectors = {
+        BinanceAccountType.USD_M_FUTURE: SimpleNamespace(cancel_all_orders=cancel_all_orders)
+    }
+    submit = OrderSubmit(
+        symbol=SYMBOL,
+        instrument_id=InstrumentId.from_str(SYMBOL),
+        submit_type=SubmitType.CANCEL_ALL,
+    )
+    orders = await ems._cancel_all_orders(submit, BinanceAccountType.USD_M_FUTURE)
+
+    assert sorted(order.uuid for order in orders) == ["uuid-1", "uuid-3"]
+    assert sorted(events["canceling"]) == ["uuid-1", "uuid-3"]
+    assert events["cancel_failed"] == ["uuid-2"]
+    assert ems._cache.get_order("uuid-2").unwrap().status == OrderStatus.PENDING
+
+
+def kline(volume: float) -> Kline:
+    return Kline(
+        exchange=ExchangeType.BINANCE,
+        symbol=SYMBOL,
+        interval=KlineInterval.MINUTE_1,
+        open=1,
+        high=1,
+        low=1,
+        close=1,
+        volume=volume,
+        start=0,
+        timestamp=0,
+        confirm=True,
+    )
+
+
+def trade(size: float) -> Trade:
+    return Trade(
+        exchange=ExchangeType.BINANCE, symbol=SYMBOL, price=60000.0, size=size, timestamp=0
+    )
@@ -0,0 +1,120 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from nexustrader.base import MockLinearConnector
+from nexustrader.constants import OrderSide, OrderStatus, OrderType
+from nexustrader.core.cache import AsyncCache
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.schema import Balance, ExchangeType, Order
+
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+BTC_MARKET = SimpleNamespace(
+    symbol=SYMBOL,
+    quote="USDT",
+    precision=SimpleNamespace(price=0.1, amount=0.001),
+)
+
+# open, add, partial close, flip, full close
+FILLS = [
+    (OrderSide.BUY, "0.010", 100.0),
+    (OrderSide.BUY, "0.020", 103.0),
+    (OrderSide.SELL, "0.015", 105.0),
+    (OrderSide.SELL, "0.030", 99.0),
+    (OrderSide.BUY, "0.015", 97.5),
+]
+
+
+@pytest.fixture
+def make_connector(tmp_path, message_bus, task_manager, order_registry):
+    exchange = SimpleNamespace(
+        market={SYMBOL: BTC_MARKET}, market_id={}, exchange_id=ExchangeType.BINANCE
+    )
+
+    def make(fixed_point: bool) -> MockLinearConnector:
+        cache = AsyncCache(
+            strategy_id="strategy-mock",
+            user_id="user-mock",
+            msgbus=message_bus,
+            task_manager=task_manager,
+            registry=order_registry,
+            db_path=str(tmp_path / f"cache-{fixed_point}.db"),
+        )
+        # realized pnl accumulates on a zero balance
+        cache._apply_balance(
+            BinanceAccountType.LINEAR_MOCK, [Balance(asset="USDT", free=Decimal("0"))]
+        )
+        return MockLinearConnector(
+            initial_balance={"USDT": 0},
+            account_type=BinanceAccountType.LINEAR_MOCK,
+            exchange=exchange,
+            msgbus=message_bus,
+            cache=cache,
+            task_manager=task_manager,
+            fixed_point=fixed_point,
+        )
+
+    return make
+
+
+def fill(side: OrderSide, amount: str, price: float) -> Order:
+    return Order(
+        exchange=ExchangeType.BINANCE,
+        symbol=SYMBOL,
+        status=OrderStatus.FILLED,
+        side=side,
+        type=OrderType.LIMIT,
+        amount=Decimal(amount),
+        price=price,
+        fee=Decimal("0"),
+        fee_currency="USDT",
+    )
+
+
+def realized_balance(connector: MockLinearConnector) -> Decimal:
+    account_balance = connector._cache._mem_account_balance[connector._account_type]
+    return account_balance.balance_total.get("USDT", Decimal("0"))
+
+
+def test_fixed_fill_matches_float_path(make_connector):
+    float_connector = make_connector(fixed_point=False)
+    fixed_connector = make_connector(fixed_point=True)
+
+    for side, amount, price in FILLS:
+        order = fill(side, amount, price)
+        float_connector._apply_position(order)
+        expected = float_connector._cache.get_position(SYMBOL).value_or(None)
+
+        position = fixed_connector._cache.get_position(SYMBOL).value_or(None)
+        position = fixed_connector._apply_fixed_fill(order, BTC_MARKET, position)
+        fixed_connector._cache._apply_position(position)
+
+        if expected is None:  # closed
+            assert position.is_closed
+            assert position.side is None
+        else:
+            assert position.signed_amount == expected.signed_amount
+            assert position.side == expected.side
+            assert position.entry_price == pytest.approx(expected.entry_price)
+        assert realized_balance(fixed_connector) == pytest.approx(
+            realized_balance(float_connector)
+        )
+
+    # 0.015 * (105 - 102) + 0.015 * (99 - 102) + 0.015 * (99 - 97.5), exactly
+    assert realized_balance(fixed_connector) == Decimal("0.0225")
+    assert fixed_connector._fixed_positions[SYMBOL] == (0, 0)
+
+
+def test_fixed_fill_flip_resets_entry_price(make_connector):
+    connector = make_connector(fixed_point=True)
+    position = None
+    for side, amount, price in FILLS[:4]:
+        position = connector._apply_fixed_fill(fill(side, amount, price), BTC_MARKET, position)
+
+    assert position.signed_amount == Decimal("-0.015")
+    assert position.entry_price == 99.0
+    assert position.realized_pnl == pytest.approx(0.0)
+    # short 15 lots at 990 ticks
+    assert connector._fixed_positions[SYMBOL] == (-15, -15 * 990)
@@ -2,6 +2,7 @@ import pytest
 from nexustrader.core.entity import TaskManager
 from nexustrader.core.nautilius_core import MessageBus, LiveClock
 from nexustrader.core.registry import OrderRegistry
+from nexustrader.core.cache import AsyncCache
 from nautilus_trader.model.identifiers import TraderId
 from decimal import Decimal
 from nexustrader.schema import Order, ExchangeType
@@ -38,3 +39,13 @@ def order_registry():
     return OrderRegistry()
 
 
+@pytest.fixture
+def cache(tmp_path, message_bus, task_manager, order_registry):
+    return AsyncCache(
+        strategy_id="strategy-mock",
+        user_id="user-mock",
+        msgbus=message_bus,
+        task_manager=task_manager,
+        registry=order_registry,
+        db_path=str(tmp_path / "cache.db"),
+    )
@@ -108,6 +108,68 @@ async def test_order_management(async_cache: AsyncCache, sample_order: Order):
     )
 
 
+async def test_order_amended(async_cache: AsyncCache, sample_order: Order):
+    sample_order.filled = Decimal("0.4")
+    async_cache._order_initialized(sample_order)
+
+    ack = Order(
+        exchange=sample_order.exchange,
+        symbol=sample_order.symbol,
+        status=OrderStatus.ACCEPTED,
+        uuid=sample_order.uuid,
+        price=49000.0,
+        amount=Decimal("2"),
+    )
+    amended = async_cache._order_amended(ack)
+    assert amended.status == OrderStatus.PENDING
+    assert (amended.price, amended.amount, amended.remaining) == (
+        49000.0,
+        Decimal("2"),
+        Decimal("1.6"),
+    )
+    assert async_cache.get_order(sample_order.uuid).unwrap() == amended
+
+    # the exchange update after an amend re-accepts the order
+    accepted = copy(amended)
+    accepted.status = OrderStatus.ACCEPTED
+    async_cache._order_status_update(accepted)
+    reaccepted = copy(accepted)
+    reaccepted.price = 48000.0
+    async_cache._order_status_update(reaccepted)
+    assert async_cache.get_order(sample_order.uuid).unwrap().price == 48000.0
+
+    closed = copy(reaccepted)
+    closed.status = OrderStatus.CANCELED
+    async_cache._order_status_update(closed)
+    assert async_cache._order_amended(ack) is None
+
+
+async def test_orders_canceling(async_cache: AsyncCache, sample_order: Order):
+    orders = []
+    for i, symbol in enumerate(["BTCUSDT-PERP.BINANCE", "BTCUSDT-PERP.BINANCE", "BTCUSDT-PERP.OKX"]):
+        order = copy(sample_order)
+        order.uuid = f"test-uuid-{i}"
+        order.symbol = symbol
+        order.exchange = ExchangeType.OKX if symbol.endswith("OKX") else ExchangeType.BINANCE
+        async_cache._order_initialized(order)
+        orders.append(order)
+    filled = copy(orders[1])
+    filled.status = OrderStatus.FILLED
+    async_cache._order_status_update(filled)
+
+    assert async_cache.get_open_order_symbols() == {"BTCUSDT-PERP.BINANCE", "BTCUSDT-PERP.OKX"}
+    assert async_cache.get_open_order_symbols(ExchangeType.OKX) == {"BTCUSDT-PERP.OKX"}
+
+    canceling = async_cache._orders_canceling(["test-uuid-0", "test-uuid-1", "unknown"], 2000)
+    assert [(order.uuid, order.status, order.timestamp) for order in canceling] == [
+        ("test-uuid-0", OrderStatus.CANCELING, 2000)
+    ]
+    assert async_cache.get_order("test-uuid-0").unwrap().status == OrderStatus.CANCELING
+    assert async_cache.get_order("test-uuid-1").unwrap().status == OrderStatus.FILLED
+    # still open until the exchange confirms the cancel
+    assert "test-uuid-0" in async_cache.get_open_orders(symbol="BTCUSDT-PERP.BINANCE")
+
+
 async def test_cache_cleanup(async_cache: AsyncCache, sample_order: Order):
     sample_order.timestamp = time.time() * 1000
     async_cache._order_initialized(sample_order)
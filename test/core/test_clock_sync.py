@@ -0,0 +1,60 @@
+from nexustrader.core.clock_sync import ClockOffsetEstimator, ClockSync
+from nexustrader.exchange.binance.connector import BinancePrivateConnector
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+from nexustrader.exchange.binance.websockets import BinanceWSApiClient, BinanceWSClient
+
+
+def test_estimator_ignores_delayed_samples():
+    estimator = ClockOffsetEstimator(window=16)
+    # true offset 250ms, symmetric 10ms round trips
+    for i in range(6):
+        send = 1000.0 * i
+        estimator.add_sample(send, send + 5 + 250, send + 10)
+    # queued responses: the server stamped them long before the client received them
+    for i in range(6):
+        send = 10_000.0 + 1000 * i
+        estimator.add_sample(send, send + 5 + 250, send + 400)
+
+    assert estimator.offset_ms == 250
+    assert estimator.rtt_ms == 10
+    assert estimator.one_way_latency_ms == 5
+
+
+async def test_clock_sync_applies_offset(task_manager):
+    clock_sync = ClockSync(task_manager, samples=4, recv_window=1000)
+    client = BinanceApiClient()
+    applied = []
+
+    async def get_server_time() -> int:
+        return client._clock.timestamp_ms() - 1500
+
+    def apply(offset_ms, recv_window):
+        applied.append((offset_ms, recv_window))
+        client.set_time_offset(offset_ms, recv_window)
+
+    clock_sync.register("BINANCE_FUTURE", get_server_time, apply)
+    await clock_sync.sync("BINANCE_FUTURE")
+
+    offset_ms, recv_window = applied[-1]
+    assert -1502 <= offset_ms <= -1498
+    assert recv_window == 1000
+    assert abs(client._timestamp_ms() - (client._clock.timestamp_ms() - 1500)) <= 2
+    assert client._recv_window == 1000
+
+
+async def test_connector_offset_reaches_its_ws_clients(task_manager):
+    connector = BinancePrivateConnector.__new__(BinancePrivateConnector)
+    connector._api_client = BinanceApiClient()
+    connector._ws_client = BinanceWSClient(
+        BinanceAccountType.USD_M_FUTURE, lambda raw: None, task_manager
+    )
+    connector._ws_api_client = BinanceWSApiClient(
+        BinanceAccountType.USD_M_FUTURE, "key", "secret", task_manager
+    )
+
+    connector.set_time_offset(-1500, recv_window=1000)
+
+    assert connector._api_client._time_offset_ms == -1500
+    assert [ws_client._time_offset_ms for ws_client in connector.ws_clients()] == [-1500, -1500]
+    assert connector._ws_api_client._recv_window == 1000
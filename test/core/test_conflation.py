@@ -0,0 +1,80 @@
+import asyncio
+from nexustrader.schema import BookL1
+from nexustrader.constants import ExchangeType
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.conflation import BookL1Conflator
+
+
+def bookl1(symbol: str, bid: float) -> BookL1:
+    return BookL1(
+        exchange=ExchangeType.BINANCE,
+        symbol=symbol,
+        bid=bid,
+        ask=bid + 1,
+        bid_size=1,
+        ask_size=1,
+        timestamp=0,
+    )
+
+
+def make_conflator(message_bus) -> BookL1Conflator:
+    task_manager = TaskManager(asyncio.get_running_loop(), enable_signal_handlers=False)
+    return BookL1Conflator(msgbus=message_bus, task_manager=task_manager, batch_size=2)
+
+
+async def test_conflates_to_latest_per_symbol(message_bus):
+    conflator = make_conflator(message_bus)
+    received = []
+    conflator.subscribe(received.append)
+
+    for i in range(5):
+        message_bus.publish(topic="bookl1", msg=bookl1("BTCUSDT-PERP.BINANCE", 100 + i))
+    message_bus.publish(topic="bookl1", msg=bookl1("ETHUSDT-PERP.BINANCE", 10))
+    assert received == []
+
+    await asyncio.sleep(0)
+    assert [(b.symbol, b.bid) for b in received] == [
+        ("BTCUSDT-PERP.BINANCE", 104),
+        ("ETHUSDT-PERP.BINANCE", 10),
+    ]
+
+    stats = conflator.stats
+    assert stats.received == 6
+    assert stats.delivered == 2
+    assert stats.conflated == 4
+    assert stats.pending == 0
+    assert stats.max_delay_ns >= stats.avg_delay_ns > 0
+
+
+async def test_delivers_in_batches(message_bus):
+    conflator = make_conflator(message_bus)
+    received = []
+    conflator.subscribe(received.append)
+
+    symbols = [f"S{i}USDT-PERP.BINANCE" for i in range(5)]
+    for symbol in symbols:
+        message_bus.publish(topic="bookl1", msg=bookl1(symbol, 1))
+
+    await asyncio.sleep(0)
+    assert len(received) == 2
+    assert conflator.stats.pending == 3
+
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert [b.symbol for b in received] == symbols
+
+
+async def test_handler_error_does_not_stop_delivery(message_bus):
+    conflator = make_conflator(message_bus)
+    received = []
+
+    def handler(b: BookL1):
+        if b.symbol == "BAD":
+            raise ValueError("bad")
+        received.append(b)
+
+    conflator.subscribe(handler)
+    message_bus.publish(topic="bookl1", msg=bookl1("BAD", 1))
+    message_bus.publish(topic="bookl1", msg=bookl1("GOOD", 1))
+    await asyncio.sleep(0)
+    assert [b.symbol for b in received] == ["GOOD"]
@@ -0,0 +1,114 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from nexustrader.constants import (
+    ExchangeType,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    SubmitType,
+)
+from nexustrader.core.event_log import EventLog, EventLogReader, OrderEvent, SubmitEvent
+from nexustrader.schema import BatchOrderSubmit, InstrumentId, Order, OrderSubmit
+
+
+SYMBOL = "BTCUSDT-PERP.BINANCE"
+
+
+@pytest.fixture
+def event_log(tmp_path):
+    return EventLog(path=str(tmp_path), flush_interval=0.01)
+
+
+def make_submit(amount: str = "0.01") -> OrderSubmit:
+    return OrderSubmit(
+        symbol=SYMBOL,
+        instrument_id=InstrumentId.from_str(SYMBOL),
+        submit_type=SubmitType.CREATE,
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        amount=Decimal(amount),
+        price=Decimal("60000.1"),
+    )
+
+
+def make_order(uuid: str, status: OrderStatus, filled: str | None = None) -> Order:
+    return Order(
+        exchange=ExchangeType.BINANCE,
+        symbol=SYMBOL,
+        status=status,
+        id=123,
+        uuid=uuid,
+        amount=Decimal("0.01"),
+        filled=Decimal(filled) if filled else None,
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        price=60000.1,
+        last_filled_price=60000.1 if filled else None,
+    )
+
+
+def test_log_and_read(event_log: EventLog, tmp_path):
+    submit = make_submit()
+    event_log.start()
+    event_log.submit(submit)
+    event_log.order("pending", make_order(submit.uuid, OrderStatus.PENDING))
+    event_log.order("filled", make_order(submit.uuid, OrderStatus.FILLED, "0.01"))
+    event_log.submit(
+        BatchOrderSubmit(
+            submit_type=SubmitType.BATCH_CREATE, orders=[make_submit(), make_submit("0.02")]
+        )
+    )
+    event_log.stop()
+
+    assert event_log.events_logged == 5
+    events = list(EventLogReader(str(tmp_path)))
+    assert [type(e) for e in events] == [
+        SubmitEvent,
+        OrderEvent,
+        OrderEvent,
+        SubmitEvent,
+        SubmitEvent,
+    ]
+    assert events[0].uuid == submit.uuid
+    assert (events[0].submit_type, events[0].side, events[0].amount) == ("CREATE", "BUY", 0.01)
+    assert (events[2].event, events[2].status, events[2].order_id) == ("filled", "FILLED", 123)
+    assert [e.submit_type for e in events[3:]] == ["BATCH_CREATE", "BATCH_CREATE"]
+    assert all(a.ts_ns <= b.ts_ns for a, b in zip(events, events[1:]))
+
+    tables = EventLogReader(str(tmp_path)).to_numpy()
+    orders = tables["order"]
+    assert orders["ts_ns"].dtype == np.int64
+    assert list(orders["event"]) == ["pending", "filled"]
+    np.testing.assert_array_equal(orders["filled"], [np.nan, 0.01])
+    np.testing.assert_array_equal(tables["submit"]["amount"], [0.01, 0.01, 0.02])
+
+    frames = EventLogReader(str(tmp_path)).to_pandas()
+    assert len(frames["submit"]) == 3
+    assert frames["order"]["last_filled_price"].iloc[-1] == 60000.1
+
+
+def test_append_after_truncated_tail(tmp_path):
+    event_log = EventLog(path=str(tmp_path), flush_interval=0.01)
+    event_log.start()
+    event_log.submit(make_submit("1"))
+    event_log.stop()
+    event_log.start()
+    event_log.submit(make_submit("2"))
+    event_log.stop()
+
+    file_name = event_log.files[0]
+    with open(file_name, "rb") as f:
+        data = f.read()
+    with open(file_name, "wb") as f:
+        f.write(data[:-3])  # killed mid-write
+
+    event_log = EventLog(path=str(tmp_path), flush_interval=0.01)
+    event_log.start()
+    event_log.submit(make_submit("3"))
+    event_log.stop()
+
+    assert event_log.files == [file_name]  # same day, same file
+    assert [e.amount for e in EventLogReader(file_name)] == [1.0, 3.0]
@@ -0,0 +1,60 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from nexustrader.core.fixed_point import FixedPoint, MarketFixedPoint
+
+
+def test_lossless_round_trip():
+    rng = random.Random(7)
+    for decimals in (0, 1, 3, 5, 8):
+        fixed_point = FixedPoint(decimals)
+        units = [rng.randint(-(10**14), 10**14) for _ in range(2000)]
+        for unit in units:
+            value = fixed_point.to_decimal(unit)
+            text = str(value)
+            assert fixed_point.from_decimal(value) == unit
+            assert fixed_point.parse(text) == unit
+            assert fixed_point.from_float(float(text)) == unit
+            assert fixed_point.to_float(unit) == float(text)
+        np.testing.assert_array_equal(
+            fixed_point.from_float_array(fixed_point.to_float_array(units)), units
+        )
+
+
+def test_parse_exchange_strings():
+    fixed_point = FixedPoint(3)
+    assert fixed_point.parse("0.0100") == 10
+    assert fixed_point.parse("12") == 12000
+    assert fixed_point.parse("-.5") == -500
+    assert fixed_point.parse("1E-2") == 10
+    assert fixed_point.to_str(10) == "0.010"
+
+
+def test_off_grid_raises():
+    fixed_point = FixedPoint(2)
+    with pytest.raises(ValueError):
+        fixed_point.parse("0.015")
+    with pytest.raises(ValueError):
+        fixed_point.from_float(0.1 + 0.2)
+    with pytest.raises(ValueError):
+        fixed_point.from_decimal(Decimal("1.001"))
+    with pytest.raises(ValueError):
+        fixed_point.from_float_array(np.array([0.01, 0.015]))
+
+
+def test_market_fixed_point():
+    fixed_point = MarketFixedPoint(FixedPoint.from_precision(0.1), FixedPoint.from_precision(0.001))
+    assert (fixed_point.price.decimals, fixed_point.size.decimals) == (1, 3)
+    assert FixedPoint.from_precision(5.0).decimals == 0
+
+    ticks, lots = fixed_point.ticks(60000.1), fixed_point.lots(Decimal("0.003"))
+    assert (ticks, lots) == (600001, 3)
+    assert fixed_point.ticks("60000.1") == ticks
+    assert fixed_point.notional(ticks * lots) == Decimal("180.0003")
+    # entry 0.004 @ 60025.15 (average of two fills), sell 0.002 @ 60200.7
+    cost = 3 * 600001 + 1 * 601003
+    closed_cost = cost * 2 // 4
+    assert fixed_point.notional(2 * fixed_point.ticks(60200.7) - closed_cost) == Decimal("0.3511")
@@ -0,0 +1,79 @@
+import math
+import random
+import numpy as np
+import pytest
+from nexustrader.schema import BookL1
+from nexustrader.constants import ExchangeType
+from nexustrader.core.latency import LatencyHistogram, LatencyTracker
+from nexustrader.core.nautilius_core import LiveClock
+
+
+def test_histogram_exact_small_values():
+    hist = LatencyHistogram()
+    for value in range(1, 101):
+        hist.record(value)
+    assert hist.count == 100
+    assert hist.min == 1
+    assert hist.max == 100
+    assert hist.value_at_percentile(50) == 50
+    assert hist.value_at_percentile(100) == 100
+
+
+@pytest.mark.parametrize("sub_bucket_bits", [5, 7, 10])
+def test_histogram_relative_error(sub_bucket_bits):
+    rng = random.Random(42)
+    values = [int(rng.lognormvariate(11, 2)) for _ in range(20_000)]
+    hist = LatencyHistogram(sub_bucket_bits)
+    for value in values:
+        hist.record(value)
+
+    max_error = 2 ** (1 - sub_bucket_bits)
+    for p in (50, 90, 99, 99.9):
+        expected = sorted(values)[math.ceil(len(values) * p / 100 - 1e-9) - 1]
+        assert abs(hist.value_at_percentile(p) - expected) <= expected * max_error + 1
+    assert hist.mean == pytest.approx(np.mean(values))
+
+
+def test_histogram_merge_and_reset():
+    a, b = LatencyHistogram(), LatencyHistogram()
+    for value in range(1000):
+        a.record(value)
+        b.record(value + 1000)
+    a.merge(b)
+    assert a.count == 2000
+    assert a.min == 0
+    assert a.max == 1999
+    a.reset()
+    assert a.count == 0
+    assert a.value_at_percentile(99) == 0
+
+
+def test_tracker_stages(message_bus, task_manager):
+    tracker = LatencyTracker(msgbus=message_bus, task_manager=task_manager)
+    received = []
+    message_bus.subscribe(topic="bookl1", handler=tracker.wrap("bookl1", received.append))
+
+    now_ms = LiveClock().timestamp_ms()
+    bookl1 = BookL1(
+        exchange=ExchangeType.BINANCE,
+        symbol="BTCUSDT-PERP.BINANCE",
+        bid=100,
+        ask=101,
+        bid_size=1,
+        ask_size=1,
+        timestamp=now_ms - 5,
+    )
+    tracker.begin_frame()
+    message_bus.publish(topic="bookl1", msg=bookl1)
+    tracker.end_frame()
+    # published outside a websocket frame, e.g. by a mock connector
+    message_bus.publish(topic="bookl1", msg=bookl1)
+
+    assert received == [bookl1, bookl1]
+    stats = tracker.stats()
+    assert stats[("binance", "bookl1", "exchange_to_receive")]["count"] == 1
+    assert stats[("binance", "bookl1", "receive_to_decode")]["count"] == 1
+    assert stats[("binance", "bookl1", "decode_to_strategy")]["count"] == 2
+    assert stats[("binance", "bookl1", "callback")]["count"] == 2
+    assert stats[("binance", "bookl1", "exchange_to_strategy")]["p50"] >= 5000
+    tracker.log_stats()
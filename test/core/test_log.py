@@ -0,0 +1,48 @@
+import spdlog as spd
+
+from nexustrader.core.log import Logger, SpdLog
+
+
+class Expensive:
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "expensive"
+
+
+def test_disabled_level_is_not_formatted(tmp_path):
+    path = tmp_path / "log.log"
+    logger = Logger(
+        spd.SinkLogger(name="test_log_facade", sinks=[spd.basic_file_sink_mt(str(path))])
+    )
+    logger.set_level(spd.LogLevel.INFO)
+    arg = Expensive()
+
+    logger.debug("dropped %s", arg)
+    logger.info("written %s %d", arg, 1)
+    logger.flush()
+    logger.close()
+
+    assert (logger.is_debug, logger.is_info) == (False, True)
+    assert arg.formatted == 1
+    content = path.read_text()
+    assert "written expensive 1" in content
+    assert "dropped" not in content
+
+
+def test_production_logger_skips_levels_no_sink_writes(tmp_path, monkeypatch):
+    monkeypatch.setattr(SpdLog, "loggers", {})
+    monkeypatch.setattr(SpdLog, "log_dir", tmp_path)
+    monkeypatch.setattr(SpdLog, "production_mode", True)
+    monkeypatch.setattr(SpdLog, "sinks", [spd.null_sink_mt()])
+    monkeypatch.setattr(SpdLog, "sink_level", SpdLog.parse_level("INFO"))
+    monkeypatch.setattr(SpdLog, "flush_level", SpdLog.parse_level("ERROR"))
+
+    logger = SpdLog.get_logger("test_log_production", level="DEBUG", flush=True)
+    try:
+        assert not logger.is_debug
+        assert logger.is_info
+    finally:
+        logger.close()
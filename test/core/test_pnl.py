@@ -0,0 +1,148 @@
+from decimal import Decimal
+
+import pytest
+from nautilus_trader.common.component import TestClock
+
+from nexustrader.constants import ExchangeType, PositionSide
+from nexustrader.core.pnl import PnLEngine
+from nexustrader.core.timer import TimerWheel
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.okx.constants import OkxAccountType
+from nexustrader.schema import BookL1, InstrumentId, MarkPrice, Position, Trade
+
+
+SEC = 1_000_000_000
+START_NS = 1_704_067_200 * SEC
+BTC = "BTCUSDT-PERP.BINANCE"
+ETH = "ETHUSDT-PERP.BINANCE"
+ETH_SPOT = "ETHUSDT.BINANCE"
+SOL = "SOLUSDT-PERP.OKX"
+
+
+def account_type(instrument_id: InstrumentId):
+    if instrument_id.exchange == ExchangeType.OKX:
+        return OkxAccountType.LIVE
+    return BinanceAccountType.SPOT if instrument_id.is_spot else BinanceAccountType.USD_M_FUTURE
+
+
+@pytest.fixture
+def clock():
+    clock = TestClock()
+    clock.set_time(START_NS)
+    return clock
+
+
+@pytest.fixture
+def timers(clock):
+    return TimerWheel(clock=clock, live=False)
+
+
+@pytest.fixture
+def pnl_engine(message_bus, cache, timers):
+    cache._bookl1_cache[BTC] = book(BTC, 100.0)
+    return PnLEngine(message_bus, cache, timers, account_type=account_type)
+
+
+def book(symbol: str, mid: float) -> BookL1:
+    return BookL1(
+        exchange=InstrumentId.from_str(symbol).exchange,
+        symbol=symbol,
+        bid=mid - 0.5,
+        ask=mid + 0.5,
+        bid_size=1,
+        ask_size=1,
+        timestamp=0,
+    )
+
+
+def position(symbol: str, amount: str, entry_price: float = 0, realized_pnl: float = 0) -> Position:
+    signed_amount = Decimal(amount)
+    return Position(
+        symbol=symbol,
+        exchange=InstrumentId.from_str(symbol).exchange,
+        signed_amount=signed_amount,
+        side=(PositionSide.LONG if signed_amount > 0 else PositionSide.SHORT)
+        if signed_amount
+        else None,
+        entry_price=entry_price,
+        realized_pnl=realized_pnl,
+    )
+
+
+def test_mark_to_market_totals(pnl_engine: PnLEngine, message_bus):
+    message_bus.publish(topic="position", msg=position(BTC, "2", 90.0))
+    # marked on the cached book
+    assert pnl_engine.position(BTC).unrealized_pnl == pytest.approx(20)
+    message_bus.publish(topic="position", msg=position(ETH, "-10", 12.0))
+    message_bus.publish(topic="position", msg=position(SOL, "5", 1.0))
+    # no price yet
+    assert pnl_engine.unrealized_pnl == pytest.approx(20)
+
+    message_bus.publish(topic="bookl1", msg=book(ETH, 10.0))
+    message_bus.publish(topic="trade", msg=Trade(ExchangeType.OKX, SOL, 1.5, 1, 0))
+    message_bus.publish(topic="bookl1", msg=book(BTC, 110.0))
+    message_bus.publish(topic="bookl1", msg=book(ETH_SPOT, 1.0))  # no position
+
+    futures = pnl_engine.account(BinanceAccountType.USD_M_FUTURE)
+    okx = pnl_engine.exchange(ExchangeType.OKX)
+    assert futures.unrealized_pnl == pytest.approx(40 + 20)
+    assert futures.notional == pytest.approx(220 + 100)
+    assert pnl_engine.exchange(ExchangeType.BINANCE).unrealized_pnl == pytest.approx(60)
+    assert okx.unrealized_pnl == pytest.approx(2.5)
+    assert pnl_engine.account(OkxAccountType.LIVE).notional == pytest.approx(7.5)
+    assert pnl_engine.unrealized_pnl == pytest.approx(62.5)
+    assert pnl_engine.portfolio.notional == pytest.approx(327.5)
+
+
+def test_mark_sources_ranked(pnl_engine: PnLEngine, message_bus):
+    message_bus.publish(topic="position", msg=position(SOL, "10", 1.0))
+    message_bus.publish(topic="trade", msg=Trade(ExchangeType.OKX, SOL, 1.2, 1, 0))
+    assert pnl_engine.unrealized_pnl == pytest.approx(2)
+    message_bus.publish(topic="bookl1", msg=book(SOL, 1.1))
+    message_bus.publish(topic="trade", msg=Trade(ExchangeType.OKX, SOL, 1.3, 1, 0))
+    assert pnl_engine.unrealized_pnl == pytest.approx(1)
+    message_bus.publish(topic="mark_price", msg=MarkPrice(ExchangeType.OKX, SOL, 0.9, 0))
+    message_bus.publish(topic="bookl1", msg=book(SOL, 1.1))
+    assert pnl_engine.unrealized_pnl == pytest.approx(-1)
+
+
+def test_realized_pnl_across_positions(pnl_engine: PnLEngine, message_bus):
+    message_bus.publish(topic="position", msg=position(BTC, "2", 90.0))
+    message_bus.publish(topic="position", msg=position(BTC, "1", 90.0, realized_pnl=15))
+    message_bus.publish(topic="position", msg=position(BTC, "0", 90.0, realized_pnl=25))
+    assert pnl_engine.realized_pnl == pytest.approx(25)
+    assert pnl_engine.unrealized_pnl == 0
+    assert pnl_engine.portfolio.notional == 0
+
+    # a new position reports its realized pnl from 0
+    message_bus.publish(topic="position", msg=position(BTC, "-1", 100.0))
+    message_bus.publish(topic="position", msg=position(BTC, "-1", 100.0, realized_pnl=-3))
+    # closed without a realized pnl: the reported one is kept
+    message_bus.publish(topic="position", msg=position(BTC, "0"))
+    state = pnl_engine.position(BTC)
+    assert state.realized_pnl == pytest.approx(22)
+    assert pnl_engine.account(BinanceAccountType.USD_M_FUTURE).realized_pnl == pytest.approx(22)
+    assert pnl_engine.exchange(ExchangeType.BINANCE).realized_pnl == pytest.approx(22)
+
+
+def test_pnl_topic_throttled(pnl_engine: PnLEngine, message_bus, timers, clock):
+    events = []
+    message_bus.subscribe(topic="pnl", handler=events.append)
+
+    message_bus.publish(topic="position", msg=position(BTC, "1", 100.0))
+    for mid in (101.0, 102.0, 103.0):
+        message_bus.publish(topic="bookl1", msg=book(BTC, mid))
+    # the first change is published, the next ones once the interval is over
+    assert [event.unrealized_pnl for event in events] == [0]
+
+    timers.advance_to(START_NS + SEC // 2)
+    assert len(events) == 1
+    timers.advance_to(START_NS + SEC)
+    assert [event.unrealized_pnl for event in events] == [0, 3]
+    assert events[-1].timestamp == (START_NS + SEC) // 1_000_000
+    assert events[-1].notional == pytest.approx(103)
+
+    # no change, nothing published
+    message_bus.publish(topic="bookl1", msg=book(BTC, 103.0))
+    timers.advance_to(START_NS + 5 * SEC)
+    assert pnl_engine.published == 2
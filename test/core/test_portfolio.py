@@ -0,0 +1,122 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+import pytest
+
+from nexustrader.constants import ExchangeType, PositionSide
+from nexustrader.core.cache import AsyncCache
+from nexustrader.core.portfolio import Portfolio
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.bybit.constants import BybitAccountType
+from nexustrader.exchange.okx.constants import OkxAccountType
+from nexustrader.schema import Balance, BookL1, InstrumentId, Position
+
+
+MARKETS = {
+    "BTCUSDT.BINANCE": SimpleNamespace(base="BTC", quote="USDT", contractSize=None, inverse=None),
+    "ETHBTC.BINANCE": SimpleNamespace(base="ETH", quote="BTC", contractSize=None, inverse=None),
+    "BTCUSDT-PERP.OKX": SimpleNamespace(base="BTC", quote="USDT", contractSize=0.01, inverse=False),
+    "BTCUSD-PERP.BYBIT": SimpleNamespace(base="BTC", quote="USD", contractSize=1.0, inverse=True),
+}
+ACCOUNT_EXCHANGES = {
+    BinanceAccountType.SPOT: ExchangeType.BINANCE,
+    OkxAccountType.LIVE: ExchangeType.OKX,
+    BybitAccountType.UNIFIED: ExchangeType.BYBIT,
+}
+
+
+@pytest.fixture
+def portfolio(message_bus):
+    return Portfolio(message_bus, MARKETS.get, ACCOUNT_EXCHANGES.get)
+
+
+def book(symbol: str, mid: float) -> BookL1:
+    return BookL1(
+        exchange=InstrumentId.from_str(symbol).exchange,
+        symbol=symbol,
+        bid=mid,
+        ask=mid,
+        bid_size=1,
+        ask_size=1,
+        timestamp=0,
+    )
+
+
+def position(symbol: str, amount: str) -> Position:
+    signed_amount = Decimal(amount)
+    return Position(
+        symbol=symbol,
+        exchange=InstrumentId.from_str(symbol).exchange,
+        signed_amount=signed_amount,
+        side=(PositionSide.LONG if signed_amount > 0 else PositionSide.SHORT)
+        if signed_amount
+        else None,
+    )
+
+
+def test_net_exposure_across_exchanges(portfolio: Portfolio, cache: AsyncCache, message_bus):
+    cache._apply_balance(
+        BinanceAccountType.SPOT,
+        [Balance(asset="BTC", free=Decimal("1")), Balance(asset="USDT", free=Decimal("1000"))],
+    )
+    cache._apply_balance(BybitAccountType.UNIFIED, [Balance(asset="ETH", free=Decimal("2"))])
+    cache._apply_position(position("BTCUSDT-PERP.OKX", "-50"))
+    cache._apply_position(position("BTCUSD-PERP.BYBIT", "1000"))
+    cache._apply_position(position("DOGEUSDT-PERP.BINANCE", "100"))  # unknown market
+
+    # inverse positions need the price
+    assert portfolio.net("BTC") == pytest.approx(0.5)
+    assert portfolio.exposure("ETH").value is None
+
+    message_bus.publish(topic="bookl1", msg=book("ETHBTC.BINANCE", 0.05))  # BTC price unknown
+    assert portfolio.price("ETH") is None
+    message_bus.publish(topic="bookl1", msg=book("BTCUSDT.BINANCE", 50000))
+    message_bus.publish(topic="bookl1", msg=book("ETHBTC.BINANCE", 0.05))
+
+    btc = portfolio.exposure("BTC")
+    assert btc.net == pytest.approx(1 - 0.5 + 0.02)
+    assert (btc.balance, btc.position) == (pytest.approx(1), pytest.approx(-0.48))
+    assert btc.value == pytest.approx(26000)
+    assert btc.exchanges == {
+        ExchangeType.BINANCE: pytest.approx(1),
+        ExchangeType.OKX: pytest.approx(-0.5),
+        ExchangeType.BYBIT: pytest.approx(0.02),
+    }
+    assert portfolio.price("ETH") == pytest.approx(2500)
+    assert portfolio.value("USDT") == 1000
+    # cash is not exposure
+    assert portfolio.gross_value == pytest.approx(26000 + 5000)
+    assert set(portfolio.snapshot()) == {"BTC", "ETH", "USDT"}
+
+
+def test_incremental_updates(portfolio: Portfolio, cache: AsyncCache, message_bus):
+    message_bus.publish(topic="bookl1", msg=book("BTCUSDT.BINANCE", 40000))
+    cache._apply_balance(BinanceAccountType.SPOT, [Balance(asset="BTC", free=Decimal("1"))])
+    cache._apply_position(position("BTCUSDT-PERP.OKX", "-100"))
+    cache._apply_position(position("BTCUSD-PERP.BYBIT", "-4000"))
+    assert portfolio.net("BTC") == pytest.approx(1 - 1 - 0.1)
+    assert portfolio.gross_value == pytest.approx(4000)
+
+    # a balance update replaces the balance of its account, a position its position
+    cache._apply_balance(
+        BinanceAccountType.SPOT,
+        [Balance(asset="BTC", free=Decimal("0.5"), locked=Decimal("0.5"))],
+    )
+    cache._apply_balance(
+        BinanceAccountType.SPOT,
+        [Balance(asset="BTC", free=Decimal("0.7"), locked=Decimal("0.4"))],
+    )
+    cache._apply_position(position("BTCUSDT-PERP.OKX", "-40"))
+    assert portfolio.net("BTC") == pytest.approx(1.1 - 0.4 - 0.1)
+
+    # the inverse amount moves with the price
+    message_bus.publish(topic="bookl1", msg=book("BTCUSDT.BINANCE", 50000))
+    assert portfolio.net("BTC") == pytest.approx(1.1 - 0.4 - 0.08)
+    assert portfolio.gross_value == pytest.approx(0.62 * 50000)
+
+    cache._apply_position(position("BTCUSD-PERP.BYBIT", "0"))
+    cache._apply_position(position("BTCUSDT-PERP.OKX", "0"))
+    btc = portfolio.exposure("BTC")
+    assert (btc.net, btc.position) == (pytest.approx(1.1), pytest.approx(0))
+    assert btc.exchanges[ExchangeType.OKX] == pytest.approx(0)
+    assert portfolio.gross_value == pytest.approx(1.1 * 50000)
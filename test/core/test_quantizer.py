@@ -0,0 +1,72 @@
+import random
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from nexustrader.core.quantizer import ROUNDING, Quantizer
+
+
+PRECISIONS = [1e-08, 1e-05, 0.0001, 0.001, 0.01, 0.1, 0.5, 0.25, 0.005, 1.0, 2.5, 5.0, 10.0, 100.0]
+MODES = ["round", "ceil", "floor"]
+
+
+def decimal_to_precision(value, precision: float, mode: str) -> Decimal:
+    """The rounding `ExecutionManagementSystem._amount_to_precision` did before `Quantizer`"""
+    value = Decimal(str(value))
+    if precision >= 1:
+        exp = Decimal(int(precision))
+        precision_decimal = Decimal("1")
+    else:
+        exp = Decimal("1")
+        precision_decimal = Decimal(str(precision))
+    return (value / exp).quantize(precision_decimal, rounding=ROUNDING[mode]) * exp
+
+
+def random_values(rng: random.Random, precision: float, decimals: int, count: int) -> list:
+    values = []
+    for _ in range(count):
+        kind = rng.random()
+        if kind < 0.25:  # decimal strings with one digit beyond the precision
+            whole = rng.randint(0, 10 ** rng.randint(1, 9))
+            values.append(float(f"{whole}.{rng.randint(0, 10 ** (decimals + 1)):0{decimals + 1}d}"))
+        elif kind < 0.5:  # grid points and half ticks, computed in float
+            ticks = rng.randint(0, 10 ** rng.randint(1, 10)) + rng.choice([0, 0.5, 1, -0.5])
+            values.append(ticks * (precision if precision < 1 else int(precision)))
+        elif kind < 0.75:
+            values.append(rng.uniform(0, 10 ** rng.randint(-3, 12)))
+        elif kind < 0.85:
+            values.append(rng.uniform(-1000, 1000))
+        else:
+            values.append(rng.choice([0.0, -0.0, 1e-12, 1e15, 0.1 + 0.2, 1.005, 2.675]))
+    return values
+
+
+@pytest.mark.parametrize("precision", PRECISIONS)
+def test_same_result_as_decimal(precision):
+    rng = random.Random(precision)
+    quantizer = Quantizer(precision)
+    values = random_values(rng, precision, quantizer.decimals, 3000)
+    array = np.array(values)
+    for mode in MODES:
+        rounded = quantizer.quantize_array(array, mode)
+        for value, rounded_float in zip(values, rounded):
+            expected = decimal_to_precision(value, precision, mode)
+            result = quantizer.quantize(value, mode)
+            # same value and same exponent
+            assert str(result) == str(expected), (value, mode)
+            assert rounded_float == float(expected), (value, mode)
+            if abs(value) < 1e12:
+                assert quantizer.ticks(value, mode) * quantizer.tick == expected
+
+
+def test_non_float_inputs():
+    quantizer = Quantizer(0.01)
+    assert quantizer.quantize(Decimal("1.005")) == Decimal("1.01")
+    assert str(quantizer.quantize(3)) == "3.00"
+    assert quantizer.quantize(np.float64(2.675), "floor") == Decimal("2.67")
+    np.testing.assert_array_equal(
+        quantizer.ticks_array(np.array([1.005, 0.0, -0.015]), "round"), [101, 0, -2]
+    )
+    assert str(Quantizer(0.5).tick) == "0.1"
+    assert Quantizer(5.0).quantize(12.5) == Decimal("15")
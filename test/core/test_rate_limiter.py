@@ -0,0 +1,102 @@
+import asyncio
+
+import pytest
+
+from nexustrader.constants import RequestPriority
+from nexustrader.core.rate_limiter import WeightedRateLimiter
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+
+
+@pytest.fixture(autouse=True)
+def shared_limiters():
+    """Start every test without the limiters shared by clients, and restore them after"""
+    saved = dict(WeightedRateLimiter._shared)
+    WeightedRateLimiter._shared.clear()
+    yield WeightedRateLimiter._shared
+    WeightedRateLimiter._shared.clear()
+    WeightedRateLimiter._shared.update(saved)
+
+
+async def test_cancels_are_served_before_queued_orders():
+    limiter = WeightedRateLimiter(10, 0.5)
+    limiter.sync_remaining(0)
+    served = []
+
+    async def request(name, priority):
+        await limiter.acquire(1, priority)
+        served.append(name)
+
+    tasks = [
+        asyncio.create_task(request(f"query-{i}", RequestPriority.QUERY)) for i in range(2)
+    ]
+    await asyncio.sleep(0)
+    tasks += [
+        asyncio.create_task(request(f"order-{i}", RequestPriority.ORDER)) for i in range(2)
+    ]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(request("cancel", RequestPriority.CANCEL)))
+    await asyncio.gather(*tasks)
+
+    assert served == ["cancel", "order-0", "order-1", "query-0", "query-1"]
+
+
+async def test_reserve_is_kept_for_cancels():
+    limiter = WeightedRateLimiter(100, 60)
+    limiter.sync_used(85)
+
+    await asyncio.wait_for(limiter.acquire(5, RequestPriority.CANCEL), 0.1)
+    await asyncio.wait_for(limiter.acquire(5, RequestPriority.ORDER), 0.1)
+    try:
+        await asyncio.wait_for(limiter.acquire(1, RequestPriority.QUERY), 0.1)
+        assert False, "queries may not spend the reserve"
+    except asyncio.TimeoutError:
+        pass
+    # the cancelled waiter does not hold up the next request
+    await asyncio.wait_for(limiter.acquire(1, RequestPriority.CANCEL), 0.1)
+
+
+async def test_block_holds_every_priority():
+    limiter = WeightedRateLimiter(100, 60)
+    limiter.block(0.2)
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    await limiter.acquire(1, RequestPriority.CANCEL)
+    assert loop.time() - start >= 0.19
+
+
+def test_binance_headers_sync_shared_limiters():
+    client = BinanceApiClient(api_key="key-a")
+    other = BinanceApiClient(api_key="key-b")
+    weight, orders = client._rate_limiters("/fapi/v1/order")
+    other_weight, other_orders = other._rate_limiters("/fapi/v1/order")
+    assert weight is other_weight  # request weight is per IP
+    assert orders is not other_orders  # order count is per account
+
+    client._sync_rate_limit(
+        "/fapi/v1/order",
+        200,
+        {"X-MBX-USED-WEIGHT-1M": "2000", "X-MBX-ORDER-COUNT-10S": "280"},
+    )
+    assert weight.remaining < 401
+    assert orders.remaining < 21
+    assert client._request_weight("GET", "/fapi/v1/klines", {"limit": 1500}) == 10
+    assert client._request_weight("GET", "/api/v3/account", None) == 20
+    assert client._request_priority("DELETE", "/fapi/v1/order") == RequestPriority.CANCEL
+    assert client._request_priority("POST", "/fapi/v1/batchOrders") == RequestPriority.ORDER
+    assert client._request_priority("POST", "/fapi/v1/listenKey") == RequestPriority.QUERY
+
+
+async def test_keep_alive_pings_spend_the_weight_budget():
+    client = BinanceApiClient()
+    pinged = []
+
+    async def request(method, url, headers=None, data=None):
+        pinged.append(url)
+
+    client._request = request
+    weight, _ = client._rate_limiters("/fapi/v1/ping")
+    weight.sync_used(0)
+    await client._ping("https://fapi.binance.com/fapi/v1/ping")
+
+    assert pinged == ["https://fapi.binance.com/fapi/v1/ping"]
+    assert weight.remaining < weight.max_weight
@@ -0,0 +1,102 @@
+from types import SimpleNamespace
+
+import pytest
+from nexustrader.core.recorder import FrameRecorder, FrameReader
+from nexustrader.engine import Engine
+from nexustrader.exchange.okx.connector import OkxPublicConnector
+from nexustrader.exchange.okx.constants import OkxAccountType
+from nexustrader.exchange.okx.websockets import OkxWSClient
+
+
+@pytest.fixture
+def recorder(tmp_path):
+    return FrameRecorder(path=str(tmp_path), max_bytes=1024, flush_interval=0.01)
+
+
+def test_record_and_read(recorder: FrameRecorder, tmp_path):
+    recorder.start()
+    conn_a = recorder.register("wss://a", client="ClientA")
+    conn_b = recorder.register("wss://b", client="ClientB")
+    payloads = [f'{{"seq":{i}}}'.encode() for i in range(100)]
+    for i, payload in enumerate(payloads):
+        recorder.record(conn_a if i % 2 == 0 else conn_b, payload)
+    recorder.stop()
+
+    assert recorder.frames_recorded == 100
+    assert len(recorder.files) > 1  # rotated at 1024 bytes
+
+    reader = FrameReader(str(tmp_path))
+    frames = list(reader)
+    assert [f.payload for f in frames] == payloads
+    assert [f.conn_id for f in frames[:2]] == [conn_a, conn_b]
+    assert all(a.ts_ns <= b.ts_ns for a, b in zip(frames, frames[1:]))
+    assert {f.session for f in frames} == {recorder.session}
+    assert reader.connections[(recorder.session, conn_b)]["url"] == "wss://b"
+    assert reader.connections[(recorder.session, conn_a)]["client"] == "ClientA"
+
+
+def test_every_file_carries_connections(recorder: FrameRecorder, tmp_path):
+    recorder.start()
+    conn_id = recorder.register("wss://a")
+    for _ in range(50):
+        recorder.record(conn_id, b"x" * 100)
+    recorder.stop()
+
+    last_file = FrameReader(recorder.files[-1])
+    list(last_file)
+    assert (recorder.session, conn_id) in last_file.connections
+
+
+def test_truncated_tail_is_ignored(recorder: FrameRecorder):
+    recorder.start()
+    conn_id = recorder.register("wss://a")
+    recorder.record(conn_id, b"first")
+    recorder.record(conn_id, b"second")
+    recorder.stop()
+
+    file_name = recorder.files[0]
+    with open(file_name, "rb") as f:
+        data = f.read()
+    with open(file_name, "wb") as f:
+        f.write(data[:-3])
+
+    assert [f.payload for f in FrameReader(file_name)] == [b"first"]
+
+
+def test_compressed_recording(tmp_path):
+    pytest.importorskip("zstandard")
+    recorder = FrameRecorder(path=str(tmp_path), compress=True, flush_interval=0.01)
+    recorder.start()
+    conn_id = recorder.register("wss://a")
+    for i in range(10):
+        recorder.record(conn_id, str(i).encode())
+    recorder.stop()
+
+    assert recorder.files[0].endswith(".bin.zst")
+    assert [f.payload for f in FrameReader(str(tmp_path))] == [
+        str(i).encode() for i in range(10)
+    ]
+
+
+def test_engine_records_every_ws_client_of_a_connector(tmp_path, task_manager):
+    connector = OkxPublicConnector.__new__(OkxPublicConnector)
+    connector._ws_client, connector._business_ws_client = (
+        OkxWSClient(OkxAccountType.DEMO, lambda raw: None, task_manager, business_url=business_url)
+        for business_url in (False, True)
+    )
+    engine = Engine.__new__(Engine)
+    engine._config = SimpleNamespace(
+        ws_recorder_config=SimpleNamespace(
+            path=str(tmp_path), prefix="ws", max_bytes=1024, compress=False, flush_interval=0.01
+        )
+    )
+    engine._public_connectors = {OkxAccountType.DEMO: connector}
+    engine._private_connectors = {}
+    engine._latency_tracker = object()
+
+    engine._build_ws_instrumentation()
+
+    assert len(connector.ws_clients()) == 2
+    for ws_client in connector.ws_clients():
+        assert ws_client._recorder is engine._ws_recorder
+        assert ws_client._latency is engine._latency_tracker
@@ -0,0 +1,97 @@
+import pytest
+from nexustrader.core.recorder import FrameRecorder
+from nexustrader.core.replay import FrameReplayer
+
+
+class FakeConnector:
+    def __init__(self, account_type: str):
+        self._account_type = account_type
+        self.received = []
+
+    def _ws_msg_handler(self, raw: bytes):
+        if raw == b"bad":
+            raise ValueError("bad frame")
+        self.received.append(raw)
+
+
+@pytest.fixture
+def recording(tmp_path):
+    spot, linear = FakeConnector("SPOT"), FakeConnector("LINEAR")
+    recorder = FrameRecorder(path=str(tmp_path), flush_interval=0.01)
+    recorder.start()
+    spot_id = recorder.register(
+        "wss://spot", handler=spot._ws_msg_handler.__qualname__, account_type="SPOT"
+    )
+    linear_id = recorder.register(
+        "wss://linear", handler=linear._ws_msg_handler.__qualname__, account_type="LINEAR"
+    )
+    other_id = recorder.register("wss://other")
+    for i in range(10):
+        recorder.record(spot_id, f"spot-{i}".encode())
+        recorder.record(linear_id, f"linear-{i}".encode())
+        recorder.record(other_id, b"other")
+    recorder.record(linear_id, b"bad")
+    recorder.stop()
+    return str(tmp_path)
+
+
+async def test_replay_routes_by_connector(recording):
+    spot, linear = FakeConnector("SPOT"), FakeConnector("LINEAR")
+    replayer = FrameReplayer(recording)
+    replayer.add_connector(spot)
+    replayer.add_connector(linear)
+    stats = await replayer.run()
+
+    assert spot.received == [f"spot-{i}".encode() for i in range(10)]
+    assert linear.received == [f"linear-{i}".encode() for i in range(10)]
+    assert stats.frames == 21
+    assert stats.skipped == 10
+    assert stats.errors == 1
+    assert stats.routes["FakeConnector._ws_msg_handler[LINEAR]"].errors == 1
+    assert stats.msgs_per_sec > 0
+
+
+async def test_replay_add_handler(recording):
+    received = []
+    replayer = FrameReplayer(recording)
+    replayer.add_handler(received.append, url="wss://other")
+    stats = await replayer.run()
+
+    assert received == [b"other"] * 10
+    assert stats.frames == 10
+
+
+async def test_replay_time_scaled(recording):
+    received = []
+    replayer = FrameReplayer(recording, speed=1000)
+    replayer.add_handler(received.append, url="wss://spot")
+    await replayer.run()
+    assert len(received) == 10
+
+
+async def test_replay_keeps_runs_apart(recording, tmp_path):
+    # a later run of the same process layout reuses the connection ids of the first one
+    recorder = FrameRecorder(path=recording, flush_interval=0.01)
+    recorder.start()
+    recorder.register("wss://other")
+    other_id = recorder.register(
+        "wss://spot", handler=FakeConnector._ws_msg_handler.__qualname__, account_type="SPOT"
+    )
+    recorder.record(other_id, b"spot-run-2")
+    recorder.stop()
+
+    spot, linear = FakeConnector("SPOT"), FakeConnector("LINEAR")
+    replayer = FrameReplayer(recording)
+    replayer.add_connector(spot)
+    replayer.add_connector(linear)
+    await replayer.run()
+
+    assert sorted(spot.received) == sorted(
+        [f"spot-{i}".encode() for i in range(10)] + [b"spot-run-2"]
+    )
+    assert linear.received == [f"linear-{i}".encode() for i in range(10)]
+
+
+def test_invalid_speed(recording):
+    with pytest.raises(ValueError):
+        FrameReplayer(recording, speed=0)
@@ -0,0 +1,173 @@
+from decimal import Decimal
+
+import pytest
+
+from nexustrader.constants import ExchangeType, OrderSide, OrderStatus, OrderType, SubmitType
+from nexustrader.core.risk import RiskConfig, RiskEngine
+from nexustrader.schema import BookL1, InstrumentId, Order, OrderSubmit, Position
+
+
+BTC = "BTCUSDT-PERP.BINANCE"
+ETH = "ETHUSDT-PERP.BINANCE"
+SOL = "SOLUSDT-PERP.OKX"
+
+
+@pytest.fixture
+def make_risk(message_bus, cache):
+    for symbol, mid in ((BTC, 100.0), (ETH, 10.0), (SOL, 1.0)):
+        cache._bookl1_cache[symbol] = book(symbol, mid)
+
+    def make(**kwargs) -> RiskEngine:
+        return RiskEngine(message_bus, cache, RiskConfig(**kwargs))
+
+    return make
+
+
+def book(symbol: str, mid: float) -> BookL1:
+    instrument_id = InstrumentId.from_str(symbol)
+    return BookL1(
+        exchange=instrument_id.exchange,
+        symbol=symbol,
+        bid=mid - 0.5,
+        ask=mid + 0.5,
+        bid_size=1,
+        ask_size=1,
+        timestamp=0,
+    )
+
+
+def submit(symbol: str, side: OrderSide, amount: str, price: str | None = None) -> OrderSubmit:
+    return OrderSubmit(
+        symbol=symbol,
+        instrument_id=InstrumentId.from_str(symbol),
+        submit_type=SubmitType.CREATE,
+        side=side,
+        type=OrderType.LIMIT if price else OrderType.MARKET,
+        amount=Decimal(amount),
+        price=Decimal(price) if price else None,
+    )
+
+
+def order_status(order_submit: OrderSubmit, status: OrderStatus, filled: str = "0") -> Order:
+    return Order(
+        exchange=order_submit.instrument_id.exchange,
+        symbol=order_submit.symbol,
+        status=status,
+        uuid=order_submit.uuid,
+        amount=order_submit.amount,
+        filled=Decimal(filled),
+        remaining=order_submit.amount - Decimal(filled),
+        side=order_submit.side,
+        type=order_submit.type,
+    )
+
+
+def test_order_rules(make_risk):
+    risk = make_risk(max_order_amount=10, max_order_notional=500, price_band=0.05)
+    assert risk.check(submit(BTC, OrderSide.BUY, "11")) == "max_order_amount"
+    assert risk.check(submit(BTC, OrderSide.BUY, "1", "106")) == "price_band"
+    assert risk.check(submit(BTC, OrderSide.SELL, "1", "94")) == "price_band"
+    # far from the mid on the passive side is allowed
+    assert risk.check(submit(BTC, OrderSide.BUY, "1", "90")) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "6")) == "max_order_notional"
+    assert risk.check(submit(ETH, OrderSide.BUY, "10")) is None
+    assert risk.stats() == {
+        "checked": 6,
+        "max_order_amount": 1,
+        "price_band": 2,
+        "max_order_notional": 1,
+    }
+
+
+def test_open_orders_released_by_order_status(make_risk, message_bus):
+    risk = make_risk(max_open_orders=2, max_total_open_orders=3)
+    first, second = submit(BTC, OrderSide.BUY, "1"), submit(BTC, OrderSide.SELL, "1")
+    assert risk.check(first) is None
+    assert risk.check(second) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) == "max_open_orders"
+    assert risk.check(submit(ETH, OrderSide.BUY, "1")) is None
+    assert risk.check(submit(SOL, OrderSide.BUY, "1")) == "max_total_open_orders"
+
+    message_bus.publish(topic="order_status", msg=order_status(first, OrderStatus.ACCEPTED))
+    assert risk.symbol_exposure(BTC).open_orders == 2
+    message_bus.publish(topic="order_status", msg=order_status(first, OrderStatus.FILLED, "1"))
+    message_bus.publish(topic="order_status", msg=order_status(second, OrderStatus.CANCELED))
+    # a late duplicate event does not release twice
+    message_bus.publish(topic="order_status", msg=order_status(second, OrderStatus.CANCELED))
+    state = risk.symbol_exposure(BTC)
+    assert (state.open_orders, state.open_buy, state.open_sell) == (0, 0.0, 0.0)
+    assert risk.total_open_orders == 1
+
+
+def test_exposure_from_orders_positions_and_marks(make_risk, message_bus):
+    risk = make_risk(max_symbol_notional=1000, symbol_max_notional={ETH: 50})
+    buy = submit(BTC, OrderSide.BUY, "8")
+    assert risk.check(buy) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "3")) == "max_symbol_notional"
+    # a sell that does not increase the exposure is not limited
+    sell = submit(BTC, OrderSide.SELL, "5")
+    assert risk.check(sell) is None
+    assert risk.check(submit(ETH, OrderSide.BUY, "6")) == "max_symbol_notional"
+    assert risk.portfolio_notional == pytest.approx(800)
+
+    # partial fill, then the position of the fill
+    message_bus.publish(
+        topic="order_status", msg=order_status(buy, OrderStatus.PARTIALLY_FILLED, "2")
+    )
+    message_bus.publish(
+        topic="position",
+        msg=Position(symbol=BTC, exchange=ExchangeType.BINANCE, signed_amount=Decimal("2")),
+    )
+    state = risk.symbol_exposure(BTC)
+    assert (state.position, state.open_buy, state.open_sell) == (2.0, 6.0, 5.0)
+    assert risk.portfolio_notional == pytest.approx(800)
+
+    message_bus.publish(topic="bookl1", msg=book(BTC, 110.0))
+    assert risk.portfolio_notional == pytest.approx(880)
+    assert risk.check(submit(BTC, OrderSide.BUY, "2")) == "max_symbol_notional"
+
+    message_bus.publish(topic="order_status", msg=order_status(buy, OrderStatus.CANCELED, "2"))
+    assert risk.exchange_notional(ExchangeType.BINANCE) == pytest.approx(330)
+    assert risk.check(submit(BTC, OrderSide.BUY, "5")) is None
+
+
+def test_exchange_and_portfolio_sums(make_risk, message_bus):
+    risk = make_risk(max_exchange_notional=1000, max_portfolio_notional=1050)
+    assert risk.check(submit(BTC, OrderSide.BUY, "9")) is None
+    assert risk.check(submit(ETH, OrderSide.SELL, "11")) == "max_exchange_notional"
+    assert risk.check(submit(ETH, OrderSide.SELL, "11", "9.8")) == "max_exchange_notional"
+    assert risk.check(submit(ETH, OrderSide.SELL, "5")) is None
+    assert risk.check(submit(SOL, OrderSide.BUY, "110")) == "max_portfolio_notional"
+    assert risk.check(submit(SOL, OrderSide.BUY, "100")) is None
+    assert risk.exchange_notional(ExchangeType.BINANCE) == pytest.approx(950)
+    assert risk.exchange_notional(ExchangeType.OKX) == pytest.approx(100)
+
+    message_bus.publish(
+        topic="position",
+        msg=Position(symbol=SOL, exchange=ExchangeType.OKX, signed_amount=Decimal("-20")),
+    )
+    # max(|-20 + 100|, |-20|) * 1
+    assert risk.exchange_notional(ExchangeType.OKX) == pytest.approx(80)
+    assert risk.portfolio_notional == pytest.approx(1030)
+
+
+def test_throttle(make_risk):
+    risk = make_risk(max_orders_per_second=2)
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) == "throttled"
+    # a rejected order is not counted as open
+    assert risk.total_open_orders == 2
+    risk._tokens_ns -= 500_000_000
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) is None
+
+
+def test_throttle_below_one_order_per_second(make_risk):
+    risk = make_risk(max_orders_per_second=0.5)
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) is None
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) == "throttled"
+    risk._tokens_ns -= 1_000_000_000
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) == "throttled"
+    # the bucket refills to 1 token in 2 seconds
+    risk._tokens_ns -= 2_000_000_000
+    assert risk.check(submit(BTC, OrderSide.BUY, "1")) is None
@@ -0,0 +1,174 @@
+import asyncio
+
+import pytest
+
+from nexustrader.constants import KlineInterval
+from nexustrader.core.nautilius_core import LiveClock
+from nexustrader.core.timer import TimerWheel
+from nautilus_trader.common.component import TestClock
+
+
+MS = 1_000_000
+SEC = 1_000_000_000
+# 2024-01-01 00:00:00 UTC, a Monday
+START_NS = 1_704_067_200 * SEC
+
+
+@pytest.fixture
+def clock():
+    clock = TestClock()
+    clock.set_time(START_NS)
+    return clock
+
+
+@pytest.fixture
+def wheel(clock):
+    return TimerWheel(clock=clock, tick=0.001, wheel_size=64, live=False)
+
+
+def test_one_shot_and_cancel(wheel: TimerWheel, clock):
+    fired = []
+    wheel.call_later(0.5, lambda: fired.append(("a", clock.timestamp_ns())))
+    handle = wheel.call_later(0.2, lambda: fired.append(("b", clock.timestamp_ns())))
+    wheel.call_at(START_NS + 100 * MS + 1, lambda: fired.append(("c", clock.timestamp_ns())))
+    assert len(wheel) == 3
+
+    handle.cancel()
+    handle.cancel()
+    assert not handle.active
+    assert len(wheel) == 2
+
+    wheel.advance_to(START_NS + 100 * MS)
+    assert fired == []
+    wheel.advance_to(START_NS + 5 * SEC)  # several revolutions of the wheel
+    assert fired == [("c", START_NS + 100 * MS + 1), ("a", START_NS + 500 * MS)]
+    assert clock.timestamp_ns() == START_NS + 5 * SEC
+    assert (wheel.fired, wheel.cancelled, len(wheel)) == (2, 1, 0)
+    assert wheel.jitter.max == 0
+
+
+def test_periodic_fires_in_order_without_drift(wheel: TimerWheel, clock):
+    fired = []
+    fast = wheel.call_every(0.3, lambda: fired.append(("fast", clock.timestamp_ns())))
+    wheel.call_every(1, lambda: fired.append(("slow", clock.timestamp_ns())))
+
+    wheel.advance_to(START_NS + 2 * SEC)
+    times = [ts for _, ts in fired]
+    assert times == sorted(times)
+    assert [ts for name, ts in fired if name == "fast"] == [
+        START_NS + i * 300 * MS for i in range(1, 7)
+    ]
+    assert [ts for name, ts in fired if name == "slow"] == [START_NS + SEC, START_NS + 2 * SEC]
+
+    fast.cancel()
+    fired.clear()
+    wheel.advance_to(START_NS + 3 * SEC)
+    assert fired == [("slow", START_NS + 3 * SEC)]
+
+
+def test_callbacks_schedule_and_cancel_timers(wheel: TimerWheel, clock):
+    fired = []
+
+    def chain():
+        fired.append(clock.timestamp_ns())
+        if len(fired) < 3:
+            wheel.call_later(0, chain)
+
+    wheel.call_later(0.01, chain)
+    periodic = None
+
+    def once():
+        fired.append("periodic")
+        periodic.cancel()
+
+    periodic = wheel.call_every(0.05, once)
+    wheel.advance_to(START_NS + SEC)
+    assert fired == [START_NS + 10 * MS] * 3 + ["periodic"]
+    assert len(wheel) == 0
+
+
+def test_kline_aligned(wheel: TimerWheel, clock):
+    clock.set_time(START_NS + 61 * SEC + 500 * MS)
+    fired = []
+    wheel.call_on_kline(KlineInterval.MINUTE_1, lambda: fired.append(clock.timestamp_ns()))
+    wheel.call_on_kline(
+        KlineInterval.MINUTE_5, lambda: fired.append(("5m", clock.timestamp_ns())), offset=-1
+    )
+    weekly = wheel.call_on_kline(KlineInterval.WEEK_1, lambda: None)
+    assert weekly.deadline_ns == START_NS + 7 * 86400 * SEC  # next Monday
+
+    wheel.advance_to(START_NS + 5 * 60 * SEC)
+    assert fired == [
+        START_NS + 120 * SEC,
+        START_NS + 180 * SEC,
+        START_NS + 240 * SEC,
+        ("5m", START_NS + 299 * SEC),
+        START_NS + 300 * SEC,
+    ]
+    with pytest.raises(ValueError):
+        wheel.call_on_kline(KlineInterval.MONTH_1, lambda: None)
+
+
+async def test_live_wheel_on_event_loop():
+    wheel = TimerWheel(clock=LiveClock(), tick=0.001)
+    fired = []
+    done = asyncio.Event()
+
+    async def stop():
+        done.set()
+
+    periodic = wheel.call_every(0.01, lambda: fired.append("tick"))
+    wheel.call_later(0.005, lambda: fired.append("once"))
+    wheel.call_later(0.055, stop)
+    await asyncio.wait_for(done.wait(), 1)
+    periodic.cancel()
+
+    assert fired[0] == "once"
+    assert 4 <= fired.count("tick") <= 6
+    stats = wheel.stats()
+    assert stats["timers"] == 0
+    assert stats["fired"] == len(fired) + 1
+    assert 0 <= stats["jitter_ns"][50] < 50 * MS
+    assert wheel._wakeup is None  # idle wheel holds no loop callback
+
+
+def test_two_deadlines_in_one_tick(wheel: TimerWheel, clock):
+    fired = []
+    wheel.call_at(START_NS + 5 * MS + 100_000, lambda: fired.append(clock.timestamp_ns()))
+    wheel.call_at(START_NS + 5 * MS + 900_000, lambda: fired.append(clock.timestamp_ns()))
+
+    wheel.advance_to(START_NS + 5 * MS + 500_000)
+    assert fired == [START_NS + 5 * MS + 100_000]
+    # the wheel did not move past the tick of the second timer
+    wheel.advance_to(START_NS + 6 * MS)
+    assert fired == [START_NS + 5 * MS + 100_000, START_NS + 5 * MS + 900_000]
+    assert len(wheel) == 0
+
+
+async def test_live_two_deadlines_in_one_tick():
+    clock = LiveClock()
+    wheel = TimerWheel(clock=clock, tick=0.001)
+    done = asyncio.Event()
+    late = []
+
+    def on_timer(deadline_ns: int):
+        late.append(clock.timestamp_ns() - deadline_ns)
+        if len(late) == 2:
+            done.set()
+
+    tick_ns = (clock.timestamp_ns() // MS + 5) * MS
+    for deadline_ns in (tick_ns + 100_000, tick_ns + 900_000):
+        wheel.call_at(deadline_ns, lambda deadline_ns=deadline_ns: on_timer(deadline_ns))
+    wakeups = 0
+    on_wakeup = wheel._on_wakeup
+
+    def count_wakeup():
+        nonlocal wakeups
+        wakeups += 1
+        on_wakeup()
+
+    wheel._on_wakeup = count_wakeup
+    await asyncio.wait_for(done.wait(), 1)
+
+    assert max(late) < 50 * MS
+    assert wakeups < 20  # no busy loop until the second deadline
@@ -0,0 +1,173 @@
+from decimal import Decimal
+from types import SimpleNamespace
+
+from nexustrader.constants import ExchangeType, OrderSide, OrderStatus, OrderType, SubmitType
+from nexustrader.core.log import SpdLog
+from nexustrader.core.nautilius_core import LiveClock
+from nexustrader.exchange.binance.rest_api import BinanceApiClient
+from nexustrader.exchange.binance.schema import BinanceBatchOrderError, BinanceOrder
+from nexustrader.exchange.bybit.connector import BybitPrivateConnector
+from nexustrader.exchange.bybit.schema import BybitBatchOrderResult
+from nexustrader.exchange.okx.connector import OkxPrivateConnector
+from nexustrader.exchange.okx.schema import (
+    OkxPendingOrderData,
+    OkxPendingOrdersResponse,
+    OkxWsOrderResponseData,
+)
+from nexustrader.schema import InstrumentId, OrderSubmit
+
+
+def bare_connector(cls, exchange_id: ExchangeType, markets):
+    """Connector with only the state the batch order path reads"""
+    connector = cls.__new__(cls)
+    connector._log = SpdLog.get_logger(cls.__name__, level="DEBUG", flush=True)
+    connector._clock = LiveClock()
+    connector._limiter = None
+    connector._exchange_id = exchange_id
+    connector._market = {market.symbol: market for market in markets}
+    return connector
+
+
+def order_submit(symbol: str, price: int) -> OrderSubmit:
+    return OrderSubmit(
+        symbol=symbol,
+        instrument_id=InstrumentId.from_str(symbol),
+        submit_type=SubmitType.CREATE,
+        side=OrderSide.BUY,
+        type=OrderType.LIMIT,
+        amount=Decimal("0.01"),
+        price=Decimal(price),
+    )
+
+
+async def test_okx_batch_orders_split_by_limit_and_keep_order():
+    market = SimpleNamespace(id="BTC-USDT-SWAP", symbol="BTCUSDT-PERP.OKX", spot=False)
+    connector = bare_connector(OkxPrivateConnector, ExchangeType.OKX, [market])
+    batches = []
+
+    async def batch_place_orders(orders):
+        batches.append(orders)
+        return [
+            OkxWsOrderResponseData(
+                ordId=order["px"], ts="1", sCode="51008" if order["px"] == "4" else "0"
+            )
+            for order in orders
+        ]
+
+    connector._ws_order = True
+    connector._ws_client = SimpleNamespace(batch_place_orders=batch_place_orders)
+
+    orders = [order_submit(market.symbol, price) for price in range(1, 46)]
+    results = await connector.create_batch_orders(orders)
+
+    assert [len(batch) for batch in batches] == [20, 20, 5]
+    assert batches[0][0]["instId"] == "BTC-USDT-SWAP"
+    assert batches[0][0]["tdMode"] == "cross"
+    assert [result.id for result in results if result.success] == [
+        str(price) for price in range(1, 46) if price != 4
+    ]
+    assert results[3].status == OrderStatus.FAILED
+    assert results[3].symbol == market.symbol
+
+
+async def test_okx_cancel_all_orders_pages_pending_orders():
+    market = SimpleNamespace(id="BTC-USDT-SWAP", symbol="BTCUSDT-PERP.OKX", spot=False)
+    connector = bare_connector(OkxPrivateConnector, ExchangeType.OKX, [market])
+    pending = [str(order_id) for order_id in range(130, 0, -1)]
+    pages = []
+    batches = []
+
+    async def get_api_v5_trade_orders_pending(inst_id, after=None, limit=100):
+        pages.append(after)
+        start = pending.index(after) + 1 if after else 0
+        return OkxPendingOrdersResponse(
+            code="0",
+            msg="",
+            data=[
+                OkxPendingOrderData(instId=inst_id, ordId=order_id, clOrdId="")
+                for order_id in pending[start : start + limit]
+            ],
+        )
+
+    async def batch_cancel_orders(orders):
+        batches.append([order["ordId"] for order in orders])
+        return [
+            OkxWsOrderResponseData(
+                ordId=order["ordId"], ts="1", sCode="51400" if order["ordId"] == "7" else "0"
+            )
+            for order in orders
+        ]
+
+    connector._ws_order = True
+    connector._ws_client = SimpleNamespace(batch_cancel_orders=batch_cancel_orders)
+    connector._api_client = SimpleNamespace(
+        get_api_v5_trade_orders_pending=get_api_v5_trade_orders_pending
+    )
+
+    # the order failed to cancel is reported
+    assert await connector.cancel_all_orders(market.symbol) == ["7"]
+    assert pages == [None, "31"]
+    assert sorted(order_id for batch in batches for order_id in batch) == sorted(pending)
+    assert [len(batch) for batch in batches] == [20] * 6 + [10]
+
+
+
+async def test_okx_amend_unknown_symbol_returns_failed_order():
+    connector = bare_connector(OkxPrivateConnector, ExchangeType.OKX, [])
+    order = await connector.amend_order(
+        symbol="ETHUSDT-PERP.OKX",
+        order_id="1",
+        side=OrderSide.BUY,
+        price=Decimal("100"),
+        amount=Decimal("0.01"),
+    )
+    assert order.status == OrderStatus.FAILED
+    assert order.id == "1"
+
+async def test_bybit_batch_orders_group_by_category():
+    spot = SimpleNamespace(
+        id="BTCUSDT", symbol="BTCUSDT.BYBIT", spot=True, linear=False, inverse=False
+    )
+    linear = SimpleNamespace(
+        id="BTCUSDT", symbol="BTCUSDT-PERP.BYBIT", spot=False, linear=True, inverse=False
+    )
+    connector = bare_connector(BybitPrivateConnector, ExchangeType.BYBIT, [spot, linear])
+    requests = []
+
+    async def post_v5_order_create_batch(category, orders):
+        requests.append((category, len(orders)))
+        return SimpleNamespace(
+            results=[
+                BybitBatchOrderResult(orderId=f"{category}-{order['price']}")
+                for order in orders
+            ]
+        )
+
+    connector._ws_api_client = None
+    connector._api_client = SimpleNamespace(
+        post_v5_order_create_batch=post_v5_order_create_batch
+    )
+
+    orders = [
+        order_submit(spot.symbol if price % 2 else linear.symbol, price)
+        for price in range(1, 31)
+    ]
+    results = await connector.create_batch_orders(orders)
+
+    assert sorted(requests) == [("linear", 15), ("spot", 5), ("spot", 10)]
+    assert [result.id for result in results] == [
+        f"{'spot' if price % 2 else 'linear'}-{price}" for price in range(1, 31)
+    ]
+
+
+def test_binance_batch_response_keeps_errors_in_place():
+    client = BinanceApiClient()
+    results = client._decode_batch_orders(
+        b'[{"symbol":"BTCUSDT","orderId":1,"clientOrderId":"a"},'
+        b'{"code":-2019,"msg":"Margin is insufficient."}]'
+    )
+    assert isinstance(results[0], BinanceOrder)
+    assert results[1] == BinanceBatchOrderError(code=-2019, msg="Margin is insufficient.")
+    assert client._encode_batch_orders(
+        [{"quantity": Decimal("0.01"), "reduceOnly": True}]
+    ) == '[{"quantity":"0.01","reduceOnly":"true"}]'
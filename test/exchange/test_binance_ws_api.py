@@ -0,0 +1,130 @@
+import asyncio
+import orjson
+import pytest
+from decimal import Decimal
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.core.nautilius_core import hmac_signature
+from nexustrader.exchange.binance.constants import BinanceAccountType
+from nexustrader.exchange.binance.error import BinanceClientError, BinanceWsApiUnavailable
+from nexustrader.exchange.binance.websockets import BinanceWSApiClient
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg_type, payload: bytes):
+        self.sent.append(orjson.loads(payload))
+
+    def disconnect(self):
+        pass
+
+
+def make_client() -> BinanceWSApiClient:
+    task_manager = TaskManager(asyncio.get_running_loop(), enable_signal_handlers=False)
+    client = BinanceWSApiClient(
+        account_type=BinanceAccountType.USD_M_FUTURE,
+        api_key="key",
+        secret="secret",
+        task_manager=task_manager,
+        timeout=1,
+    )
+    client._transport, client._listener = FakeTransport(), object()
+    return client
+
+
+async def wait_sent(client: BinanceWSApiClient) -> dict:
+    while not client._transport.sent:
+        await asyncio.sleep(0)
+    return client._transport.sent.pop()
+
+
+async def test_place_order_signed_and_correlated():
+    client = make_client()
+    task = asyncio.create_task(
+        client.place_order(
+            symbol="BTCUSDT",
+            side="BUY",
+            type="LIMIT",
+            quantity=Decimal("0.001"),
+            price=Decimal("60000.1"),
+            reduceOnly=True,
+        )
+    )
+    request = await wait_sent(client)
+    assert request["method"] == "order.place"
+
+    params = dict(request["params"])
+    signature = params.pop("signature")
+    query = "&".join(f"{key}={params[key]}" for key in sorted(params))
+    assert signature == hmac_signature("secret", query)
+    assert params["quantity"] == "0.001"
+    assert params["reduceOnly"] == "true"
+    assert params["apiKey"] == "key"
+
+    # a response for another request does not resolve this one
+    client._ws_msg_handler(orjson.dumps({"id": 999, "status": 200, "result": None}))
+    assert not task.done()
+
+    client._ws_msg_handler(
+        orjson.dumps(
+            {
+                "id": request["id"],
+                "status": 200,
+                "result": {"symbol": "BTCUSDT", "orderId": 42, "clientOrderId": "abc"},
+                "rateLimits": [
+                    {
+                        "rateLimitType": "ORDERS",
+                        "interval": "MINUTE",
+                        "intervalNum": 1,
+                        "limit": 1200,
+                        "count": 1,
+                    }
+                ],
+            }
+        )
+    )
+    order = await task
+    assert order.orderId == 42
+    assert client.rate_limits[0].count == 1
+    assert not client._pending
+
+
+async def test_error_response_raises_client_error():
+    client = make_client()
+    task = asyncio.create_task(client.cancel_order(symbol="BTCUSDT", orderId=1))
+    request = await wait_sent(client)
+    client._ws_msg_handler(
+        orjson.dumps(
+            {
+                "id": request["id"],
+                "status": 400,
+                "error": {"code": -2011, "msg": "Unknown order sent."},
+            }
+        )
+    )
+    with pytest.raises(BinanceClientError) as e:
+        await task
+    assert e.value.message["code"] == -2011
+
+
+async def test_unavailable_and_disconnect():
+    client = make_client()
+    task = asyncio.create_task(client.place_order(symbol="BTCUSDT"))
+    await wait_sent(client)
+
+    client.disconnect()
+    with pytest.raises(ConnectionAbortedError):
+        await task
+
+    with pytest.raises(BinanceWsApiUnavailable):
+        await client.place_order(symbol="BTCUSDT")
+
+
+async def test_signature_uses_clock_sync_offset():
+    client = make_client()
+    client.set_time_offset(-30_000, recv_window=5000)
+    params = client._sign({"symbol": "BTCUSDT"})
+    assert abs(params["timestamp"] - (client._clock.timestamp_ms() - 30_000)) < 1000
+    assert params["recvWindow"] == 5000
@@ -0,0 +1,145 @@
+import asyncio
+import orjson
+import pytest
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.exchange.bybit.constants import BybitAccountType
+from nexustrader.exchange.bybit.error import BybitError, BybitWsApiUnavailable
+from nexustrader.exchange.bybit.websockets import BybitWSApiClient
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg_type, payload: bytes):
+        self.sent.append(orjson.loads(payload))
+
+    def disconnect(self):
+        pass
+
+
+def make_client() -> BybitWSApiClient:
+    task_manager = TaskManager(asyncio.get_running_loop(), enable_signal_handlers=False)
+    client = BybitWSApiClient(
+        account_type=BybitAccountType.UNIFIED_TESTNET,
+        api_key="key",
+        secret="secret",
+        task_manager=task_manager,
+        timeout=1,
+    )
+    client._transport, client._listener = FakeTransport(), object()
+    client._ws_msg_handler(orjson.dumps({"op": "auth", "retCode": 0, "retMsg": "OK"}))
+    return client
+
+
+async def wait_sent(client: BybitWSApiClient) -> dict:
+    while not client._transport.sent:
+        await asyncio.sleep(0)
+    return client._transport.sent.pop()
+
+
+HEADER = {
+    "X-Bapi-Limit": "10",
+    "X-Bapi-Limit-Status": "9",
+    "X-Bapi-Limit-Reset-Timestamp": "1711001595208",
+    "Timenow": "1711001595209",
+}
+
+
+async def test_create_order_correlates_req_id_and_reads_rate_limit():
+    client = make_client()
+    task = asyncio.create_task(
+        client.create_order(
+            category="linear", symbol="BTCUSDT", side="Buy", orderType="Market", qty="0.001"
+        )
+    )
+    request = await wait_sent(client)
+    assert request["op"] == "order.create"
+    assert request["args"][0]["orderType"] == "Market"
+    assert "X-BAPI-TIMESTAMP" in request["header"]
+
+    client._ws_msg_handler(
+        orjson.dumps(
+            {
+                "reqId": request["reqId"],
+                "retCode": 0,
+                "retMsg": "OK",
+                "op": "order.create",
+                "data": {"orderId": "1", "orderLinkId": "a"},
+                "retExtInfo": {},
+                "header": HEADER,
+            }
+        )
+    )
+    res = await task
+    assert res.result.orderId == "1"
+    assert res.time == 1711001595209
+    assert client.rate_limits["order.create"].remaining == 9
+
+
+async def test_batch_results_and_errors():
+    client = make_client()
+    task = asyncio.create_task(
+        client.cancel_batch_orders(
+            "linear", [{"symbol": "BTCUSDT", "orderId": "1"}, {"symbol": "BTCUSDT", "orderId": "2"}]
+        )
+    )
+    request = await wait_sent(client)
+    client._ws_msg_handler(
+        orjson.dumps(
+            {
+                "reqId": request["reqId"],
+                "retCode": 0,
+                "op": "order.cancel-batch",
+                "data": {
+                    "list": [
+                        {"category": "linear", "symbol": "BTCUSDT", "orderId": "1", "orderLinkId": ""},
+                        {"category": "linear", "symbol": "BTCUSDT", "orderId": "2", "orderLinkId": ""},
+                    ]
+                },
+                "retExtInfo": {"list": [{"code": 0, "msg": "OK"}, {"code": 110001, "msg": "order not exists"}]},
+            }
+        )
+    )
+    results = await task
+    assert [r.code for r in results] == [0, 110001]
+
+    task = asyncio.create_task(client.cancel_order(category="linear", symbol="BTCUSDT", orderId="3"))
+    request = await wait_sent(client)
+    client._ws_msg_handler(
+        orjson.dumps(
+            {"reqId": request["reqId"], "retCode": 110001, "retMsg": "order not exists", "op": "order.cancel"}
+        )
+    )
+    with pytest.raises(BybitError):
+        await task
+
+
+async def test_unavailable_before_auth_and_after_disconnect():
+    client = make_client()
+    task = asyncio.create_task(client.create_order(category="linear", symbol="BTCUSDT"))
+    await wait_sent(client)
+    client.disconnect()
+    with pytest.raises(ConnectionAbortedError):
+        await task
+    with pytest.raises(BybitWsApiUnavailable):
+        await client.create_order(category="linear", symbol="BTCUSDT")
+
+
+async def test_auth_and_orders_use_clock_sync_offset():
+    client = make_client()
+    client.set_time_offset(-30_000, recv_window=3000)
+    local_ms = client._clock.timestamp_ms()
+    expires = client._get_auth_payload()["args"][1]
+    assert abs(expires - (local_ms - 30_000 + 1_000)) < 1000
+
+    task = asyncio.create_task(
+        client.create_order(
+            category="linear", symbol="BTCUSDT", side="Buy", orderType="Market", qty="0.001"
+        )
+    )
+    request = await wait_sent(client)
+    assert abs(int(request["header"]["X-BAPI-TIMESTAMP"]) - (local_ms - 30_000)) < 1000
+    assert request["header"]["X-BAPI-RECV-WINDOW"] == "3000"
+    task.cancel()
@@ -0,0 +1,149 @@
+import asyncio
+import orjson
+import pytest
+
+from nexustrader.core.entity import TaskManager
+from nexustrader.exchange.okx.constants import OkxAccountType
+from nexustrader.exchange.okx.error import OkxRequestError
+from nexustrader.exchange.okx.websockets import OkxWSClient
+
+
+class FakeTransport:
+    def __init__(self):
+        self.sent = []
+
+    def send(self, msg_type, payload: bytes):
+        self.sent.append(orjson.loads(payload))
+
+    def disconnect(self):
+        pass
+
+
+def make_client() -> OkxWSClient:
+    task_manager = TaskManager(asyncio.get_running_loop(), enable_signal_handlers=False)
+    client = OkxWSClient(
+        account_type=OkxAccountType.DEMO,
+        handler=lambda raw: None,
+        task_manager=task_manager,
+        api_key="key",
+        secret="secret",
+        passphrase="passphrase",
+        request_timeout=1,
+    )
+    client._transport, client._listener = FakeTransport(), object()
+    client._authed = True
+    client.on_login()
+    return client
+
+
+async def wait_sent(client: OkxWSClient) -> dict:
+    while not client._transport.sent:
+        await asyncio.sleep(0)
+    return client._transport.sent.pop()
+
+
+def response(request: dict, code: str = "0", s_code: str = "0") -> bytes:
+    return orjson.dumps(
+        {
+            "id": request["id"],
+            "op": request["op"],
+            "code": code,
+            "msg": "",
+            "data": [
+                {
+                    "ordId": "123",
+                    "clOrdId": request["args"][0].get("clOrdId", ""),
+                    "tag": "",
+                    "ts": "1695190491421",
+                    "sCode": s_code,
+                    "sMsg": "" if s_code == "0" else "rejected",
+                }
+            ],
+        }
+    )
+
+
+async def test_place_order_correlates_id():
+    client = make_client()
+    task = asyncio.create_task(
+        client.place_order(
+            inst_id="BTC-USDT-SWAP", td_mode="cross", side="buy", ord_type="limit", sz="1", px="1"
+        )
+    )
+    request = await wait_sent(client)
+    assert request["op"] == "order"
+    assert request["args"][0]["clOrdId"]
+
+    client.on_order_response(response(request))
+    data = await task
+    assert data.ordId == "123"
+    assert data.clOrdId == request["args"][0]["clOrdId"]
+
+
+async def test_rejection_raises():
+    client = make_client()
+    task = asyncio.create_task(client.cancel_order(inst_id="BTC-USDT-SWAP", ord_id="1"))
+    request = await wait_sent(client)
+    client.on_order_response(response(request, code="1", s_code="51400"))
+    with pytest.raises(OkxRequestError) as e:
+        await task
+    assert e.value.error_code == "51400"
+
+
+async def test_in_flight_request_fails_on_disconnect():
+    client = make_client()
+    task = asyncio.create_task(
+        client.place_order(
+            inst_id="BTC-USDT-SWAP", td_mode="cross", side="buy", ord_type="market", sz="1"
+        )
+    )
+    await wait_sent(client)
+
+    client.disconnect()
+    # the order may have been accepted, it is not sent again
+    with pytest.raises(ConnectionAbortedError):
+        await task
+    client._transport, client._listener = FakeTransport(), object()
+    client.on_login()
+    await asyncio.sleep(0)
+    assert client._transport.sent == []
+
+
+async def test_request_made_while_disconnected_sent_after_login():
+    client = make_client()
+    client.disconnect()
+    task = asyncio.create_task(client.cancel_order(inst_id="BTC-USDT-SWAP", ord_id="1"))
+    await asyncio.sleep(0)
+    # queued while the connection is down, kept by a disconnect
+    client.disconnect()
+    assert not task.done()
+
+    client._transport, client._listener = FakeTransport(), object()
+    client.on_login()
+    request = await wait_sent(client)
+    assert request["op"] == "cancel-order"
+    client.on_order_response(response(request))
+    assert (await task).ordId == "123"
+    assert not client._pending and not client._unsent
+
+
+async def test_batch_orders_return_every_result():
+    client = make_client()
+    task = asyncio.create_task(
+        client.batch_cancel_orders(
+            [{"instId": "BTC-USDT-SWAP", "ordId": "1"}, {"instId": "BTC-USDT-SWAP", "ordId": "2"}]
+        )
+    )
+    request = await wait_sent(client)
+    assert request["op"] == "batch-cancel-orders"
+    assert len(request["args"]) == 2
+    client.on_order_response(response(request, code="2", s_code="51400"))
+    results = await task
+    assert results[0].sCode == "51400"
+
+
+async def test_login_uses_clock_sync_offset():
+    client = make_client()
+    client.set_time_offset(-30_000)
+    timestamp = client._get_auth_payload()["args"][0]["timestamp"]
+    assert abs(timestamp - (client._clock.timestamp_ms() - 30_000) // 1000) <= 1